@@ -0,0 +1,49 @@
+"""add worker_event_block (columnar worker event storage)
+
+Revision ID: e4b2c6d8f0a1
+Revises: d3f9a1c72b84
+Create Date: 2026-10-17
+
+Worker events are compacted per HpcRun into fixed-size blocks: sequence numbers,
+times and the mass matrix as packed little-endian arrays plus the block's shared
+mass key index (see sms_api/simulation/worker_event_blocks.py). ``worker_event``
+stays as the ingest buffer for events not yet compacted.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e4b2c6d8f0a1"
+down_revision: str | Sequence[str] | None = "d3f9a1c72b84"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "worker_event_block",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.Column("hpcrun_id", sa.Integer(), nullable=False),
+        sa.Column("correlation_id", sa.String(), nullable=False),
+        sa.Column("first_sequence_number", sa.Integer(), nullable=False),
+        sa.Column("last_sequence_number", sa.Integer(), nullable=False),
+        sa.Column("n_events", sa.Integer(), nullable=False),
+        sa.Column("mass_keys", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("sequence_numbers", sa.LargeBinary(), nullable=False),
+        sa.Column("times", sa.LargeBinary(), nullable=False),
+        sa.Column("mass", sa.LargeBinary(), nullable=False),
+        sa.ForeignKeyConstraint(["hpcrun_id"], ["hpcrun.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_worker_event_block_hpcrun_seq", "worker_event_block", ["hpcrun_id", "first_sequence_number"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_worker_event_block_hpcrun_seq", table_name="worker_event_block")
+    op.drop_table("worker_event_block")
@@ -0,0 +1,68 @@
+"""add output_manifest and output_manifest_file (indexed analysis output listings)
+
+Revision ID: f5c7d9e1a3b2
+Revises: e4b2c6d8f0a1
+Create Date: 2026-10-17
+
+One ``output_manifest`` row per indexed output directory (HPC) or prefix (S3), and
+one ``output_manifest_file`` row per file in it with its size, version (mtime/ETag)
+and parsed variant/lineage_seed/generation, so output listings and partition filters
+are answered from the database (see sms_api/analysis/output_manifest.py).
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f5c7d9e1a3b2"
+down_revision: str | Sequence[str] | None = "e4b2c6d8f0a1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "output_manifest",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("storage", sa.String(), nullable=False),
+        sa.Column("root", sa.String(), nullable=False),
+        sa.Column("experiment_id", sa.String(), nullable=True),
+        sa.Column("source_version", sa.String(), nullable=True),
+        sa.Column("file_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("total_bytes", sa.BigInteger(), server_default="0", nullable=False),
+        sa.Column("indexed_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("storage", "root", name="uq_output_manifest_storage_root"),
+    )
+    op.create_index(op.f("ix_output_manifest_experiment_id"), "output_manifest", ["experiment_id"])
+    op.create_table(
+        "output_manifest_file",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("manifest_id", sa.Integer(), nullable=False),
+        sa.Column("path", sa.String(), nullable=False),
+        sa.Column("extension", sa.String(), nullable=False),
+        sa.Column("size", sa.BigInteger(), nullable=False),
+        sa.Column("version", sa.String(), nullable=True),
+        sa.Column("variant", sa.Integer(), nullable=True),
+        sa.Column("lineage_seed", sa.Integer(), nullable=True),
+        sa.Column("generation", sa.Integer(), nullable=True),
+        sa.Column("agent_id", sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(["manifest_id"], ["output_manifest.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("manifest_id", "path", name="uq_output_manifest_file_path"),
+    )
+    op.create_index(
+        "ix_output_manifest_file_partition",
+        "output_manifest_file",
+        ["manifest_id", "variant", "lineage_seed", "generation"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_output_manifest_file_partition", table_name="output_manifest_file")
+    op.drop_table("output_manifest_file")
+    op.drop_index(op.f("ix_output_manifest_experiment_id"), table_name="output_manifest")
+    op.drop_table("output_manifest")
@@ -1,11 +1,8 @@
 import asyncio
-import gzip
-import io
 import os
 import sys
-import tarfile
 import time
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterator
 from contextlib import asynccontextmanager
 from enum import StrEnum
 from pathlib import Path
@@ -16,15 +13,26 @@ from tqdm import tqdm
 
 from sms_api.analysis.models import AnalysisRun, ExperimentAnalysisDTO, OutputFile, TsvOutputFile
 from sms_api.common.simulator_defaults import SimulationConfigFilename
+from sms_api.common.sse import SSE_MEDIA_TYPE, iter_sse_events
+from sms_api.common.storage.archive import (
+    ARCHIVE_MEDIA_TYPES,
+    ArchiveFormat,
+    archive_filename,
+    archive_member_names,
+    extract_archive,
+)
 from sms_api.simulation.models import (
     HpcRun,
     ParcaDataset,
     RepoDiscovery,
     Simulation,
+    SimulationObservables,
     SimulationRun,
     Simulator,
     SimulatorVersion,
+    WorkerEvent,
 )
+from sms_api.simulation.observable_reader import ARROW_STREAM_MEDIA_TYPE, NDJSON_MEDIA_TYPE, PARQUET_MEDIA_TYPE
 
 
 class BaseUrl(StrEnum):
@@ -40,9 +48,50 @@ class BaseUrl(StrEnum):
 
 DEFAULT_BASE_URL = BaseUrl.LOCAL_8080
 DEFAULT_REQUEST_TIMEOUT = 1000
+# Read timeout of an event stream; the server sends a keepalive well within it.
+EVENT_STREAM_READ_TIMEOUT = 120.0
 
 SUPPORTED_CONFIGS = [name.replace(".json", "") for name in SimulationConfigFilename.values()]
 
+# Wire formats for GET /simulations/{id}/observables, keyed by the client-facing name.
+OBSERVABLE_FORMATS: dict[str, str] = {
+    "json": "application/json",
+    "arrow": ARROW_STREAM_MEDIA_TYPE,
+    "parquet": PARQUET_MEDIA_TYPE,
+}
+
+
+def decode_observables_body(body: bytes, content_type: str) -> SimulationObservables:
+    """Decode an observables response (JSON, Arrow IPC stream or Parquet) into ``SimulationObservables``.
+
+    The columnar formats carry ``time`` + one column per observable, with the
+    scalar fields (simulation id, seed, ...) in the Arrow schema metadata.
+    """
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if media_type == "application/json":
+        return SimulationObservables.model_validate_json(body)
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if media_type == ARROW_STREAM_MEDIA_TYPE:
+        table = pa.ipc.open_stream(body).read_all()
+    elif media_type == PARQUET_MEDIA_TYPE:
+        table = pq.read_table(pa.BufferReader(body))
+    else:
+        raise ValueError(f"Unsupported observables content type: {content_type!r}")
+    meta = {k.decode(): v.decode() for k, v in (table.schema.metadata or {}).items()}
+    columns = table.to_pydict()
+    time = columns.pop("time")
+    return SimulationObservables(
+        simulation_id=int(meta["simulation_id"]),
+        experiment_id=meta["experiment_id"],
+        seed=int(meta["seed"]),
+        store=meta["store"],
+        time=time,
+        series=columns,
+    )
+
 
 def _parse_content_disposition_filename(header_value: str) -> str | None:
     """Return the ``filename`` parameter from a Content-Disposition header, or None.
@@ -64,6 +113,25 @@ def _parse_content_disposition_filename(header_value: str) -> str | None:
     return None
 
 
+def _archive_params(archive_format: ArchiveFormat, level: int | None) -> dict[str, str | int]:
+    params: dict[str, str | int] = {"format": str(archive_format)}
+    if level is not None:
+        params["level"] = level
+    return params
+
+
+def _partition_params(
+    variant: int | None, lineage_seed: int | None, min_generation: int | None, max_generation: int | None
+) -> dict[str, int]:
+    params = {
+        "variant": variant,
+        "lineage_seed": lineage_seed,
+        "min_generation": min_generation,
+        "max_generation": max_generation,
+    }
+    return {name: value for name, value in params.items() if value is not None}
+
+
 @asynccontextmanager
 async def async_client(base_url: BaseUrl, timeout: int = 300) -> AsyncIterator[AsyncClient]:
     try:
@@ -164,9 +232,26 @@ class E2EDataService:
     def get_workflow_log(self, simulation_id: int, truncate: bool = True) -> str:
         return self.submit_get_workflow_log(simulation_id=simulation_id, truncate=truncate)
 
+    def get_observables(
+        self,
+        simulation_id: int,
+        names: list[str] | None = None,
+        seed: int = 0,
+        stride: int = 1,
+        max_points: int | None = None,
+        fmt: str = "arrow",
+    ) -> SimulationObservables:
+        """Fetch observable timeseries; ``fmt`` is the wire format (``arrow`` | ``parquet`` | ``json``)."""
+        return self.submit_get_observables(
+            simulation_id=simulation_id, names=names, seed=seed, stride=stride, max_points=max_points, fmt=fmt
+        )
+
     def get_workflow_status(self, simulation_id: int) -> SimulationRun:
         return self.submit_get_workflow_status(simulation_id=simulation_id)
 
+    def watch_workflow(self, simulation_id: int, worker_events: bool = True) -> Iterator[SimulationRun | WorkerEvent]:
+        return self.submit_watch_workflow_events(simulation_id=simulation_id, worker_events=worker_events)
+
     def cancel_workflow(self, simulation_id: int) -> SimulationRun:
         return self.submit_cancel_workflow(simulation_id=simulation_id)
 
@@ -180,37 +265,54 @@ class E2EDataService:
             raise httpx.HTTPError(f"Server returned {response.status_code}: {response.text}")
         return response.json()  # type: ignore[no-any-return]
 
-    def get_output_data_sync(self, simulation_id: int, dest: Path) -> Path:
+    def get_output_data_sync(
+        self,
+        simulation_id: int,
+        dest: Path,
+        archive_format: ArchiveFormat = ArchiveFormat.TAR_GZ,
+        level: int | None = None,
+    ) -> Path:
         """Download simulation outputs synchronously (no async event loop required)."""
         simulation = self.submit_get_workflow(simulation_id=simulation_id)
         experiment_id = simulation.experiment_id
-        output_path = dest / f"{experiment_id}.tar.gz"
+        output_path = dest / archive_filename(experiment_id, archive_format)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with self.client.stream("POST", f"/api/v1/simulations/{simulation_id}/data") as response:
+        with self.client.stream(
+            "POST",
+            f"/api/v1/simulations/{simulation_id}/data",
+            params=_archive_params(archive_format, level),
+        ) as response:
             if response.status_code != 200:
                 raise httpx.HTTPError(f"Server returned {response.status_code}")
             with open(output_path, "wb") as f:
                 for chunk in response.iter_bytes():
                     f.write(chunk)
-        with tarfile.open(output_path, "r:gz") as tar:
-            tar.extractall(output_path.parent)  # noqa: S202
-        # .stem on .tar.gz gives "foo.tar", so strip both suffixes
+        extract_archive(output_path, output_path.parent, archive_format)
         return output_path.parent / experiment_id
 
-    async def get_output_data(self, simulation_id: int, dest: Path | None = None, timeout: int = 1800) -> Path:
+    async def get_output_data(
+        self,
+        simulation_id: int,
+        dest: Path | None = None,
+        timeout: int = 1800,
+        archive_format: ArchiveFormat = ArchiveFormat.TAR_GZ,
+        level: int | None = None,
+    ) -> Path:
         if dest is None:
             dest = Path(os.getcwd()).absolute()
         archive_path = await self.submit_stream_output_data(
-            simulation_id=simulation_id, output_dirpath=dest, timeout=timeout
+            simulation_id=simulation_id,
+            output_dirpath=dest,
+            timeout=timeout,
+            archive_format=archive_format,
+            level=level,
         )
         if not isinstance(archive_path, Path):
             raise TypeError()
-        with tarfile.open(archive_path, "r:gz") as tar:
-            # Extract to parent dir - the tar already contains the experiment_id directory
-            tar.extractall(archive_path.parent)  # noqa: S202
-        # Return the extracted directory (archive stem is the experiment_id)
-        extracted_dir = archive_path.parent / archive_path.stem
-        return extracted_dir
+        # Extract to parent dir - the tar already contains the experiment_id directory
+        extract_archive(archive_path, archive_path.parent, archive_format)
+        # Return the extracted directory (the archive name minus its format suffix is the experiment_id)
+        return archive_path.parent / archive_path.name.removesuffix(f".{archive_format}")
 
     # -- Parca --
 
@@ -234,6 +336,37 @@ class E2EDataService:
     def get_analysis_plots(self, analysis_id: int) -> list[OutputFile]:
         return self.submit_get_analysis_plots(analysis_id=analysis_id)
 
+    def get_analysis_data(
+        self,
+        analysis_id: int,
+        variant: int | None = None,
+        lineage_seed: int | None = None,
+        min_generation: int | None = None,
+        max_generation: int | None = None,
+    ) -> list[TsvOutputFile]:
+        return list(
+            self.iter_analysis_data(
+                analysis_id=analysis_id,
+                variant=variant,
+                lineage_seed=lineage_seed,
+                min_generation=min_generation,
+                max_generation=max_generation,
+            )
+        )
+
+    def iter_analysis_data(
+        self,
+        analysis_id: int,
+        variant: int | None = None,
+        lineage_seed: int | None = None,
+        min_generation: int | None = None,
+        max_generation: int | None = None,
+    ) -> Iterator[TsvOutputFile]:
+        return self.submit_stream_analysis_data(
+            analysis_id=analysis_id,
+            params=_partition_params(variant, lineage_seed, min_generation, max_generation),
+        )
+
     # -- Low-level HTTP methods: Simulator --
 
     def submit_get_latest_simulator(self, repo_url: str | None = None, branch: str | None = None) -> Simulator:
@@ -389,6 +522,27 @@ class E2EDataService:
         except Exception as e:
             raise httpx.HTTPError(f"Could not load status for simulation {simulation_id}: {e}") from e
 
+    def submit_watch_workflow_events(
+        self, simulation_id: int, worker_events: bool = True
+    ) -> Iterator[SimulationRun | WorkerEvent]:
+        """Yield status updates (and worker events) pushed by the server until the run is terminal."""
+        timeout = httpx.Timeout(self.client.timeout.connect, read=EVENT_STREAM_READ_TIMEOUT)
+        with self.client.stream(
+            "GET",
+            f"/api/v1/simulations/{simulation_id}/events",
+            params={"worker_events": worker_events},
+            headers={"Accept": SSE_MEDIA_TYPE},
+            timeout=timeout,
+        ) as response:
+            if response.status_code != 200:
+                body = response.read().decode(errors="replace")
+                raise httpx.HTTPError(f"Server returned {response.status_code}: {body}")
+            for event in iter_sse_events(response.iter_lines()):
+                if event.event == "status":
+                    yield SimulationRun.model_validate_json(event.data)
+                elif event.event == "worker_event":
+                    yield WorkerEvent.model_validate_json(event.data)
+
     def submit_cancel_workflow(self, simulation_id: int) -> SimulationRun:
         try:
             response = self.client.delete(url=f"/api/v1/simulations/{simulation_id}/cancel")
@@ -411,6 +565,36 @@ class E2EDataService:
         except Exception as e:
             raise httpx.HTTPError(f"Could not load output data for simulation {simulation_id}: {e}") from e
 
+    def submit_get_observables(
+        self,
+        simulation_id: int,
+        names: list[str] | None = None,
+        seed: int = 0,
+        stride: int = 1,
+        max_points: int | None = None,
+        fmt: str = "arrow",
+    ) -> SimulationObservables:
+        if fmt not in OBSERVABLE_FORMATS:
+            raise ValueError(f"Unknown observables format {fmt!r}; expected one of {sorted(OBSERVABLE_FORMATS)}")
+        try:
+            params: dict[str, str | int] = {"seed": seed, "stride": stride}
+            if names:
+                params["names"] = ",".join(names)
+            if max_points is not None:
+                params["max_points"] = max_points
+            response = self.client.get(
+                url=f"/api/v1/simulations/{simulation_id}/observables",
+                params=params,
+                headers={"Accept": OBSERVABLE_FORMATS[fmt]},
+            )
+            if response.status_code != 200:
+                raise httpx.HTTPError(f"Server returned {response.status_code}: {response.text}")  # noqa: TRY301
+            return decode_observables_body(response.content, response.headers.get("content-type", ""))
+        except httpx.HTTPError:
+            raise
+        except Exception as e:
+            raise httpx.HTTPError(f"Could not load observables for simulation {simulation_id}: {e}") from e
+
     def submit_get_workflow(self, simulation_id: int) -> Simulation:
         try:
             simulation = self.client.get(url=f"/api/v1/simulations/{simulation_id}")
@@ -545,20 +729,69 @@ class E2EDataService:
         except Exception as e:
             raise httpx.HTTPError(f"Could not load analysis plots for id {analysis_id}") from e
 
+    def submit_stream_analysis_data(
+        self, analysis_id: int, params: dict[str, int] | None = None
+    ) -> Iterator[TsvOutputFile]:
+        """Yield the analysis's output files one NDJSON line at a time, as the server fetches them.
+
+        The server gzips the stream when asked (httpx sends ``Accept-Encoding: gzip`` and
+        decodes it transparently), so only the file being parsed is held in memory.
+        """
+        with self.client.stream(
+            "GET",
+            f"/api/v1/analyses/{analysis_id}/data",
+            params=params,
+            headers={"Accept": NDJSON_MEDIA_TYPE},
+        ) as response:
+            if response.status_code != 200:
+                body = response.read().decode(errors="replace")
+                raise httpx.HTTPError(f"Server returned {response.status_code}: {body}")
+            for line in response.iter_lines():
+                if line:
+                    yield TsvOutputFile.model_validate_json(line)
+
+    async def submit_astream_analysis_data(
+        self, analysis_id: int, params: dict[str, int] | None = None, timeout: int = 1800
+    ) -> AsyncIterator[TsvOutputFile]:
+        """Async variant of ``submit_stream_analysis_data``."""
+        async with (
+            async_client(base_url=self.base_url, timeout=timeout) as client,
+            client.stream(
+                "GET",
+                f"/api/v1/analyses/{analysis_id}/data",
+                params=params,
+                headers={"Accept": NDJSON_MEDIA_TYPE},
+            ) as response,
+        ):
+            if response.status_code != 200:
+                body = await response.aread()
+                raise httpx.HTTPError(f"Server returned {response.status_code}: {body.decode(errors='replace')}")
+            async for line in response.aiter_lines():
+                if line:
+                    yield TsvOutputFile.model_validate_json(line)
+
     # -- Streaming output download --
 
     async def submit_stream_output_data(  # noqa: C901
-        self, simulation_id: int, show_progress: bool = True, output_dirpath: Path | None = None, timeout: int = 1800
+        self,
+        simulation_id: int,
+        show_progress: bool = True,
+        output_dirpath: Path | None = None,
+        timeout: int = 1800,
+        archive_format: ArchiveFormat = ArchiveFormat.TAR_GZ,
+        level: int | None = None,
     ) -> set[str] | Path:
         """
-        Download simulation output data as a streamable tar.gz archive.
+        Download simulation output data as a streamable archive.
 
         Args:
             simulation_id: The ID of the simulation to download data for.
             show_progress: If True, display a tqdm progress bar during download.
             output_dirpath: If provided, stream directly to a file
-            found at: <OUTPUT_PATH>/<EXPERIMENT_ID>.tar.gz (memory-efficient
+            found at: <OUTPUT_PATH>/<EXPERIMENT_ID>.<FORMAT> (memory-efficient
                 for large archives). If None, keep in memory and return file basenames.
+            archive_format: Archive codec to request (tar.gz, tar.zst or tar).
+            level: Compression level to request (server default if None).
 
         Returns:
             If output_path is None: Set of archived file basenames.
@@ -574,7 +807,11 @@ class E2EDataService:
 
             try:
                 # Use stream=True to test actual streaming behavior
-                async with client.stream("POST", f"/api/v1/simulations/{simulation_id}/data") as response:
+                async with client.stream(
+                    "POST",
+                    f"/api/v1/simulations/{simulation_id}/data",
+                    params=_archive_params(archive_format, level),
+                ) as response:
                     # Stop spinner once we get a response
                     if spinner_task:
                         spinner_task.cancel()
@@ -591,9 +828,10 @@ class E2EDataService:
                         raise httpx.HTTPError(message=body.decode(errors="replace"))  # noqa: TRY301
 
                     # Validate headers
-                    if response.headers["content-type"] != "application/gzip":
+                    expected_media_type = ARCHIVE_MEDIA_TYPES[archive_format]
+                    if response.headers["content-type"] != expected_media_type:
                         raise httpx.HTTPError(  # noqa: TRY301
-                            f"Unexpected MIME type for archive. Expected: {'application/gzip'}; "
+                            f"Unexpected MIME type for archive. Expected: {expected_media_type}; "
                             f"Got: {response.headers['content-type']}"
                         )
 
@@ -672,18 +910,11 @@ class E2EDataService:
                     spinner_task.cancel()
                 raise
 
-        # If we got here, output_path was None - process in-memory content
-        # Validate it's valid gzip
-        decompressed = gzip.decompress(content)
-
-        # Validate it's a valid tar archive with expected structure
-        tar_buffer = io.BytesIO(decompressed)
-        with tarfile.open(fileobj=tar_buffer, mode="r") as tar:
-            archived_names = set(tar.getnames())
-            # Extract basenames from archived files for comparison
-            archived_basenames = {Path(name).name for name in archived_names}
-
-        return archived_basenames
+        # If we got here, output_path was None - process in-memory content.
+        # Validate it decodes as a tar archive in the requested format
+        archived_names = archive_member_names(content, archive_format)
+        # Extract basenames from archived files for comparison
+        return {Path(name).name for name in archived_names}
 
     @staticmethod
     async def _show_spinner(message: str) -> None:
@@ -11,13 +11,16 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from sms_api.common import StrEnumBase
+from sms_api.common.storage.archive import ArchiveFormat, resolve_compression_level
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
     from rich.console import Console
 
+    from app.app_data_service import E2EDataService
     from sms_api.common.storage.file_service_s3 import FileServiceS3
+    from sms_api.simulation.models import SimulationRun
 
 import httpx
 import typer
@@ -269,6 +272,53 @@ def main() -> None:
 # -- Info/Help --
 
 
+_TERMINAL_SIMULATION_STATUSES = ("completed", "failed", "cancelled", "unknown")
+
+
+def _follow_simulation(
+    console: Console, data_service: E2EDataService, simulation_id: int, poll_interval: int = 30
+) -> SimulationRun | None:
+    """Print status transitions and progress of a simulation until it finishes; return its final status.
+
+    Subscribes to the server's event stream; if the stream is unavailable (e.g. an older
+    server) or drops, falls back to polling the status every ``poll_interval`` seconds.
+    """
+    import time
+
+    from sms_api.simulation.models import SimulationRun
+
+    start = time.monotonic()
+    run: SimulationRun | None = None
+    try:
+        for event in data_service.watch_workflow(simulation_id=simulation_id):
+            elapsed = int(time.monotonic() - start)
+            if isinstance(event, SimulationRun):
+                run = event
+                status = run.status.value
+                console.print(f"  [{elapsed}s] status: [{status_style(status)}]{status}[/]")
+            else:
+                total_mass = sum(event.mass.values())
+                console.print(f"  [{elapsed}s] [memphis.dim]t={event.time:g}s  mass={total_mass:.4g}[/]")
+        if run is not None and run.status.value in _TERMINAL_SIMULATION_STATUSES:
+            return run
+        console.print("  [memphis.dim]Event stream ended; polling instead.[/]")
+    except (httpx.HTTPError, ValueError) as e:
+        console.print(f"  [memphis.dim]Event stream unavailable ({e}); polling instead.[/]")
+
+    status = run.status.value if run is not None else "running"
+    while status not in _TERMINAL_SIMULATION_STATUSES:
+        time.sleep(poll_interval)
+        elapsed = int(time.monotonic() - start)
+        try:
+            run = data_service.get_workflow_status(simulation_id=simulation_id)
+            status = run.status.value
+        except Exception as e:
+            console.print(f"  [{elapsed}s] [memphis.error]error: {e}[/]")
+            continue
+        console.print(f"  [{elapsed}s] status: [{status_style(status)}]{status}[/]")
+    return run
+
+
 def _show_group_help(group_name: str) -> None:
     """Print the banner then display help for *group_name* (a sub-typer)."""
     import click
@@ -497,7 +547,6 @@ def simulation_run(
     base_url: ApiBaseUrl = Option(default=API_BASE_URL, help="API server base URL."),
 ) -> None:
     import json as _json
-    import time
 
     from rich.panel import Panel
 
@@ -565,22 +614,10 @@ def simulation_run(
         console.print(f"[memphis.hint]Download data:[/]   atlantis simulation outputs {sim_id} --dest ./debug")
         return
 
-    # Poll until done
-    console.print("\n[memphis.info]Polling simulation status...[/]")
-    poll_interval = 30
-    elapsed = 0
-    status = "running"
-    run = None
-    while status not in ("completed", "failed", "cancelled", "unknown"):
-        time.sleep(poll_interval)
-        elapsed += poll_interval
-        try:
-            run = data_service.get_workflow_status(simulation_id=simulation.database_id)
-            status = run.status.value
-        except Exception as e:
-            console.print(f"  [{elapsed}s] [memphis.error]error: {e}[/]")
-            continue
-        console.print(f"  [{elapsed}s] status: [{status_style(status)}]{status}[/]")
+    # Follow until done
+    console.print("\n[memphis.info]Following simulation status...[/]")
+    run = _follow_simulation(console, data_service, simulation.database_id)
+    status = run.status.value if run is not None else "unknown"
 
     error_detail = f"\n{run.error_message}" if run and run.error_message else ""
     console.print(
@@ -697,31 +734,17 @@ def simulation_status(
     poll: bool = Option(default=False, help="Poll until simulation completes."),
     base_url: ApiBaseUrl = Option(default=API_BASE_URL, help="API server base URL."),
 ) -> None:
-    import time
-
     from sms_api.common.handlers.simulations import workflow_log
 
     if not poll:
         workflow_log(simulation_id=simulation_id, base_url=base_url)
         return
 
-    # Poll until terminal state
+    # Follow until terminal state
     console = get_console()
     data_service = get_data_service(base_url=base_url)
-    console.print("[memphis.info]Polling...[/]")
-    poll_interval = 30
-    elapsed = 0
-    status = "running"
-    while status not in ("completed", "failed", "cancelled", "unknown"):
-        time.sleep(poll_interval)
-        elapsed += poll_interval
-        try:
-            run = data_service.get_workflow_status(simulation_id=simulation_id)
-            status = run.status.value
-        except Exception as e:
-            console.print(f"  [{elapsed}s] [memphis.error]error: {e}[/]")
-            continue
-        console.print(f"  [{elapsed}s] status: [{status_style(status)}]{status}[/]")
+    console.print("[memphis.info]Following...[/]")
+    _follow_simulation(console, data_service, simulation_id)
 
     workflow_log(simulation_id=simulation_id, base_url=base_url)
 
@@ -753,16 +776,33 @@ def simulation_log(
         console.print(f"[memphis.error]Error: {e}[/]")
 
 
-@simulation_cli.command("outputs", help="Download simulation output data as a tar.gz archive.")
+@simulation_cli.command("outputs", help="Download simulation output data as an archive (tar.gz, tar.zst or tar).")
 def simulation_outputs(
     simulation_id: int = Argument(help="Simulation database ID."),
     dest: str | None = Option(default=None, help="Destination directory. Defaults to ./simulation_id_<ID>."),
+    archive_format: ArchiveFormat = Option(
+        ArchiveFormat.TAR_GZ,
+        "--format",
+        help="Archive codec: tar.zst (fastest), tar.gz, or tar (no compression; best for zarr stores).",
+    ),
+    level: int | None = Option(
+        default=None, help="Compression level (1-9 for tar.gz, 1-22 for tar.zst). Defaults to the server's choice."
+    ),
     base_url: ApiBaseUrl = Option(default=API_BASE_URL, help="API server base URL."),
 ) -> None:
     console = get_console()
+    try:
+        resolve_compression_level(archive_format, level)
+    except ValueError as e:
+        console.print(f"[memphis.error]Error: {e}[/]")
+        raise typer.Exit(1) from e
     data_service = get_data_service(base_url=base_url)
     outdir = Path(dest) if dest is not None else Path(f"simulation_id_{simulation_id}")
-    archive_dir = asyncio.run(data_service.get_output_data(simulation_id=simulation_id, dest=outdir))
+    archive_dir = asyncio.run(
+        data_service.get_output_data(
+            simulation_id=simulation_id, dest=outdir, archive_format=archive_format, level=level
+        )
+    )
     console.print(f"[memphis.success]Saved simulation outputs to:[/] {archive_dir!s}")
 
 
@@ -865,6 +905,41 @@ def analysis_plots(
         display_json(plot.model_dump(), console)
 
 
+@analysis_cli.command("data", help="Download the output files (TSV/CSV/TXT/HTML) of a completed analysis.")
+def analysis_data(
+    analysis_id: int = Argument(help="Analysis database ID."),
+    dest: Path = Option(default=Path("."), help="Directory to write the files to (one subdirectory per partition)."),
+    variant: int | None = Option(default=None, help="Only files of this variant."),
+    lineage_seed: int | None = Option(default=None, help="Only files of this lineage seed."),
+    min_generation: int | None = Option(default=None, help="Only files of this generation or later."),
+    max_generation: int | None = Option(default=None, help="Only files of this generation or earlier."),
+    base_url: ApiBaseUrl = Option(default=API_BASE_URL, help="API server base URL."),
+) -> None:
+    console = get_console()
+    data_service = get_data_service(base_url=base_url)
+    outputs = data_service.iter_analysis_data(
+        analysis_id=analysis_id,
+        variant=variant,
+        lineage_seed=lineage_seed,
+        min_generation=min_generation,
+        max_generation=max_generation,
+    )
+    n_files = 0
+    with console.status(f"[memphis.spinner]Fetching outputs of analysis {analysis_id}...") as status:
+        for output in outputs:
+            partition = [f"variant={output.variant}"]
+            if output.lineage_seed is not None:
+                partition.append(f"lineage_seed={output.lineage_seed}")
+            if output.generation is not None:
+                partition.append(f"generation={output.generation}")
+            path = dest.joinpath(*partition, Path(output.filename).name)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(output.content or "")
+            n_files += 1
+            status.update(f"[memphis.spinner]Fetched {n_files} files of analysis {analysis_id} ({output.filename})")
+    console.print(f"[memphis.label]Wrote {n_files} files to[/] {dest}")
+
+
 # -- Compose (process-bigraph) commands --
 
 
@@ -1,10 +1,8 @@
 # ================================= new implementation ================================================= #
-import asyncio
 import dataclasses
 import hashlib
 import json
 import logging
-import re
 import tempfile
 from pathlib import Path
 from textwrap import dedent
@@ -19,13 +17,16 @@ from sms_api.analysis.models import (
     TsvOutputFile,
     infer_n_tp_from_tsv,
 )
+from sms_api.analysis.output_manifest import hpc_output_files, parse_partition_metadata
+from sms_api.analysis.status_watcher import AnalysisStatusWatcher
 from sms_api.common.hpc.slurm_service import SlurmService
 from sms_api.common.models import JobStatus, SSHTarget
 from sms_api.common.ssh.ssh_service import SSHSession
 from sms_api.common.storage.file_paths import HPCFilePath
 from sms_api.common.utils import capture_slurm_script
 from sms_api.config import Settings
-from sms_api.dependencies import get_ssh_session_service
+from sms_api.dependencies import get_analysis_status_watcher, get_ssh_session_service
+from sms_api.simulation.database_service import DatabaseService
 from sms_api.simulation.hpc_utils import get_slurm_submit_file, get_slurmjob_name
 
 logger = logging.getLogger(__name__)
@@ -34,6 +35,7 @@ logger.setLevel(logging.INFO)
 
 MAX_ANALYSIS_CPUS = 4
 MAX_ANALYSIS_MEM = "24GB"
+ANALYSIS_OUTPUT_EXTENSIONS = ("txt", "tsv", "csv", "html")  # text-based outputs that can be returned
 
 
 @dataclasses.dataclass
@@ -58,9 +60,11 @@ def normalize_json(obj: Any) -> Any:
 
 class AnalysisServiceSlurm:
     env: Settings
+    status_watcher: AnalysisStatusWatcher | None
 
-    def __init__(self, env: Settings):
+    def __init__(self, env: Settings, status_watcher: AnalysisStatusWatcher | None = None):
         self.env = env
+        self.status_watcher = status_watcher  # defaults to the process-wide watcher
 
     @property
     def slurm_service(self) -> SlurmService:
@@ -158,21 +162,22 @@ class AnalysisServiceSlurm:
         )
         return slurmjob_name, slurmjob_id, analysis_config
 
-    async def poll_status(self, dto: ExperimentAnalysisDTO, ssh: SSHSession) -> AnalysisRun:
-        db_id = dto.database_id
-        identifier = dto.job_id
-        if identifier is None:
-            raise ValueError("There is no job id yet associated with this record.")
+    async def wait_for_completion(self, dto: ExperimentAnalysisDTO) -> AnalysisRun:
+        """Wait until the analysis's SLURM job finishes; raises AnalysisJobFailedException (with its log) if it fails.
 
-        await asyncio.sleep(3)
-        run = await self.get_analysis_status(job_id=identifier, db_id=db_id, ssh=ssh)
-        while run.status.lower() not in ["completed", "failed"]:
-            await asyncio.sleep(3)
-            run = await self.get_analysis_status(job_id=identifier, db_id=db_id, ssh=ssh)
-        if run.status.lower() == "failed":
+        The job is registered with the shared :class:`AnalysisStatusWatcher`, which batches
+        the status queries of every analysis in flight; no SSH session is held while waiting.
+        """
+        if dto.job_id is None:
+            raise ValueError("There is no job id yet associated with this record.")
+        status_watcher = self.status_watcher or get_analysis_status_watcher()
+        if status_watcher is None:
+            raise RuntimeError("Analysis status watcher is not initialized")
+        run = await status_watcher.wait(analysis_id=dto.database_id, job_id=dto.job_id)
+        if run.status != JobStatus.COMPLETED:
             # Fetch the job log for error details
-            error_log = await self._fetch_job_log(job_name=dto.job_name, ssh=ssh)
-            run.error_log = error_log
+            async with get_ssh_session_service(SSHTarget.SLURM).session() as ssh:
+                run.error_log = await self._fetch_job_log(job_name=dto.job_name, ssh=ssh)
             raise AnalysisJobFailedException(run=run)
         return run
 
@@ -190,20 +195,31 @@ class AnalysisServiceSlurm:
             logger.warning(f"Failed to fetch job log for {job_name}: {e}")
             return f"Error fetching log: {e}"
 
-    async def get_available_output_paths(self, remote_analysis_outdir: HPCFilePath) -> list[HPCFilePath]:
+    async def get_available_output_paths(
+        self,
+        remote_analysis_outdir: HPCFilePath,
+        db_service: DatabaseService | None = None,
+        refresh: bool = False,
+    ) -> list[HPCFilePath]:
         """Get available output file paths from the remote analysis directory.
 
         Only returns files with text-based extensions that can be read and returned.
+        With ``db_service`` the listing comes from the directory's output manifest
+        (indexed on first use, or re-indexed when ``refresh`` — e.g. right after the job completed).
         """
+        if db_service is not None:
+            files = await hpc_output_files(
+                db_service, remote_analysis_outdir, extensions=ANALYSIS_OUTPUT_EXTENSIONS, refresh=refresh
+            )
+            return [HPCFilePath(remote_path=Path(file.path)) for file in files]
         cmd = f'find "{remote_analysis_outdir!s}" -type f'
         async with get_ssh_session_service(SSHTarget.SLURM).session() as ssh:
             ret, out, err = await ssh.run_command(cmd)
         # Filter to only include text-based file types
-        accepted_extensions = ["txt", "tsv", "csv", "html"]
         paths = []
         for fp in out.splitlines():
             extension = fp.split(".")[-1].lower()
-            if extension in accepted_extensions:
+            if extension in ANALYSIS_OUTPUT_EXTENSIONS:
                 paths.append(HPCFilePath(remote_path=Path(fp)))
         return paths
 
@@ -371,23 +387,3 @@ def generate_slurm_script(
         ### optionally, remove uploaded fp
         rm -f \"$config_fp\"
     """)
-
-
-# Regex for vEcoli partition directory segments: key=value or key[value]
-_PARTITION_RE = re.compile(r"(variant|lineage_seed|generation|agent_id)[=\[](\d+)\]?")
-
-
-def parse_partition_metadata(path: Path) -> dict[str, int]:
-    """Extract variant/lineage_seed/generation/agent_id from vEcoli partition directory paths.
-
-    vEcoli analysis output paths look like:
-        .../single/variant[0]/lineage_seed[0]/generation[5]/ptools_rna.tsv
-    or sometimes:
-        .../variant=0/lineage_seed=0/generation=5/ptools_rna.tsv
-    """
-    metadata: dict[str, int] = {}
-    for part in path.parts:
-        m = _PARTITION_RE.match(part)
-        if m:
-            metadata[m.group(1)] = int(m.group(2))
-    return metadata
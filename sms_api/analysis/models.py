@@ -1,3 +1,4 @@
+import datetime
 import json
 import pathlib
 import random
@@ -295,6 +296,47 @@ class ExperimentAnalysisDTO(BaseModel):
     error_message: str | None = None
 
 
+class OutputStorage(StrEnumBase):
+    """Where the files of an output manifest live."""
+
+    HPC = "hpc"  # paths on the SLURM cluster filesystem
+    S3 = "s3"  # object keys in the configured bucket
+
+
+class OutputManifestEntry(BaseModel):
+    """One indexed output file, with the partition parsed from its path (see ``parse_partition_metadata``)."""
+
+    path: str  # absolute HPC path or S3 key
+    size: int
+    version: str | None = None  # mtime (HPC) or ETag (S3); changes when the file is rewritten
+    variant: int | None = None
+    lineage_seed: int | None = None
+    generation: int | None = None
+    agent_id: int | None = None
+
+
+class OutputManifest(BaseModel):
+    """The indexed state of one output directory or S3 prefix (``root``)."""
+
+    database_id: int
+    storage: OutputStorage
+    root: str
+    experiment_id: str | None = None
+    source_version: str | None = None  # e.g. the analysis row's last_updated when it was indexed
+    file_count: int = 0
+    total_bytes: int = 0
+    indexed_at: datetime.datetime
+
+
+class PartitionFilter(BaseModel):
+    """Restricts an output listing to a partition range; unset fields match everything."""
+
+    variant: int | None = None
+    lineage_seed: int | None = None
+    min_generation: int | None = None
+    max_generation: int | None = None
+
+
 class AnalysisRun(BaseModel):
     id: int
     status: JobStatus
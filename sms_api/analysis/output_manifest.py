@@ -0,0 +1,224 @@
+"""Persisted index of the output files under an output directory (HPC) or prefix (S3).
+
+Listing analysis outputs used to walk storage on every request: ``find <dir> -type f``
+over SSH on the SLURM cluster, a full listing of ``result_uri`` on S3. A manifest keeps
+each file's path, size, version (mtime on the HPC, ETag on S3) and the partition
+parsed from its path (variant/lineage_seed/generation, see ``parse_partition_metadata``)
+in ``output_manifest_file``, so a listing — with a partition filter such as
+``min_generation=5`` — is one indexed query.
+
+A manifest is built when its run completes (:class:`OutputManifestIndexer` for SLURM
+simulations, the analysis handlers for analyses) or on first use, and kept current
+incrementally: storage is listed again only once the manifest is older than
+``output_manifest_max_age_seconds`` or its source changed (e.g. an analysis row was
+rewritten), and only the added, changed and removed files are written.
+"""
+
+import asyncio
+import contextlib
+import datetime
+import logging
+import re
+import shlex
+from asyncio import Queue
+from collections.abc import Awaitable, Callable, Sequence
+from pathlib import Path
+
+from sms_api.analysis.models import OutputManifest, OutputManifestEntry, OutputStorage, PartitionFilter
+from sms_api.common.models import JobBackend, JobStatus, SSHTarget
+from sms_api.common.storage.file_paths import HPCFilePath, S3FilePath
+from sms_api.config import get_settings
+from sms_api.dependencies import get_file_service, get_ssh_session_service
+from sms_api.simulation.database_service import DatabaseService
+from sms_api.simulation.models import JobType
+from sms_api.simulation.status_watcher import JobStatusChange, JobStatusWatcher
+
+logger = logging.getLogger(__name__)
+
+# size, mtime (seconds since the epoch) and path of every file, tab-separated
+_FIND_PRINTF = r"%s\t%T@\t%p\n"
+
+# Regex for vEcoli partition directory segments: key=value or key[value]
+_PARTITION_RE = re.compile(r"(variant|lineage_seed|generation|agent_id)[=\[](\d+)\]?")
+
+
+def parse_partition_metadata(path: Path) -> dict[str, int]:
+    """Extract variant/lineage_seed/generation/agent_id from vEcoli partition directory paths.
+
+    vEcoli analysis output paths look like:
+        .../single/variant[0]/lineage_seed[0]/generation[5]/ptools_rna.tsv
+    or sometimes:
+        .../variant=0/lineage_seed=0/generation=5/ptools_rna.tsv
+    """
+    metadata: dict[str, int] = {}
+    for part in path.parts:
+        m = _PARTITION_RE.match(part)
+        if m:
+            metadata[m.group(1)] = int(m.group(2))
+    return metadata
+
+
+def manifest_entry(path: str, size: int, version: str | None) -> OutputManifestEntry:
+    metadata = parse_partition_metadata(Path(path))
+    return OutputManifestEntry(
+        path=path,
+        size=size,
+        version=version,
+        variant=metadata.get("variant"),
+        lineage_seed=metadata.get("lineage_seed"),
+        generation=metadata.get("generation"),
+        agent_id=metadata.get("agent_id"),
+    )
+
+
+async def list_hpc_outputs(remote_dir: HPCFilePath) -> list[OutputManifestEntry]:
+    """Every file under ``remote_dir`` on the SLURM cluster (one ``find`` over SSH)."""
+    cmd = f"find {shlex.quote(str(remote_dir))} -type f -printf {shlex.quote(_FIND_PRINTF)}"
+    async with get_ssh_session_service(SSHTarget.SLURM).session() as ssh:
+        _, out, _ = await ssh.run_command(cmd)
+    entries = []
+    for line in out.splitlines():
+        size, mtime, path = line.split("\t", 2)
+        entries.append(manifest_entry(path, int(size), mtime))
+    return entries
+
+
+async def list_s3_outputs(prefix: S3FilePath) -> list[OutputManifestEntry]:
+    """Every object under ``prefix`` in the configured bucket."""
+    file_service = get_file_service()
+    if file_service is None:
+        raise RuntimeError("File service is not initialized")
+    listing = await file_service.get_listing(prefix)
+    return [manifest_entry(item.Key, item.Size, item.ETag) for item in listing]
+
+
+def _is_stale(manifest: OutputManifest, source_version: str | None) -> bool:
+    if source_version is not None and manifest.source_version != source_version:
+        return True
+    age = datetime.datetime.now(datetime.UTC).replace(tzinfo=None) - manifest.indexed_at
+    return age.total_seconds() >= get_settings().output_manifest_max_age_seconds
+
+
+async def _manifest_files(
+    db_service: DatabaseService,
+    storage: OutputStorage,
+    root: str,
+    list_outputs: Callable[[], Awaitable[list[OutputManifestEntry]]],
+    extensions: Sequence[str] | None,
+    partition: PartitionFilter | None,
+    experiment_id: str | None,
+    source_version: str | None,
+    refresh: bool,
+) -> list[OutputManifestEntry]:
+    manifest = await db_service.get_output_manifest(storage, root)
+    if refresh or manifest is None or _is_stale(manifest, source_version):
+        entries = await list_outputs()
+        await db_service.sync_output_manifest(
+            storage, root, entries, experiment_id=experiment_id, source_version=source_version
+        )
+    files = await db_service.list_output_manifest_files(storage, root, extensions=extensions, partition=partition)
+    return files or []
+
+
+async def hpc_output_files(
+    db_service: DatabaseService,
+    remote_dir: HPCFilePath,
+    extensions: Sequence[str] | None = None,
+    partition: PartitionFilter | None = None,
+    experiment_id: str | None = None,
+    refresh: bool = False,
+) -> list[OutputManifestEntry]:
+    """Indexed files under ``remote_dir``, indexing it first if it is new or stale (or ``refresh``)."""
+    return await _manifest_files(
+        db_service,
+        OutputStorage.HPC,
+        str(remote_dir),
+        lambda: list_hpc_outputs(remote_dir),
+        extensions=extensions,
+        partition=partition,
+        experiment_id=experiment_id,
+        source_version=None,
+        refresh=refresh,
+    )
+
+
+async def s3_output_files(
+    db_service: DatabaseService,
+    prefix: S3FilePath,
+    extensions: Sequence[str] | None = None,
+    partition: PartitionFilter | None = None,
+    experiment_id: str | None = None,
+    source_version: str | None = None,
+    refresh: bool = False,
+) -> list[OutputManifestEntry]:
+    """Indexed objects under ``prefix``; re-listed when stale or when ``source_version`` differs
+    from the one it was indexed at."""
+    return await _manifest_files(
+        db_service,
+        OutputStorage.S3,
+        str(prefix),
+        lambda: list_s3_outputs(prefix),
+        extensions=extensions,
+        partition=partition,
+        experiment_id=experiment_id,
+        source_version=source_version,
+        refresh=refresh,
+    )
+
+
+def simulation_analyses_dir(experiment_id: str) -> HPCFilePath:
+    """Where a SLURM simulation's workflow writes its analysis outputs."""
+    return get_settings().hpc_sim_base_path / experiment_id / "analyses"
+
+
+class OutputManifestIndexer:
+    """Indexes the analysis outputs of each SLURM simulation as it reaches COMPLETED.
+
+    Subscribes to the :class:`JobStatusWatcher`, so the ``find`` runs once per finished
+    simulation instead of on the first (and every later) request for its outputs.
+    """
+
+    def __init__(self, database_service: DatabaseService, status_watcher: JobStatusWatcher, queue_size: int = 1000):
+        self.database_service = database_service
+        self.status_watcher = status_watcher
+        self._queue: Queue[JobStatusChange] = Queue(maxsize=queue_size)
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        self.status_watcher.subscribe(self._queue)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        self.status_watcher.unsubscribe(self._queue)
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def index_simulation(self, simulation_id: int) -> OutputManifest | None:
+        simulation = await self.database_service.get_simulation(simulation_id=simulation_id)
+        if simulation is None:
+            return None
+        remote_dir = simulation_analyses_dir(simulation.experiment_id)
+        entries = await list_hpc_outputs(remote_dir)
+        return await self.database_service.sync_output_manifest(
+            OutputStorage.HPC, str(remote_dir), entries, experiment_id=simulation.experiment_id
+        )
+
+    async def _run(self) -> None:
+        while True:
+            change = await self._queue.get()
+            hpc_run = change.hpc_run
+            if (
+                hpc_run.status != JobStatus.COMPLETED
+                or hpc_run.job_type != JobType.SIMULATION
+                or hpc_run.job_id.backend != JobBackend.SLURM
+            ):
+                continue
+            try:
+                await self.index_simulation(hpc_run.ref_id)
+            except Exception:
+                logger.exception(f"Could not index the outputs of simulation {hpc_run.ref_id}")
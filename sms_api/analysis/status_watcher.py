@@ -0,0 +1,176 @@
+"""Shared status watcher for SLURM analysis jobs.
+
+``POST /analyses`` waits for the SLURM job it submitted. Instead of every request
+polling SLURM on its own SSH session, requests register their job with one
+:class:`AnalysisStatusWatcher` and await a future that resolves when the job reaches a
+terminal status (or subscribe a queue to see every transition).
+
+The watcher queries all registered jobs that are due in one batched
+:class:`JobStatusSource` call (one ``squeue`` for any number of analyses). Each job
+is re-polled on an exponential backoff — ``min_interval_seconds``, doubling up to
+``max_interval_seconds`` while its status is unchanged, back to the minimum when it
+changes — so an hour-long analysis costs a few dozen queries, shared with every other
+analysis in flight.
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+from asyncio import Future, Queue
+from dataclasses import dataclass
+
+from sms_api.analysis.models import AnalysisRun
+from sms_api.common.hpc.job_status_sources import JobStatusSource
+from sms_api.common.models import JobId, JobStatus
+from sms_api.simulation.status_watcher import TERMINAL_JOB_STATUSES
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _WatchedAnalysis:
+    analysis_id: int
+    job_id: JobId
+    future: Future[AnalysisRun]
+    interval: float  # current backoff
+    next_poll: float  # time.monotonic() of the next status query
+    status: JobStatus | None = None
+
+
+class AnalysisStatusWatcher:
+    """Polls the SLURM jobs of registered analyses in batches until each is terminal.
+
+    The polling task starts with the first registration (it needs the running event
+    loop) and idles while nothing is registered.
+    """
+
+    def __init__(
+        self,
+        source: JobStatusSource,
+        min_interval_seconds: float = 2.0,
+        max_interval_seconds: float = 60.0,
+        backoff_factor: float = 2.0,
+    ) -> None:
+        self.source = source
+        self.min_interval_seconds = min_interval_seconds
+        self.max_interval_seconds = max_interval_seconds
+        self.backoff_factor = backoff_factor
+        self._watched: dict[int, _WatchedAnalysis] = {}
+        self._listeners: dict[Queue[AnalysisRun], int | None] = {}
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def watch(self, analysis_id: int, job_id: int) -> Future[AnalysisRun]:
+        """Register the SLURM job of an analysis; the future resolves with its terminal ``AnalysisRun``.
+
+        Registering an analysis that is already watched returns the same future.
+        """
+        watched = self._watched.get(analysis_id)
+        if watched is None:
+            now = time.monotonic()
+            watched = _WatchedAnalysis(
+                analysis_id=analysis_id,
+                job_id=JobId.slurm(job_id),
+                future=asyncio.get_running_loop().create_future(),
+                interval=self.min_interval_seconds,
+                next_poll=now + self.min_interval_seconds,  # a job just submitted is rarely done yet
+            )
+            self._watched[analysis_id] = watched
+            self._wakeup.set()
+            if not self.is_running():
+                self._task = asyncio.create_task(self._run())
+        return watched.future
+
+    async def wait(self, analysis_id: int, job_id: int, timeout: float | None = None) -> AnalysisRun:
+        """Wait for the analysis's job to reach a terminal status (COMPLETED, FAILED or CANCELLED).
+
+        Cancelling (or timing out) one waiter leaves the job watched for the others.
+        """
+        return await asyncio.wait_for(asyncio.shield(self.watch(analysis_id, job_id)), timeout=timeout)
+
+    def status(self, analysis_id: int) -> AnalysisRun | None:
+        """Last status polled for a watched analysis (None if not watched or not polled yet)."""
+        watched = self._watched.get(analysis_id)
+        if watched is None or watched.status is None:
+            return None
+        return AnalysisRun(id=analysis_id, status=watched.status, job_id=watched.job_id.as_slurm_int)
+
+    def subscribe(self, queue: Queue[AnalysisRun], analysis_id: int | None = None) -> None:
+        """Deliver status changes (of ``analysis_id``, or of every watched analysis) to ``queue``."""
+        self._listeners[queue] = analysis_id
+
+    def unsubscribe(self, queue: Queue[AnalysisRun]) -> None:
+        self._listeners.pop(queue, None)
+
+    async def stop(self) -> None:
+        """Stop polling; analyses still being waited for are cancelled."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        for watched in self._watched.values():
+            watched.future.cancel()
+        self._watched.clear()
+
+    async def poll_once(self) -> float | None:
+        """Query every analysis that is due; returns the seconds until the next one is due (None if idle).
+
+        Analyses due within half of ``min_interval_seconds`` ride along, so their queries are batched.
+        """
+        now = time.monotonic()
+        horizon = now + self.min_interval_seconds / 2
+        due = [w for w in self._watched.values() if w.next_poll <= horizon]
+        if due:
+            try:
+                infos = await self.source.get_statuses([w.job_id for w in due])
+            except Exception:
+                logger.exception(f"Status query for {len(due)} analysis job(s) failed; backing off")
+                infos = []
+            statuses = {info.job_id: info.status for info in infos}
+            now = time.monotonic()
+            for watched in due:
+                self._apply(watched, statuses.get(watched.job_id), now)
+        if not self._watched:
+            return None
+        return max(0.0, min(w.next_poll for w in self._watched.values()) - time.monotonic())
+
+    def _apply(self, watched: _WatchedAnalysis, status: JobStatus | None, now: float) -> None:
+        # A job the scheduler does not (or no longer) report counts as unchanged: it stays watched, on backoff.
+        if status is None or status == JobStatus.UNKNOWN or status == watched.status:
+            watched.interval = min(watched.interval * self.backoff_factor, self.max_interval_seconds)
+        else:
+            logger.info(f"Analysis {watched.analysis_id} (job {watched.job_id.value}): {watched.status} -> {status}")
+            watched.status = status
+            watched.interval = self.min_interval_seconds
+            self._publish(AnalysisRun(id=watched.analysis_id, status=status, job_id=watched.job_id.as_slurm_int))
+        watched.next_poll = now + watched.interval
+        if status is not None and status in TERMINAL_JOB_STATUSES:
+            del self._watched[watched.analysis_id]
+            if not watched.future.done():
+                run = AnalysisRun(id=watched.analysis_id, status=status, job_id=watched.job_id.as_slurm_int)
+                watched.future.set_result(run)
+
+    def _publish(self, run: AnalysisRun) -> None:
+        for queue, analysis_id in list(self._listeners.items()):
+            if analysis_id is not None and analysis_id != run.id:
+                continue
+            try:
+                queue.put_nowait(run)
+            except asyncio.QueueFull:
+                logger.warning(f"Dropping status change of analysis {run.id} for a slow subscriber")
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                delay = await self.poll_once()
+            except Exception:
+                logger.exception("Error during analysis status polling")
+                delay = self.min_interval_seconds
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
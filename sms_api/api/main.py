@@ -16,8 +16,10 @@ import logging
 import os
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from dataclasses import asdict
 from functools import partial
 from pathlib import Path
+from typing import Any
 
 import marimo
 import uvicorn
@@ -30,10 +32,12 @@ from starlette.responses import RedirectResponse
 from sms_api.common.gateway.models import ServerMode
 from sms_api.config import get_settings
 from sms_api.dependencies import (
+    get_database_service,
     get_job_scheduler,
     init_standalone,
     shutdown_standalone,
 )
+from sms_api.simulation.database_cache import CachingDatabaseService
 from sms_api.version import __version__
 
 logger = logging.getLogger(__name__)
@@ -186,6 +190,20 @@ async def check_health() -> dict[str, str]:
     return {"docs": f"{ACTIVE_URL}{app.docs_url}", "version": APP_VERSION}
 
 
+@app.get("/metrics", tags=["SMS API"])
+async def get_metrics() -> dict[str, dict[str, Any]]:
+    """Runtime counters of this replica's background services (only those that are running)."""
+    metrics: dict[str, dict[str, Any]] = {}
+    job_scheduler = get_job_scheduler()
+    if job_scheduler is not None:
+        metrics["worker_event_ingest"] = asdict(job_scheduler.worker_event_metrics())
+    database_service = get_database_service()
+    if isinstance(database_service, CachingDatabaseService):
+        stats = database_service.stats()
+        metrics["database_cache"] = {**asdict(stats), "hit_rate": stats.hit_rate}
+    return metrics
+
+
 @app.get("/version", tags=["SMS API"])
 async def get_version() -> str:
     return APP_VERSION
@@ -7,14 +7,19 @@
 #   IE: where do we provide this special config: in vEcoli or API?
 # TODO: what does a "configuration endpoint" actually mean (can we configure via the simulation?)
 # TODO: labkey preprocessing
+import asyncio
 import json
 import logging
-from collections.abc import Sequence
+import zlib
+from collections.abc import AsyncIterator, Sequence
 
-from fastapi import BackgroundTasks, Body, Depends, HTTPException, Query
+import numpy as np
+import orjson
+from fastapi import BackgroundTasks, Body, Depends, Header, HTTPException, Query
 from fastapi import Path as FastAPIPath
 from fastapi.requests import Request
-from fastapi.responses import FileResponse, Response, StreamingResponse
+from fastapi.responses import Response, StreamingResponse
+from numpy.typing import NDArray
 
 from sms_api.analysis.analysis_service import AnalysisServiceSlurm
 from sms_api.analysis.models import (
@@ -24,12 +29,16 @@ from sms_api.analysis.models import (
     ExperimentAnalysisRequest,
     OutputFile,
     OutputFileMetadata,
+    PartitionFilter,
     TsvOutputFile,
 )
 from sms_api.api import request_examples
 from sms_api.common import handlers
 from sms_api.common.gateway.utils import get_router_config
+from sms_api.common.models import JobStatus
+from sms_api.common.sse import SSE_HEADERS, SSE_MEDIA_TYPE
 from sms_api.common.storage import data_layout
+from sms_api.common.storage.archive import ARCHIVE_MEDIA_TYPES, ArchiveFormat, resolve_compression_level
 from sms_api.config import ComputeBackend, compute_backend_for_repo, get_job_backend, get_settings
 from sms_api.dependencies import get_database_service, get_simulation_service
 from sms_api.simulation.database_service import DatabaseService
@@ -37,6 +46,7 @@ from sms_api.simulation.github_repo import open_repo_tarball_stream
 from sms_api.simulation.models import (
     AnalysisOptions,
     CompositeEngine,
+    JobType,
     ObservableInfoModel,
     RepoDiscovery,
     Simulation,
@@ -44,8 +54,30 @@ from sms_api.simulation.models import (
     SimulationObservables,
     SimulationRun,
     VecoliSource,
+    WorkerEventPage,
+)
+from sms_api.simulation.observable_reader import (
+    ARROW_STREAM_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+    PARQUET_MEDIA_TYPE,
+    ArrowStreamEncoder,
+    DownsampleMethod,
+    SeedArrays,
+    encode_parquet,
+    ensemble_bands,
+    iter_arrow_stream,
+    iter_seed_observable_arrays,
+    list_observables_async,
+    observables_batch,
+    observables_batch_schema,
+    observables_table,
+    parse_generation_spec,
+    parse_seed_spec,
+    read_observable_arrays_async,
+    split_observable_names,
+    store_index_wanted,
+    write_store_index_async,
 )
-from sms_api.simulation.observable_reader import list_observables_async, read_observables_async
 
 
 def _validate_simulation_config_filename(simulation_config_filename: str) -> None:
@@ -97,6 +129,212 @@ async def _ray_seed_store_uri_or_error(db: DatabaseService, sim: Simulation, see
     return data_layout.RayLayout.seed_store_uri(sim.experiment_id, seed)
 
 
+def _observables_json_response(
+    simulation_id: int,
+    experiment_id: str,
+    seed: int,
+    store_kind: str,
+    time: NDArray[np.float64],
+    series: dict[str, NDArray[np.float64]],
+) -> Response:
+    """Encode a ``SimulationObservables`` body straight from the reader's NumPy arrays.
+
+    orjson serializes the arrays natively (NaN/±Inf → ``null``), skipping the
+    per-sample Python floats and Pydantic re-validation; the JSON shape is the
+    same as ``SimulationObservables``.
+    """
+    body = orjson.dumps(
+        {
+            "simulation_id": simulation_id,
+            "experiment_id": experiment_id,
+            "seed": seed,
+            "store": store_kind,
+            "time": time,
+            "series": series,
+        },
+        option=orjson.OPT_SERIALIZE_NUMPY,
+    )
+    return Response(content=body, media_type="application/json")
+
+
+def _negotiate_media_type(accept: str | None, offered: tuple[str, ...]) -> str:
+    """Pick the ``offered`` media type ``Accept`` ranks highest by ``q`` (earlier wins a tie).
+
+    ``q=0`` rules a type out; the first offered type is the fallback.
+    """
+    best, best_quality = offered[0], 0.0
+    for part in (accept or "").lower().split(","):
+        media_type, *params = (item.strip() for item in part.split(";"))
+        if media_type not in offered:
+            continue
+        quality = next((param[2:] for param in params if param.startswith("q=")), "1")
+        try:
+            q = float(quality)
+        except ValueError:
+            continue
+        if q > best_quality:
+            best, best_quality = media_type, q
+    return best
+
+
+def _negotiate_observables_media_type(accept: str | None) -> str:
+    """Pick the observables body format from ``Accept``: JSON, Arrow IPC or Parquet (JSON by default)."""
+    return _negotiate_media_type(accept, ("application/json", ARROW_STREAM_MEDIA_TYPE, PARQUET_MEDIA_TYPE))
+
+
+async def _observables_columnar_response(
+    media_type: str,
+    simulation_id: int,
+    experiment_id: str,
+    seed: int,
+    store_kind: str,
+    time: NDArray[np.float64],
+    series: dict[str, NDArray[np.float64]],
+) -> Response:
+    """Encode observables as an Arrow IPC stream (streamed per record batch) or a Parquet file.
+
+    The table is ``time`` + one column per observable; the ``SimulationObservables``
+    scalar fields ride along in the schema metadata.
+    """
+    metadata = {
+        "simulation_id": str(simulation_id),
+        "experiment_id": experiment_id,
+        "seed": str(seed),
+        "store": store_kind,
+    }
+    table = observables_table(time, series, metadata=metadata)
+    if media_type == ARROW_STREAM_MEDIA_TYPE:
+        return StreamingResponse(iter_arrow_stream(table), media_type=ARROW_STREAM_MEDIA_TYPE)
+    body = await asyncio.to_thread(encode_parquet, table)
+    return Response(content=body, media_type=PARQUET_MEDIA_TYPE)
+
+
+async def _consolidate_store_indexes(db: DatabaseService, simulation_id: int, store_uris: Sequence[str]) -> None:
+    """Background step: write index sidecars for finished Ray seed stores that were just walked in full.
+
+    Runs after the response is sent. Only stores whose cached handle came from a full
+    datatree walk are touched, and only once the run is COMPLETED (a sidecar of a
+    store still being written would go stale without its fingerprint changing).
+    """
+    wanted = [uri for uri in store_uris if store_index_wanted(uri)]
+    if not wanted:
+        return
+    hpc_run = await db.get_hpcrun_by_ref(ref_id=simulation_id, job_type=JobType.SIMULATION)
+    if hpc_run is None or hpc_run.status != JobStatus.COMPLETED:
+        return
+    for uri in wanted:
+        try:
+            index_uri = await write_store_index_async(uri)
+        except Exception:
+            logger.warning(f"Could not write observable index sidecar for {uri}", exc_info=True)
+            continue
+        if index_uri is not None:
+            logger.info(f"Wrote observable index sidecar {index_uri}")
+
+
+def _parse_observables_window(t_start: float | None, t_end: float | None, generations: str) -> list[int] | None:
+    """Validate the observables time window and parse ``generations`` (``None`` = all), or raise a 400."""
+    if t_start is not None and t_end is not None and t_start > t_end:
+        raise HTTPException(400, f"t_start ({t_start}) is after t_end ({t_end})")
+    if not generations.strip():
+        return None
+    try:
+        return parse_generation_spec(generations)
+    except ValueError as e:
+        raise HTTPException(400, str(e)) from e
+
+
+def _parse_percentiles(spec: str) -> list[float]:
+    """Parse ``"5,50,95"`` into percentiles in [0, 100]."""
+    try:
+        qs = [float(p) for p in spec.split(",") if p.strip()]
+    except ValueError:
+        raise ValueError(f"invalid percentiles {spec!r}; expected comma-separated numbers") from None
+    if any(not 0 <= q <= 100 for q in qs):
+        raise ValueError(f"percentiles must be within [0, 100], got {spec!r}")
+    return qs
+
+
+async def _observables_batch_ndjson(
+    results: AsyncIterator[tuple[int, SeedArrays | Exception]],
+    simulation_id: int,
+    experiment_id: str,
+    percentiles: list[float] | None,
+) -> AsyncIterator[bytes]:
+    """One ``SimulationObservables`` line per seed (or ``SimulationObservablesSeedError``), in completion order.
+
+    With ``percentiles`` set, a final ``SimulationObservablesEnsemble`` line carries the bands.
+    """
+    runs: list[tuple[NDArray[np.float64], dict[str, NDArray[np.float64]]]] = []
+    run_seeds: list[int] = []
+    async for seed, result in results:
+        if isinstance(result, Exception):
+            line = {"simulation_id": simulation_id, "experiment_id": experiment_id, "seed": seed, "error": str(result)}
+            yield orjson.dumps(line, option=orjson.OPT_APPEND_NEWLINE)
+            continue
+        store_kind, time, series = result
+        if percentiles is not None:
+            runs.append((time, series))
+            run_seeds.append(seed)
+        body = {
+            "simulation_id": simulation_id,
+            "experiment_id": experiment_id,
+            "seed": seed,
+            "store": store_kind,
+            "time": time,
+            "series": series,
+        }
+        yield orjson.dumps(body, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE)
+    if percentiles is not None and runs:
+        time, bands = await asyncio.to_thread(ensemble_bands, runs, percentiles)
+        body = {
+            "simulation_id": simulation_id,
+            "experiment_id": experiment_id,
+            "seeds": sorted(run_seeds),
+            "time": time,
+            "bands": bands,
+        }
+        yield orjson.dumps(body, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE)
+
+
+async def _observables_batch_arrow(
+    results: AsyncIterator[tuple[int, SeedArrays | Exception]],
+    names: list[str],
+    metadata: dict[str, str],
+    percentiles: list[float] | None,
+) -> AsyncIterator[bytes]:
+    """Long-format Arrow IPC stream: one record batch per seed, then one per ensemble statistic.
+
+    The schema is fixed by ``names`` (or, when empty, by the first seed read);
+    seeds that fail are logged and left out.
+    """
+    encoder: ArrowStreamEncoder | None = None
+    schema = observables_batch_schema(names, metadata) if names else None
+    runs: list[tuple[NDArray[np.float64], dict[str, NDArray[np.float64]]]] = []
+    async for seed, result in results:
+        if isinstance(result, Exception):
+            logger.warning(f"observables batch: skipping seed {seed}: {result}")
+            continue
+        _, time, series = result
+        if schema is None:
+            schema = observables_batch_schema(list(series), metadata)
+        if encoder is None:
+            encoder = ArrowStreamEncoder(schema)
+        if percentiles is not None:
+            runs.append((time, series))
+        yield encoder.write(observables_batch(schema, time, series, seed=seed))
+    if schema is None:
+        schema = observables_batch_schema([], metadata)
+    if encoder is None:
+        encoder = ArrowStreamEncoder(schema)
+    if percentiles is not None and runs:
+        time, bands = await asyncio.to_thread(ensemble_bands, runs, percentiles)
+        for stat in next(iter(bands.values()), {}):
+            columns = {name: by_stat[stat] for name, by_stat in bands.items()}
+            yield encoder.write(observables_batch(schema, time, columns, stat=stat))
+    yield encoder.close()
+
+
 AnalysisOptions()
 
 
@@ -346,6 +584,75 @@ async def get_simulation_status(id: int = FastAPIPath(...)) -> SimulationRun:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@config.router.get(
+    path="/simulations/{id}/events",
+    operation_id="stream-ecoli-simulation-events",
+    tags=["Simulations"],
+    dependencies=[Depends(get_database_service)],
+    summary="Stream simulation status transitions and worker events (Server-Sent Events)",
+    response_class=StreamingResponse,
+    responses={200: {"content": {SSE_MEDIA_TYPE: {}}}},
+)
+async def stream_simulation_events(
+    id: int = FastAPIPath(..., description="Database ID of the simulation"),
+    worker_events: bool = Query(
+        default=True, description="Also stream the mass/time worker events ingested for the simulation."
+    ),
+) -> StreamingResponse:
+    """``status`` events carry a SimulationRun, ``worker_event`` events a WorkerEvent; the stream
+    starts with the current status and ends after a terminal one."""
+    db_service = get_database_service()
+    if db_service is None:
+        raise HTTPException(status_code=404, detail="Database not found")
+    try:
+        events = await handlers.simulations.stream_simulation_events(
+            db_service=db_service, simulation_id=id, include_worker_events=worker_events
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+    except Exception as e:
+        logger.exception("Error opening simulation event stream")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+    return StreamingResponse(events, media_type=SSE_MEDIA_TYPE, headers=SSE_HEADERS)
+
+
+@config.router.get(
+    path="/simulations/{id}/worker-events",
+    response_model=WorkerEventPage,
+    operation_id="list-ecoli-simulation-worker-events",
+    tags=["Simulations"],
+    dependencies=[Depends(get_database_service)],
+    summary="Page through a simulation's worker events, optionally downsampled into time buckets",
+)
+async def list_simulation_worker_events(
+    id: int = FastAPIPath(..., description="Database ID of the simulation"),
+    after_seq: int | None = Query(
+        default=None, description="Return events after this sequence number (next_after_seq of the previous page)."
+    ),
+    limit: int = Query(
+        default=handlers.simulations.WORKER_EVENTS_PAGE_LIMIT,
+        ge=1,
+        le=handlers.simulations.WORKER_EVENTS_MAX_PAGE_LIMIT,
+        description="Maximum events (or buckets, with bucket_seconds) per page.",
+    ),
+    bucket_seconds: float | None = Query(
+        default=None, gt=0, description="Aggregate min/max/mean mass per bucket of this many simulated seconds."
+    ),
+) -> WorkerEventPage:
+    db_service = get_database_service()
+    if db_service is None:
+        raise HTTPException(status_code=404, detail="Database not found")
+    try:
+        return await handlers.simulations.list_simulation_worker_events(
+            db_service=db_service, simulation_id=id, after_seq=after_seq, limit=limit, bucket_seconds=bucket_seconds
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+    except Exception as e:
+        logger.exception("Error listing simulation worker events")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
 @config.router.delete(
     path="/simulations/{id}/cancel",
     response_model=SimulationRun,
@@ -526,13 +833,15 @@ async def add_simulation_tags(
     operation_id="get-ecoli-simulation-data",
     tags=["Simulations"],
     dependencies=[Depends(get_database_service)],
-    summary="Get simulation omics data as a downloadable tar.gz archive",
+    summary="Get simulation omics data as a downloadable archive (tar.gz, tar.zst or tar)",
     response_model=None,
     responses={
         200: {
-            "content": {"application/gzip": {}},
-            "description": "A tar.gz archive containing simulation output files",
-        }
+            "content": {media_type: {} for media_type in ARCHIVE_MEDIA_TYPES.values()},
+            "description": "An archive containing simulation output files, in the requested `format`",
+        },
+        206: {"description": "The requested byte range of the archive"},
+        304: {"description": "The archive matching `If-None-Match` is unchanged"},
     },
 )
 async def get_simulation_data(
@@ -543,15 +852,44 @@ async def get_simulation_data(
         description="Response type: 'file' for direct download (recommended for browsers/Swagger UI), "
         "'streaming' for chunked streaming response (better for large files or programmatic access)",
     ),
-) -> StreamingResponse | FileResponse:
-    """Get simulation outputs as a tar.gz archive.
+    archive_format: ArchiveFormat = Query(
+        default=ArchiveFormat.TAR_GZ,
+        alias="format",
+        description="Archive codec: 'tar.gz' (default), 'tar.zst' (faster, multi-threaded) or 'tar' "
+        "(uncompressed; best for already-compressed zarr stores).",
+    ),
+    level: int | None = Query(
+        default=None,
+        description="Compression level: 1-9 for tar.gz (default 6), 1-22 for tar.zst (default 3). "
+        "Not accepted for tar.",
+    ),
+    if_none_match: str | None = Header(None, description="ETag of a previously downloaded archive (304 if unchanged)."),
+    range_header: str | None = Header(
+        None, alias="range", description="Byte range of the archive, e.g. `bytes=1048576-` to resume a download."
+    ),
+    remote_stream: bool = Query(
+        default=False,
+        description="SLURM runs only: build the archive on the HPC login node and stream it as it is produced, "
+        "without a server-side copy (no ETag, no Range).",
+    ),
+) -> Response:
+    """Get simulation outputs as an archive.
 
     Choose response_type based on your use case:
     - **file**: Creates the archive and returns it as a downloadable file.
       Best for browser downloads and Swagger UI - shows a "Download" button.
     - **streaming**: Streams the archive in chunks as it's created.
       Better for very large files or when you want to start processing before download completes.
+
+    Built archives are cached on the server, keyed by the outputs' listing, and carry an
+    `ETag`: send it back as `If-None-Match` to skip an unchanged download, or send a
+    `Range` (with `If-Range`) to resume an interrupted one. With `remote_stream`, outputs of
+    SLURM runs are tarred on the HPC and relayed as they are read, skipping the server copy.
     """
+    try:
+        resolve_compression_level(archive_format, level)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
     db_service = get_database_service()
     if db_service is None:
         logger.error("Database service is not initialized")
@@ -563,6 +901,11 @@ async def get_simulation_data(
             hpc_sim_base_path=ENV.hpc_sim_base_path,
             data_response_type=response_type,
             bg_tasks=bg_tasks,
+            archive_format=archive_format,
+            level=level,
+            if_none_match=if_none_match,
+            range_requested=range_header is not None,
+            remote_stream=remote_stream,
         )
     except Exception as e:
         logger.exception("Error retrieving simulation data")
@@ -577,6 +920,7 @@ async def get_simulation_data(
     summary="List observables available in a simulation's emitter store (S3)",
 )
 async def get_simulation_observables_index(
+    background_tasks: BackgroundTasks,
     id: int = FastAPIPath(description="Database ID of the simulation"),
     seed: int = Query(0, ge=0),
 ) -> SimulationObservableIndex:
@@ -591,6 +935,7 @@ async def get_simulation_observables_index(
         idx = await list_observables_async(store_uri)
     except FileNotFoundError:
         raise HTTPException(404, f"No emitter store for simulation {id} (seed {seed})") from None
+    background_tasks.add_task(_consolidate_store_indexes, db, id, [store_uri])
     return SimulationObservableIndex(
         simulation_id=id,
         experiment_id=sim.experiment_id,
@@ -606,27 +951,65 @@ async def get_simulation_observables_index(
     operation_id="get-simulation-observables",
     tags=["Simulations"],
     summary="Read observable timeseries from a simulation's emitter store (S3)",
+    responses={
+        200: {
+            "content": {ARROW_STREAM_MEDIA_TYPE: {}, PARQUET_MEDIA_TYPE: {}},
+            "description": (
+                "Observable timeseries. JSON by default; send `Accept: application/vnd.apache.arrow.stream` "
+                "or `Accept: application/x-parquet` for a columnar table (time + one column per observable)."
+            ),
+        }
+    },
 )
 async def get_simulation_observables(
+    background_tasks: BackgroundTasks,
     id: int = FastAPIPath(description="Database ID of the simulation"),
-    names: str = "",
+    names: str = Query(
+        "",
+        description=(
+            "Comma-separated observables (empty = all). Select columns of a 2-D observable with "
+            "`bulk[0,5,7]`, `bulk[10:20]` or `bulk[ids=ATP,GTP]`; each column is returned as its own series."
+        ),
+    ),
     seed: int = Query(0, ge=0),
     stride: int = Query(1, ge=1, description="Return every Nth point (decimation). 1 = full resolution."),
     max_points: int | None = Query(
         None, ge=1, description="Cap the number of points returned; overrides `stride` if it implies a coarser step."
     ),
-) -> SimulationObservables:
+    downsample: DownsampleMethod | None = Query(
+        None,
+        description=(
+            "Meet `max_points` with a feature-preserving reduction instead of every-Nth decimation: "
+            "`lttb` (largest-triangle-three-buckets), `m4` (first/last/min/max per bucket) or "
+            "`minmax` (min/max per bucket). Ignored without `max_points`."
+        ),
+    ),
+    t_start: float | None = Query(None, description="Only return samples at or after this simulation time."),
+    t_end: float | None = Query(None, description="Only return samples at or before this simulation time."),
+    generations: str = Query(
+        "", description="Only return these generations, e.g. `3` or `1,4-6` (partitioned stores skip the rest)."
+    ),
+    accept: str | None = Header(None, description="Response format (JSON, Arrow IPC stream or Parquet)."),
+) -> Response:
     db = get_database_service()
     if db is None:
         raise HTTPException(503, "database service unavailable")
     sim = await db.get_simulation(simulation_id=id)
     if sim is None:
         raise HTTPException(404, f"Simulation {id} not found")
-    requested = [n.strip() for n in names.split(",") if n.strip()]
+    requested = split_observable_names(names)
+    generation_list = _parse_observables_window(t_start, t_end, generations)
     store_uri = await _ray_seed_store_uri_or_error(db, sim, seed)
     try:
-        store_kind, time, series = await read_observables_async(
-            store_uri, requested, stride=stride, max_points=max_points
+        store_kind, time, series = await read_observable_arrays_async(
+            store_uri,
+            requested,
+            stride=stride,
+            max_points=max_points,
+            downsample=downsample,
+            t_start=t_start,
+            t_end=t_end,
+            generations=generation_list,
         )
     except FileNotFoundError:
         raise HTTPException(404, f"No emitter store for simulation {id} (seed {seed})") from None
@@ -634,13 +1017,91 @@ async def get_simulation_observables(
         raise HTTPException(400, str(e)) from e
     except ValueError as e:
         raise HTTPException(400, str(e)) from e
-    return SimulationObservables(
-        simulation_id=id,
-        experiment_id=sim.experiment_id,
-        seed=seed,
-        store=store_kind,
-        time=time,
-        series=series,
+    background_tasks.add_task(_consolidate_store_indexes, db, id, [store_uri])
+    media_type = _negotiate_observables_media_type(accept)
+    if media_type != "application/json":
+        return await _observables_columnar_response(media_type, id, sim.experiment_id, seed, store_kind, time, series)
+    return _observables_json_response(id, sim.experiment_id, seed, store_kind, time, series)
+
+
+@config.router.get(
+    path="/simulations/{id}/observables/batch",
+    operation_id="get-simulation-observables-batch",
+    tags=["Simulations"],
+    summary="Read observable timeseries for many seeds of a simulation, streamed per seed",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {NDJSON_MEDIA_TYPE: {}, ARROW_STREAM_MEDIA_TYPE: {}},
+            "description": (
+                "NDJSON by default: one `SimulationObservables` line per seed in completion order "
+                "(`SimulationObservablesSeedError` for a seed that could not be read), then a "
+                "`SimulationObservablesEnsemble` line when `ensemble=true`. Send "
+                "`Accept: application/vnd.apache.arrow.stream` for one long-format Arrow stream "
+                "(`seed`, `stat`, `time` + one column per observable)."
+            ),
+        }
+    },
+)
+async def get_simulation_observables_batch(
+    background_tasks: BackgroundTasks,
+    id: int = FastAPIPath(description="Database ID of the simulation"),
+    seeds: str = Query("0", description="Seeds to read, e.g. `0-31` or `0,2,5-7`."),
+    names: str = Query(
+        "",
+        description=(
+            "Comma-separated observables (empty = all). Select columns of a 2-D observable with "
+            "`bulk[0,5,7]`, `bulk[10:20]` or `bulk[ids=ATP,GTP]`; each column is returned as its own series."
+        ),
+    ),
+    stride: int = Query(1, ge=1, description="Return every Nth point (decimation). 1 = full resolution."),
+    max_points: int | None = Query(None, ge=1, description="Cap the number of points returned per seed."),
+    downsample: DownsampleMethod | None = Query(
+        None, description="Feature-preserving reduction to `max_points` (`lttb`, `m4` or `minmax`)."
+    ),
+    t_start: float | None = Query(None, description="Only return samples at or after this simulation time."),
+    t_end: float | None = Query(None, description="Only return samples at or before this simulation time."),
+    generations: str = Query(
+        "", description="Only return these generations, e.g. `3` or `1,4-6` (partitioned stores skip the rest)."
+    ),
+    ensemble: bool = Query(False, description="Append ensemble mean/percentile bands computed across the seeds."),
+    percentiles: str = Query("5,50,95", description="Percentile bands to compute when `ensemble=true`."),
+    accept: str | None = Header(None, description="Response format (NDJSON or Arrow IPC stream)."),
+) -> StreamingResponse:
+    db = get_database_service()
+    if db is None:
+        raise HTTPException(503, "database service unavailable")
+    sim = await db.get_simulation(simulation_id=id)
+    if sim is None:
+        raise HTTPException(404, f"Simulation {id} not found")
+    try:
+        seed_list = parse_seed_spec(seeds)
+        bands = _parse_percentiles(percentiles) if ensemble else None
+    except ValueError as e:
+        raise HTTPException(400, str(e)) from e
+    requested = split_observable_names(names)
+    generation_list = _parse_observables_window(t_start, t_end, generations)
+    # One backend check for the whole batch; the per-seed URIs then follow the Ray layout.
+    await _ray_seed_store_uri_or_error(db, sim, seed_list[0])
+    store_uris = {seed: data_layout.RayLayout.seed_store_uri(sim.experiment_id, seed) for seed in seed_list}
+    background_tasks.add_task(_consolidate_store_indexes, db, id, list(store_uris.values()))
+    results = iter_seed_observable_arrays(
+        store_uris,
+        requested,
+        stride=stride,
+        max_points=max_points,
+        downsample=downsample,
+        t_start=t_start,
+        t_end=t_end,
+        generations=generation_list,
+    )
+    if _negotiate_media_type(accept, (NDJSON_MEDIA_TYPE, ARROW_STREAM_MEDIA_TYPE)) == ARROW_STREAM_MEDIA_TYPE:
+        metadata = {"simulation_id": str(id), "experiment_id": sim.experiment_id, "seeds": seeds}
+        return StreamingResponse(
+            _observables_batch_arrow(results, requested, metadata, bands), media_type=ARROW_STREAM_MEDIA_TYPE
+        )
+    return StreamingResponse(
+        _observables_batch_ndjson(results, id, sim.experiment_id, bands), media_type=NDJSON_MEDIA_TYPE
     )
 
 
@@ -803,26 +1264,87 @@ async def get_analysis_plots(
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+async def _analysis_data_ndjson(outputs: AsyncIterator[TsvOutputFile], analysis_id: int) -> AsyncIterator[bytes]:
+    """One ``TsvOutputFile`` line per file, as each download finishes."""
+    n_files = 0
+    try:
+        async for output in outputs:
+            n_files += 1
+            yield orjson.dumps(output.model_dump(), option=orjson.OPT_APPEND_NEWLINE)
+    finally:
+        logger.info(f"Streamed {n_files} output files of analysis {analysis_id}")
+
+
+async def _gzip_stream(chunks: AsyncIterator[bytes], level: int = 6) -> AsyncIterator[bytes]:
+    """gzip ``chunks`` as one stream, flushed after every chunk so each line reaches the client at once."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
+
+
+def _accepts_gzip(accept_encoding: str | None) -> bool:
+    """Whether an ``Accept-Encoding`` header lists ``gzip`` with a non-zero quality."""
+    for coding in (accept_encoding or "").lower().split(","):
+        name, *params = (part.strip() for part in coding.split(";"))
+        if name == "gzip":
+            quality = next((param[2:] for param in params if param.startswith("q=")), "1")
+            try:
+                return float(quality) > 0
+            except ValueError:
+                return False
+    return False
+
+
 @config.router.get(
     path="/analyses/{id}/data",
     tags=["Analyses"],
     operation_id="get-analysis-data",
     dependencies=[Depends(get_database_service)],
     summary="Retrieve the output files (TSV/CSV/TXT/HTML) of an existing analysis by id",
+    response_model=list[TsvOutputFile],
+    responses={
+        200: {
+            "content": {NDJSON_MEDIA_TYPE: {}},
+            "description": (
+                "A JSON list of `TsvOutputFile` by default. Send `Accept: application/x-ndjson` to "
+                "stream one `TsvOutputFile` line per file as each is fetched (gzip-encoded when the "
+                "request's `Accept-Encoding` allows it)."
+            ),
+        }
+    },
 )
 async def get_analysis_data(
     id: int = FastAPIPath(..., description="Database ID of the analysis"),
-) -> list[TsvOutputFile]:
+    variant: int | None = Query(default=None, description="Only files of this variant."),
+    lineage_seed: int | None = Query(default=None, description="Only files of this lineage seed."),
+    min_generation: int | None = Query(default=None, description="Only files of this generation or later."),
+    max_generation: int | None = Query(default=None, description="Only files of this generation or earlier."),
+    accept: str | None = Header(None, description="Response format (JSON or NDJSON)."),
+    accept_encoding: str | None = Header(None, description="`gzip` to compress an NDJSON stream."),
+) -> list[TsvOutputFile] | StreamingResponse:
     """Pure retrieval of a pre-computed analysis's files by id (never computes).
 
     Returns the same ``list[TsvOutputFile]`` shape as the legacy ``POST /analyses``.
-    409 if the analysis is not READY; 404 if the analysis id is unknown.
+    409 if the analysis is not READY; 404 if the analysis id is unknown. The partition
+    filters are answered from the analysis's indexed output manifest. Files are fetched
+    from S3 concurrently; with ``Accept: application/x-ndjson`` each is sent as soon as
+    it arrives instead of after the last one, which keeps large analyses within proxy
+    timeouts.
     """
     db_service = get_database_service()
     if db_service is None:
         raise HTTPException(status_code=404, detail="Database not found")
+    partition = PartitionFilter(
+        variant=variant, lineage_seed=lineage_seed, min_generation=min_generation, max_generation=max_generation
+    )
+    stream = _negotiate_media_type(accept, ("application/json", NDJSON_MEDIA_TYPE)) == NDJSON_MEDIA_TYPE
     try:
-        return await handlers.analyses.fetch_analysis_data(db_service=db_service, analysis_id=id)
+        if not stream:
+            return await handlers.analyses.fetch_analysis_data(
+                db_service=db_service, analysis_id=id, partition=partition
+            )
+        files = await handlers.analyses.list_analysis_data_files(db_service, analysis_id=id, partition=partition)
     except handlers.analyses.AnalysisNotReadyError as e:
         raise HTTPException(status_code=409, detail=str(e)) from e
     except RuntimeError as e:
@@ -830,3 +1352,10 @@ async def get_analysis_data(
     except Exception as e:
         logger.exception("Error retrieving analysis data")
         raise HTTPException(status_code=500, detail=str(e)) from e
+    body = _analysis_data_ndjson(handlers.analyses.iter_analysis_data(files), id)
+    headers = {"Vary": "Accept, Accept-Encoding", "X-Output-File-Count": str(len(files))}
+    if _accepts_gzip(accept_encoding):
+        return StreamingResponse(
+            _gzip_stream(body), media_type=NDJSON_MEDIA_TYPE, headers={**headers, "Content-Encoding": "gzip"}
+        )
+    return StreamingResponse(body, media_type=NDJSON_MEDIA_TYPE, headers=headers)
@@ -4,29 +4,35 @@ Simulation analysis handler for SMS API simulation experiment outputs.
 NOTE: this module is essentially "analysis_handlers_hpc". TODO: abstract this into interface
 """
 
+import asyncio
+import itertools
 import json
 import logging
 import re
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from pathlib import Path
 from textwrap import dedent
 
 from starlette.requests import Request
 
-from sms_api.analysis.analysis_service import AnalysisServiceSlurm, RequestPayload, parse_partition_metadata
+from sms_api.analysis.analysis_service import AnalysisServiceSlurm, RequestPayload
 from sms_api.analysis.models import (
     AnalysisRun,
     ExperimentAnalysisDTO,
     ExperimentAnalysisRequest,
     OutputFile,
     OutputFileMetadata,
+    OutputManifestEntry,
+    PartitionFilter,
     TsvOutputFile,
 )
+from sms_api.analysis.output_manifest import s3_output_files
 from sms_api.common.models import JobStatus, SSHTarget
 from sms_api.common.storage.file_paths import HPCFilePath, S3FilePath
+from sms_api.common.storage.file_service import FileService
 from sms_api.common.utils import get_data_id, timestamp
 from sms_api.config import get_settings
-from sms_api.dependencies import get_file_service, get_ssh_session_service
+from sms_api.dependencies import get_analysis_status_watcher, get_file_service, get_ssh_session_service
 from sms_api.simulation.database_service import DatabaseService
 from sms_api.simulation.models import SimulatorVersion
 
@@ -47,41 +53,103 @@ async def list_simulation_analyses(db_service: DatabaseService, simulation_id: i
     return await db_service.list_analyses(experiment_id=simulation.experiment_id)
 
 
-async def fetch_analysis_data(db_service: DatabaseService, analysis_id: int) -> list[TsvOutputFile]:
-    """Return all text output files of an existing analysis by id, as ``list[TsvOutputFile]``.
+async def list_analysis_data_files(
+    db_service: DatabaseService, analysis_id: int, partition: PartitionFilter | None = None
+) -> list[OutputManifestEntry]:
+    """The text output files of a READY analysis, from its ``result_uri`` output manifest.
 
-    Pure retrieval: reads S3 under the analysis row's ``result_uri`` and inlines each
-    file's content with variant/lineage_seed/generation parsed from its partition
-    path — the same shape as the legacy ``POST /analyses``. Never computes: if the
-    analysis is not READY it raises ``AnalysisNotReadyError`` (mapped to 409).
+    ``partition`` is applied in the database; S3 is only listed again when the analysis
+    row changed since it was indexed (or the manifest is older than
+    ``output_manifest_max_age_seconds``). Raises ``AnalysisNotReadyError`` if the
+    analysis is not READY, so callers can fail before they start a response.
     """
     analysis = await db_service.get_analysis(database_id=analysis_id)  # RuntimeError -> 404 at the router
     if analysis.status != JobStatus.COMPLETED or not analysis.result_uri:
         raise AnalysisNotReadyError(f"Analysis {analysis_id} is not ready (status={analysis.status})")
+    return await s3_output_files(
+        db_service,
+        S3FilePath(s3_path=Path(analysis.result_uri)),
+        extensions=_ANALYSIS_OUTPUT_EXTENSIONS,
+        partition=partition,
+        experiment_id=analysis.experiment_id,
+        source_version=analysis.last_updated,
+    )
+
 
+async def _download_output(file_service: FileService, file: OutputManifestEntry) -> TsvOutputFile | None:
+    content = await file_service.get_file_contents(S3FilePath(s3_path=Path(file.path)))
+    if content is None:
+        return None
+    return TsvOutputFile(
+        filename=Path(file.path).name,
+        content=content.decode(errors="replace"),
+        variant=file.variant if file.variant is not None else 0,
+        lineage_seed=file.lineage_seed,
+        generation=file.generation,
+    )
+
+
+async def _iter_downloads(
+    files: Sequence[OutputManifestEntry], max_concurrency: int
+) -> AsyncIterator[tuple[int, TsvOutputFile]]:
+    """Download ``files`` from S3, yielding ``(index in files, output)`` as each finishes.
+
+    A window of at most ``max_concurrency`` downloads is in flight (or finished but not
+    yet consumed), so a slow consumer holds back the next downloads instead of letting
+    contents pile up in memory. Downloads still running when the consumer stops are
+    cancelled; objects that vanished since indexing are skipped.
+    """
     file_service = get_file_service()
     if file_service is None:
         raise RuntimeError("File service is not initialized")
+    remaining = iter(enumerate(files))
+    pending: dict[asyncio.Task[TsvOutputFile | None], int] = {}
+    try:
+        while True:
+            for index, file in itertools.islice(remaining, max(1, max_concurrency) - len(pending)):
+                pending[asyncio.create_task(_download_output(file_service, file))] = index
+            if not pending:
+                return
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                index = pending.pop(task)
+                output = task.result()
+                if output is not None:
+                    yield index, output
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def iter_analysis_data(
+    files: Sequence[OutputManifestEntry], max_concurrency: int | None = None
+) -> AsyncIterator[TsvOutputFile]:
+    """Each of ``files`` (see ``list_analysis_data_files``) as a ``TsvOutputFile``, in completion order."""
+    limit = max_concurrency or get_settings().analysis_data_fetch_concurrency
+    async for _, output in _iter_downloads(files, limit):
+        yield output
+
+
+async def fetch_analysis_data(
+    db_service: DatabaseService,
+    analysis_id: int,
+    partition: PartitionFilter | None = None,
+    max_concurrency: int | None = None,
+) -> list[TsvOutputFile]:
+    """Return all text output files of an existing analysis by id, as ``list[TsvOutputFile]``.
 
-    listing = await file_service.get_listing(S3FilePath(s3_path=Path(analysis.result_uri)))
-    outputs: list[TsvOutputFile] = []
-    for item in listing:
-        if not item.Key.lower().endswith(_ANALYSIS_OUTPUT_EXTENSIONS):
-            continue
-        content = await file_service.get_file_contents(S3FilePath(s3_path=Path(item.Key)))
-        if content is None:
-            continue
-        metadata = parse_partition_metadata(Path(item.Key))
-        outputs.append(
-            TsvOutputFile(
-                filename=Path(item.Key).name,
-                content=content.decode(errors="replace"),
-                variant=metadata.get("variant", 0),
-                lineage_seed=metadata.get("lineage_seed"),
-                generation=metadata.get("generation"),
-            )
-        )
-    return outputs
+    Pure retrieval: reads S3 under the analysis row's ``result_uri`` and inlines each
+    file's content with variant/lineage_seed/generation parsed from its partition
+    path — the same shape as the legacy ``POST /analyses``. Never computes: if the
+    analysis is not READY it raises ``AnalysisNotReadyError`` (mapped to 409).
+
+    Files are downloaded ``analysis_data_fetch_concurrency`` at a time and returned in
+    path order; ``iter_analysis_data`` yields them as they arrive instead.
+    """
+    files = await list_analysis_data_files(db_service, analysis_id, partition=partition)
+    limit = max_concurrency or get_settings().analysis_data_fetch_concurrency
+    downloads = [item async for item in _iter_downloads(files, limit)]
+    return [output for _, output in sorted(downloads, key=lambda item: item[0])]
 
 
 async def handle_run_analysis(
@@ -124,9 +192,8 @@ async def handle_run_analysis_slurm(
     if not cache_has_files:
         # 2a. mk local cache (use makedirs with exist_ok for empty directories)
         analysis_request_cache.mkdir(parents=True, exist_ok=True)
-        # Use a single SSH session for job submission and polling
+        # 2c. dispatch job
         async with get_ssh_session_service(SSHTarget.SLURM).session() as ssh:
-            # 2c. dispatch job
             jobname, jobid, config = await analysis_service.dispatch_analysis(
                 request=request,
                 logger=logger,
@@ -134,22 +201,23 @@ async def handle_run_analysis_slurm(
                 ssh=ssh,
                 simulator_hash=simulator.git_commit_hash,
             )
-            # 2d. insert analysis into db
-            dto: ExperimentAnalysisDTO = await db_service.insert_analysis(
-                name=analysis_name,
-                config=config,
-                last_updated=timestamp(),
-                job_name=jobname,
-                job_id=jobid,
-            )
-            # 2e. poll status
-            _run = await analysis_service.poll_status(dto=dto, ssh=ssh)
+        # 2d. insert analysis into db
+        dto: ExperimentAnalysisDTO = await db_service.insert_analysis(
+            name=analysis_name,
+            config=config,
+            last_updated=timestamp(),
+            job_name=jobname,
+            job_id=jobid,
+        )
+        # 2e. wait for the job (the shared status watcher polls it, batched with other analyses)
+        _run = await analysis_service.wait_for_completion(dto=dto)
 
         # Fetch available output files from the analysis output directory
         # Analysis outputs are stored at: hpc_sim_base_path / experiment_id / "analyses"
         remote_analysis_outdir = HPCFilePath(remote_path=Path(config.analysis_options.outdir))  # type: ignore[attr-defined]
+        # The job just completed: index its output directory now (the manifest is new or stale).
         available_paths: list[HPCFilePath] = await analysis_service.get_available_output_paths(
-            remote_analysis_outdir=remote_analysis_outdir
+            remote_analysis_outdir=remote_analysis_outdir, db_service=db_service, refresh=True
         )
 
         # download available
@@ -214,6 +282,11 @@ async def handle_get_analysis_status(
     )
     if analysis_record.job_id is None:
         raise ValueError("Analysis record has no job_id")
+    # An analysis being waited for already has a current status, polled by the shared watcher.
+    status_watcher = analysis_service.status_watcher or get_analysis_status_watcher()
+    watched = status_watcher.status(analysis_record.database_id) if status_watcher is not None else None
+    if watched is not None:
+        return watched
     async with get_ssh_session_service(SSHTarget.SLURM).session() as ssh:
         return await analysis_service.get_analysis_status(
             job_id=analysis_record.job_id, db_id=analysis_record.database_id, ssh=ssh
@@ -1,32 +1,53 @@
 import asyncio
-import gzip
 import io
 import json
 import logging
 import os
 import random
+import shlex
 import string
 import tarfile
 import uuid
+from collections import deque
 from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 from fastapi import BackgroundTasks, HTTPException
 from fastapi.responses import FileResponse, Response, StreamingResponse
 
 from sms_api.analysis.models import TsvOutputFile
+from sms_api.analysis.output_manifest import hpc_output_files
 from sms_api.common import StrEnumBase
 from sms_api.common.handlers.simulators import upload_simulator
 from sms_api.common.hpc.job_service import JobStatusUpdate
 from sms_api.common.models import JobBackend, JobStatus, SSHTarget
 from sms_api.common.simulator_defaults import DEFAULT_OBSERVABLES, RepoUrl
+from sms_api.common.sse import format_sse, format_sse_comment
 from sms_api.common.storage import data_layout
+from sms_api.common.storage.archive import (
+    ARCHIVE_MEDIA_TYPES,
+    ArchiveCompressor,
+    ArchiveFormat,
+    archive_filename,
+    resolve_compression_level,
+)
+from sms_api.common.storage.archive_cache import (
+    ArchiveKey,
+    ArchiveSource,
+    archive_key,
+    etag_matches,
+    get_archive_cache,
+)
 from sms_api.common.storage.file_paths import HPCFilePath, S3FilePath
+from sms_api.common.storage.file_service import ListingItem
 from sms_api.config import ComputeBackend, compute_backend_for_repo, get_job_backend, get_settings
 from sms_api.dependencies import (
     get_database_service,
     get_file_service,
+    get_job_scheduler,
+    get_job_status_watcher,
     get_simulation_service,
     get_simulation_service_for_job,
     get_simulation_service_for_repo,
@@ -48,8 +69,13 @@ from sms_api.simulation.models import (
     SimulationRun,
     SimulatorVersion,
     VecoliSource,
+    WorkerEvent,
+    WorkerEventBucket,
+    WorkerEventPage,
 )
 from sms_api.simulation.simulation_service import SimulationService
+from sms_api.simulation.status_watcher import TERMINAL_JOB_STATUSES, JobStatusChange, track_hpcrun
+from sms_api.simulation.worker_event_blocks import WorkerEventSeries
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +87,15 @@ DEFAULT_SIMDATA_PATH = get_settings().hpc_parca_base_path / "default" / "kb" / "
 # repo/image build)
 
 
+# Idle interval after which an event stream sends a keepalive (and re-checks the status).
+SIMULATION_EVENTS_KEEPALIVE_SECONDS = 15.0
+SIMULATION_EVENTS_QUEUE_SIZE = 1000
+# Page size of the worker event listing (events, or buckets when downsampled) and the
+# number of events read per query while filling a page of buckets.
+WORKER_EVENTS_PAGE_LIMIT = 1000
+WORKER_EVENTS_MAX_PAGE_LIMIT = 10_000
+WORKER_EVENTS_SCAN_SIZE = 10_000
+
 ANALYSIS_CATEGORIES = {"single", "multiseed", "multigeneration", "multidaughter", "multivariant", "multiexperiment"}
 
 
@@ -337,12 +372,13 @@ async def run_workflow_legacy(
     job_id = await simulation_service.submit_ecoli_simulation_job(
         ecoli_simulation=simulation, database_service=database_service, correlation_id=correlation_id
     )
-    _ = await database_service.insert_hpcrun(
+    hpc_run = await database_service.insert_hpcrun(
         job_id=job_id,
         job_type=JobType.SIMULATION,
         ref_id=simulation.database_id,
         correlation_id=correlation_id,
     )
+    track_hpcrun(hpc_run)
 
     simulation.job_id = str(job_id)
     return simulation
@@ -649,12 +685,13 @@ async def run_simulation_workflow(  # noqa: C901
     )
 
     # 8. Record HPC run
-    _ = await database_service.insert_hpcrun(
+    hpc_run = await database_service.insert_hpcrun(
         job_id=job_id,
         job_type=JobType.SIMULATION,
         ref_id=simulation.database_id,
         correlation_id=correlation_id,
     )
+    track_hpcrun(hpc_run)
 
     simulation.job_id = str(job_id)
     return simulation
@@ -685,12 +722,13 @@ async def run_parca(
 
     # Submit parca job
     parca_job_id = await simulation_service_slurm.submit_parca_job(parca_dataset=parca_dataset)
-    _hpc_run = await database_service.insert_hpcrun(
+    hpc_run = await database_service.insert_hpcrun(
         job_id=parca_job_id,
         job_type=JobType.PARCA,
         ref_id=parca_dataset.database_id,
         correlation_id="N/A",
     )
+    track_hpcrun(hpc_run)
 
     return parca_dataset
 
@@ -728,7 +766,14 @@ async def get_simulation_status(db_service: DatabaseService, id: int) -> Simulat
     if hpc_run is None:
         raise RuntimeError(f"No HPC run found for simulation {id}")
 
-    # Route to the service that owns this run (by the run's backend), not the global default.
+    # Terminal statuses are final, and the status watcher keeps the others current in the DB.
+    watcher = get_job_status_watcher()
+    if hpc_run.status in TERMINAL_JOB_STATUSES or (watcher is not None and watcher.covers(hpc_run.job_id.backend)):
+        return SimulationRun(
+            id=int(id), status=hpc_run.status or JobStatus.UNKNOWN, error_message=hpc_run.error_message
+        )
+
+    # No watcher for this backend: ask the service that owns this run (by the run's backend).
     simulation_service = get_simulation_service_for_job(hpc_run.job_id)
     if simulation_service is None:
         raise RuntimeError("Simulation service is not initialized")
@@ -739,7 +784,7 @@ async def get_simulation_status(db_service: DatabaseService, id: int) -> Simulat
         return SimulationRun(id=int(id), status=JobStatus.UNKNOWN)
 
     # Persist terminal status to DB so future calls don't need to hit the backend
-    if job_status_info.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED):
+    if job_status_info.status in TERMINAL_JOB_STATUSES:
         update = JobStatusUpdate(
             job_id=hpc_run.job_id,
             status=job_status_info.status,
@@ -752,6 +797,173 @@ async def get_simulation_status(db_service: DatabaseService, id: int) -> Simulat
     return SimulationRun(id=int(id), status=job_status_info.status, error_message=job_status_info.error_message)
 
 
+class _SimulationEventSubscription:
+    """The watcher and scheduler queues of one simulation event stream."""
+
+    def __init__(self, hpc_run: HpcRun, include_worker_events: bool) -> None:
+        self.hpc_run = hpc_run
+        self.watcher = get_job_status_watcher()
+        self.scheduler = get_job_scheduler() if include_worker_events else None
+        self.changes: asyncio.Queue[JobStatusChange] = asyncio.Queue(maxsize=SIMULATION_EVENTS_QUEUE_SIZE)
+        self.worker_events: asyncio.Queue[WorkerEvent] = asyncio.Queue(maxsize=SIMULATION_EVENTS_QUEUE_SIZE)
+        self._change_task: asyncio.Task[JobStatusChange] | None = None
+        self._event_task: asyncio.Task[WorkerEvent] | None = None
+
+    def open(self) -> None:
+        if self.watcher is not None:
+            self.watcher.subscribe(self.changes, job_id=self.hpc_run.job_id)
+        if self.scheduler is not None:
+            self.scheduler.subscribe_worker_events(self.worker_events, hpcrun_id=self.hpc_run.database_id)
+
+    def close(self) -> None:
+        for task in (self._change_task, self._event_task):
+            if task is not None:
+                task.cancel()
+        if self.watcher is not None:
+            self.watcher.unsubscribe(self.changes)
+        if self.scheduler is not None:
+            self.scheduler.unsubscribe_worker_events(self.worker_events)
+
+    async def next(self, timeout: float) -> tuple[WorkerEvent | None, JobStatusChange | None]:
+        """Wait up to ``timeout`` for a worker event and/or a status change (both None on timeout)."""
+        if self._change_task is None and self.watcher is not None:
+            self._change_task = asyncio.create_task(self.changes.get())
+        if self._event_task is None and self.scheduler is not None:
+            self._event_task = asyncio.create_task(self.worker_events.get())
+        pending: set[asyncio.Future[Any]] = {t for t in (self._change_task, self._event_task) if t is not None}
+        if not pending:
+            await asyncio.sleep(timeout)
+            return None, None
+        done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        worker_event = change = None
+        if self._event_task is not None and self._event_task in done:
+            worker_event, self._event_task = self._event_task.result(), None
+        if self._change_task is not None and self._change_task in done:
+            change, self._change_task = self._change_task.result(), None
+        return worker_event, change
+
+
+async def stream_simulation_events(
+    db_service: DatabaseService,
+    simulation_id: int,
+    include_worker_events: bool = True,
+    keepalive_seconds: float = SIMULATION_EVENTS_KEEPALIVE_SECONDS,
+) -> AsyncIterator[str]:
+    """Server-Sent Events for a simulation: ``status`` (a SimulationRun) and ``worker_event``
+    (a WorkerEvent) until the run reaches a terminal status.
+
+    The current status is sent first. Transitions come from the job status watcher and
+    worker events from the job scheduler as they are ingested; when nothing arrives for
+    ``keepalive_seconds`` the status is re-checked (which is how runs on a backend without
+    a watcher are followed) and a keepalive comment is sent if it has not changed.
+    """
+    hpc_run = await db_service.get_hpcrun_by_ref(ref_id=simulation_id, job_type=JobType.SIMULATION)
+    if hpc_run is None:
+        raise ValueError(f"No HPC run found for simulation {simulation_id}")
+    subscription = _SimulationEventSubscription(hpc_run, include_worker_events)
+
+    async def _events() -> AsyncIterator[str]:
+        # Subscribe before reading the current status, so no transition falls in between.
+        subscription.open()
+        try:
+            run = await get_simulation_status(db_service=db_service, id=simulation_id)
+            yield format_sse("status", run.model_dump_json())
+            while run.status not in TERMINAL_JOB_STATUSES:
+                worker_event, change = await subscription.next(timeout=keepalive_seconds)
+                # Worker events first, so a terminal status is always the last event of the stream.
+                if worker_event is not None:
+                    yield format_sse("worker_event", worker_event.model_dump_json())
+                if change is not None:
+                    run = SimulationRun(
+                        id=simulation_id,
+                        status=change.hpc_run.status or JobStatus.UNKNOWN,
+                        error_message=change.hpc_run.error_message,
+                    )
+                    yield format_sse("status", run.model_dump_json())
+                elif worker_event is None:
+                    latest = await get_simulation_status(db_service=db_service, id=simulation_id)
+                    if latest == run:
+                        yield format_sse_comment()
+                    else:
+                        run = latest
+                        yield format_sse("status", run.model_dump_json())
+        finally:
+            subscription.close()
+
+    return _events()
+
+
+async def list_simulation_worker_events(
+    db_service: DatabaseService,
+    simulation_id: int,
+    after_seq: int | None = None,
+    limit: int = WORKER_EVENTS_PAGE_LIMIT,
+    bucket_seconds: float | None = None,
+) -> WorkerEventPage:
+    """A page of the simulation's worker events with ``sequence_number > after_seq``.
+
+    Without ``bucket_seconds`` the page holds up to ``limit`` events; with it, up to
+    ``limit`` time buckets (min/max/mean per mass component). ``next_after_seq`` is the
+    cursor of the next page. Buckets assume time increases with the sequence number; the
+    last bucket of a running simulation may still grow and is then repeated, complete, by
+    a later page.
+    """
+    hpc_run = await db_service.get_hpcrun_by_ref(ref_id=simulation_id, job_type=JobType.SIMULATION)
+    if hpc_run is None:
+        raise ValueError(f"No HPC run found for simulation {simulation_id}")
+    if bucket_seconds is not None:
+        return await _list_worker_event_buckets(
+            db_service, simulation_id, hpc_run.database_id, after_seq, limit, bucket_seconds
+        )
+
+    events = await db_service.list_worker_events(
+        hpcrun_id=hpc_run.database_id, prev_sequence_number=after_seq, limit=limit + 1
+    )
+    page = events[:limit]
+    return WorkerEventPage(
+        simulation_id=simulation_id,
+        events=page,
+        next_after_seq=page[-1].sequence_number if page else after_seq,
+        has_more=len(events) > limit,
+    )
+
+
+async def _list_worker_event_buckets(
+    db_service: DatabaseService,
+    simulation_id: int,
+    hpcrun_id: int,
+    after_seq: int | None,
+    limit: int,
+    bucket_seconds: float,
+) -> WorkerEventPage:
+    # Read until the events span more than ``limit`` buckets (the surplus one may be cut
+    # off by the last read and is left for the next page) or the series is exhausted.
+    parts: list[WorkerEventSeries] = []
+    bucket_ids: set[int] = set()
+    start = None if after_seq is None else after_seq + 1
+    exhausted = False
+    while len(bucket_ids) <= limit:
+        chunk = await db_service.get_worker_event_series(
+            hpcrun_id, start_sequence_number=start, limit=WORKER_EVENTS_SCAN_SIZE
+        )
+        if len(chunk):
+            parts.append(chunk)
+            bucket_ids.update(np.floor(chunk.times / bucket_seconds).astype(np.int64).tolist())
+            start = int(chunk.sequence_numbers[-1]) + 1
+        if len(chunk) < WORKER_EVENTS_SCAN_SIZE:
+            exhausted = True
+            break
+
+    buckets: list[WorkerEventBucket] = WorkerEventSeries.concat(hpcrun_id, parts).downsample(bucket_seconds)
+    page = buckets[:limit]
+    return WorkerEventPage(
+        simulation_id=simulation_id,
+        buckets=page,
+        next_after_seq=page[-1].last_sequence_number if page else after_seq,
+        has_more=not exhausted or len(buckets) > limit,
+    )
+
+
 async def cancel_simulation(
     db_service: DatabaseService,
     simulation_service: SimulationService,
@@ -821,14 +1033,21 @@ def _split_csv(value: str | None) -> list[str]:
 
 
 async def get_omics_outputs(
-    hpc_sim_base_path: HPCFilePath, experiment_id: str, output_type: SimulationAnalysisResponseType | None = None
+    hpc_sim_base_path: HPCFilePath,
+    experiment_id: str,
+    output_type: SimulationAnalysisResponseType | None = None,
+    db_service: DatabaseService | None = None,
 ) -> list[TsvOutputFile] | StreamingResponse:
     exp_analysis_outdir = hpc_sim_base_path / experiment_id / "analyses"
-    return await fetch_omics_outputs(exp_analysis_outdir=exp_analysis_outdir, output_type=output_type)
+    return await fetch_omics_outputs(
+        exp_analysis_outdir=exp_analysis_outdir, output_type=output_type, db_service=db_service
+    )
 
 
 async def fetch_omics_outputs(
-    exp_analysis_outdir: HPCFilePath, output_type: SimulationAnalysisResponseType | None = None
+    exp_analysis_outdir: HPCFilePath,
+    output_type: SimulationAnalysisResponseType | None = None,
+    db_service: DatabaseService | None = None,
 ) -> list[TsvOutputFile] | StreamingResponse:
     if output_type is None:
         # original implementation's analysis response type, so default
@@ -836,37 +1055,55 @@ async def fetch_omics_outputs(
 
     analysis_request_cache = Path(get_settings().cache_dir)
     available_paths: list[HPCFilePath] = await get_available_omics_output_paths(
-        remote_analysis_outdir=exp_analysis_outdir
+        remote_analysis_outdir=exp_analysis_outdir, db_service=db_service
     )
 
     # download available, preserving directory structure
-    results_arr: None | list[TsvOutputFile] = None if output_type == SimulationAnalysisResponseType.GZIP_STREAM else []
-    for remote_path in available_paths:
-        output_i: TsvOutputFile | Path = await download_analysis_output(
-            local_dir=analysis_request_cache,
-            remote_path=remote_path,
-            response_type=output_type,
-            remote_base_dir=exp_analysis_outdir,
-        )
-        if isinstance(output_i, TsvOutputFile) and results_arr is not None:
-            results_arr.append(output_i)
-            continue
-    if results_arr is None:
-        # indicates streaming response desired
+    local_paths = await _download_analysis_outputs(available_paths, exp_analysis_outdir, analysis_request_cache)
+    if output_type == SimulationAnalysisResponseType.GZIP_STREAM:
         return await stream_analysis_output_archive(dir_path=analysis_request_cache)
-    return results_arr
+    return [
+        TsvOutputFile(filename=str(local.relative_to(analysis_request_cache)), content=local.read_text())
+        for local in local_paths
+    ]
+
+
+async def _download_analysis_outputs(
+    remote_paths: list[HPCFilePath], remote_base_dir: HPCFilePath, local_dir: Path
+) -> list[Path]:
+    """Bulk-download ``remote_paths`` (over one SSH session) to ``local_dir``, keeping their
+    layout below ``remote_base_dir``; files already present are not fetched again."""
+    files = [
+        (remote_path, local_dir / remote_path.remote_path.relative_to(remote_base_dir.remote_path))
+        for remote_path in remote_paths
+    ]
+    if files:
+        async with get_ssh_session_service(SSHTarget.SLURM).session() as ssh:
+            await ssh.download_files(files)
+    return [local for _, local in files]
+
 
+_OMICS_OUTPUT_EXTENSIONS = ("tsv", "html", "csv", "txt")
 
-async def get_available_omics_output_paths(remote_analysis_outdir: HPCFilePath) -> list[HPCFilePath]:
+
+async def get_available_omics_output_paths(
+    remote_analysis_outdir: HPCFilePath, db_service: DatabaseService | None = None, experiment_id: str | None = None
+) -> list[HPCFilePath]:
+    """Omics output files under ``remote_analysis_outdir``; from its output manifest when
+    ``db_service`` is given (see ``sms_api.analysis.output_manifest``), else by ``find`` over SSH."""
     cmd = f'find "{remote_analysis_outdir!s}" -type f'
     try:
+        if db_service is not None:
+            files = await hpc_output_files(
+                db_service, remote_analysis_outdir, extensions=_OMICS_OUTPUT_EXTENSIONS, experiment_id=experiment_id
+            )
+            return [HPCFilePath(remote_path=Path(file.path)) for file in files]
         async with get_ssh_session_service(SSHTarget.SLURM).session() as ssh:
             ret, out, err = await ssh.run_command(cmd)
         paths = []
-        accepted_extensions = ["tsv", "html", "csv", "txt"]
         for fp in out.splitlines():
             extension = fp.split(".")[-1]
-            if extension in accepted_extensions:
+            if extension in _OMICS_OUTPUT_EXTENSIONS:
                 paths.append(HPCFilePath(remote_path=Path(fp)))
         return paths
     except Exception:
@@ -874,7 +1111,12 @@ async def get_available_omics_output_paths(remote_analysis_outdir: HPCFilePath)
         return []
 
 
-async def stream_tar_gz(dir_path: Path, chunk_size: int = 64 * 1024) -> AsyncIterator[bytes]:
+async def stream_archive(
+    dir_path: Path,
+    archive_format: ArchiveFormat = ArchiveFormat.TAR_GZ,
+    level: int | None = None,
+    chunk_size: int = 64 * 1024,
+) -> AsyncIterator[bytes]:
     read_fd, write_fd = os.pipe()
     read_file = os.fdopen(read_fd, "rb")
     write_file = os.fdopen(write_fd, "wb")
@@ -894,8 +1136,7 @@ async def stream_tar_gz(dir_path: Path, chunk_size: int = 64 * 1024) -> AsyncIte
 
     tar_task = asyncio.create_task(create_tar())
 
-    gzip_buffer = io.BytesIO()
-    gzip_file = gzip.GzipFile(fileobj=gzip_buffer, mode="wb")
+    compressor = ArchiveCompressor(archive_format, level)
 
     try:
         while True:
@@ -904,18 +1145,11 @@ async def stream_tar_gz(dir_path: Path, chunk_size: int = 64 * 1024) -> AsyncIte
             if not chunk:
                 break
 
-            gzip_file.write(chunk)
-
-            if gzip_buffer.tell() > 0:
-                gzip_buffer.seek(0)
-                compressed = gzip_buffer.read()
-                gzip_buffer.seek(0)
-                gzip_buffer.truncate()
+            compressed = await loop.run_in_executor(None, compressor.write, chunk)
+            if compressed:
                 yield compressed
 
-        gzip_file.close()
-        gzip_buffer.seek(0)
-        final_chunk = gzip_buffer.read()
+        final_chunk = await loop.run_in_executor(None, compressor.close)
         if final_chunk:
             yield final_chunk
 
@@ -946,75 +1180,17 @@ def validate_path(dir_path: Path, base_allowed: Path | None = None) -> Path:
     return path
 
 
-async def stream_analysis_output_archive(dir_path: Path) -> StreamingResponse:
+async def stream_analysis_output_archive(
+    dir_path: Path, archive_format: ArchiveFormat = ArchiveFormat.TAR_GZ, level: int | None = None
+) -> StreamingResponse:
     validated_path = validate_path(dir_path, base_allowed=None)
 
     # Generate a safe filename for the download
-    archive_name = f"{validated_path.name}.tar.gz"
+    archive_name = archive_filename(validated_path.name, archive_format)
 
     return StreamingResponse(
-        stream_tar_gz(validated_path),
-        media_type="application/gzip",
-        headers={
-            "Content-Disposition": f'attachment; filename="{archive_name}"',
-            "X-Content-Type-Options": "nosniff",
-        },
-    )
-
-
-def create_tar_gz_archive(dir_path: Path, output_path: Path) -> Path:
-    """Create a tar.gz archive of a directory and save it to disk.
-
-    Args:
-        dir_path: Directory to archive
-        output_path: Path where the archive will be saved
-
-    Returns:
-        Path to the created archive
-    """
-    validated_path = validate_path(dir_path, base_allowed=None)
-
-    # Create parent directories if needed
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    # Create the tar.gz archive
-    with tarfile.open(output_path, "w:gz") as tar:
-        tar.add(str(validated_path), arcname=validated_path.name)
-
-    return output_path
-
-
-def cleanup_archive_file(file_path: Path) -> None:
-    """Remove the archive file after it has been sent."""
-    try:
-        if file_path.exists():
-            file_path.unlink()
-            logger.debug(f"Cleaned up temporary archive: {file_path}")
-    except Exception as e:
-        logger.warning(f"Failed to clean up archive file {file_path}: {e}")
-
-
-async def file_analysis_output_archive(dir_path: Path, bg_tasks: BackgroundTasks, experiment_id: str) -> FileResponse:
-    """Create a tar.gz archive and return it as a FileResponse for direct download.
-
-    The archive is saved to disk temporarily and cleaned up after the response is sent.
-    """
-    validated_path = validate_path(dir_path, base_allowed=None)
-
-    # Generate archive filename and path
-    archive_name = f"{experiment_id}.tar.gz"
-    archive_path = Path(get_settings().cache_dir) / "downloads" / archive_name
-
-    # Create the archive
-    create_tar_gz_archive(validated_path, archive_path)
-
-    # Schedule cleanup after response is sent
-    bg_tasks.add_task(cleanup_archive_file, archive_path)
-
-    return FileResponse(
-        path=archive_path,
-        filename=archive_name,
-        media_type="application/gzip",
+        stream_archive(validated_path, archive_format, level),
+        media_type=ARCHIVE_MEDIA_TYPES[archive_format],
         headers={
             "Content-Disposition": f'attachment; filename="{archive_name}"',
             "X-Content-Type-Options": "nosniff",
@@ -1073,76 +1249,190 @@ async def get_simulation_outputs(
     hpc_sim_base_path: HPCFilePath,
     data_response_type: SimulationAnalysisDataResponseType = SimulationAnalysisDataResponseType.STREAMING,
     bg_tasks: BackgroundTasks | None = None,
-) -> StreamingResponse | FileResponse:
-    """Get simulation outputs as a tar.gz archive.
+    archive_format: ArchiveFormat = ArchiveFormat.TAR_GZ,
+    level: int | None = None,
+    if_none_match: str | None = None,
+    range_requested: bool = False,
+    remote_stream: bool = False,
+) -> Response:
+    """Get simulation outputs as an archive (``tar.gz`` by default, see ``ArchiveFormat``).
 
     Dispatches to SSH/SCP (SLURM backend) or S3 (K8s/LOCAL backend) based on the HpcRun record.
+    Archives go through the on-disk ``ArchiveCache``, keyed by a digest of the source
+    listing: a repeat download of unchanged outputs is served from disk, ``if_none_match``
+    against the listing's ETag yields ``304``, and a ``Range`` request (``range_requested``)
+    is answered from the finished archive so interrupted downloads resume. ``bg_tasks`` is
+    accepted for existing callers; cached archives are no longer cleaned up per request.
+    For SLURM runs, ``remote_stream`` (unless a range is requested) skips the local copy
+    and the cache and relays an archive built on the login node as it is produced.
+    Raises ValueError for a compression level the chosen format does not accept.
     """
+    resolve_compression_level(archive_format, level)
     simulation = await db_service.get_simulation(simulation_id=simulation_id)
     if simulation is None:
         raise ValueError(f"Simulation with id {simulation_id} not found in database.")
 
     experiment_id = simulation.config.experiment_id
-
-    # Download files to local cache, preserving directory structure
-    analysis_request_cache = Path(get_settings().cache_dir) / experiment_id
-    analysis_request_cache.mkdir(parents=True, exist_ok=True)
+    archive_name = archive_filename(experiment_id, archive_format)
+    as_file = data_response_type == SimulationAnalysisDataResponseType.FILE
 
     # Dispatch based on backend
     hpc_run = await db_service.get_hpcrun_by_ref(ref_id=simulation_id, job_type=JobType.SIMULATION)
-    if hpc_run and hpc_run.job_id.backend == JobBackend.RAY:
-        # Ray backend: stream the xarray/zarr ensemble outputs (seed_NN/store.zarr +
-        # summary.json) directly from S3. FILE mode falls back to streaming.
-        archive_name = f"{experiment_id}.tar.gz"
-        return StreamingResponse(
-            _stream_s3_tar_gz_ray(experiment_id),
-            media_type="application/gzip",
-            headers={
-                "Content-Disposition": f'attachment; filename="{archive_name}"',
-                "X-Content-Type-Options": "nosniff",
-            },
-        )
-    if hpc_run and hpc_run.job_id.backend in (JobBackend.K8S, JobBackend.LOCAL):
-        # K8s/S3 path: stream directly from S3 into tar.gz response (no disk cache).
-        # This avoids ALB 504 timeouts on large simulations by sending bytes immediately.
-        if data_response_type == SimulationAnalysisDataResponseType.FILE:
-            # FILE mode still needs disk — fall back to download-then-serve
-            await _download_outputs_from_s3(experiment_id, analysis_request_cache)
-            if bg_tasks is None:
-                raise ValueError("BackgroundTasks required for FILE response type")
-            return await file_analysis_output_archive(
-                dir_path=analysis_request_cache, bg_tasks=bg_tasks, experiment_id=experiment_id
-            )
-        archive_name = f"{experiment_id}.tar.gz"
-        return StreamingResponse(
-            _stream_s3_tar_gz(experiment_id),
-            media_type="application/gzip",
-            headers={
-                "Content-Disposition": f'attachment; filename="{archive_name}"',
-                "X-Content-Type-Options": "nosniff",
-            },
+    if hpc_run and hpc_run.job_id.backend in (JobBackend.RAY, JobBackend.K8S, JobBackend.LOCAL):
+        # S3 path: stream directly from S3 into the archive response. This avoids ALB 504
+        # timeouts on large simulations by sending bytes immediately. Ray ensembles ship
+        # their xarray/zarr stores + summaries; Nextflow runs their analyses outputs.
+        if hpc_run.job_id.backend == JobBackend.RAY:
+            experiment_prefix, items = await _list_s3_archive_objects_ray(experiment_id)
+        else:
+            experiment_prefix, items = await _list_s3_archive_objects(experiment_id)
+        key = archive_key(experiment_id, archive_format, level, ((i.Key, i.ETag, i.Size) for i in items))
+        return await _cached_archive_response(
+            key,
+            lambda: _stream_s3_objects_archive(experiment_id, experiment_prefix, items, archive_format, level),
+            archive_name=archive_name,
+            as_file=as_file,
+            if_none_match=if_none_match,
+            range_requested=range_requested,
         )
-    else:
-        # SLURM path: download via SSH/SCP then stream
-        exp_analysis_outdir = hpc_sim_base_path / experiment_id / "analyses"
-        available_paths: list[HPCFilePath] = await get_available_omics_output_paths(
-            remote_analysis_outdir=exp_analysis_outdir
+
+    exp_analysis_outdir = hpc_sim_base_path / experiment_id / "analyses"
+    if remote_stream and not range_requested:
+        return await _remote_archive_response(
+            exp_analysis_outdir, experiment_id, archive_format, level, archive_name=archive_name
         )
-        for remote_path in available_paths:
-            await download_analysis_output(
-                local_dir=analysis_request_cache,
-                remote_path=remote_path,
-                response_type=SimulationAnalysisResponseType.TAR_GZIP_STREAM,
-                remote_base_dir=exp_analysis_outdir,
-            )
 
-        if data_response_type == SimulationAnalysisDataResponseType.FILE:
-            if bg_tasks is None:
-                raise ValueError("BackgroundTasks required for FILE response type")
-            return await file_analysis_output_archive(
-                dir_path=analysis_request_cache, bg_tasks=bg_tasks, experiment_id=experiment_id
-            )
-        return await stream_analysis_output_archive(dir_path=analysis_request_cache)
+    # SLURM path: download via SSH/SCP (already-downloaded files are skipped) then archive
+    analysis_request_cache = Path(get_settings().cache_dir) / experiment_id
+    analysis_request_cache.mkdir(parents=True, exist_ok=True)
+    available_paths: list[HPCFilePath] = await get_available_omics_output_paths(
+        remote_analysis_outdir=exp_analysis_outdir, db_service=db_service, experiment_id=experiment_id
+    )
+    await _download_analysis_outputs(available_paths, exp_analysis_outdir, analysis_request_cache)
+    validated_path = validate_path(analysis_request_cache, base_allowed=None)
+    entries = await asyncio.to_thread(_local_archive_entries, validated_path)
+    key = archive_key(experiment_id, archive_format, level, entries)
+    return await _cached_archive_response(
+        key,
+        lambda: stream_archive(validated_path, archive_format, level),
+        archive_name=archive_name,
+        as_file=as_file,
+        if_none_match=if_none_match,
+        range_requested=range_requested,
+    )
+
+
+def _remote_archive_command(remote_dir: HPCFilePath, arcname: str, codec: str | None) -> str:
+    """Shell command that writes a tar of the omics outputs under ``remote_dir`` to stdout.
+
+    Members are named ``<arcname>/<path below remote_dir>``, as in the archive built from
+    the local cache, and the tar is piped through ``codec`` (e.g. ``gzip -6``) if given.
+    ``pipefail`` makes a failing ``find``/``tar`` fail the whole command.
+    """
+    names = " -o ".join(f"-name '*.{extension}'" for extension in _OMICS_OUTPUT_EXTENSIONS)
+    transform = shlex.quote(f"s,^\\.,{arcname},")
+    pipeline = (
+        f"cd {shlex.quote(str(remote_dir))} && find . -type f \\( {names} \\) -print0"
+        f" | tar -cf - --null -T - --transform {transform}"
+    )
+    if codec is not None:
+        pipeline += f" | {codec}"
+    return f"bash -o pipefail -c {shlex.quote(pipeline)}"
+
+
+async def _stream_remote_archive(command: str, compressor: ArchiveCompressor | None) -> AsyncIterator[bytes]:
+    """Yield the output of ``command`` on the SLURM login node, compressed locally by ``compressor`` if given."""
+    loop = asyncio.get_running_loop()
+    async with get_ssh_session_service(SSHTarget.SLURM).session() as ssh:
+        async for chunk in ssh.stream_command(command):
+            if compressor is None:
+                yield chunk
+                continue
+            compressed = await loop.run_in_executor(None, compressor.write, chunk)
+            if compressed:
+                yield compressed
+    if compressor is not None:
+        final_chunk = await loop.run_in_executor(None, compressor.close)
+        if final_chunk:
+            yield final_chunk
+
+
+async def _remote_archive_response(
+    remote_dir: HPCFilePath, arcname: str, archive_format: ArchiveFormat, level: int | None, archive_name: str
+) -> StreamingResponse:
+    """Stream the archive of ``remote_dir`` straight from the login node, without a local copy.
+
+    The login node runs ``find | tar | gzip/zstd`` and its stdout is relayed as the
+    response body. If ``zstd`` is not installed there, the raw tar is compressed here
+    instead. Nothing is cached, so the response carries no ETag and cannot serve Range.
+    """
+    compression_level = resolve_compression_level(archive_format, level)
+    probe = f"test -d {shlex.quote(str(remote_dir))} && {{ command -v zstd >/dev/null && echo zstd || echo none; }}"
+    async with get_ssh_session_service(SSHTarget.SLURM).session() as ssh:
+        return_code, stdout, _ = await ssh.run_command(probe, check=False)
+    if return_code != 0:
+        raise ValueError(f"Simulation output directory {remote_dir} not found on the HPC.")
+
+    codec: str | None = None
+    compressor: ArchiveCompressor | None = None
+    if archive_format == ArchiveFormat.TAR_GZ:
+        codec = f"gzip -{compression_level}"
+    elif archive_format == ArchiveFormat.TAR_ZST and stdout.strip() == "zstd":
+        ultra = " --ultra" if compression_level is not None and compression_level > 19 else ""
+        codec = f"zstd -{compression_level}{ultra} -T0 -q -c"
+    elif archive_format == ArchiveFormat.TAR_ZST:
+        compressor = ArchiveCompressor(archive_format, compression_level)
+
+    command = _remote_archive_command(remote_dir, arcname, codec)
+    return StreamingResponse(
+        _stream_remote_archive(command, compressor),
+        media_type=ARCHIVE_MEDIA_TYPES[archive_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{archive_name}"',
+            "X-Content-Type-Options": "nosniff",
+        },
+    )
+
+
+def _local_archive_entries(dir_path: Path) -> list[tuple[str, str, int]]:
+    """``(relative path, mtime_ns, size)`` of every file under ``dir_path`` (its archive cache listing)."""
+    entries = []
+    for path in dir_path.rglob("*"):
+        if path.is_file():
+            stat = path.stat()
+            entries.append((str(path.relative_to(dir_path)), str(stat.st_mtime_ns), stat.st_size))
+    return entries
+
+
+async def _cached_archive_response(
+    key: ArchiveKey,
+    source: ArchiveSource,
+    archive_name: str,
+    as_file: bool,
+    if_none_match: str | None,
+    range_requested: bool,
+) -> Response:
+    """Serve ``key``'s archive from the archive cache, building it from ``source`` on a miss.
+
+    A miss streams the archive while it is written to the cache, unless the caller
+    wants a file or a byte range — both need the finished archive on disk first.
+    ``FileResponse`` then answers ``Range``/``If-Range`` itself.
+    """
+    headers = {
+        "Content-Disposition": f'attachment; filename="{archive_name}"',
+        "X-Content-Type-Options": "nosniff",
+        "ETag": key.etag,
+    }
+    if etag_matches(if_none_match, key.etag):
+        return Response(status_code=304, headers={"ETag": key.etag})
+    media_type = ARCHIVE_MEDIA_TYPES[key.archive_format]
+    cache = get_archive_cache()
+    path = cache.lookup(key)
+    if path is None and (as_file or range_requested):
+        path = await cache.build(key, source)
+    if path is not None:
+        return FileResponse(path=path, media_type=media_type, headers=headers)
+    return StreamingResponse(cache.stream(key, source), media_type=media_type, headers=headers)
 
 
 _ACCEPTED_ANALYSES_EXTENSIONS = (".tsv", ".json")
@@ -1219,45 +1509,116 @@ async def _download_outputs_from_s3(experiment_id: str, local_cache: Path) -> No
             logger.warning(f"workflow_config.json not found at {workflow_config_key}, skipping")
 
 
-async def _fetch_s3_file_entries(
-    experiment_id: str, download_keys: list[str], experiment_prefix: str
-) -> list[tuple[str, bytes]]:
-    """Fetch S3 objects in-memory as (arcname, content) pairs for tar creation."""
+_S3_PREFETCH_CONCURRENCY = 16
+_S3_PREFETCH_WINDOW_BYTES = 128 * 1024 * 1024
+
+
+async def _prefetch_s3_objects(
+    objects: list[tuple[str, int]],
+    concurrency: int = _S3_PREFETCH_CONCURRENCY,
+    window_bytes: int = _S3_PREFETCH_WINDOW_BYTES,
+) -> AsyncIterator[tuple[str, bytes]]:
+    """Download ``(key, size)`` S3 objects concurrently, yielding ``(key, content)`` in input order.
+
+    At most ``concurrency`` objects are in flight or waiting to be consumed, and a
+    new download only starts while those objects' listed sizes stay within
+    ``window_bytes`` (an object bigger than the window still goes through, alone).
+    So memory is bounded by the window, not by the experiment size, and the first
+    object is handed on as soon as it lands. A failed or missing object raises, so
+    a partial archive is never produced. Downloads not yet consumed are cancelled
+    if the consumer stops early.
+    """
     file_service = get_file_service()
     if file_service is None:
         raise RuntimeError("File service is not initialized")
 
-    entries: list[tuple[str, bytes]] = []
-    for key in download_keys:
-        try:
-            content = await file_service.get_file_contents(S3FilePath(s3_path=Path(key)))
-            if content is not None:
-                relative = str(Path(key).relative_to(experiment_prefix))
-                entries.append((f"{experiment_id}/{relative}", content))
-        except Exception:
-            logger.warning(f"Failed to fetch {key}, skipping")
-    return entries
-
+    async def _fetch(key: str) -> bytes:
+        content = await file_service.get_file_contents(S3FilePath(s3_path=Path(key)))
+        if content is None:
+            raise FileNotFoundError(f"S3 object {key} not found")
+        return content
 
-def _write_tar_entries(write_file: io.BufferedWriter, file_entries: list[tuple[str, bytes]]) -> None:
-    """Write (arcname, content) pairs into a streaming tar archive."""
+    window: deque[tuple[str, int, asyncio.Task[bytes]]] = deque()
+    window_size = 0
+    pending = iter(objects)
+    next_object = next(pending, None)
     try:
-        with tarfile.open(fileobj=write_file, mode="w|") as tar:
-            for arcname, data in file_entries:
-                info = tarfile.TarInfo(name=arcname)
-                info.size = len(data)
-                tar.addfile(info, io.BytesIO(data))
+        while window or next_object is not None:
+            while (
+                next_object is not None
+                and len(window) < concurrency
+                and (not window or window_size + next_object[1] <= window_bytes)
+            ):
+                key, size = next_object
+                window.append((key, size, asyncio.create_task(_fetch(key))))
+                window_size += size
+                next_object = next(pending, None)
+            key, size, task = window.popleft()
+            content = await task
+            window_size -= size
+            yield key, content
     finally:
-        write_file.close()
+        for _, _, task in window:
+            task.cancel()
+
+
+class _TarEncoder:
+    """Incremental tar writer: each ``add`` returns the encoded (compressed) bytes ready to send."""
+
+    def __init__(self, compressor: ArchiveCompressor) -> None:
+        self._compressor = compressor
+        self._sink = io.BytesIO()
+        self._tar = tarfile.open(fileobj=self._sink, mode="w|")  # noqa: SIM115 closed in close()
+
+    def _drain(self) -> bytes:
+        data = self._sink.getvalue()
+        self._sink.seek(0)
+        self._sink.truncate()
+        return self._compressor.write(data)
+
+    def add(self, arcname: str, data: bytes) -> bytes:
+        info = tarfile.TarInfo(name=arcname)
+        info.size = len(data)
+        self._tar.addfile(info, io.BytesIO(data))
+        return self._drain()
+
+    def close(self) -> bytes:
+        self._tar.close()
+        return self._drain() + self._compressor.close()
 
+    def discard(self) -> None:
+        """Release the tar stream of an archive that will not be finished."""
+        self._tar.close()
+        self._sink.close()
 
-async def _stream_s3_tar_gz(experiment_id: str, chunk_size: int = 64 * 1024) -> AsyncIterator[bytes]:
-    """Stream S3 simulation outputs directly into a tar.gz response.
 
-    Fetches S3 objects in-memory and pipes them into a tar stream on-the-fly,
-    so bytes flow to the client continuously — avoids ALB 504 timeouts that
-    occur when the server downloads all files to disk before responding.
+async def _stream_s3_objects_archive(
+    experiment_id: str,
+    experiment_prefix: str,
+    items: list[ListingItem],
+    archive_format: ArchiveFormat,
+    level: int | None,
+) -> AsyncIterator[bytes]:
+    """Archive the S3 objects ``items`` (under ``experiment_prefix``) as they arrive.
+
+    Entries are named ``{experiment_id}/{key relative to the prefix}`` and written
+    in listing order; tar encoding and compression run off the event loop.
     """
+    encoder = _TarEncoder(ArchiveCompressor(archive_format, level))
+    try:
+        async for key, content in _prefetch_s3_objects([(item.Key, item.Size) for item in items]):
+            arcname = f"{experiment_id}/{Path(key).relative_to(experiment_prefix)}"
+            chunk = await asyncio.to_thread(encoder.add, arcname, content)
+            if chunk:
+                yield chunk
+    except BaseException:
+        encoder.discard()
+        raise
+    yield await asyncio.to_thread(encoder.close)
+
+
+async def _list_s3_archive_objects(experiment_id: str) -> tuple[str, list[ListingItem]]:
+    """List a Nextflow run's S3 outputs to archive (analyses + workflow config), with their prefix."""
     experiment_prefix = data_layout.NextflowLayout.experiment_prefix(experiment_id)
 
     file_service = get_file_service()
@@ -1266,27 +1627,20 @@ async def _stream_s3_tar_gz(experiment_id: str, chunk_size: int = 64 * 1024) ->
 
     analyses_prefix = S3FilePath(s3_path=Path(f"{experiment_prefix}/analyses"))
     analyses_listing = await file_service.get_listing(analyses_prefix)
-    download_keys = [item.Key for item in analyses_listing if item.Key.endswith(_ACCEPTED_ANALYSES_EXTENSIONS)]
-    download_keys.append(f"{experiment_prefix}/{_WORKFLOW_CONFIG_KEY}")
-    logger.info(f"Streaming {len(download_keys)} files from S3 for experiment {experiment_id}")
-
-    file_entries = await _fetch_s3_file_entries(experiment_id, download_keys, experiment_prefix)
-
-    read_fd, write_fd = os.pipe()
-    read_file = os.fdopen(read_fd, "rb")
-    write_file = os.fdopen(write_fd, "wb")
-    loop = asyncio.get_event_loop()
+    items = [item for item in analyses_listing if item.Key.endswith(_ACCEPTED_ANALYSES_EXTENSIONS)]
+    config_key = f"{experiment_prefix}/{_WORKFLOW_CONFIG_KEY}"
+    config_listing = await file_service.get_listing(S3FilePath(s3_path=Path(config_key).parent))
+    # Only listed objects are archived: any fetch failure aborts the whole archive.
+    items.extend(item for item in config_listing if item.Key == config_key)
+    logger.info(f"Archiving {len(items)} files from S3 for experiment {experiment_id}")
+    return experiment_prefix, items
 
-    tar_future = loop.run_in_executor(None, _write_tar_entries, write_file, file_entries)
 
-    async for chunk in _gzip_pipe_stream(read_file, loop, chunk_size):
-        yield chunk
+async def _list_s3_archive_objects_ray(experiment_id: str) -> tuple[str, list[ListingItem]]:
+    """List a Ray ensemble's S3 outputs (zarr stores + summaries) to archive, with their prefix.
 
-    await tar_future
-
-
-async def _stream_s3_tar_gz_ray(experiment_id: str, chunk_size: int = 64 * 1024) -> AsyncIterator[bytes]:
-    """Stream a Ray ensemble's S3 outputs (zarr stores + summaries) into a tar.gz.
+        The zarr chunks are already compressed, so ``ArchiveFormat.TAR`` is the cheap
+        choice here; ``tar.zst`` still helps the JSON/metadata objects.
 
         The Ray entrypoint syncs the whole ``.pbg/runs/phase0-xarray`` tree to
         ``s3://{bucket}/{s3_output_prefix}/{experiment_id}/`` — for v2ecoli comparison
@@ -1303,50 +1657,9 @@ async def _stream_s3_tar_gz_ray(experiment_id: str, chunk_size: int = 64 * 1024)
     if file_service is None:
         raise RuntimeError("File service is not initialized")
 
-    listing = await file_service.get_listing(S3FilePath(s3_path=Path(experiment_prefix)))
-    download_keys = [item.Key for item in listing]
-    logger.info(f"Streaming {len(download_keys)} Ray output objects from S3 for experiment {experiment_id}")
-
-    file_entries = await _fetch_s3_file_entries(experiment_id, download_keys, experiment_prefix)
-
-    read_fd, write_fd = os.pipe()
-    read_file = os.fdopen(read_fd, "rb")
-    write_file = os.fdopen(write_fd, "wb")
-    loop = asyncio.get_event_loop()
-
-    tar_future = loop.run_in_executor(None, _write_tar_entries, write_file, file_entries)
-
-    async for chunk in _gzip_pipe_stream(read_file, loop, chunk_size):
-        yield chunk
-
-    await tar_future
-
-
-async def _gzip_pipe_stream(
-    read_file: io.BufferedReader, loop: asyncio.AbstractEventLoop, chunk_size: int
-) -> AsyncIterator[bytes]:
-    """Read raw tar data from a pipe, gzip-compress, and yield chunks."""
-    gzip_buffer = io.BytesIO()
-    gzip_file = gzip.GzipFile(fileobj=gzip_buffer, mode="wb")
-    try:
-        while True:
-            raw = await loop.run_in_executor(None, read_file.read, chunk_size)
-            if not raw:
-                break
-            gzip_file.write(raw)
-            if gzip_buffer.tell() > 0:
-                gzip_buffer.seek(0)
-                compressed = gzip_buffer.read()
-                gzip_buffer.seek(0)
-                gzip_buffer.truncate()
-                yield compressed
-        gzip_file.close()
-        gzip_buffer.seek(0)
-        final = gzip_buffer.read()
-        if final:
-            yield final
-    finally:
-        read_file.close()
+    items = await file_service.get_listing(S3FilePath(s3_path=Path(experiment_prefix)))
+    logger.info(f"Archiving {len(items)} Ray output objects from S3 for experiment {experiment_id}")
+    return experiment_prefix, items
 
 
 async def get_simulation_log(db_service: DatabaseService, simulation_id: int, truncate: bool = True) -> Response:
@@ -15,6 +15,7 @@ from sms_api.simulation.models import (
     SimulatorVersion,
 )
 from sms_api.simulation.simulation_service import SimulationService, SimulationServiceHpc
+from sms_api.simulation.status_watcher import track_hpcrun
 
 logger = logging.getLogger(__name__)
 
@@ -155,6 +156,7 @@ async def upload_simulator(  # noqa: C901
             ref_id=simulator.database_id,
             correlation_id="N/A",
         )
+        track_hpcrun(hpc_run)
 
         # For LOCAL builds (K8s AND Ray both submit the DooD build as a LOCAL task),
         # register a done-callback to propagate the final status to the DB. Both services
@@ -0,0 +1,160 @@
+"""Per-backend job status sources for the status watcher.
+
+Each source answers "what is the status of these jobs?" for one :class:`JobBackend`
+with as few backend calls as the backend allows (one ``squeue``, one
+``describe_jobs`` per 100 IDs, one K8s job listing). Sources that can *push*
+transitions (a K8s Job watch stream) are :class:`PushJobStatusSource` and implement
+:meth:`PushJobStatusSource.watch`; the watcher then only polls them occasionally to
+catch anything a stream missed.
+"""
+
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+from sms_api.common.hpc.job_service import JobStatusInfo
+from sms_api.common.hpc.k8s_job_service import K8sJobService
+from sms_api.common.hpc.local_task_service import LocalTaskService
+from sms_api.common.hpc.models import SlurmJob
+from sms_api.common.hpc.slurm_service import SlurmService
+from sms_api.common.models import JobBackend, JobId, JobStatus, SSHTarget
+from sms_api.dependencies import get_ssh_session_service
+
+logger = logging.getLogger(__name__)
+
+# AWS Batch DescribeJobs accepts at most 100 job IDs per call.
+BATCH_DESCRIBE_JOBS_MAX = 100
+
+
+class JobStatusSource(ABC):
+    """Batched status lookups for one backend."""
+
+    backend: JobBackend
+
+    @abstractmethod
+    async def get_statuses(self, job_ids: list[JobId]) -> list[JobStatusInfo]:
+        """Current status of each job the backend knows about; unknown jobs are omitted."""
+        pass
+
+
+class PushJobStatusSource(JobStatusSource):
+    """A status source that also streams status changes as the backend reports them."""
+
+    @abstractmethod
+    def watch(self) -> AsyncIterator[JobStatusInfo]:
+        """Yield status changes until the backend ends the stream (the watcher restarts it)."""
+        pass
+
+
+def slurm_job_to_status_info(slurm_job: SlurmJob) -> JobStatusInfo:
+    status = JobStatus.from_slurm_state(slurm_job.job_state)
+    error_message = None
+    if status in (JobStatus.FAILED, JobStatus.CANCELLED):
+        error_parts = [f"SLURM state: {slurm_job.job_state}"]
+        if slurm_job.reason:
+            error_parts.append(f"reason: {slurm_job.reason}")
+        if slurm_job.exit_code:
+            error_parts.append(f"exit_code: {slurm_job.exit_code}")
+        error_message = ", ".join(error_parts)
+    return JobStatusInfo(
+        job_id=JobId.slurm(slurm_job.job_id),
+        status=status,
+        start_time=slurm_job.start_time,
+        end_time=slurm_job.end_time,
+        exit_code=slurm_job.exit_code,
+        error_message=error_message,
+    )
+
+
+class SlurmJobStatusSource(JobStatusSource):
+    """All SLURM jobs in one batched ``squeue`` round-trip (terminal jobs come from its cache)."""
+
+    backend = JobBackend.SLURM
+
+    def __init__(self, slurm_service: SlurmService) -> None:
+        self.slurm_service = slurm_service
+
+    async def get_statuses(self, job_ids: list[JobId]) -> list[JobStatusInfo]:
+        async with get_ssh_session_service(SSHTarget.SLURM).session() as ssh:
+            slurm_jobs = await self.slurm_service.get_job_statuses(ssh, [job_id.as_slurm_int for job_id in job_ids])
+        return [slurm_job_to_status_info(slurm_job) for slurm_job in slurm_jobs]
+
+
+class BatchJobStatusSource(JobStatusSource):
+    """AWS Batch jobs via ``describe_jobs``, up to 100 IDs per call."""
+
+    def __init__(self, backend: JobBackend, batch_client_factory: Callable[[], Any]) -> None:
+        self.backend = backend
+        self._batch_client_factory = batch_client_factory
+        self._client: Any | None = None
+
+    async def get_statuses(self, job_ids: list[JobId]) -> list[JobStatusInfo]:
+        by_value = {job_id.value: job_id for job_id in job_ids}
+        values = list(by_value)
+        chunks = [values[i : i + BATCH_DESCRIBE_JOBS_MAX] for i in range(0, len(values), BATCH_DESCRIBE_JOBS_MAX)]
+        responses = await asyncio.gather(*(asyncio.to_thread(self._describe_jobs, chunk) for chunk in chunks))
+        infos: list[JobStatusInfo] = []
+        for jobs in responses:
+            for job in jobs:
+                job_id = by_value.get(job.get("jobId", ""))
+                if job_id is not None:
+                    infos.append(batch_job_to_status_info(job, job_id))
+        return infos
+
+    def _describe_jobs(self, job_ids: list[str]) -> list[dict[str, Any]]:
+        if self._client is None:
+            self._client = self._batch_client_factory()
+        response = self._client.describe_jobs(jobs=job_ids)
+        jobs: list[dict[str, Any]] = response.get("jobs", [])
+        return jobs
+
+
+def batch_job_to_status_info(job: dict[str, Any], job_id: JobId) -> JobStatusInfo:
+    status = JobStatus.from_batch_state(job.get("status", ""))
+    started = job.get("startedAt")
+    stopped = job.get("stoppedAt")
+    return JobStatusInfo(
+        job_id=job_id,
+        status=status,
+        start_time=str(started) if started else None,
+        end_time=str(stopped) if stopped else None,
+        exit_code=None,
+        error_message=job.get("statusReason") if status == JobStatus.FAILED else None,
+    )
+
+
+class K8sJobStatusSource(PushJobStatusSource):
+    """K8s Jobs: one namespace listing per poll, and a Job watch stream for pushes."""
+
+    backend = JobBackend.K8S
+
+    def __init__(self, k8s_job_service: K8sJobService, watch_timeout_seconds: int = 60) -> None:
+        self.k8s_job_service = k8s_job_service
+        self.watch_timeout_seconds = watch_timeout_seconds
+
+    async def get_statuses(self, job_ids: list[JobId]) -> list[JobStatusInfo]:
+        wanted = {job_id.value for job_id in job_ids}
+        infos = await asyncio.to_thread(self.k8s_job_service.list_job_statuses)
+        return [info for info in infos if info.job_id.value in wanted]
+
+    async def watch(self) -> AsyncIterator[JobStatusInfo]:
+        # The kubernetes watch is a blocking generator that ends after watch_timeout_seconds;
+        # the watcher restarts it, which also replays the current state of every Job.
+        events = self.k8s_job_service.watch_job_statuses(timeout_seconds=self.watch_timeout_seconds)
+        while (info := await asyncio.to_thread(next, events, None)) is not None:
+            yield info
+
+
+class LocalJobStatusSource(JobStatusSource):
+    """In-process tasks tracked by a :class:`LocalTaskService` (a dict lookup, no I/O)."""
+
+    backend = JobBackend.LOCAL
+
+    def __init__(self, local_task_service: LocalTaskService) -> None:
+        self.local_task_service = local_task_service
+
+    async def get_statuses(self, job_ids: list[JobId]) -> list[JobStatusInfo]:
+        infos = [self.local_task_service.get_status(job_id.value) for job_id in job_ids]
+        return [info for info in infos if info is not None]
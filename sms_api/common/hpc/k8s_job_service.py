@@ -1,8 +1,10 @@
 """Kubernetes Job status service for polling workflow run status."""
 
 import logging
+from collections.abc import Iterator
 
 from kubernetes import client as k8s_client
+from kubernetes import watch as k8s_watch
 
 from sms_api.common.hpc.job_service import JobStatusInfo
 from sms_api.common.models import JobId, JobStatus
@@ -92,6 +94,30 @@ class K8sJobService:
             raise
         return _job_to_status_info(job, JobId.k8s(job_name))
 
+    def list_job_statuses(self) -> list[JobStatusInfo]:
+        """Status of every K8s Job in the namespace, in one API call."""
+        jobs = self._batch_api.list_namespaced_job(namespace=self._namespace)
+        return [
+            _job_to_status_info(job, JobId.k8s(job.metadata.name))
+            for job in jobs.items
+            if job.metadata and job.metadata.name
+        ]
+
+    def watch_job_statuses(self, timeout_seconds: int = 60) -> Iterator[JobStatusInfo]:
+        """Stream the status of Jobs in the namespace as they change (blocking).
+
+        Starts with the current state of every Job, then yields each add/modify event
+        until the server closes the watch after ``timeout_seconds``.
+        """
+        watch = k8s_watch.Watch()  # type: ignore[no-untyped-call]
+        stream = watch.stream(  # type: ignore[no-untyped-call]
+            self._batch_api.list_namespaced_job, namespace=self._namespace, timeout_seconds=timeout_seconds
+        )
+        for event in stream:
+            job: k8s_client.V1Job = event["object"]
+            if event["type"] in ("ADDED", "MODIFIED") and job.metadata and job.metadata.name:
+                yield _job_to_status_info(job, JobId.k8s(job.metadata.name))
+
     def delete_job(self, job_name: str) -> None:
         """Delete a K8s Job with foreground propagation (kills pods)."""
         self._batch_api.delete_namespaced_job(
@@ -12,6 +12,20 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+# Job states after which SLURM never changes a job again.
+SLURM_TERMINAL_STATES = frozenset({
+    "BOOT_FAIL",
+    "CANCELLED",
+    "COMPLETED",
+    "DEADLINE",
+    "FAILED",
+    "NODE_FAIL",
+    "OUT_OF_MEMORY",
+    "PREEMPTED",
+    "TIMEOUT",
+})
+
+
 class SlurmJob(BaseModel):
     #                                 --squeue--   --sacct--   --scontrol--
     job_id: int  #                       %i          jobid       JobId
@@ -87,10 +101,18 @@ class SlurmJob(BaseModel):
     def get_squeue_format_string() -> str:
         return "%i|%j|%a|%u|%T"
 
+    @staticmethod
+    def get_squeue_status_format_string() -> str:
+        """``get_squeue_format_string`` plus start time, elapsed time and reason."""
+        return "%i|%j|%a|%u|%T|%S|%M|%r"
+
     @classmethod
     def from_squeue_formatted_output(cls, line: str) -> "SlurmJob":
         # Split the line by delimiter
         fields = line.strip().split("|")
+        # Fields past the state are only present with get_squeue_status_format_string
+        extra = [None if value in ("N/A", "None", "") else value for value in fields[5:8]]
+        start_time, elapsed, reason = extra + [None] * (3 - len(extra))
         # Map fields to model attributes
         return cls(
             job_id=int(fields[0]),
@@ -98,8 +120,24 @@ class SlurmJob(BaseModel):
             account=fields[2],
             user_name=fields[3],
             job_state=fields[4],
+            start_time=start_time,
+            elapsed=elapsed,
+            reason=reason,
         )
 
+    def is_terminal(self) -> bool:
+        """Whether SLURM will never report a different state for this job."""
+        return self.job_state.upper() in SLURM_TERMINAL_STATES
+
+    @staticmethod
+    def scontrol_oneliner_job_id(line: str) -> int | None:
+        """Job ID of one ``scontrol -o show job`` record, without parsing the rest of the line."""
+        if not line.startswith("JobId="):
+            return None
+        end = line.find(" ")
+        value = line[len("JobId=") : end if end != -1 else None]
+        return int(value) if value.isdigit() else None
+
     @classmethod
     def from_scontrol_output(cls, output: str) -> "SlurmJob":
         """Parse scontrol show job output into a SlurmJob.
@@ -133,9 +171,10 @@ class SlurmJob(BaseModel):
 
         job_state = data.get("JobState", "UNKNOWN")
         # Only accept EndTime for completed jobs - running jobs report scheduled end time
-        terminal_states = {"COMPLETED", "FAILED", "CANCELLED", "TIMEOUT", "NODE_FAIL", "PREEMPTED", "OUT_OF_MEMORY"}
         end_time_raw = data.get("EndTime")
-        end_time = end_time_raw if end_time_raw and end_time_raw != "Unknown" and job_state in terminal_states else None
+        end_time = (
+            end_time_raw if end_time_raw and end_time_raw != "Unknown" and job_state in SLURM_TERMINAL_STATES else None
+        )
 
         return cls(
             job_id=int(data.get("JobId", "0")),
@@ -1,4 +1,5 @@
 import logging
+from collections import OrderedDict
 from pathlib import Path
 
 from sms_api.common.hpc.models import SlurmJob
@@ -9,9 +10,47 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 
+# Bound on remembered finished jobs; one poll loop sees far fewer distinct jobs than this.
+TERMINAL_JOB_CACHE_SIZE = 10_000
+
+
+class TerminalJobCache:
+    """Bounded memo of jobs in a terminal SLURM state.
+
+    SLURM never changes a job once it has finished, so a terminal answer is final and
+    the job need not be queried again — which also keeps it answerable after it has
+    aged out of the controller's memory.
+    """
+
+    def __init__(self, max_size: int = TERMINAL_JOB_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self._jobs: OrderedDict[int, SlurmJob] = OrderedDict()
+
+    def get(self, job_id: int) -> SlurmJob | None:
+        return self._jobs.get(job_id)
+
+    def add(self, job: SlurmJob) -> None:
+        if not job.is_terminal():
+            return
+        self._jobs[job.job_id] = job
+        self._jobs.move_to_end(job.job_id)
+        while len(self._jobs) > self.max_size:
+            self._jobs.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+
+# Shared by default: SlurmService is instantiated per call site, the answers are cluster-wide.
+_terminal_job_cache = TerminalJobCache()
+
+
 class SlurmService:
     verified_htc_dir: bool = False
 
+    def __init__(self, terminal_cache: TerminalJobCache | None = None) -> None:
+        self.terminal_cache = terminal_cache if terminal_cache is not None else _terminal_job_cache
+
     async def get_job_status_squeue(self, ssh: SSHSession, job_ids: list[int] | None = None) -> list[SlurmJob]:
         command = f'squeue -u $USER --noheader --format="{SlurmJob.get_squeue_format_string()}"'
         if job_ids is not None:
@@ -20,12 +59,12 @@ class SlurmService:
 
         return_code, stdout, stderr = await ssh.run_command(command=command, check=False)
 
+        if return_code != 0 and "Invalid job id" in stderr and job_ids is not None:
+            # An invalid job id makes squeue fail entirely, even if the other jobs are valid.
+            # List all of the user's jobs once instead and keep the requested ones.
+            logger.debug("Batch squeue failed due to invalid job id(s), falling back to listing all user jobs")
+            return await self._get_job_status_squeue_filtered(ssh, job_ids)
         if return_code != 0:
-            # Invalid job id causes squeue to fail entirely, even if some jobs are valid
-            # Fall back to querying each job individually to get partial results
-            if "Invalid job id" in stderr and job_ids is not None:
-                logger.debug("Batch squeue failed due to invalid job id(s), falling back to individual queries")
-                return await self._get_job_status_squeue_individual(ssh, job_ids)
             raise Exception(
                 f"failed to get job status with command {command} return code {return_code} stderr {stderr[:100]}"
             )
@@ -36,34 +75,14 @@ class SlurmService:
             slurm_jobs.append(SlurmJob.from_squeue_formatted_output(line.strip()))
         return slurm_jobs
 
-    async def _get_job_status_squeue_individual(self, ssh: SSHSession, job_ids: list[int]) -> list[SlurmJob]:
-        """Query squeue for each job individually to handle invalid job IDs gracefully.
+    async def _get_job_status_squeue_filtered(self, ssh: SSHSession, job_ids: list[int]) -> list[SlurmJob]:
+        """Query squeue once for all of the user's jobs and keep those in ``job_ids``.
 
-        This is slower than batch querying but allows returning partial results
-        when some job IDs are invalid (e.g., jobs that have completed and left squeue).
+        Used when a batch query fails because some job IDs are unknown to squeue
+        (e.g. jobs that have completed and left the queue).
         """
-        slurm_jobs: list[SlurmJob] = []
-        for job_id in job_ids:
-            command = f'squeue --noheader --format="{SlurmJob.get_squeue_format_string()}" -j {job_id}'
-            return_code, stdout, stderr = await ssh.run_command(command=command, check=False)
-
-            if return_code != 0:
-                if "Invalid job id" in stderr:
-                    logger.debug(f"Job {job_id} not found in squeue (may have completed)")
-                    continue
-                # Log warning but continue to next job
-                logger.warning(f"squeue failed for job {job_id}: {stderr[:100]}")
-                continue
-
-            for line in stdout.splitlines():
-                if not line.strip():
-                    continue
-                try:
-                    slurm_jobs.append(SlurmJob.from_squeue_formatted_output(line.strip()))
-                except Exception as e:
-                    logger.warning(f"Failed to parse squeue output for job {job_id}: {e}")
-
-        return slurm_jobs
+        wanted = set(job_ids)
+        return [job for job in await self.get_job_status_squeue(ssh) if job.job_id in wanted]
 
     # this is deprecated for use in this project since GovCloud PCS doesn't support Slurm accounting
     async def _get_job_status_sacct(self, ssh: SSHSession, job_ids: list[int] | None = None) -> list[SlurmJob]:
@@ -93,9 +112,9 @@ class SlurmService:
         return slurm_jobs
 
     async def get_job_status_scontrol(self, ssh: SSHSession, job_ids: list[int]) -> list[SlurmJob]:
-        """Get job status using scontrol show job (alternative to sacct when accounting is disabled).
+        """Get job status using squeue and scontrol show job (alternative to sacct when accounting is disabled).
 
-        Note: scontrol only shows jobs that are still in the scheduler's memory.
+        Note: squeue and scontrol only show jobs that are still in the scheduler's memory.
         Completed jobs may not be available after some time (typically minutes to hours
         depending on SLURM configuration). For historical job data, use sacct if available.
 
@@ -106,32 +125,88 @@ class SlurmService:
         Returns:
             List of SlurmJob objects for jobs that were found
         """
-        if not job_ids:
-            return []
+        return await self.get_job_statuses(ssh, job_ids)
 
-        slurm_jobs: list[SlurmJob] = []
-        for job_id in job_ids:
-            command = f"scontrol show job {job_id}"
-            return_code, stdout, stderr = await ssh.run_command(command=command, check=False)
+    async def get_job_statuses(self, ssh: SSHSession, job_ids: list[int]) -> list[SlurmJob]:
+        """Status of every job in ``job_ids``, querying the controller for those jobs only.
 
-            if return_code != 0:
-                # Job not found is not an error - it may have completed and left scheduler memory
-                if "Invalid job id" in stderr or "not found" in stderr.lower():
-                    logger.debug(f"Job {job_id} not found in scontrol (may have completed)")
-                    continue
-                raise Exception(
-                    f"failed to get job status with command {command} return code {return_code} stderr {stderr[:100]}"
-                )
-
-            if stdout.strip():
-                try:
-                    slurm_job = SlurmJob.from_scontrol_output(stdout)
-                    slurm_jobs.append(slurm_job)
-                except Exception as e:
-                    logger.warning(f"Failed to parse scontrol output for job {job_id}: {e}")
+        Jobs already known to be terminal are answered from ``terminal_cache``. The rest
+        are fetched with one ``squeue -j`` for just their IDs (all states, so recently
+        finished jobs are still listed). Jobs that squeue reports as finished, for their
+        exit code and end time, or no longer reports at all are then looked up one by one
+        with ``scontrol -o show job <id>``; each job takes that path once, after which it
+        is cached. Jobs unknown to both are omitted from the result.
+        """
+        found: dict[int, SlurmJob] = {}
+        pending: list[int] = []
+        for job_id in dict.fromkeys(job_ids):
+            cached = self.terminal_cache.get(job_id)
+            if cached is not None:
+                found[job_id] = cached
+            else:
+                pending.append(job_id)
+
+        if pending:
+            queued = {slurm_job.job_id: slurm_job for slurm_job in await self._squeue_jobs(ssh, pending)}
+            for job_id in pending:
+                slurm_job = queued.get(job_id)
+                if slurm_job is None or slurm_job.is_terminal():
+                    slurm_job = await self._scontrol_show_job(ssh, job_id) or slurm_job
+                if slurm_job is not None:
+                    found[job_id] = slurm_job
+                    self.terminal_cache.add(slurm_job)
+
+        return [found[job_id] for job_id in dict.fromkeys(job_ids) if job_id in found]
+
+    async def _squeue_jobs(self, ssh: SSHSession, job_ids: list[int]) -> list[SlurmJob]:
+        fields = f'--noheader --states=all --format="{SlurmJob.get_squeue_status_format_string()}"'
+        command = f"squeue {fields} -j {','.join(map(str, job_ids))}"
+        return_code, stdout, stderr = await ssh.run_command(command=command, check=False)
 
+        if return_code != 0 and "Invalid job id" in stderr:
+            if len(job_ids) == 1:
+                return []
+            # An invalid job id can fail the whole query; list the user's jobs once instead.
+            logger.debug("Batch squeue failed due to invalid job id(s), falling back to listing all user jobs")
+            command = f"squeue -u $USER {fields}"
+            return_code, stdout, stderr = await ssh.run_command(command=command, check=False)
+        if return_code != 0:
+            raise Exception(
+                f"failed to get job status with command {command} return code {return_code} stderr {stderr[:100]}"
+            )
+
+        wanted = set(job_ids)
+        slurm_jobs: list[SlurmJob] = []
+        for line in stdout.splitlines():
+            if not line.strip():
+                continue
+            slurm_job = SlurmJob.from_squeue_formatted_output(line)
+            if slurm_job.job_id in wanted:
+                slurm_jobs.append(slurm_job)
         return slurm_jobs
 
+    async def _scontrol_show_job(self, ssh: SSHSession, job_id: int) -> SlurmJob | None:
+        command = f"scontrol -o show job {job_id}"
+        return_code, stdout, stderr = await ssh.run_command(command=command, check=False)
+
+        if return_code != 0:
+            # Job not found is not an error - it may have completed and left scheduler memory
+            if "Invalid job id" in stderr or "not found" in stderr.lower():
+                logger.debug(f"Job {job_id} not found in scontrol (may have completed)")
+                return None
+            raise Exception(
+                f"failed to get job status with command {command} return code {return_code} stderr {stderr[:100]}"
+            )
+
+        for line in stdout.splitlines():
+            if SlurmJob.scontrol_oneliner_job_id(line) != job_id:
+                continue
+            try:
+                return SlurmJob.from_scontrol_output(line)
+            except Exception as e:
+                logger.warning(f"Failed to parse scontrol output line {line[:100]!r}: {e}")
+        return None
+
     async def submit_job(
         self,
         ssh: SSHSession,
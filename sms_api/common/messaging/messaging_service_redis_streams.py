@@ -0,0 +1,264 @@
+"""Redis Streams implementation of the messaging service (consumer groups).
+
+Unlike pub/sub, a stream keeps messages until they are acknowledged, so messages
+published while no API replica is listening are delivered when one comes back, and
+replicas that share the consumer group split the load without duplicates. Each
+subject is a stream; :meth:`MessagingServiceRedisStreams.publish` appends with
+``XADD`` (trimmed to about ``max_len`` entries).
+
+The listener reads up to ``batch_size`` messages per ``XREADGROUP`` and runs the
+callbacks concurrently, at most ``max_concurrency`` at a time (the reader waits for a
+free worker, which backpressures the stream rather than memory). A message is
+``XACK``-ed once its callback returns — failures are logged, as with pub/sub — so a
+message is only redelivered if the replica died while handling it: its own pending
+entries are replayed on start, and those of other (dead) consumers are claimed with
+``XAUTOCLAIM`` once idle for ``claim_idle_seconds``. Callbacks may therefore run out
+of order and, rarely, more than once.
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+import socket
+from typing import Any, override
+
+from redis.asyncio.client import Redis
+from redis.exceptions import ResponseError
+
+from sms_api.common.messaging.messaging_service import MessageHandler, MessagingService
+
+logger = logging.getLogger(__name__)
+
+STREAM_DATA_FIELD = b"data"
+
+
+def default_consumer_name() -> str:
+    """Unique per process: the pod name (hostname) plus the PID."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class MessagingServiceRedisStreams(MessagingService):
+    """Redis Streams implementation of the messaging service using a consumer group."""
+
+    def __init__(
+        self,
+        group: str = "sms-api",
+        consumer: str | None = None,
+        batch_size: int = 100,
+        max_concurrency: int = 16,
+        max_len: int = 1_000_000,
+        block_ms: int = 1000,
+        claim_idle_seconds: float = 60.0,
+    ) -> None:
+        """Initialize the Redis Streams messaging service.
+
+        Args:
+            group: Consumer group shared by every replica
+            consumer: This replica's consumer name (defaults to hostname-pid)
+            batch_size: Messages per XREADGROUP (COUNT)
+            max_concurrency: Callbacks running at once
+            max_len: Approximate stream length kept by publish (XADD MAXLEN ~)
+            block_ms: How long one XREADGROUP waits for new messages
+            claim_idle_seconds: Idle time after which another consumer's pending message is claimed
+        """
+        self.group = group
+        self.consumer = consumer or default_consumer_name()
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.max_len = max_len
+        self.block_ms = block_ms
+        self.claim_idle_seconds = claim_idle_seconds
+        self._client: Redis | None = None
+        self._subscriptions: dict[str, MessageHandler] = {}
+        self._listener_task: asyncio.Task[None] | None = None
+        self._stop_event: asyncio.Event = asyncio.Event()
+        self._workers = asyncio.Semaphore(max_concurrency)
+        self._in_flight: set[asyncio.Task[None]] = set()
+
+    @override
+    async def connect(self, host: str, port: int, **kwargs: Any) -> None:
+        """Connect to the Redis server.
+
+        Args:
+            host: Redis server host (e.g. localhost)
+            port: Redis server port (e.g. 6379)
+            **kwargs: Additional Redis connection parameters
+        """
+        if self._client is not None:
+            logger.warning("Redis client is already connected")
+            return
+
+        logger.info(f"Connecting to Redis server at host:port {host}:{port} (streams, consumer {self.consumer})")
+        self._client = Redis(host=host, port=port, **kwargs)
+        await self._client.ping()
+        logger.info("Successfully connected to Redis server")
+
+    @override
+    async def disconnect(self) -> None:
+        """Stop the listener, let in-flight callbacks finish (and be acked), and disconnect."""
+        if self._listener_task is not None and not self._listener_task.done():
+            logger.info("Stopping Redis stream listener task")
+            self._stop_event.set()
+            await self._listener_task
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+        if self._client is not None:
+            logger.info("Disconnecting from Redis server")
+            await self._client.close()
+            self._client = None
+            logger.info("Disconnected from Redis server")
+
+    @override
+    async def publish(self, subject: str, data: bytes) -> None:
+        """Append a message to the Redis stream ``subject``.
+
+        Args:
+            subject: The Redis stream to append to
+            data: The message data as bytes
+
+        Raises:
+            RuntimeError: If not connected to Redis
+        """
+        if self._client is None:
+            raise RuntimeError("Not connected to Redis server")
+
+        await self._client.xadd(subject, {STREAM_DATA_FIELD: data}, maxlen=self.max_len, approximate=True)
+        logger.debug(f"Appended message to stream '{subject}'")
+
+    @override
+    async def subscribe(self, subject: str, callback: MessageHandler) -> None:
+        """Join the consumer group on stream ``subject`` (creating both if needed).
+
+        Args:
+            subject: The Redis stream to consume
+            callback: Async function to handle received messages
+
+        Raises:
+            RuntimeError: If not connected to Redis
+        """
+        if self._client is None:
+            raise RuntimeError("Not connected to Redis server")
+
+        try:
+            # From the start of the stream: messages appended before the group existed are not lost.
+            await self._client.xgroup_create(subject, self.group, id="0", mkstream=True)
+            logger.info(f"Created consumer group '{self.group}' on stream '{subject}'")
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._subscriptions[subject] = callback
+        logger.info(f"Subscribed to Redis stream '{subject}' as '{self.group}/{self.consumer}'")
+
+        if self._listener_task is None or self._listener_task.done():
+            self._stop_event.clear()
+            self._listener_task = asyncio.create_task(self._listen_for_messages())
+
+    async def _listen_for_messages(self) -> None:
+        """Replay this consumer's pending messages, then read new ones (claiming abandoned ones) until stopped."""
+        logger.info("Starting Redis stream listener")
+        loop = asyncio.get_running_loop()
+        next_claim = loop.time()
+        try:
+            await self._replay_pending()
+            while not self._stop_event.is_set():
+                try:
+                    if loop.time() >= next_claim:
+                        await self._claim_abandoned()
+                        next_claim = loop.time() + self.claim_idle_seconds
+                    await self._read()
+                except Exception:
+                    if self._stop_event.is_set():
+                        break
+                    logger.exception("Error while reading Redis streams; retrying")
+                    with contextlib.suppress(TimeoutError):
+                        await asyncio.wait_for(self._stop_event.wait(), timeout=1.0)
+        except Exception:
+            logger.exception("Fatal error in Redis stream listener")
+        finally:
+            logger.info("Redis stream listener stopped")
+
+    async def _read(self) -> None:
+        """One XREADGROUP of new messages (``>``) over every subscribed stream."""
+        if self._client is None or not self._subscriptions:
+            return
+        streams: dict[Any, Any] = dict.fromkeys(self._subscriptions, ">")
+        response = await self._client.xreadgroup(
+            self.group, self.consumer, streams, count=self.batch_size, block=self.block_ms
+        )
+        for stream, messages in _stream_entries(response):
+            for message_id, fields in messages:
+                await self._dispatch(stream, message_id, fields)
+
+    async def _replay_pending(self) -> None:
+        """Re-handle messages delivered to this consumer (name) before a restart but never acked."""
+        if self._client is None:
+            return
+        for subject in list(self._subscriptions):
+            last_id: Any = "0"
+            while True:
+                response = await self._client.xreadgroup(
+                    self.group, self.consumer, {subject: last_id}, count=self.batch_size
+                )
+                messages = [message for _, stream_messages in _stream_entries(response) for message in stream_messages]
+                if not messages:
+                    break
+                for message_id, fields in messages:
+                    await self._dispatch(subject, message_id, fields)
+                last_id = messages[-1][0]
+
+    async def _claim_abandoned(self) -> None:
+        """Take over messages other consumers read but never acked (e.g. a replica that was killed)."""
+        if self._client is None:
+            return
+        min_idle_ms = int(self.claim_idle_seconds * 1000)
+        for subject in list(self._subscriptions):
+            result = await self._client.xautoclaim(
+                subject, self.group, self.consumer, min_idle_time=min_idle_ms, count=self.batch_size
+            )
+            claimed = result[1] if len(result) > 1 else []
+            if claimed:
+                logger.info(f"Claimed {len(claimed)} abandoned messages on stream '{subject}'")
+            for message_id, fields in claimed:
+                await self._dispatch(subject, message_id, fields)
+
+    async def _dispatch(self, stream: str, message_id: Any, fields: dict[bytes, bytes] | None) -> None:
+        """Run the callback on a free worker (waiting for one if all are busy)."""
+        await self._workers.acquire()
+        task = asyncio.create_task(self._handle(stream, message_id, fields))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _handle(self, stream: str, message_id: Any, fields: dict[bytes, bytes] | None) -> None:
+        try:
+            callback = self._subscriptions.get(stream)
+            data = (fields or {}).get(STREAM_DATA_FIELD)
+            if callback is not None and data is not None:
+                try:
+                    await callback(data)
+                except Exception:
+                    logger.exception(f"Error in message handler for stream '{stream}'")
+            elif data is None:
+                logger.warning(f"Message {message_id!r} on stream '{stream}' has no data field (or was trimmed)")
+            if self._client is not None:
+                await self._client.xack(stream, self.group, message_id)
+        finally:
+            self._workers.release()
+
+    def is_connected(self) -> bool:
+        """Check if connected to Redis server.
+
+        Returns:
+            True if connected, False otherwise
+        """
+        return self._client is not None
+
+
+def _stream_entries(response: Any) -> list[tuple[str, list[tuple[Any, dict[bytes, bytes] | None]]]]:
+    """Normalize an XREADGROUP reply to ``[(stream name, [(message id, fields), ...])]``."""
+    entries = []
+    for stream, messages in response or []:
+        name = stream.decode("utf-8") if isinstance(stream, bytes) else str(stream)
+        entries.append((name, list(messages)))
+    return entries
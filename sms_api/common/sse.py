@@ -0,0 +1,52 @@
+"""Server-Sent Events framing (``text/event-stream``), for both the API and its clients.
+
+Only the subset the API emits is supported: named events (``event:``) with a single
+JSON ``data:`` line, and comment lines (``: ...``) as keepalives.
+"""
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+SSE_MEDIA_TYPE = "text/event-stream"
+# Response headers that keep proxies (nginx in particular) from buffering the stream.
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+@dataclass(frozen=True)
+class ServerSentEvent:
+    event: str
+    data: str
+
+
+def format_sse(event: str, data: str) -> str:
+    """One named event; ``data`` must be a single line (e.g. compact JSON)."""
+    if "\n" in data or "\r" in data:
+        raise ValueError("SSE data must be a single line")
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+def format_sse_comment(comment: str = "keepalive") -> str:
+    return f": {comment}\n\n"
+
+
+def iter_sse_events(lines: Iterable[str]) -> Iterator[ServerSentEvent]:
+    """Parse decoded stream lines into events; comments and unnamed events are skipped."""
+    event: str | None = None
+    data: list[str] = []
+    for raw in lines:
+        line = raw.rstrip("\r\n")
+        if not line:
+            if event is not None and data:
+                yield ServerSentEvent(event=event, data="\n".join(data))
+            event, data = None, []
+        elif line.startswith(":"):
+            continue
+        else:
+            field, _, value = line.partition(":")
+            value = value.removeprefix(" ")
+            if field == "event":
+                event = value
+            elif field == "data":
+                data.append(value)
+    if event is not None and data:
+        yield ServerSentEvent(event=event, data="\n".join(data))
@@ -0,0 +1,231 @@
+"""Bulk download of many remote files over one SSH connection.
+
+Instead of one ``scp`` (and one SSH session) per file, :class:`SFTPBulkDownloader`
+opens a single SFTP client on the connection and:
+
+- stats every file with pipelined SFTP requests to split them by size;
+- packs the small files (``<= small_file_bytes``) server-side into one ``tar`` stream
+  (``tar -cf - --null -T -``, names on stdin) read over an exec channel and unpacked
+  locally — one round trip instead of one per file;
+- downloads the large files concurrently (``max_concurrency`` at a time) with
+  ``SFTPClient.get``, which itself keeps ``max_requests`` reads in flight per file.
+
+Each file lands at the local path it was mapped to (written to ``<name>.part`` and
+renamed, so an interrupted download never leaves a truncated file that a later
+``skip_existing`` run would trust). Every transfer's throughput is logged and
+returned in :class:`BulkTransferStats`.
+"""
+
+import asyncio
+import logging
+import os
+import shlex
+import tarfile
+import tempfile
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO
+
+import asyncssh
+
+from sms_api.common.storage.file_paths import HPCFilePath
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TRANSFER_CONCURRENCY = 16
+DEFAULT_SMALL_FILE_BYTES = 1024 * 1024
+_SFTP_MAX_REQUESTS = 128  # in-flight reads per SFTP get
+_TAR_SPOOL_BYTES = 64 * 1024 * 1024  # tar stream kept in memory up to this size, then spilled to disk
+_READ_CHUNK_BYTES = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class TransferResult:
+    method: str  # "tar" (one stream of small files) or "sftp" (one large file)
+    files: int
+    bytes: int
+    seconds: float
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes / self.seconds if self.seconds > 0 else 0.0
+
+
+@dataclass
+class BulkTransferStats:
+    transfers: list[TransferResult] = field(default_factory=list)
+    skipped: int = 0  # already present locally
+    seconds: float = 0.0
+
+    @property
+    def files(self) -> int:
+        return sum(t.files for t in self.transfers)
+
+    @property
+    def bytes(self) -> int:
+        return sum(t.bytes for t in self.transfers)
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes / self.seconds if self.seconds > 0 else 0.0
+
+
+class SFTPBulkDownloader:
+    """Download many files over one connection (see module docstring)."""
+
+    def __init__(
+        self,
+        conn: asyncssh.SSHClientConnection,
+        max_concurrency: int = DEFAULT_TRANSFER_CONCURRENCY,
+        small_file_bytes: int = DEFAULT_SMALL_FILE_BYTES,
+    ) -> None:
+        self._conn = conn
+        self.max_concurrency = max_concurrency
+        self.small_file_bytes = small_file_bytes
+        self._slots = asyncio.Semaphore(max_concurrency)  # concurrent SFTP gets and tar streams
+
+    async def download(
+        self, files: Iterable[tuple[HPCFilePath, Path]], skip_existing: bool = True
+    ) -> BulkTransferStats:
+        """Download each ``(remote path, local path)``; raises RuntimeError if any file failed
+        (after the others finished, so a retry only fetches what is missing)."""
+        started = time.monotonic()
+        stats = BulkTransferStats()
+        pending: dict[str, Path] = {}
+        for remote_path, local_path in files:
+            if skip_existing and local_path.exists():
+                stats.skipped += 1
+            else:
+                pending[str(remote_path.remote_path)] = local_path
+        if pending:
+            async with self._conn.start_sftp_client() as sftp:
+                sizes = await self._stat_all(sftp, list(pending))
+                small = {path: pending[path] for path in pending if sizes[path] <= self.small_file_bytes}
+                large = {path: pending[path] for path in pending if path not in small}
+                results = await asyncio.gather(
+                    self._tar_download(sftp, small, sizes),
+                    *(self._sftp_download(sftp, path, local, sizes[path]) for path, local in large.items()),
+                    return_exceptions=True,
+                )
+            failures = [result for result in results if isinstance(result, BaseException)]
+            for result in results:
+                if isinstance(result, list):
+                    stats.transfers.extend(result)
+                elif isinstance(result, TransferResult):
+                    stats.transfers.append(result)
+            if failures:
+                raise RuntimeError(f"{len(failures)} transfer(s) failed, first: {failures[0]}") from failures[0]
+        stats.seconds = time.monotonic() - started
+        if stats.transfers:
+            logger.info(
+                f"Downloaded {stats.files} files ({stats.bytes} bytes, {stats.skipped} already present) in "
+                f"{stats.seconds:.2f}s: {stats.bytes_per_second / 1e6:.1f} MB/s"
+            )
+        return stats
+
+    async def _stat_all(self, sftp: asyncssh.SFTPClient, paths: list[str]) -> dict[str, int]:
+        limit = asyncio.Semaphore(self.max_concurrency * 4)
+
+        async def _size(path: str) -> int:
+            async with limit:
+                attrs = await sftp.stat(path)
+            return attrs.size or 0
+
+        sizes = await asyncio.gather(*(_size(path) for path in paths))
+        return dict(zip(paths, sizes, strict=True))
+
+    async def _sftp_download(
+        self, sftp: asyncssh.SFTPClient, remote_path: str, local_path: Path, size: int
+    ) -> TransferResult:
+        started = time.monotonic()
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        part = local_path.with_name(local_path.name + ".part")
+        async with self._slots:
+            await sftp.get(remote_path, part, max_requests=_SFTP_MAX_REQUESTS)
+        part.replace(local_path)
+        result = TransferResult(method="sftp", files=1, bytes=size, seconds=time.monotonic() - started)
+        logger.debug(f"SFTP {remote_path}: {size} bytes at {result.bytes_per_second / 1e6:.1f} MB/s")
+        return result
+
+    async def _tar_download(
+        self, sftp: asyncssh.SFTPClient, files: dict[str, Path], sizes: dict[str, int]
+    ) -> list[TransferResult]:
+        """One tar stream of all ``files``; files it could not deliver fall back to SFTP."""
+        if not files:
+            return []
+        if len(files) == 1:
+            ((path, local),) = files.items()
+            return [await self._sftp_download(sftp, path, local, sizes[path])]
+        started = time.monotonic()
+        base = os.path.commonpath([os.path.dirname(path) for path in files])
+        members = {os.path.relpath(path, base): local for path, local in files.items()}
+        written: set[str] = set()
+        try:
+            with tempfile.SpooledTemporaryFile(max_size=_TAR_SPOOL_BYTES) as spool:
+                n_bytes = await self._run_tar(base, list(members), spool)
+                spool.seek(0)
+                written = await asyncio.to_thread(_unpack_tar, spool, members)
+        except Exception as e:
+            logger.warning(f"tar transfer from {base} failed, falling back to SFTP: {e}")
+            n_bytes = 0
+        results = []
+        if written:
+            results.append(
+                TransferResult(method="tar", files=len(written), bytes=n_bytes, seconds=time.monotonic() - started)
+            )
+            logger.info(
+                f"tar stream of {len(written)} files from {base}: {n_bytes} bytes at "
+                f"{results[0].bytes_per_second / 1e6:.1f} MB/s"
+            )
+        remaining = {os.path.join(base, name): local for name, local in members.items() if name not in written}
+        results.extend(
+            await asyncio.gather(
+                *(self._sftp_download(sftp, path, local, sizes[path]) for path, local in remaining.items())
+            )
+        )
+        return results
+
+    async def _run_tar(self, base: str, names: list[str], out: IO[bytes]) -> int:
+        command = f"tar -cf - -C {shlex.quote(base)} --null -T -"
+        stdin = b"".join(name.encode() + b"\0" for name in names)
+        async with self._slots:
+            process = await self._conn.create_process(command, input=stdin, encoding=None)
+            n_bytes = 0
+            while chunk := await process.stdout.read(_READ_CHUNK_BYTES):
+                out.write(chunk)
+                n_bytes += len(chunk)
+            completed = await process.wait()
+        if completed.exit_status != 0:
+            stderr = completed.stderr.decode(errors="replace") if isinstance(completed.stderr, bytes) else ""
+            # GNU tar exits 1 when a file changed while being read; the archive is still usable.
+            if completed.exit_status != 1:
+                raise RuntimeError(f"tar exited with {completed.exit_status}: {stderr[:200]}")
+            logger.warning(f"tar reported: {stderr[:200]}")
+        return n_bytes
+
+
+def _unpack_tar(fileobj: IO[bytes], members: dict[str, Path]) -> set[str]:
+    """Write the regular-file members named in ``members`` to their local paths; returns the names written.
+
+    Only names we asked for are written, and only to the path mapped to them, so a
+    crafted archive cannot write elsewhere.
+    """
+    written: set[str] = set()
+    with tarfile.open(fileobj=fileobj, mode="r|") as tar:
+        for member in tar:
+            local = members.get(os.path.normpath(member.name))
+            if local is None or not member.isfile():
+                continue
+            source = tar.extractfile(member)
+            if source is None:
+                continue
+            local.parent.mkdir(parents=True, exist_ok=True)
+            part = local.with_name(local.name + ".part")
+            with source, part.open("wb") as target:
+                while chunk := source.read(_READ_CHUNK_BYTES):
+                    target.write(chunk)
+            part.replace(local)
+            written.add(os.path.normpath(member.name))
+    return written
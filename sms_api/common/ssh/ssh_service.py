@@ -1,14 +1,19 @@
 import asyncio
 import contextlib
+import dataclasses
+import functools
 import logging
-from collections.abc import AsyncIterator, Awaitable, Callable
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
 from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 import asyncssh
 from asyncssh import SSHCompletedProcess
 
+from sms_api.common.ssh.sftp_transfer import BulkTransferStats, SFTPBulkDownloader
 from sms_api.common.storage.file_paths import HPCFilePath
 
 logger = logging.getLogger(__name__)
@@ -19,7 +24,10 @@ class SSHSession:
     """A self-healing SSH session that reconnects on connection failures.
 
     This wrapper around an SSH connection provides command execution and file transfer
-    with automatic reconnection when the connection is lost.
+    with automatic reconnection when the connection is lost. A session that owns its
+    connection replaces it with ``connect_fn``; a session over a shared (pooled)
+    connection instead reports it to ``reconnect_fn``, which returns the connection to
+    continue on and decides whether the reported one is closed.
     """
 
     def __init__(
@@ -29,10 +37,12 @@ class SSHSession:
         connect_fn: Callable[[], Awaitable[asyncssh.SSHClientConnection]] | None = None,
         max_retries: int = 3,
         retry_delay: float = 2.0,
+        reconnect_fn: Callable[[asyncssh.SSHClientConnection], Awaitable[asyncssh.SSHClientConnection]] | None = None,
     ) -> None:
         self._conn = conn
         self._hostname = hostname
         self._connect_fn = connect_fn
+        self._reconnect_fn = reconnect_fn
         self._max_retries = max_retries
         self._retry_delay = retry_delay
 
@@ -51,8 +61,17 @@ class SSHSession:
         if self._conn is not None:
             await self._conn.wait_closed()
 
+    @property
+    def _can_reconnect(self) -> bool:
+        return self._connect_fn is not None or self._reconnect_fn is not None
+
     async def _reconnect(self) -> None:
         """Reconnect to the remote host."""
+        if self._reconnect_fn is not None:
+            # A shared connection: the owner checks it and closes it once nobody else uses it.
+            logger.info(f"Reporting a failed connection to {self._hostname}...")
+            self._conn = await self._reconnect_fn(self._conn)
+            return
         if self._connect_fn is None:
             raise RuntimeError("Cannot reconnect: no connection factory provided")
         logger.info(f"Reconnecting to {self._hostname}...")
@@ -110,9 +129,7 @@ class SSHSession:
 
             except (OSError, asyncssh.Error) as exc:
                 last_exc = exc
-                can_retry = (
-                    self._connect_fn is not None and attempt < self._max_retries and self._is_connection_error(exc)
-                )
+                can_retry = self._can_reconnect and attempt < self._max_retries and self._is_connection_error(exc)
                 if can_retry:
                     logger.warning(
                         f"Connection error on attempt {attempt + 1}/{self._max_retries + 1}, "
@@ -147,9 +164,7 @@ class SSHSession:
 
             except (OSError, asyncssh.Error) as exc:
                 last_exc = exc
-                can_retry = (
-                    self._connect_fn is not None and attempt < self._max_retries and self._is_connection_error(exc)
-                )
+                can_retry = self._can_reconnect and attempt < self._max_retries and self._is_connection_error(exc)
                 if can_retry:
                     logger.warning(
                         f"Connection error on upload attempt {attempt + 1}/{self._max_retries + 1}, "
@@ -184,9 +199,7 @@ class SSHSession:
 
             except (OSError, asyncssh.Error) as exc:
                 last_exc = exc
-                can_retry = (
-                    self._connect_fn is not None and attempt < self._max_retries and self._is_connection_error(exc)
-                )
+                can_retry = self._can_reconnect and attempt < self._max_retries and self._is_connection_error(exc)
                 if can_retry:
                     logger.warning(
                         f"Connection error on download attempt {attempt + 1}/{self._max_retries + 1}, "
@@ -204,13 +217,289 @@ class SSHSession:
 
         raise RuntimeError(f"SCP download failed after {self._max_retries} retries") from last_exc
 
+    async def stream_command(self, command: str, chunk_size: int = 64 * 1024) -> AsyncIterator[bytes]:
+        """Run a command on the remote host and yield its stdout as it arrives.
+
+        Not retried: a partly consumed stream cannot be resumed. If the consumer stops early
+        (e.g. the HTTP client went away) the remote process is closed.
+
+        :raises RuntimeError: If the command exits non-zero (after its output was yielded)
+        """
+        logger.info(f"Streaming SSH command: {command}")
+        process = await self._conn.create_process(command, encoding=None)
+        try:
+            while chunk := await process.stdout.read(chunk_size):
+                yield chunk
+            completed = await process.wait()
+        finally:
+            process.close()
+        if completed.exit_status != 0:
+            stderr = completed.stderr if isinstance(completed.stderr, bytes) else b""
+            raise RuntimeError(
+                f"SSH command failed with exit code {completed.exit_status}: {stderr.decode(errors='replace')[:200]!r}"
+            )
+
+    async def download_files(
+        self, files: Iterable[tuple[HPCFilePath, Path]], skip_existing: bool = True, **kwargs: Any
+    ) -> BulkTransferStats:
+        """Download many ``(remote path, local path)`` files over this connection (one SFTP client,
+        small files packed into one remote tar stream). See :class:`SFTPBulkDownloader`.
+
+        :raises RuntimeError: If any file could not be downloaded
+        """
+        return await SFTPBulkDownloader(self._conn, **kwargs).download(files, skip_existing=skip_existing)
+
+
+@dataclass
+class SSHPoolMetrics:
+    """Point-in-time counters of an :class:`SSHConnectionPool`."""
+
+    hostname: str
+    max_size: int
+    connections: int = 0  # live connections, in use or idle
+    active_sessions: int = 0  # sessions currently leased across all connections
+    idle_connections: int = 0
+    waiting: int = 0  # acquirers blocked because every connection is at its channel limit
+    connections_opened: int = 0
+    connections_closed: int = 0
+    acquisitions: int = 0
+    reuses: int = 0  # acquisitions served by an already open connection
+    health_check_failures: int = 0
+
+
+@dataclass(eq=False)
+class _PooledConnection:
+    conn: asyncssh.SSHClientConnection
+    # Leases per connection: ``conn`` plus any it replaced that sessions have not moved off yet.
+    holders: dict[asyncssh.SSHClientConnection, int] = field(default_factory=dict)
+    last_used: float = field(default_factory=time.monotonic)
+    last_checked: float = field(default_factory=time.monotonic)
+    replacing: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    @property
+    def leases(self) -> int:
+        return sum(self.holders.values())
+
+    def lease(self, conn: asyncssh.SSHClientConnection) -> None:
+        self.holders[conn] = self.holders.get(conn, 0) + 1
+
+    def unlease(self, conn: asyncssh.SSHClientConnection) -> bool:
+        """Drop one lease on ``conn``; True if it was the last one."""
+        remaining = self.holders.get(conn, 0) - 1
+        if remaining > 0:
+            self.holders[conn] = remaining
+            return False
+        self.holders.pop(conn, None)
+        return True
+
+
+class SSHConnectionPool:
+    """A bounded pool of live SSH connections shared by concurrent sessions.
+
+    Each connection multiplexes up to ``max_channels`` sessions (every command or SCP
+    transfer opens its own SSH channel), so the handshake/key-exchange/auth cost is paid
+    once per connection instead of once per session. Connections idle for longer than
+    ``health_check_interval`` are pinged before reuse, and closed once idle for
+    ``idle_timeout``. A session that hits an error reports its connection through
+    :meth:`reconnect`; the pool replaces it only if it is closed or fails a health
+    check, and closes it only once no other session is still leasing it.
+    """
+
+    def __init__(
+        self,
+        hostname: str,
+        connect_fn: Callable[[], Awaitable[asyncssh.SSHClientConnection]],
+        max_size: int = 4,
+        max_channels: int = 8,
+        idle_timeout: float = 300.0,
+        health_check_interval: float = 30.0,
+        health_check_timeout: float = 10.0,
+    ) -> None:
+        if max_size < 1 or max_channels < 1:
+            raise ValueError("SSH connection pool needs max_size >= 1 and max_channels >= 1")
+        self.hostname = hostname
+        self.max_size = max_size
+        self.max_channels = max_channels
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        self._connect_fn = connect_fn
+        self._connections: list[_PooledConnection] = []
+        self._opening = 0
+        self._available = asyncio.Condition()
+        self._metrics = SSHPoolMetrics(hostname=hostname, max_size=max_size)
+
+    def metrics(self) -> SSHPoolMetrics:
+        """Snapshot of the pool's gauges and counters."""
+        return dataclasses.replace(
+            self._metrics,
+            connections=len(self._connections),
+            active_sessions=sum(pooled.leases for pooled in self._connections),
+            idle_connections=sum(1 for pooled in self._connections if pooled.leases == 0),
+        )
+
+    async def acquire(self) -> _PooledConnection:
+        """Lease a channel slot on a live connection, opening a connection if the pool has room."""
+        while True:
+            async with self._available:
+                self._prune_idle()
+                pooled = self._least_loaded()
+                if pooled is None and len(self._connections) + self._opening >= self.max_size:
+                    self._metrics.waiting += 1
+                    try:
+                        await self._available.wait()
+                    finally:
+                        self._metrics.waiting -= 1
+                    continue
+                if pooled is not None:
+                    pooled.lease(pooled.conn)
+                else:
+                    self._opening += 1
+
+            if pooled is None:
+                return await self._open()
+            if await self._is_healthy(pooled):
+                self._metrics.acquisitions += 1
+                self._metrics.reuses += 1
+                pooled.last_used = time.monotonic()
+                return pooled
+            await self._discard(pooled)
+
+    async def release(self, pooled: _PooledConnection, conn: asyncssh.SSHClientConnection) -> None:
+        """Return a lease; ``conn`` is the session's connection, which differs if it reconnected."""
+        async with self._available:
+            last = pooled.unlease(conn)
+            pooled.last_used = time.monotonic()
+            self._available.notify()
+            if last and conn is not pooled.conn:
+                # A replaced (or, after the pool closed, private) connection its last session is done with.
+                conn.close()
+                self._metrics.connections_closed += 1
+            elif last and pooled not in self._connections:
+                # Discarded (failed health check, pool closed) while leased: nothing to return it to.
+                conn.close()
+
+    async def reconnect(
+        self, pooled: _PooledConnection, conn: asyncssh.SSHClientConnection
+    ) -> asyncssh.SSHClientConnection:
+        """The connection a session should continue on after an error on ``conn``.
+
+        ``conn`` is replaced (once, however many sessions report it) only if it is closed
+        or fails a health check; otherwise the error was not the connection's and the
+        session keeps it. A replaced connection is closed when its last lease moves off.
+        """
+        async with pooled.replacing:
+            if pooled not in self._connections:
+                # Pool closed under the session: continue on a private connection, closed on release.
+                replacement = await self._connect()
+            elif conn is pooled.conn and (conn.is_closed() or not await self._is_healthy(pooled, force=True)):
+                replacement = await self._connect()
+                pooled.conn = replacement
+                pooled.last_checked = time.monotonic()
+                logger.info(f"Replaced lost pooled SSH connection to {self.hostname}")
+            else:
+                replacement = pooled.conn
+        if replacement is conn:
+            return conn
+        async with self._available:
+            pooled.lease(replacement)
+            if pooled.unlease(conn):
+                conn.close()
+                self._metrics.connections_closed += 1
+        return replacement
+
+    async def close(self) -> None:
+        """Close every pooled connection (in-flight sessions fail and reconnect outside the pool)."""
+        async with self._available:
+            connections, self._connections = self._connections, []
+            self._available.notify_all()
+        for pooled in connections:
+            pooled.conn.close()
+            self._metrics.connections_closed += 1
+        for pooled in connections:
+            with contextlib.suppress(Exception):
+                await pooled.conn.wait_closed()
+        logger.info(f"Closed SSH connection pool to {self.hostname}: {self.metrics()}")
+
+    def _least_loaded(self) -> _PooledConnection | None:
+        candidates = [
+            pooled for pooled in self._connections if pooled.leases < self.max_channels and not pooled.conn.is_closed()
+        ]
+        return min(candidates, key=lambda pooled: pooled.leases, default=None)
+
+    def _prune_idle(self) -> None:
+        now = time.monotonic()
+        for pooled in list(self._connections):
+            if pooled.leases == 0 and (pooled.conn.is_closed() or now - pooled.last_used > self.idle_timeout):
+                self._connections.remove(pooled)
+                pooled.conn.close()
+                self._metrics.connections_closed += 1
+                logger.info(f"Closed idle SSH connection to {self.hostname}")
+
+    async def _connect(self) -> asyncssh.SSHClientConnection:
+        conn = await self._connect_fn()
+        try:
+            await _verify_connection(conn)
+        except BaseException:
+            conn.close()
+            raise
+        self._metrics.connections_opened += 1
+        return conn
+
+    async def _open(self) -> _PooledConnection:
+        try:
+            conn = await self._connect()
+            pooled = _PooledConnection(conn=conn, holders={conn: 1})
+            async with self._available:
+                self._connections.append(pooled)
+            self._metrics.acquisitions += 1
+            logger.info(f"Opened pooled SSH connection to {self.hostname} ({len(self._connections)}/{self.max_size})")
+            return pooled
+        finally:
+            async with self._available:
+                self._opening -= 1
+                self._available.notify()
+
+    async def _is_healthy(self, pooled: _PooledConnection, force: bool = False) -> bool:
+        if pooled.conn.is_closed():
+            return False
+        if not force and time.monotonic() - pooled.last_checked < self.health_check_interval:
+            return True
+        try:
+            await asyncio.wait_for(_verify_connection(pooled.conn), timeout=self.health_check_timeout)
+        except (OSError, RuntimeError, TimeoutError, asyncssh.Error) as exc:
+            self._metrics.health_check_failures += 1
+            logger.warning(f"Pooled SSH connection to {self.hostname} failed its health check: {exc}")
+            return False
+        pooled.last_checked = time.monotonic()
+        return True
+
+    async def _discard(self, pooled: _PooledConnection) -> None:
+        async with self._available:
+            pooled.unlease(pooled.conn)
+            if pooled in self._connections:
+                self._connections.remove(pooled)
+                self._metrics.connections_closed += 1
+            self._available.notify()
+        pooled.conn.close()
+
+
+async def _verify_connection(conn: asyncssh.SSHClientConnection) -> None:
+    """Run a trivial command to check that the connection can open channels and execute."""
+    result = await conn.run("echo ping", check=True)
+    if result.stdout is None or "ping" not in result.stdout:
+        raise RuntimeError("SSH connection verification failed: ping did not return expected output")
+
 
 class SSHSessionService:
     """SSH service that provides sessions via an async context manager.
 
-    Each session creates a fresh SSH connection, verifies it with a ping,
-    and cleanly closes it when the context exits. Sessions support automatic
-    reconnection if the connection is lost during operations.
+    By default each session creates a fresh SSH connection, verifies it with a ping,
+    and cleanly closes it when the context exits. With ``pool_size > 0`` sessions
+    are instead leased from an :class:`SSHConnectionPool`: live connections are
+    reused and shared by concurrent sessions, and stay open between sessions until
+    idle or :meth:`close` is called. Sessions support automatic reconnection if the
+    connection is lost during operations.
 
     Example:
         service = SSHSessionService(hostname="example.com", username="user", key_path=Path("~/.ssh/id_rsa"))
@@ -225,12 +514,35 @@ class SSHSessionService:
         key_path: Path,
         known_hosts: Path | None = None,
         keepalive_interval: int = 30,
+        pool_size: int = 0,
+        pool_max_channels: int = 8,
+        pool_idle_timeout: float = 300.0,
+        pool_health_check_interval: float = 30.0,
     ) -> None:
         self.hostname = hostname
         self.username = username
         self.key_path = key_path
         self.known_hosts = str(known_hosts) if known_hosts else None
         self.keepalive_interval = keepalive_interval
+        self._pool: SSHConnectionPool | None = None
+        if pool_size > 0:
+            self._pool = SSHConnectionPool(
+                hostname=hostname,
+                connect_fn=self._create_connection,
+                max_size=pool_size,
+                max_channels=pool_max_channels,
+                idle_timeout=pool_idle_timeout,
+                health_check_interval=pool_health_check_interval,
+            )
+
+    def pool_metrics(self) -> SSHPoolMetrics | None:
+        """Connection pool metrics, or None if this service does not pool connections."""
+        return self._pool.metrics() if self._pool is not None else None
+
+    async def close(self) -> None:
+        """Close pooled connections (no-op for an unpooled service)."""
+        if self._pool is not None:
+            await self._pool.close()
 
     async def _create_connection(self) -> asyncssh.SSHClientConnection:
         """Create a new SSH connection."""
@@ -257,6 +569,11 @@ class SSHSessionService:
         :yields: An SSHSession instance for running commands and transferring files
         :raises RuntimeError: If connection or verification fails
         """
+        if self._pool is not None:
+            async with self._pooled_session() as pooled_session:
+                yield pooled_session
+            return
+
         conn: asyncssh.SSHClientConnection | None = None
         ssh_session: SSHSession | None = None
         try:
@@ -264,9 +581,7 @@ class SSHSessionService:
             conn = await self._create_connection()
 
             # Verify connection with a ping
-            result = await conn.run("echo ping", check=True)
-            if result.stdout is None or "ping" not in result.stdout:
-                raise RuntimeError("SSH connection verification failed: ping did not return expected output")
+            await _verify_connection(conn)
 
             logger.info(f"SSH session established and verified to {self.hostname}")
             ssh_session = SSHSession(
@@ -301,3 +616,25 @@ class SSHSessionService:
                         await conn.wait_closed()
                     except Exception as exc:
                         logger.warning(f"Error while waiting for SSH connection to close: {exc}")
+
+    @asynccontextmanager
+    async def _pooled_session(self) -> AsyncIterator[SSHSession]:
+        """Yield an SSHSession over a connection leased from the pool (``wait_closed`` does not apply)."""
+        if self._pool is None:
+            raise RuntimeError("SSH connection pool is not configured")
+        try:
+            pooled = await self._pool.acquire()
+        except (OSError, asyncssh.Error) as exc:
+            logger.exception(f"Failed to establish SSH session to {self.hostname}")
+            raise RuntimeError(f"SSH session failed: {str(exc)[:100]}") from exc
+        ssh_session = SSHSession(
+            conn=pooled.conn, hostname=self.hostname, reconnect_fn=functools.partial(self._pool.reconnect, pooled)
+        )
+        logger.debug(f"Leased pooled SSH session to {self.hostname}: {self._pool.metrics()}")
+        try:
+            yield ssh_session
+        except (OSError, asyncssh.Error) as exc:
+            logger.exception(f"SSH session to {self.hostname} failed")
+            raise RuntimeError(f"SSH session failed: {str(exc)[:100]}") from exc
+        finally:
+            await self._pool.release(pooled, ssh_session.connection)
@@ -0,0 +1,187 @@
+"""Archive codecs for simulation output downloads: ``tar.zst``, ``tar.gz`` and plain ``tar``.
+
+Compression is block-parallel: the tar byte stream is cut into fixed-size blocks and
+each block is compressed as an independent frame (zstd) or member (gzip) on a shared
+thread pool, then emitted in order. Concatenated frames/members are valid single
+streams for every standard decoder (``zstd -d``, ``gzip -d``, ``tar xzf``, Python's
+``gzip``/``tarfile``), so clients see ordinary archives while the server uses every
+core instead of one. Both codecs release the GIL while compressing.
+
+Plain ``tar`` skips compression entirely — the right choice for zarr stores, whose
+chunks are already compressed.
+"""
+
+import gzip
+import io
+import os
+import tarfile
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO
+
+import pyarrow as pa
+
+from sms_api.common import StrEnumBase
+
+ARCHIVE_BLOCK_SIZE = 4 * 1024 * 1024
+ARCHIVE_COMPRESS_THREADS = min(8, os.cpu_count() or 1)
+
+
+class ArchiveFormat(StrEnumBase):
+    """Container/codec of a simulation output archive (also its file suffix)."""
+
+    TAR_ZST = "tar.zst"
+    TAR_GZ = "tar.gz"
+    TAR = "tar"
+
+
+ARCHIVE_MEDIA_TYPES: dict[ArchiveFormat, str] = {
+    ArchiveFormat.TAR_ZST: "application/zstd",
+    ArchiveFormat.TAR_GZ: "application/gzip",
+    ArchiveFormat.TAR: "application/x-tar",
+}
+
+# (min, max, default) compression level per codec; plain tar takes no level.
+ARCHIVE_LEVELS: dict[ArchiveFormat, tuple[int, int, int]] = {
+    ArchiveFormat.TAR_ZST: (1, 22, 3),
+    ArchiveFormat.TAR_GZ: (1, 9, 6),
+}
+
+_executor: ThreadPoolExecutor | None = None
+
+
+def _compress_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=ARCHIVE_COMPRESS_THREADS, thread_name_prefix="archive-compress")
+    return _executor
+
+
+def resolve_compression_level(archive_format: ArchiveFormat, level: int | None) -> int | None:
+    """Return the level to use for ``archive_format``, raising ValueError if it is out of range."""
+    bounds = ARCHIVE_LEVELS.get(archive_format)
+    if bounds is None:
+        if level is not None:
+            raise ValueError(f"Archive format '{archive_format}' is uncompressed and takes no compression level")
+        return None
+    low, high, default = bounds
+    if level is None:
+        return default
+    if not low <= level <= high:
+        raise ValueError(f"Compression level for '{archive_format}' must be in [{low}, {high}], got {level}")
+    return level
+
+
+def archive_filename(stem: str, archive_format: ArchiveFormat) -> str:
+    return f"{stem}.{archive_format}"
+
+
+def _compress_block(archive_format: ArchiveFormat, level: int, block: bytes) -> bytes:
+    if archive_format == ArchiveFormat.TAR_ZST:
+        return pa.Codec("zstd", compression_level=level).compress(block, asbytes=True)  # type: ignore[no-any-return]
+    return gzip.compress(block, compresslevel=level, mtime=0)
+
+
+class ArchiveCompressor:
+    """Incremental block-parallel compressor for one archive stream.
+
+    ``write`` buffers input and returns whatever compressed output is ready, in order;
+    ``close`` flushes the tail. At most ``ARCHIVE_COMPRESS_THREADS`` blocks are pending
+    at once, so ``write`` blocks (call it off the event loop) once the pool is saturated
+    and memory stays bounded by roughly ``2 * threads * block_size``.
+    """
+
+    def __init__(
+        self, archive_format: ArchiveFormat, level: int | None = None, block_size: int = ARCHIVE_BLOCK_SIZE
+    ) -> None:
+        self.archive_format = archive_format
+        self.level = resolve_compression_level(archive_format, level)
+        self._block_size = block_size
+        self._buffer = bytearray()
+        self._pending: deque[Future[bytes]] = deque()
+
+    def _submit(self, level: int, block: bytes) -> None:
+        self._pending.append(_compress_executor().submit(_compress_block, self.archive_format, level, block))
+
+    def _collect(self, wait: bool) -> bytes:
+        out = bytearray()
+        while self._pending and (wait or self._pending[0].done() or len(self._pending) > ARCHIVE_COMPRESS_THREADS):
+            out += self._pending.popleft().result()
+        return bytes(out)
+
+    def write(self, data: bytes) -> bytes:
+        level = self.level
+        if level is None:
+            return data
+        self._buffer += data
+        while len(self._buffer) >= self._block_size:
+            self._submit(level, bytes(self._buffer[: self._block_size]))
+            del self._buffer[: self._block_size]
+        return self._collect(wait=False)
+
+    def close(self) -> bytes:
+        level = self.level
+        if level is None:
+            return b""
+        if self._buffer or not self._pending:
+            # An empty stream still gets one (empty) frame so the output is a valid archive.
+            self._submit(level, bytes(self._buffer))
+            self._buffer.clear()
+        return self._collect(wait=True)
+
+
+class CompressedWriter:
+    """Minimal binary file object that compresses into ``fileobj`` (for ``tarfile`` stream mode)."""
+
+    def __init__(self, fileobj: IO[bytes], compressor: ArchiveCompressor) -> None:
+        self._fileobj = fileobj
+        self._compressor = compressor
+
+    def write(self, data: bytes) -> int:
+        self._fileobj.write(self._compressor.write(bytes(data)))
+        return len(data)
+
+    def close(self) -> None:
+        self._fileobj.write(self._compressor.close())
+
+
+def write_archive(dir_path: Path, output_path: Path, archive_format: ArchiveFormat, level: int | None = None) -> Path:
+    """Archive ``dir_path`` (as a top-level ``dir_path.name`` entry) into ``output_path``."""
+    compressor = ArchiveCompressor(archive_format, level)
+    with open(output_path, "wb") as f:
+        writer = CompressedWriter(f, compressor)
+        with tarfile.open(fileobj=writer, mode="w|") as tar:  # type: ignore[call-overload]
+            tar.add(str(dir_path), arcname=dir_path.name)
+        writer.close()
+    return output_path
+
+
+@contextmanager
+def _open_tar(source: Path | bytes, archive_format: ArchiveFormat) -> Iterator[tarfile.TarFile]:
+    if archive_format == ArchiveFormat.TAR_ZST:
+        raw = pa.BufferReader(source) if isinstance(source, bytes) else str(source)
+        with pa.input_stream(raw, compression="zstd") as stream, tarfile.open(fileobj=stream, mode="r|") as tar:
+            yield tar
+        return
+    mode = "r:gz" if archive_format == ArchiveFormat.TAR_GZ else "r:"
+    if isinstance(source, bytes):
+        with tarfile.open(fileobj=io.BytesIO(source), mode=mode) as tar:  # type: ignore[call-overload]
+            yield tar
+        return
+    with tarfile.open(source, mode) as tar:  # type: ignore[call-overload]
+        yield tar
+
+
+def archive_member_names(content: bytes, archive_format: ArchiveFormat) -> list[str]:
+    """Names of the members of an in-memory archive (raises ``tarfile.TarError`` if it is not one)."""
+    with _open_tar(content, archive_format) as tar:
+        return [member.name for member in tar]
+
+
+def extract_archive(path: Path, dest: Path, archive_format: ArchiveFormat) -> None:
+    """Extract an archive written in ``archive_format`` into ``dest``."""
+    with _open_tar(path, archive_format) as tar:
+        tar.extractall(dest, filter="data")
@@ -0,0 +1,254 @@
+"""Content-addressed on-disk cache of built simulation output archives.
+
+An archive is keyed by experiment ID, archive format and a digest of its *source
+listing* (object keys + ETags/sizes, or file paths + sizes/mtimes), so a repeat
+download of an unchanged experiment is served from disk — with ``ETag``,
+``If-None-Match`` and ``Range`` support — instead of redoing every transfer and
+all the compression. A changed listing is a new key; entries of the superseded
+listing for the same experiment/format (at any compression level) are dropped when
+the new one lands, and the whole cache is bounded by total bytes with
+least-recently-used eviction.
+
+Builds are single-flight and run as their own task, independent of any client:
+responses *tail* the file while it is being written, so a disconnect does not waste
+the work and the resumed (``Range``) request is served from the finished entry.
+"""
+
+import asyncio
+import contextlib
+import functools
+import hashlib
+import json
+import logging
+import os
+import uuid
+from collections.abc import AsyncIterator, Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO
+
+from sms_api.common.storage.archive import ArchiveFormat, archive_filename, resolve_compression_level
+from sms_api.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_CACHE_READ_SIZE = 1024 * 1024
+
+ArchiveSource = Callable[[], AsyncIterator[bytes]]
+
+
+@dataclass(frozen=True)
+class ArchiveKey:
+    experiment_id: str
+    archive_format: ArchiveFormat
+    listing: str  # digest of the source listing
+    level: int | None  # resolved compression level
+
+    @property
+    def digest(self) -> str:
+        return self.listing if self.level is None else f"{self.listing}-{self.level}"
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.digest}"'
+
+    @property
+    def filename(self) -> str:
+        return archive_filename(self.digest, self.archive_format)
+
+
+def archive_key(
+    experiment_id: str,
+    archive_format: ArchiveFormat,
+    level: int | None,
+    entries: Iterable[tuple[str, str, int]],
+) -> ArchiveKey:
+    """Key for an archive of ``entries`` — ``(name, version, size)`` per source object.
+
+    ``version`` is whatever changes when the object does (an S3 ETag, a file mtime).
+    The listing digest and the resolved compression level are kept apart: ``level=None``
+    and an explicit default share an entry, and a new listing supersedes the entries of
+    the old one at every level.
+    """
+    payload = {
+        "experiment_id": experiment_id,
+        "format": str(archive_format),
+        "entries": sorted([name, version, size] for name, version, size in entries),
+    }
+    listing = hashlib.sha256(json.dumps(payload, separators=(",", ":")).encode()).hexdigest()[:32]
+    return ArchiveKey(
+        experiment_id=experiment_id,
+        archive_format=archive_format,
+        listing=listing,
+        level=resolve_compression_level(archive_format, level),
+    )
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an ``If-None-Match`` header value matches ``etag`` (weak comparison, ``*`` included)."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+@dataclass
+class _Build:
+    part: Path
+    task: asyncio.Task[Path | None] | None = None
+    written: int = 0
+    finished: bool = False
+    error: BaseException | None = None
+    changed: asyncio.Condition = field(default_factory=asyncio.Condition)
+
+    def has_news(self, offset: int) -> bool:
+        return self.finished or self.written > offset
+
+
+class ArchiveCache:
+    """Size-bounded, LRU, content-addressed archive cache under ``root``."""
+
+    def __init__(self, root: Path, max_bytes: int) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self._builds: dict[ArchiveKey, _Build] = {}
+
+    def entry_path(self, key: ArchiveKey) -> Path:
+        return self.root / key.experiment_id / key.filename
+
+    def lookup(self, key: ArchiveKey) -> Path | None:
+        """Path of a finished entry (marking it recently used), or None."""
+        path = self.entry_path(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    async def build(self, key: ArchiveKey, source: ArchiveSource) -> Path:
+        """Return the finished entry for ``key``, building it from ``source()`` if needed."""
+        path = self.lookup(key)
+        if path is not None:
+            return path
+        build = self._start(key, source)
+        if build.task is None:
+            raise RuntimeError(f"Archive build for {key} did not start")
+        path = await asyncio.shield(build.task)
+        if path is None:
+            raise RuntimeError(f"Building archive {key.filename} failed") from build.error
+        return path
+
+    async def stream(self, key: ArchiveKey, source: ArchiveSource) -> AsyncIterator[bytes]:
+        """Yield the bytes of ``key``'s archive while it is built (or from disk if it already is)."""
+        path = self.lookup(key)
+        if path is not None:
+            async for chunk in _read_file(path):
+                yield chunk
+            return
+        build = self._start(key, source)
+        offset = 0
+        with open(build.part, "rb") as f:  # stays readable after the rename into place
+            while True:
+                async with build.changed:
+                    await build.changed.wait_for(functools.partial(build.has_news, offset))
+                    available = build.written
+                if available > offset:
+                    chunk = await asyncio.to_thread(f.read, min(available - offset, ARCHIVE_CACHE_READ_SIZE))
+                    offset += len(chunk)
+                    yield chunk
+                    continue
+                if build.error is not None:
+                    raise RuntimeError(f"Building archive {key.filename} failed") from build.error
+                return
+
+    def _start(self, key: ArchiveKey, source: ArchiveSource) -> _Build:
+        build = self._builds.get(key)
+        if build is not None:
+            return build
+        path = self.entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        build = _Build(part=path.with_name(f".{path.name}.{uuid.uuid4().hex}.part"))
+        build.part.touch()
+        self._builds[key] = build
+        build.task = asyncio.create_task(self._run(key, build, source()))
+        return build
+
+    async def _run(self, key: ArchiveKey, build: _Build, chunks: AsyncIterator[bytes]) -> Path | None:
+        path = self.entry_path(key)
+        try:
+            with open(build.part, "wb") as f:
+                async for chunk in chunks:
+                    await asyncio.to_thread(_write_flush, f, chunk)
+                    async with build.changed:
+                        build.written += len(chunk)
+                        build.changed.notify_all()
+            # Unregister and rename in one step: a newcomer either tails the part file or finds the entry.
+            self._builds.pop(key, None)
+            build.part.replace(path)
+            await asyncio.to_thread(self._evict, key)
+            logger.info(f"Cached archive {path} ({build.written} bytes)")
+            return path
+        except BaseException as e:
+            build.error = e
+            with contextlib.suppress(FileNotFoundError):
+                build.part.unlink()
+            logger.warning(f"Archive build for {path} failed: {e!r}")
+            if not isinstance(e, Exception):
+                raise
+            # Reported to every waiter through build.error; nobody may be awaiting the task itself.
+            return None
+        finally:
+            if self._builds.get(key) is build:
+                del self._builds[key]
+            async with build.changed:
+                build.finished = True
+                build.changed.notify_all()
+
+    def _evict(self, keep: ArchiveKey) -> None:
+        """Drop entries of ``keep``'s experiment/format built from another listing, then LRU entries over ``max_bytes``.
+
+        Entries of the same listing at other compression levels are still current; only
+        the byte budget evicts them.
+        """
+        kept = self.entry_path(keep)
+        suffix = f".{keep.archive_format}"
+        for stale in kept.parent.glob(f"*{suffix}"):
+            if stale.name.removesuffix(suffix).split("-", 1)[0] != keep.listing:
+                stale.unlink(missing_ok=True)
+        entries: list[tuple[float, int, Path]] = []
+        for path in self.root.glob("*/*"):
+            if path.name.startswith(".") or not path.is_file():
+                continue
+            stat = path.stat()
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path == kept:
+                continue
+            path.unlink(missing_ok=True)
+            total -= size
+            logger.info(f"Evicted cached archive {path}")
+
+
+def _write_flush(f: IO[bytes], chunk: bytes) -> None:
+    f.write(chunk)
+    f.flush()
+
+
+async def _read_file(path: Path) -> AsyncIterator[bytes]:
+    with open(path, "rb") as f:
+        while chunk := await asyncio.to_thread(f.read, ARCHIVE_CACHE_READ_SIZE):
+            yield chunk
+
+
+_archive_cache: ArchiveCache | None = None
+
+
+def get_archive_cache() -> ArchiveCache:
+    global _archive_cache
+    if _archive_cache is None:
+        settings = get_settings()
+        _archive_cache = ArchiveCache(Path(settings.cache_dir) / "archives", settings.archive_cache_max_bytes)
+    return _archive_cache
@@ -21,6 +21,7 @@ class ComposeJobMonitor:
     database_service: ComposeDatabaseService
     nats_client: Any | None  # nats.aio.client.Client or None
     internal_listeners: dict[int, Queue[ComposeHpcRun]]
+    slurm_service: SlurmService
     _polling_task: asyncio.Task[None] | None = None
     _stop_event: asyncio.Event
 
@@ -28,6 +29,7 @@ class ComposeJobMonitor:
         self.nats_client = nats_client
         self.database_service = database_service
         self.internal_listeners = {}
+        self.slurm_service = SlurmService()
         self._stop_event = asyncio.Event()
 
     @alru_cache
@@ -81,13 +83,10 @@ class ComposeJobMonitor:
         if not job_ids:
             return
 
-        slurm_service = SlurmService()
         async with get_ssh_session_service(SSHTarget.SLURM).session() as ssh:
-            slurm_jobs_squeue = await slurm_service.get_job_status_squeue(ssh, job_ids)
-            slurm_jobs_sacct = await slurm_service.get_job_status_scontrol(ssh, job_ids)
+            slurm_jobs = await self.slurm_service.get_job_statuses(ssh, job_ids)
 
-        slurm_job_map = {job.job_id: job for job in slurm_jobs_squeue}
-        slurm_job_map.update({job.job_id: job for job in slurm_jobs_sacct})
+        slurm_job_map = {job.job_id: job for job in slurm_jobs}
 
         for hpc_run in running_jobs:
             slurm_job = slurm_job_map.get(hpc_run.slurmjobid)
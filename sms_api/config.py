@@ -48,6 +48,7 @@ def _parse_docker_config_json(path: str) -> tuple[str, str]:
 KV_DRIVER = Literal["file", "s3", "gcs"]
 TS_DRIVER = Literal["zarr", "n5", "zarr3"]
 STORAGE_BACKEND = Literal["gcs", "s3", "qumulo"]
+MESSAGING_MODE = Literal["pubsub", "streams"]
 
 # -- load dev env -- #
 REPO_ROOT = os.path.dirname(os.path.dirname(__file__))
@@ -117,11 +118,17 @@ class Settings(BaseSettings):
     postgres_max_overflow: int = 5  # maximum number of connections that can be created beyond the pool size
     postgres_pool_timeout: int = 30  # timeout for acquiring a connection from the pool in seconds
     postgres_pool_recycle: int = 1800  # recycle connections every seconds
+    database_cache_max_entries: int = 1024  # cached simulator/simulation/parca rows (0 disables the cache)
+    database_cache_ttl_seconds: float = 30.0  # how long a cached row may miss another replica's change
 
     slurm_submit_host: str = ""
     slurm_submit_user: str = ""  # "svc_vivarium"
     slurm_submit_key_path: str = ""  # "/Users/jimschaff/.ssh/id_rsa"
     slurm_submit_known_hosts: str | None = None
+    ssh_pool_size: int = 4  # pooled SSH connections per host; 0 opens a fresh connection per session
+    ssh_pool_max_channels: int = 8  # concurrent sessions per pooled connection (keep below sshd MaxSessions)
+    ssh_pool_idle_timeout: float = 300.0  # close pooled connections idle for this many seconds
+    ssh_pool_health_check_interval: float = 30.0  # ping idle pooled connections before reuse after this many seconds
     slurm_partition: str = ""
     slurm_node_list: str = ""  # comma-separated list of nodes, e.g., "node1,node2"
     slurm_qos: str = ""
@@ -145,6 +152,18 @@ class Settings(BaseSettings):
     redis_external_port: int = -1
     redis_channel: str = "worker.events"
     redis_emitter_magic_word: str = "emitter-magic-word"
+    # "pubsub" (PUBLISH/SUBSCRIBE) or "streams" (XADD + consumer group; emitters must XADD to redis_channel)
+    redis_messaging_mode: MESSAGING_MODE = "pubsub"
+    redis_stream_group: str = "sms-api"  # consumer group shared by all API replicas
+    redis_stream_batch_size: int = 100  # messages per XREADGROUP
+    redis_stream_concurrency: int = 16  # message callbacks running at once per replica
+    redis_stream_max_len: int = 1_000_000  # approximate entries kept per stream (XADD MAXLEN ~)
+    redis_stream_claim_idle_seconds: float = 60.0  # reclaim messages left unacked this long by a dead replica
+    worker_event_batch_size: int = 500  # max WorkerEvents per bulk INSERT
+    worker_event_flush_interval: float = 0.05  # seconds a partial batch waits for more events
+    worker_event_queue_size: int = 10_000  # buffered events before the messaging listener is throttled
+    worker_event_enqueue_timeout: float = 1.0  # seconds a throttled event waits for room before it is dropped
+    worker_event_block_size: int = 1024  # WorkerEvents per compacted columnar block (0 disables compaction)
 
     app_dir: str = f"{REPO_ROOT}/app"
     assets_dir: str = f"{REPO_ROOT}/assets"
@@ -178,6 +197,9 @@ class Settings(BaseSettings):
     analysis_outdir: HPCFilePath = HPCFilePath(remote_path=Path(""))
     vecoli_config_dir: HPCFilePath = HPCFilePath(remote_path=Path(""))
     cache_dir: str = f"{REPO_ROOT}/.results_cache"
+    archive_cache_max_bytes: int = 20 * 1024**3  # built output archives kept under {cache_dir}/archives (LRU)
+    output_manifest_max_age_seconds: float = 300.0  # re-list storage for an output manifest older than this
+    analysis_data_fetch_concurrency: int = 16  # analysis output files downloaded from S3 at once per request
 
     # Path prefix mapping for local vs remote (HPC) filesystem access
     # Example: path_local_prefix=/Volumes/SMS, path_remote_prefix=/projects/SMS
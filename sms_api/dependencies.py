@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
 from sms_api.common.messaging.messaging_service import MessagingService
 from sms_api.common.messaging.messaging_service_redis import MessagingServiceRedis
+from sms_api.common.messaging.messaging_service_redis_streams import MessagingServiceRedisStreams
 from sms_api.common.models import SSHTarget
 from sms_api.common.ssh.ssh_service import SSHSessionService
 from sms_api.common.storage.file_service import FileService
@@ -15,13 +16,16 @@ from sms_api.common.storage.file_service_qumulo_s3 import FileServiceQumuloS3
 from sms_api.common.storage.file_service_s3 import FileServiceS3
 from sms_api.config import ComputeBackend, Settings, get_job_backend, get_settings
 from sms_api.log_config import setup_logging
+from sms_api.simulation.database_cache import CachingDatabaseService
 from sms_api.simulation.database_service import DatabaseService, DatabaseServiceSQL
 from sms_api.simulation.tables_orm import create_db
 
 if TYPE_CHECKING:
+    from sms_api.analysis.status_watcher import AnalysisStatusWatcher
     from sms_api.common.models import JobId
     from sms_api.simulation.job_scheduler import JobScheduler
     from sms_api.simulation.simulation_service import SimulationService
+    from sms_api.simulation.status_watcher import JobStatusWatcher
 
 logger = logging.getLogger(__name__)
 setup_logging(logger)
@@ -151,6 +155,36 @@ def get_job_scheduler() -> "JobScheduler | None":
     return global_job_scheduler
 
 
+# ------ job status watcher (standalone) -----------------------------
+
+global_job_status_watcher: "JobStatusWatcher | None" = None
+
+
+def set_job_status_watcher(watcher: "JobStatusWatcher | None") -> None:
+    global global_job_status_watcher
+    global_job_status_watcher = watcher
+
+
+def get_job_status_watcher() -> "JobStatusWatcher | None":
+    global global_job_status_watcher
+    return global_job_status_watcher
+
+
+# ------ analysis status watcher (standalone) -----------------------------
+
+global_analysis_status_watcher: "AnalysisStatusWatcher | None" = None
+
+
+def set_analysis_status_watcher(watcher: "AnalysisStatusWatcher | None") -> None:
+    global global_analysis_status_watcher
+    global_analysis_status_watcher = watcher
+
+
+def get_analysis_status_watcher() -> "AnalysisStatusWatcher | None":
+    global global_analysis_status_watcher
+    return global_analysis_status_watcher
+
+
 # ------ messaging/cache service (modular standalone: new/arbitrary channels ----
 
 global_messaging_service: MessagingService | None = None
@@ -252,6 +286,27 @@ def _init_simulation_service(job_backend: str, settings: Settings) -> None:
     )
 
 
+def _create_messaging_service(settings: Settings) -> MessagingService:
+    if settings.redis_messaging_mode == "streams":
+        return MessagingServiceRedisStreams(
+            group=settings.redis_stream_group,
+            batch_size=settings.redis_stream_batch_size,
+            max_concurrency=settings.redis_stream_concurrency,
+            max_len=settings.redis_stream_max_len,
+            claim_idle_seconds=settings.redis_stream_claim_idle_seconds,
+        )
+    return MessagingServiceRedis()
+
+
+def _ssh_pool_options(settings: Settings) -> dict[str, Any]:
+    return {
+        "pool_size": settings.ssh_pool_size,
+        "pool_max_channels": settings.ssh_pool_max_channels,
+        "pool_idle_timeout": settings.ssh_pool_idle_timeout,
+        "pool_health_check_interval": settings.ssh_pool_health_check_interval,
+    }
+
+
 def _init_ssh_service(job_backend: str, settings: Settings) -> None:
     """Initialize SSH session services.
 
@@ -272,6 +327,7 @@ def _init_ssh_service(job_backend: str, settings: Settings) -> None:
                 username=settings.slurm_submit_user,
                 key_path=ssh_key_path,
                 known_hosts=Path(settings.slurm_submit_known_hosts) if settings.slurm_submit_known_hosts else None,
+                **_ssh_pool_options(settings),
             ),
             name=SSHTarget.SLURM,
         )
@@ -286,6 +342,7 @@ def _init_ssh_service(job_backend: str, settings: Settings) -> None:
                 hostname=settings.build_node_host,
                 username=settings.build_node_user,
                 key_path=Path(settings.build_node_key_path),
+                **_ssh_pool_options(settings),
             ),
             name=SSHTarget.BUILD,
         )
@@ -293,8 +350,12 @@ def _init_ssh_service(job_backend: str, settings: Settings) -> None:
 
 
 async def init_standalone(enable_ssl: bool = True) -> None:
+    from sms_api.analysis.status_watcher import AnalysisStatusWatcher
+    from sms_api.common.hpc.job_status_sources import SlurmJobStatusSource
     from sms_api.common.hpc.slurm_service import SlurmService
+    from sms_api.common.models import JobBackend
     from sms_api.simulation.job_scheduler import JobScheduler
+    from sms_api.simulation.status_watcher import JobStatusWatcher
 
     _settings = get_settings()
     job_backend = get_job_backend()
@@ -344,21 +405,29 @@ async def init_standalone(enable_ssl: bool = True) -> None:
             await create_db(engine)
             set_postgres_engine(engine)
             logger.info("✓ Postgres connection established and tables initialized")
-            db_service = DatabaseServiceSQL(engine)
+            db_service = CachingDatabaseService.from_settings(DatabaseServiceSQL(engine))
             set_database_service(db_service)
 
         _init_ssh_service(job_backend, _settings)
 
-        # Initialize Slurm service (SLURM backend only)
-        slurm_service: SlurmService | None = None
-        if job_backend == ComputeBackend.SLURM:
-            slurm_service = SlurmService()
-            logger.info("✓ SlurmService initialized")
+        # One status watcher for every configured backend (SLURM, K8s, Batch, local tasks)
+        status_sources = [
+            source for service in global_simulation_services.values() for source in service.job_status_sources()
+        ]
+        status_watcher = JobStatusWatcher(database_service=db_service, sources=status_sources)
+        set_job_status_watcher(status_watcher)
+        logger.info(f"✓ Job status watcher initialized for backends {sorted(status_watcher.backends)}")
+
+        # SLURM analyses (POST /analyses) wait on one shared watcher instead of polling per request
+        if get_ssh_session_service_or_none(SSHTarget.SLURM) is not None:
+            slurm_source = next((s for s in status_sources if s.backend == JobBackend.SLURM), None)
+            set_analysis_status_watcher(AnalysisStatusWatcher(slurm_source or SlurmJobStatusSource(SlurmService())))
+            logger.info("✓ Analysis status watcher initialized")
 
         # Initialize messaging service
         redis_addr = f"{_settings.redis_internal_host}:{_settings.redis_internal_port}"
-        logger.info(f"Initializing Redis messaging service at {redis_addr}...")
-        messaging_service: MessagingService = MessagingServiceRedis()
+        logger.info(f"Initializing Redis messaging service ({_settings.redis_messaging_mode}) at {redis_addr}...")
+        messaging_service = _create_messaging_service(_settings)
         await messaging_service.connect(host=_settings.redis_internal_host, port=_settings.redis_internal_port)
         logger.info("✓ Messaging service connected")
         set_messaging_service(messaging_service)
@@ -368,7 +437,7 @@ async def init_standalone(enable_ssl: bool = True) -> None:
         job_scheduler = JobScheduler(
             messaging_service=messaging_service,
             database_service=db_service,
-            slurm_service=slurm_service,
+            status_watcher=status_watcher,
         )
         set_job_scheduler(job_scheduler)
         logger.info("✓ JobScheduler initialized")
@@ -415,6 +484,11 @@ async def _init_compose_subsystem(engine: AsyncEngine | None) -> None:
 
 
 async def shutdown_standalone() -> None:
+    analysis_status_watcher = get_analysis_status_watcher()
+    if analysis_status_watcher:
+        await analysis_status_watcher.stop()
+        set_analysis_status_watcher(None)
+
     mongodb_service = get_database_service()
     if mongodb_service:
         await mongodb_service.close()
@@ -431,12 +505,16 @@ async def shutdown_standalone() -> None:
     set_simulation_service_registry({})
     set_database_service(None)
     set_file_service(None)
-    set_ssh_session_service(None, name=SSHTarget.SLURM)
-    set_ssh_session_service(None, name=SSHTarget.BUILD)
+    for ssh_target in (SSHTarget.SLURM, SSHTarget.BUILD):
+        ssh_service = get_ssh_session_service_or_none(ssh_target)
+        if ssh_service:
+            await ssh_service.close()
+        set_ssh_session_service(None, name=ssh_target)
 
     job_scheduler = get_job_scheduler()
     if job_scheduler:
         await job_scheduler.close()
         set_job_scheduler(None)
+    set_job_status_watcher(None)
     # for dirpath in [p for p in Path(f"{REPO_ROOT}/.results_cache").rglob("*") if p.is_dir()]:
     #     shutil.rmtree(dirpath)
@@ -0,0 +1,436 @@
+"""Read-through cache in front of a :class:`DatabaseService`.
+
+A request typically looks up the same few rows several times (the router fetches
+the simulation, then the handler fetches it again; a workflow submission reads its
+simulator and re-inserts the same parca dataset), each in a fresh session.
+:class:`CachingDatabaseService` keeps rows that do not change once written —
+simulators, simulations (except their tags) and parca datasets — in a small LRU
+with a short TTL, and passes every other call straight through.
+
+Writes made through this process invalidate or refresh the affected entries; the
+TTL bounds how long a change made by another replica (e.g. tags) can go unseen.
+"""
+
+import logging
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any, override
+
+from pydantic import BaseModel
+
+from sms_api.analysis.models import (
+    AnalysisConfig,
+    ExperimentAnalysisDTO,
+    OutputManifest,
+    OutputManifestEntry,
+    OutputStorage,
+    PartitionFilter,
+)
+from sms_api.common.hpc.job_service import JobStatusUpdate
+from sms_api.common.models import JobId
+from sms_api.config import get_settings
+from sms_api.simulation.database_service import DatabaseService
+from sms_api.simulation.models import (
+    HpcRun,
+    JobType,
+    ParcaDataset,
+    ParcaDatasetRequest,
+    Simulation,
+    SimulationRequest,
+    SimulatorVersion,
+    WorkerEvent,
+)
+from sms_api.simulation.tables_orm import AnalysisStatusDB
+from sms_api.simulation.worker_event_blocks import WORKER_EVENT_BLOCK_SIZE, WorkerEventSeries
+
+logger = logging.getLogger(__name__)
+
+# Cache key kinds (first element of every key); hits and misses are counted per kind.
+SIMULATOR = "simulator"
+SIMULATOR_BY_COMMIT = "simulator_by_commit"
+SIMULATION = "simulation"
+PARCA_DATASET = "parca_dataset"
+PARCA_DATASET_BY_CONFIG = "parca_dataset_by_config"  # (simulator_id, parca config hash)
+
+
+@dataclass
+class DatabaseCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    size: int
+    max_entries: int
+    hits_by_kind: dict[str, int] = field(default_factory=dict)
+    misses_by_kind: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class DatabaseCache:
+    """Size-bounded LRU of database rows keyed by ``(kind, *key)``, entries expire after ``ttl_seconds``."""
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 30.0) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple[Any, ...], tuple[float, BaseModel]] = OrderedDict()
+        self._hits: Counter[str] = Counter()
+        self._misses: Counter[str] = Counter()
+        self._evictions = 0
+        self._invalidations = 0
+
+    def get(self, key: tuple[Any, ...]) -> BaseModel | None:
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.ttl_seconds:
+            self._entries.move_to_end(key)
+            self._hits[key[0]] += 1
+            # A copy, so callers mutating the row do not change the cached one.
+            return entry[1].model_copy(deep=True)
+        if entry is not None:
+            del self._entries[key]
+        self._misses[key[0]] += 1
+        return None
+
+    def put(self, key: tuple[Any, ...], value: BaseModel) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = (time.monotonic(), value.model_copy(deep=True))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate(self, key: tuple[Any, ...]) -> None:
+        if self._entries.pop(key, None) is not None:
+            self._invalidations += 1
+
+    def invalidate_kind(self, kind: str, database_id: int | None = None) -> None:
+        """Drop the entries of ``kind`` (only those holding row ``database_id``, if given)."""
+        for key, (_, value) in list(self._entries.items()):
+            if key[0] == kind and (database_id is None or getattr(value, "database_id", None) == database_id):
+                del self._entries[key]
+                self._invalidations += 1
+
+    def clear(self) -> None:
+        self._invalidations += len(self._entries)
+        self._entries.clear()
+
+    def stats(self) -> DatabaseCacheStats:
+        return DatabaseCacheStats(
+            hits=sum(self._hits.values()),
+            misses=sum(self._misses.values()),
+            evictions=self._evictions,
+            invalidations=self._invalidations,
+            size=len(self._entries),
+            max_entries=self.max_entries,
+            hits_by_kind=dict(self._hits),
+            misses_by_kind=dict(self._misses),
+        )
+
+
+class CachingDatabaseService(DatabaseService):
+    """DatabaseService decorator caching immutable rows of the wrapped service (see module docstring)."""
+
+    def __init__(self, database_service: DatabaseService, cache: DatabaseCache | None = None) -> None:
+        self.database_service = database_service
+        self.cache = cache if cache is not None else DatabaseCache()
+
+    @classmethod
+    def from_settings(cls, database_service: DatabaseService) -> "CachingDatabaseService":
+        settings = get_settings()
+        cache = DatabaseCache(
+            max_entries=settings.database_cache_max_entries, ttl_seconds=settings.database_cache_ttl_seconds
+        )
+        return cls(database_service, cache)
+
+    def stats(self) -> DatabaseCacheStats:
+        return self.cache.stats()
+
+    # -- cached lookups -------------------------------------------------
+
+    @override
+    async def get_simulator(self, simulator_id: int) -> SimulatorVersion | None:
+        cached = self.cache.get((SIMULATOR, simulator_id))
+        if isinstance(cached, SimulatorVersion):
+            return cached
+        simulator = await self.database_service.get_simulator(simulator_id)
+        if simulator is not None:
+            self.cache.put((SIMULATOR, simulator_id), simulator)
+        return simulator
+
+    @override
+    async def get_simulator_by_commit(self, commit_hash: str) -> SimulatorVersion | None:
+        cached = self.cache.get((SIMULATOR_BY_COMMIT, commit_hash))
+        if isinstance(cached, SimulatorVersion):
+            return cached
+        simulator = await self.database_service.get_simulator_by_commit(commit_hash)
+        if simulator is not None:
+            self.cache.put((SIMULATOR_BY_COMMIT, commit_hash), simulator)
+            self.cache.put((SIMULATOR, simulator.database_id), simulator)
+        return simulator
+
+    @override
+    async def get_simulation(self, simulation_id: int) -> Simulation | None:
+        cached = self.cache.get((SIMULATION, simulation_id))
+        if isinstance(cached, Simulation):
+            return cached
+        simulation = await self.database_service.get_simulation(simulation_id)
+        if simulation is not None:
+            self.cache.put((SIMULATION, simulation_id), simulation)
+        return simulation
+
+    @override
+    async def get_parca_dataset(self, parca_dataset_id: int) -> ParcaDataset | None:
+        cached = self.cache.get((PARCA_DATASET, parca_dataset_id))
+        if isinstance(cached, ParcaDataset):
+            return cached
+        parca_dataset = await self.database_service.get_parca_dataset(parca_dataset_id)
+        if parca_dataset is not None:
+            self.cache.put((PARCA_DATASET, parca_dataset_id), parca_dataset)
+        return parca_dataset
+
+    @override
+    async def insert_parca_dataset(self, parca_dataset_request: ParcaDatasetRequest) -> ParcaDataset:
+        # Get-or-create by (simulator, config hash): a repeated request returns the same row.
+        key = (
+            PARCA_DATASET_BY_CONFIG,
+            parca_dataset_request.simulator_version.database_id,
+            parca_dataset_request.config_hash,
+        )
+        cached = self.cache.get(key)
+        if isinstance(cached, ParcaDataset):
+            return cached
+        parca_dataset = await self.database_service.insert_parca_dataset(parca_dataset_request)
+        self.cache.put(key, parca_dataset)
+        self.cache.put((PARCA_DATASET, parca_dataset.database_id), parca_dataset)
+        return parca_dataset
+
+    # -- writes to cached rows ------------------------------------------
+
+    @override
+    async def insert_simulator(self, git_commit_hash: str, git_repo_url: str, git_branch: str) -> SimulatorVersion:
+        simulator = await self.database_service.insert_simulator(git_commit_hash, git_repo_url, git_branch)
+        self.cache.put((SIMULATOR, simulator.database_id), simulator)
+        return simulator
+
+    @override
+    async def delete_simulator(self, simulator_id: int) -> None:
+        await self.database_service.delete_simulator(simulator_id)
+        self.cache.invalidate((SIMULATOR, simulator_id))
+        self.cache.invalidate_kind(SIMULATOR_BY_COMMIT, simulator_id)
+        # Parca datasets embed their simulator.
+        self.cache.invalidate_kind(PARCA_DATASET)
+        self.cache.invalidate_kind(PARCA_DATASET_BY_CONFIG)
+
+    @override
+    async def delete_parca_dataset(self, parca_dataset_id: int) -> None:
+        await self.database_service.delete_parca_dataset(parca_dataset_id)
+        self.cache.invalidate((PARCA_DATASET, parca_dataset_id))
+        self.cache.invalidate_kind(PARCA_DATASET_BY_CONFIG, parca_dataset_id)
+
+    @override
+    async def insert_simulation(self, sim_request: SimulationRequest) -> Simulation:
+        simulation = await self.database_service.insert_simulation(sim_request)
+        self.cache.put((SIMULATION, simulation.database_id), simulation)
+        return simulation
+
+    @override
+    async def delete_simulation(self, simulation_id: int) -> None:
+        await self.database_service.delete_simulation(simulation_id)
+        self.cache.invalidate((SIMULATION, simulation_id))
+
+    @override
+    async def add_tags(self, simulation_id: int, tags: list[str]) -> Simulation:
+        self.cache.invalidate((SIMULATION, simulation_id))
+        simulation = await self.database_service.add_tags(simulation_id, tags)
+        self.cache.put((SIMULATION, simulation_id), simulation)
+        return simulation
+
+    @override
+    async def close(self) -> None:
+        stats = self.stats()
+        logger.info(f"Database cache: hit rate {stats.hit_rate:.1%} ({stats})")
+        self.cache.clear()
+        await self.database_service.close()
+
+    # -- pass-through ---------------------------------------------------
+
+    @override
+    async def insert_analysis(
+        self, name: str, config: AnalysisConfig, last_updated: str, job_name: str, job_id: int
+    ) -> ExperimentAnalysisDTO:
+        return await self.database_service.insert_analysis(name, config, last_updated, job_name, job_id)
+
+    @override
+    async def get_analysis(self, database_id: int) -> ExperimentAnalysisDTO:
+        return await self.database_service.get_analysis(database_id)
+
+    @override
+    async def list_analyses(
+        self, *, experiment_id: str | None = None, simulation_id: int | None = None
+    ) -> list[ExperimentAnalysisDTO]:
+        return await self.database_service.list_analyses(experiment_id=experiment_id, simulation_id=simulation_id)
+
+    @override
+    async def record_analysis(
+        self,
+        *,
+        experiment_id: str,
+        n_tp: int | None,
+        status: AnalysisStatusDB,
+        config: dict[str, Any],
+        name: str,
+        simulation_id: int | None = None,
+        backend: str = "batch",
+        job_name: str | None = None,
+        job_id_ext: str | None = None,
+        result_uri: str | None = None,
+        error_message: str | None = None,
+    ) -> ExperimentAnalysisDTO:
+        return await self.database_service.record_analysis(
+            experiment_id=experiment_id,
+            n_tp=n_tp,
+            status=status,
+            config=config,
+            name=name,
+            simulation_id=simulation_id,
+            backend=backend,
+            job_name=job_name,
+            job_id_ext=job_id_ext,
+            result_uri=result_uri,
+            error_message=error_message,
+        )
+
+    @override
+    async def get_analysis_by_experiment_ntp(self, experiment_id: str, n_tp: int) -> ExperimentAnalysisDTO | None:
+        return await self.database_service.get_analysis_by_experiment_ntp(experiment_id, n_tp)
+
+    @override
+    async def update_analysis_status(
+        self,
+        analysis_id: int,
+        status: AnalysisStatusDB,
+        result_uri: str | None = None,
+        error_message: str | None = None,
+    ) -> ExperimentAnalysisDTO:
+        return await self.database_service.update_analysis_status(analysis_id, status, result_uri, error_message)
+
+    @override
+    async def insert_worker_event(self, worker_event: WorkerEvent, hpcrun_id: int) -> WorkerEvent:
+        return await self.database_service.insert_worker_event(worker_event, hpcrun_id)
+
+    @override
+    async def insert_worker_events(self, worker_events: list[WorkerEvent]) -> list[WorkerEvent]:
+        return await self.database_service.insert_worker_events(worker_events)
+
+    @override
+    async def list_worker_events(
+        self, hpcrun_id: int, prev_sequence_number: int | None = None, limit: int | None = None
+    ) -> list[WorkerEvent]:
+        return await self.database_service.list_worker_events(hpcrun_id, prev_sequence_number, limit)
+
+    @override
+    async def get_worker_event_series(
+        self,
+        hpcrun_id: int,
+        start_sequence_number: int | None = None,
+        end_sequence_number: int | None = None,
+        limit: int | None = None,
+    ) -> WorkerEventSeries:
+        return await self.database_service.get_worker_event_series(
+            hpcrun_id, start_sequence_number, end_sequence_number, limit
+        )
+
+    @override
+    async def compact_worker_events(
+        self, hpcrun_id: int, block_size: int = WORKER_EVENT_BLOCK_SIZE, max_blocks: int = 64
+    ) -> int:
+        return await self.database_service.compact_worker_events(hpcrun_id, block_size, max_blocks)
+
+    @override
+    async def get_output_manifest(self, storage: OutputStorage, root: str) -> OutputManifest | None:
+        return await self.database_service.get_output_manifest(storage, root)
+
+    @override
+    async def sync_output_manifest(
+        self,
+        storage: OutputStorage,
+        root: str,
+        entries: Sequence[OutputManifestEntry],
+        experiment_id: str | None = None,
+        source_version: str | None = None,
+    ) -> OutputManifest:
+        return await self.database_service.sync_output_manifest(storage, root, entries, experiment_id, source_version)
+
+    @override
+    async def list_output_manifest_files(
+        self,
+        storage: OutputStorage,
+        root: str,
+        extensions: Sequence[str] | None = None,
+        partition: PartitionFilter | None = None,
+    ) -> list[OutputManifestEntry] | None:
+        return await self.database_service.list_output_manifest_files(storage, root, extensions, partition)
+
+    @override
+    async def list_simulators(self) -> list[SimulatorVersion]:
+        return await self.database_service.list_simulators()
+
+    @override
+    async def insert_hpcrun(self, job_id: JobId, job_type: JobType, ref_id: int, correlation_id: str) -> HpcRun:
+        return await self.database_service.insert_hpcrun(job_id, job_type, ref_id, correlation_id)
+
+    @override
+    async def get_hpcrun_by_ref(self, ref_id: int, job_type: JobType) -> HpcRun | None:
+        return await self.database_service.get_hpcrun_by_ref(ref_id, job_type)
+
+    @override
+    async def get_hpcrun_by_job_id(self, job_id: JobId) -> HpcRun | None:
+        return await self.database_service.get_hpcrun_by_job_id(job_id)
+
+    @override
+    async def get_hpcrun(self, hpcrun_id: int) -> HpcRun | None:
+        return await self.database_service.get_hpcrun(hpcrun_id)
+
+    @override
+    async def get_hpcrun_id_by_correlation_id(self, correlation_id: str) -> int | None:
+        return await self.database_service.get_hpcrun_id_by_correlation_id(correlation_id)
+
+    @override
+    async def delete_hpcrun(self, hpcrun_id: int) -> None:
+        await self.database_service.delete_hpcrun(hpcrun_id)
+
+    @override
+    async def list_parca_datasets(self) -> list[ParcaDataset]:
+        return await self.database_service.list_parca_datasets()
+
+    @override
+    async def get_simulation_by_experiment_id(self, experiment_id: str) -> Simulation | None:
+        return await self.database_service.get_simulation_by_experiment_id(experiment_id)
+
+    @override
+    async def list_simulations(self) -> list[Simulation]:
+        return await self.database_service.list_simulations()
+
+    @override
+    async def list_simulations_filtered(
+        self, experiment_ids: list[str] | None = None, tags: list[str] | None = None
+    ) -> list[Simulation]:
+        return await self.database_service.list_simulations_filtered(experiment_ids=experiment_ids, tags=tags)
+
+    @override
+    async def list_distinct_tags(self) -> dict[str, list[str]]:
+        return await self.database_service.list_distinct_tags()
+
+    @override
+    async def list_active_hpcruns(self) -> list[HpcRun]:
+        return await self.database_service.list_active_hpcruns()
+
+    @override
+    async def update_hpcrun_status(self, hpcrun_id: int, update: JobStatusUpdate) -> None:
+        await self.database_service.update_hpcrun_status(hpcrun_id, update)
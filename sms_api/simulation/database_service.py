@@ -1,14 +1,24 @@
 import contextlib
 import datetime
 import logging
+import posixpath
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from typing import Any, override
 
-from sqlalchemy import ColumnElement, Result, and_, or_, select
+from sqlalchemy import ColumnElement, Result, and_, delete, insert, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import InstrumentedAttribute
 
-from sms_api.analysis.models import AnalysisConfig, ExperimentAnalysisDTO
+from sms_api.analysis.models import (
+    AnalysisConfig,
+    ExperimentAnalysisDTO,
+    OutputManifest,
+    OutputManifestEntry,
+    OutputStorage,
+    PartitionFilter,
+)
 from sms_api.common.hpc.job_service import JobStatusUpdate
 from sms_api.common.models import JobId
 from sms_api.simulation.models import (
@@ -29,10 +39,19 @@ from sms_api.simulation.tables_orm import (
     JobTypeDB,
     ORMAnalysis,
     ORMHpcRun,
+    ORMOutputManifest,
+    ORMOutputManifestFile,
     ORMParcaDataset,
     ORMSimulation,
     ORMSimulator,
     ORMWorkerEvent,
+    ORMWorkerEventBlock,
+)
+from sms_api.simulation.worker_event_blocks import (
+    WORKER_EVENT_BLOCK_SIZE,
+    WorkerEventSeries,
+    pack_worker_events,
+    unpack_worker_event_block,
 )
 
 logger = logging.getLogger(__name__)
@@ -100,7 +119,73 @@ class DatabaseService(ABC):
         pass
 
     @abstractmethod
-    async def list_worker_events(self, hpcrun_id: int, prev_sequence_number: int | None = None) -> list[WorkerEvent]:
+    async def insert_worker_events(self, worker_events: list[WorkerEvent]) -> list[WorkerEvent]:
+        """Insert many events (each with ``hpcrun_id`` set) at once; returned in the same order."""
+        pass
+
+    @abstractmethod
+    async def list_worker_events(
+        self, hpcrun_id: int, prev_sequence_number: int | None = None, limit: int | None = None
+    ) -> list[WorkerEvent]:
+        """Events after ``prev_sequence_number`` in sequence order, at most ``limit`` of them.
+
+        Keyset pagination: pass the last sequence number of a page as ``prev_sequence_number``.
+        """
+        pass
+
+    @abstractmethod
+    async def get_worker_event_series(
+        self,
+        hpcrun_id: int,
+        start_sequence_number: int | None = None,
+        end_sequence_number: int | None = None,
+        limit: int | None = None,
+    ) -> WorkerEventSeries:
+        """The first ``limit`` worker events of ``hpcrun_id`` with ``start <= sequence_number <= end``,
+        as NumPy columns."""
+        pass
+
+    @abstractmethod
+    async def compact_worker_events(
+        self, hpcrun_id: int, block_size: int = WORKER_EVENT_BLOCK_SIZE, max_blocks: int = 64
+    ) -> int:
+        """Pack up to ``max_blocks`` full blocks of row-stored events into columnar blocks.
+
+        Returns the number of events compacted (0 once fewer than ``block_size`` rows are left).
+        """
+        pass
+
+    @abstractmethod
+    async def get_output_manifest(self, storage: OutputStorage, root: str) -> OutputManifest | None:
+        """The manifest of the output directory/prefix ``root``, or None if it was never indexed."""
+        pass
+
+    @abstractmethod
+    async def sync_output_manifest(
+        self,
+        storage: OutputStorage,
+        root: str,
+        entries: Sequence[OutputManifestEntry],
+        experiment_id: str | None = None,
+        source_version: str | None = None,
+    ) -> OutputManifest:
+        """Make the manifest of ``root`` list exactly ``entries`` (a full listing of it).
+
+        Only the difference is written: new paths are inserted, paths whose size or
+        version changed are updated and paths no longer listed are deleted.
+        """
+        pass
+
+    @abstractmethod
+    async def list_output_manifest_files(
+        self,
+        storage: OutputStorage,
+        root: str,
+        extensions: Sequence[str] | None = None,
+        partition: PartitionFilter | None = None,
+    ) -> list[OutputManifestEntry] | None:
+        """Indexed files of ``root`` (ordered by path) with one of ``extensions`` and within
+        ``partition``; None if ``root`` was never indexed."""
         pass
 
     @abstractmethod
@@ -680,8 +765,41 @@ class DatabaseServiceSQL(DatabaseService):
             return new_worker_event
 
     @override
-    async def list_worker_events(self, hpcrun_id: int, prev_sequence_number: int | None = None) -> list[WorkerEvent]:
+    async def insert_worker_events(self, worker_events: list[WorkerEvent]) -> list[WorkerEvent]:
+        if not worker_events:
+            return []
+        rows = []
+        for worker_event in worker_events:
+            if worker_event.hpcrun_id is None:
+                raise ValueError(
+                    f"WorkerEvent {worker_event.correlation_id}#{worker_event.sequence_number} has no hpcrun_id"
+                )
+            rows.append({
+                "hpcrun_id": worker_event.hpcrun_id,
+                "correlation_id": worker_event.correlation_id,
+                "sequence_number": worker_event.sequence_number,
+                "mass": worker_event.mass,
+                "time": worker_event.time,
+            })
+        # A single multi-row INSERT ... VALUES ... RETURNING (batched by the driver), not a flush per event.
+        stmt = insert(ORMWorkerEvent).returning(
+            ORMWorkerEvent.id, ORMWorkerEvent.created_at, sort_by_parameter_order=True
+        )
         async with self.async_sessionmaker() as session, session.begin():
+            result = await session.execute(stmt, rows)
+            inserted = result.all()
+        return [
+            worker_event.model_copy(update={"database_id": row.id, "created_at": str(row.created_at)})
+            for worker_event, row in zip(worker_events, inserted, strict=True)
+        ]
+
+    @override
+    async def list_worker_events(
+        self, hpcrun_id: int, prev_sequence_number: int | None = None, limit: int | None = None
+    ) -> list[WorkerEvent]:
+        first_sequence_number = 0 if prev_sequence_number is None else prev_sequence_number + 1
+        async with self.async_sessionmaker() as session, session.begin():
+            blocks = await self._get_worker_event_blocks(session, hpcrun_id, first_sequence_number, None, limit)
             stmt = (
                 select(
                     ORMWorkerEvent.mass,
@@ -693,10 +811,11 @@ class DatabaseServiceSQL(DatabaseService):
                 .where(
                     and_(
                         ORMWorkerEvent.hpcrun_id == hpcrun_id,
-                        ORMWorkerEvent.sequence_number > (prev_sequence_number or -1),
+                        ORMWorkerEvent.sequence_number >= first_sequence_number,
                     )
                 )
                 .order_by(ORMWorkerEvent.sequence_number)
+                .limit(limit)
             )
             result: Result[tuple[dict[str, float], int, int, float, int]] = await session.execute(stmt)
             orm_worker_events = result.all()
@@ -704,7 +823,237 @@ class DatabaseServiceSQL(DatabaseService):
             worker_events: list[WorkerEvent] = []
             for orm_worker_event in orm_worker_events:
                 worker_events.append(ORMWorkerEvent.from_query_results(orm_worker_event.tuple()))
-            return worker_events
+        if blocks:
+            # Compacted events have no row id; merge them with the not yet compacted rows.
+            compacted = WorkerEventSeries.concat(hpcrun_id, blocks).select(first_sequence_number)
+            worker_events = sorted([*compacted.to_worker_events(), *worker_events], key=lambda e: e.sequence_number)
+        return worker_events[:limit]
+
+    @override
+    async def get_worker_event_series(
+        self,
+        hpcrun_id: int,
+        start_sequence_number: int | None = None,
+        end_sequence_number: int | None = None,
+        limit: int | None = None,
+    ) -> WorkerEventSeries:
+        async with self.async_sessionmaker() as session, session.begin():
+            parts = await self._get_worker_event_blocks(
+                session, hpcrun_id, start_sequence_number, end_sequence_number, limit
+            )
+            conditions = [ORMWorkerEvent.hpcrun_id == hpcrun_id]
+            if start_sequence_number is not None:
+                conditions.append(ORMWorkerEvent.sequence_number >= start_sequence_number)
+            if end_sequence_number is not None:
+                conditions.append(ORMWorkerEvent.sequence_number <= end_sequence_number)
+            stmt = (
+                select(ORMWorkerEvent.mass, ORMWorkerEvent.sequence_number, ORMWorkerEvent.time)
+                .where(and_(*conditions))
+                .order_by(ORMWorkerEvent.sequence_number)
+                .limit(limit)
+            )
+            rows = (await session.execute(stmt)).all()
+        if rows:
+            row_events = [
+                WorkerEvent(correlation_id="", sequence_number=sequence_number, mass=mass, time=event_time)
+                for mass, sequence_number, event_time in rows
+            ]
+            parts.append(WorkerEventSeries.from_worker_events(hpcrun_id, row_events))
+        series = WorkerEventSeries.concat(hpcrun_id, parts).select(start_sequence_number, end_sequence_number)
+        return series if limit is None else series.head(limit)
+
+    async def _get_worker_event_blocks(
+        self,
+        session: AsyncSession,
+        hpcrun_id: int,
+        start_sequence_number: int | None,
+        end_sequence_number: int | None,
+        max_events: int | None = None,
+    ) -> list[WorkerEventSeries]:
+        """Unpacked blocks of ``hpcrun_id`` overlapping the sequence number range (not yet trimmed to it),
+        only as many as hold the first ``max_events`` events of the range."""
+        conditions = [ORMWorkerEventBlock.hpcrun_id == hpcrun_id]
+        if start_sequence_number is not None:
+            conditions.append(ORMWorkerEventBlock.last_sequence_number >= start_sequence_number)
+        if end_sequence_number is not None:
+            conditions.append(ORMWorkerEventBlock.first_sequence_number <= end_sequence_number)
+        stmt = (
+            select(
+                ORMWorkerEventBlock.mass_keys,
+                ORMWorkerEventBlock.sequence_numbers,
+                ORMWorkerEventBlock.times,
+                ORMWorkerEventBlock.mass,
+            )
+            .where(and_(*conditions))
+            .order_by(ORMWorkerEventBlock.first_sequence_number)
+        )
+        if max_events is None:
+            rows = (await session.execute(stmt)).all()
+            return [
+                unpack_worker_event_block(hpcrun_id, mass_keys, sequence_numbers, times, mass)
+                for mass_keys, sequence_numbers, times, mass in rows
+            ]
+        blocks: list[WorkerEventSeries] = []
+        n_events = 0
+        result = await session.stream(stmt.execution_options(yield_per=8))
+        try:
+            async for mass_keys, sequence_numbers, times, mass in result:
+                block = unpack_worker_event_block(hpcrun_id, mass_keys, sequence_numbers, times, mass)
+                blocks.append(block)
+                n_events += len(block.select(start_sequence_number, end_sequence_number))
+                if n_events >= max_events:
+                    break
+        finally:
+            await result.close()
+        return blocks
+
+    @override
+    async def compact_worker_events(
+        self, hpcrun_id: int, block_size: int = WORKER_EVENT_BLOCK_SIZE, max_blocks: int = 64
+    ) -> int:
+        async with self.async_sessionmaker() as session, session.begin():
+            # SKIP LOCKED: replicas compacting the same run concurrently pack disjoint rows.
+            stmt = (
+                select(ORMWorkerEvent)
+                .where(ORMWorkerEvent.hpcrun_id == hpcrun_id)
+                .order_by(ORMWorkerEvent.sequence_number, ORMWorkerEvent.id)
+                .limit(block_size * max_blocks)
+                .with_for_update(skip_locked=True)
+            )
+            orm_worker_events = list((await session.execute(stmt)).scalars().all())
+            n_compacted = len(orm_worker_events) // block_size * block_size
+            if n_compacted == 0:
+                return 0
+            for offset in range(0, n_compacted, block_size):
+                chunk = orm_worker_events[offset : offset + block_size]
+                # A redelivered message can leave duplicate sequence numbers; keep the first.
+                unique = {row.sequence_number: row.to_worker_event() for row in reversed(chunk)}
+                packed = pack_worker_events(sorted(unique.values(), key=lambda e: e.sequence_number))
+                session.add(
+                    ORMWorkerEventBlock(
+                        hpcrun_id=hpcrun_id,
+                        correlation_id=chunk[0].correlation_id,
+                        first_sequence_number=packed.first_sequence_number,
+                        last_sequence_number=packed.last_sequence_number,
+                        n_events=packed.n_events,
+                        mass_keys=packed.mass_keys,
+                        sequence_numbers=packed.sequence_numbers,
+                        times=packed.times,
+                        mass=packed.mass,
+                    )
+                )
+            compacted_ids = [row.id for row in orm_worker_events[:n_compacted]]
+            await session.execute(delete(ORMWorkerEvent).where(ORMWorkerEvent.id.in_(compacted_ids)))
+        logger.debug(f"Compacted {n_compacted} worker events of HpcRun {hpcrun_id}")
+        return n_compacted
+
+    @override
+    async def get_output_manifest(self, storage: OutputStorage, root: str) -> OutputManifest | None:
+        async with self.async_sessionmaker() as session:
+            orm_manifest = await self._get_orm_output_manifest(session, storage, root)
+            return orm_manifest.to_output_manifest() if orm_manifest is not None else None
+
+    async def _get_orm_output_manifest(
+        self, session: AsyncSession, storage: OutputStorage, root: str, for_update: bool = False
+    ) -> ORMOutputManifest | None:
+        stmt = select(ORMOutputManifest).where(
+            ORMOutputManifest.storage == storage.value, ORMOutputManifest.root == root
+        )
+        if for_update:
+            stmt = stmt.with_for_update()
+        return (await session.execute(stmt)).scalars().one_or_none()
+
+    @override
+    async def sync_output_manifest(
+        self,
+        storage: OutputStorage,
+        root: str,
+        entries: Sequence[OutputManifestEntry],
+        experiment_id: str | None = None,
+        source_version: str | None = None,
+    ) -> OutputManifest:
+        indexed_at = datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
+        async with self.async_sessionmaker() as session, session.begin():
+            # Concurrent first syncs of one root race on the insert; the row lock then serializes them.
+            await session.execute(
+                pg_insert(ORMOutputManifest)
+                .values(storage=storage.value, root=root, indexed_at=indexed_at)
+                .on_conflict_do_nothing(index_elements=["storage", "root"])
+            )
+            orm_manifest = await self._get_orm_output_manifest(session, storage, root, for_update=True)
+            if orm_manifest is None:
+                raise RuntimeError(f"Output manifest {storage}:{root} vanished during sync")
+
+            stmt = select(
+                ORMOutputManifestFile.id,
+                ORMOutputManifestFile.path,
+                ORMOutputManifestFile.size,
+                ORMOutputManifestFile.version,
+            ).where(ORMOutputManifestFile.manifest_id == orm_manifest.id)
+            existing = {
+                path: (file_id, size, version) for file_id, path, size, version in (await session.execute(stmt)).all()
+            }
+            incoming = {entry.path: entry for entry in entries}
+
+            added = [
+                _manifest_file_values(orm_manifest.id, entry)
+                for path, entry in incoming.items()
+                if path not in existing
+            ]
+            changed = [
+                {"id": existing[path][0], **_manifest_file_values(orm_manifest.id, entry)}
+                for path, entry in incoming.items()
+                if path in existing and existing[path][1:] != (entry.size, entry.version)
+            ]
+            removed = [file_id for path, (file_id, _, _) in existing.items() if path not in incoming]
+            if removed:
+                await session.execute(delete(ORMOutputManifestFile).where(ORMOutputManifestFile.id.in_(removed)))
+            if added:
+                await session.execute(insert(ORMOutputManifestFile), added)
+            if changed:
+                await session.execute(update(ORMOutputManifestFile), changed)
+
+            orm_manifest.file_count = len(incoming)
+            orm_manifest.total_bytes = sum(entry.size for entry in incoming.values())
+            orm_manifest.indexed_at = indexed_at
+            orm_manifest.source_version = source_version
+            if experiment_id is not None:
+                orm_manifest.experiment_id = experiment_id
+            await session.flush()
+            manifest = orm_manifest.to_output_manifest()
+        logger.info(
+            f"Synced output manifest {storage}:{root}: {len(added)} added, {len(changed)} changed, "
+            f"{len(removed)} removed ({manifest.file_count} files)"
+        )
+        return manifest
+
+    @override
+    async def list_output_manifest_files(
+        self,
+        storage: OutputStorage,
+        root: str,
+        extensions: Sequence[str] | None = None,
+        partition: PartitionFilter | None = None,
+    ) -> list[OutputManifestEntry] | None:
+        async with self.async_sessionmaker() as session:
+            orm_manifest = await self._get_orm_output_manifest(session, storage, root)
+            if orm_manifest is None:
+                return None
+            clauses: list[ColumnElement[bool]] = [ORMOutputManifestFile.manifest_id == orm_manifest.id]
+            if extensions is not None:
+                clauses.append(ORMOutputManifestFile.extension.in_([_normalize_extension(e) for e in extensions]))
+            if partition is not None:
+                if partition.variant is not None:
+                    clauses.append(ORMOutputManifestFile.variant == partition.variant)
+                if partition.lineage_seed is not None:
+                    clauses.append(ORMOutputManifestFile.lineage_seed == partition.lineage_seed)
+                if partition.min_generation is not None:
+                    clauses.append(ORMOutputManifestFile.generation >= partition.min_generation)
+                if partition.max_generation is not None:
+                    clauses.append(ORMOutputManifestFile.generation <= partition.max_generation)
+            stmt = select(ORMOutputManifestFile).where(and_(*clauses)).order_by(ORMOutputManifestFile.path)
+            rows = (await session.execute(stmt)).scalars().all()
+            return [row.to_output_manifest_entry() for row in rows]
 
     @override
     async def insert_simulation(self, sim_request: SimulationRequest) -> Simulation:
@@ -923,3 +1272,21 @@ class DatabaseServiceSQL(DatabaseService):
     @override
     async def close(self) -> None:
         pass
+
+
+def _normalize_extension(extension: str) -> str:
+    return extension.lstrip(".").lower()
+
+
+def _manifest_file_values(manifest_id: int, entry: OutputManifestEntry) -> dict[str, Any]:
+    return {
+        "manifest_id": manifest_id,
+        "path": entry.path,
+        "extension": _normalize_extension(posixpath.splitext(entry.path)[1]),
+        "size": entry.size,
+        "version": entry.version,
+        "variant": entry.variant,
+        "lineage_seed": entry.lineage_seed,
+        "generation": entry.generation,
+        "agent_id": entry.agent_id,
+    }
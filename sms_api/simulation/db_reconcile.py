@@ -104,6 +104,14 @@ async def _marker_analysis_query_columns(conn: AsyncConnection) -> bool:
     return await _column_exists(conn, "analysis", "n_tp")
 
 
+async def _marker_worker_event_block(conn: AsyncConnection) -> bool:
+    return await _table_exists(conn, "worker_event_block")
+
+
+async def _marker_output_manifest(conn: AsyncConnection) -> bool:
+    return await _table_exists(conn, "output_manifest")
+
+
 # (revision, human-readable marker description, async predicate)
 # One marker per revision reachable by a legacy create_all database. New entries
 # are needed ONLY while create_all still bootstraps prod DBs (see module docstring):
@@ -115,6 +123,8 @@ LEGACY_FINGERPRINTS: list[tuple[str, str]] = [
     ("a1c3e5f7b9d2", "enum jobstatusdb has value 'cancelled'"),
     ("c1a2b3d4e5f6", "simulation.tags column exists"),
     ("d3f9a1c72b84", "analysis.n_tp column exists"),
+    ("e4b2c6d8f0a1", "table 'worker_event_block' exists"),
+    ("f5c7d9e1a3b2", "table 'output_manifest' exists"),
 ]
 _LEGACY_PREDICATES = [
     _marker_baseline,
@@ -122,6 +132,8 @@ _LEGACY_PREDICATES = [
     _marker_jobstatus_cancelled,
     _marker_simulation_tags,
     _marker_analysis_query_columns,
+    _marker_worker_event_block,
+    _marker_output_manifest,
 ]
 
 
@@ -1,16 +1,18 @@
 import asyncio
 import logging
+from asyncio import Queue
 
 from async_lru import alru_cache
 
-from sms_api.common.hpc.job_service import JobStatusUpdate
+from sms_api.analysis.output_manifest import OutputManifestIndexer
+from sms_api.common.hpc.job_status_sources import SlurmJobStatusSource
 from sms_api.common.hpc.slurm_service import SlurmService
 from sms_api.common.messaging.messaging_service import MessagingService
-from sms_api.common.models import JobBackend, JobStatus, SSHTarget
 from sms_api.config import get_settings
-from sms_api.dependencies import get_ssh_session_service
 from sms_api.simulation.database_service import DatabaseService
 from sms_api.simulation.models import WorkerEvent, WorkerEventMessagePayload
+from sms_api.simulation.status_watcher import JobStatusWatcher
+from sms_api.simulation.worker_event_ingest import WorkerEventIngestMetrics, WorkerEventIngestor
 
 logger = logging.getLogger(__name__)
 
@@ -19,27 +21,60 @@ class JobScheduler:
     database_service: DatabaseService
     slurm_service: SlurmService | None
     messaging_service: MessagingService
-    _polling_task: asyncio.Task[None] | None = None
-    _stop_event: asyncio.Event
+    status_watcher: JobStatusWatcher
+    worker_event_ingestor: WorkerEventIngestor
+    output_manifest_indexer: OutputManifestIndexer
 
     def __init__(
         self,
         messaging_service: MessagingService,
         database_service: DatabaseService,
         slurm_service: SlurmService | None = None,
+        status_watcher: JobStatusWatcher | None = None,
+        worker_event_ingestor: WorkerEventIngestor | None = None,
     ):
         self.messaging_service = messaging_service
         self.database_service = database_service
         self.slurm_service = slurm_service
-        self._stop_event = asyncio.Event()
+        if status_watcher is None:
+            sources = [SlurmJobStatusSource(slurm_service)] if slurm_service is not None else []
+            status_watcher = JobStatusWatcher(database_service=database_service, sources=sources)
+        self.status_watcher = status_watcher
+        self._worker_event_listeners: dict[Queue[WorkerEvent], int | None] = {}
+        if worker_event_ingestor is None:
+            worker_event_ingestor = WorkerEventIngestor.from_settings(database_service)
+        worker_event_ingestor.on_inserted = self._publish_worker_events
+        self.worker_event_ingestor = worker_event_ingestor
+        self.output_manifest_indexer = OutputManifestIndexer(database_service, status_watcher)
 
     @alru_cache
     async def get_hpcrun_by_correlation_id(self, correlation_id: str) -> int | None:
         return await self.database_service.get_hpcrun_id_by_correlation_id(correlation_id=correlation_id)
 
+    def subscribe_worker_events(self, queue: Queue[WorkerEvent], hpcrun_id: int | None = None) -> None:
+        """Deliver each ingested worker event (of ``hpcrun_id``, or of every run) to ``queue``."""
+        self._worker_event_listeners[queue] = hpcrun_id
+
+    def unsubscribe_worker_events(self, queue: Queue[WorkerEvent]) -> None:
+        self._worker_event_listeners.pop(queue, None)
+
+    def worker_event_metrics(self) -> WorkerEventIngestMetrics:
+        return self.worker_event_ingestor.metrics()
+
+    def _publish_worker_events(self, worker_events: list[WorkerEvent]) -> None:
+        for queue, hpcrun_id in list(self._worker_event_listeners.items()):
+            for worker_event in worker_events:
+                if hpcrun_id is not None and hpcrun_id != worker_event.hpcrun_id:
+                    continue
+                try:
+                    queue.put_nowait(worker_event)
+                except asyncio.QueueFull:
+                    logger.warning(f"Dropping worker event of HpcRun {worker_event.hpcrun_id} for a slow subscriber")
+
     async def subscribe(self) -> None:
         channel = get_settings().redis_channel
         logger.info(f"Subscribing to messaging service for channel '{channel}'")
+        self.worker_event_ingestor.start()
 
         async def message_handler(data: bytes) -> None:
             try:
@@ -53,9 +88,8 @@ class JobScheduler:
                 if hpcrun_id is None:
                     logger.error(f"No HpcRun found for correlation ID {worker_event.correlation_id}. Skipping event.")
                     return
-                _updated_worker_event = await self.database_service.insert_worker_event(
-                    worker_event, hpcrun_id=hpcrun_id
-                )
+                # Buffered and bulk-inserted; waits here (backpressure) while the ingestion queue is full.
+                await self.worker_event_ingestor.submit(worker_event.model_copy(update={"hpcrun_id": hpcrun_id}))
             except Exception:
                 logger.exception(f"Exception while handling message: {data!r}")
 
@@ -66,78 +100,19 @@ class JobScheduler:
             logger.error("Messaging service is not connected.")
 
     async def start_polling(self, interval_seconds: int = 30) -> None:
-        if self._polling_task is not None and not self._polling_task.done():
-            logger.warning("Polling task already running.")
-            return
-        self._stop_event.clear()
-        self._polling_task = asyncio.create_task(self._polling_loop(interval_seconds))
-        logger.info("Started job status polling task.")
+        self.output_manifest_indexer.start()
+        await self.status_watcher.start(interval_seconds=interval_seconds)
 
     async def stop_polling(self) -> None:
-        if self._stop_event:
-            self._stop_event.set()
-        if self._polling_task:
-            await self._polling_task
-            logger.info("Stopped job status polling task.")
-
-    async def _polling_loop(self, interval_seconds: int) -> None:
-        while not self._stop_event.is_set():
-            try:
-                await self.update_running_jobs()
-            except Exception:
-                logger.exception("Error during job polling")
-            await asyncio.sleep(interval_seconds)
+        await self.status_watcher.stop()
+        await self.output_manifest_indexer.stop()
 
     async def update_running_jobs(self) -> None:
-        if self.slurm_service is None:
-            return  # No SLURM polling when using K8s backend
-
-        # Fetch all active (PENDING or RUNNING) HpcRun jobs
-        running_jobs = await self.database_service.list_active_hpcruns()
-        if not running_jobs:
-            logger.debug("No active jobs found for polling.")
-            return
-        # Filter to SLURM-backend jobs (K8s jobs will be polled separately)
-        slurm_runs = [job for job in running_jobs if job.job_id.backend == JobBackend.SLURM]
-        if not slurm_runs:
-            logger.debug("No active SLURM jobs found for polling.")
-            return
-        slurm_job_ids = [job.job_id.as_slurm_int for job in slurm_runs]
-        async with get_ssh_session_service(SSHTarget.SLURM).session() as ssh:
-            slurm_jobs_from_squeue = await self.slurm_service.get_job_status_squeue(ssh, slurm_job_ids)
-            slurm_jobs_from_sacct = await self.slurm_service.get_job_status_scontrol(ssh, slurm_job_ids)
-        slurm_job_map = {job.job_id: job for job in slurm_jobs_from_squeue}
-        slurm_job_map.update({job.job_id: job for job in slurm_jobs_from_sacct})
-        for hpc_run in slurm_runs:
-            slurm_job = slurm_job_map.get(hpc_run.job_id.as_slurm_int)
-            if not slurm_job or not slurm_job.job_state:
-                continue
-            new_status = JobStatus.from_slurm_state(slurm_job.job_state)
-            if new_status == hpc_run.status:
-                logger.debug(f"HpcRun {hpc_run.database_id} is still running with status {new_status}")
-                continue
-
-            # Build error message for failed/cancelled jobs
-            error_message = None
-            if new_status in (JobStatus.FAILED, JobStatus.CANCELLED):
-                error_parts = [f"SLURM state: {slurm_job.job_state}"]
-                if slurm_job.reason:
-                    error_parts.append(f"reason: {slurm_job.reason}")
-                if slurm_job.exit_code:
-                    error_parts.append(f"exit_code: {slurm_job.exit_code}")
-                error_message = ", ".join(error_parts)
-
-            update = JobStatusUpdate(
-                job_id=hpc_run.job_id,
-                status=new_status,
-                start_time=slurm_job.start_time,
-                end_time=slurm_job.end_time,
-                error_message=error_message,
-            )
-            await self.database_service.update_hpcrun_status(hpcrun_id=hpc_run.database_id, update=update)
-            logger.info(f"Updated HpcRun {hpc_run.database_id} status to {new_status}")
+        """Run one status poll of every active job (see JobStatusWatcher.poll_once)."""
+        await self.status_watcher.poll_once()
 
     async def close(self) -> None:
         await self.stop_polling()
         logger.debug("Closing messaging service connection")
         await self.messaging_service.disconnect()
+        await self.worker_event_ingestor.stop()
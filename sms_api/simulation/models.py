@@ -168,6 +168,28 @@ class WorkerEvent(BaseModel):
         )
 
 
+class WorkerEventBucket(BaseModel):
+    """Aggregate of the worker events in one time bucket of a downsampled series."""
+
+    start_time: float  # bucket covers [start_time, start_time + bucket_seconds) of simulation time
+    n_events: int
+    first_sequence_number: int
+    last_sequence_number: int
+    mass_min: dict[str, float]
+    mass_max: dict[str, float]
+    mass_mean: dict[str, float]
+
+
+class WorkerEventPage(BaseModel):
+    """One page of a simulation's worker events: raw ``events``, or ``buckets`` when downsampled."""
+
+    simulation_id: int
+    events: list[WorkerEvent] = Field(default_factory=list)
+    buckets: list[WorkerEventBucket] | None = None
+    next_after_seq: int | None = None  # pass as after_seq to get the next page
+    has_more: bool = False  # False: the page reached the latest ingested event
+
+
 class WorkerEventMessagePayload(BaseModel):
     correlation_id: str  # to correlate with the HpcRun job - see hpc_utils.get_correlation_id()
     sequence_number: int  # Sequence number provided by the message producer (emitter)
@@ -431,3 +453,22 @@ class SimulationObservables(BaseModel):
     store: Literal["zarr", "parquet"]
     time: list[float]
     series: dict[str, list[float | None]]
+
+
+class SimulationObservablesSeedError(BaseModel):
+    """NDJSON line of ``/observables/batch`` for a seed whose store could not be read."""
+
+    simulation_id: int
+    experiment_id: str
+    seed: int
+    error: str
+
+
+class SimulationObservablesEnsemble(BaseModel):
+    """Final NDJSON line of ``/observables/batch?ensemble=true``: per-observable mean/percentile bands."""
+
+    simulation_id: int
+    experiment_id: str
+    seeds: list[int]
+    time: list[float]
+    bands: dict[str, dict[str, list[float | None]]]
@@ -21,18 +21,57 @@ Read performance (per review):
 - The Parquet path uses **Polars** with **column projection** — listing reads
   only the schema + the parquet footer row count (no column data), and fetching
   reads only the requested columns + ``time``.
-- ``read_observables`` supports **decimation** (``stride`` / ``max_points``).
+- ``read_observables`` supports **decimation** (``stride`` / ``max_points``), and
+  feature-preserving **downsampling** to ``max_points`` (``downsample=lttb|m4|minmax``)
+  so spikes and division events survive the reduction.
+- Reads stay in NumPy end to end (:func:`read_observable_arrays`) and can be
+  encoded as a columnar Arrow IPC stream or Parquet file (time + one column per
+  observable) without going through Python lists.
+- Opened stores are kept in a process-wide LRU (:class:`StoreCache`) keyed by
+  store URI, so repeated dashboard refreshes skip the ``exists`` probes, the
+  datatree open and the ``subtree`` walk. Entries expire after a TTL or when the
+  store's ``.zattrs`` ETag changes.
+- A finished partitioned store can be summarized into a JSON **index sidecar**
+  (:func:`write_store_index`, ``v2ecoli_seedNN.zarr.index.json``) listing its
+  leaves, generations and lengths. When the sidecar matches the store's
+  fingerprint, it replaces the datatree open: listing is one GET, and reads open
+  only the requested arrays.
+- 2-D observables (bulk counts, listener arrays) are served column by column:
+  a name such as ``bulk[0,5,7]``, ``bulk[10:20]`` or ``bulk[ids=ATP,GTP]``
+  (:func:`parse_observable_name`) reads only the selected columns' chunks and
+  returns each column as its own series (``bulk[5]``, ``bulk[ATP]``).
+- Multi-seed batches (:func:`iter_seed_observable_arrays`) fan the per-seed reads
+  out over a bounded number of worker threads and hand results back in
+  completion order; :func:`ensemble_bands` reduces them to mean/percentile bands.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
+import json
 import math
-from dataclasses import dataclass
-from typing import Any, Literal
+import re
+import threading
+import time as _time
+import warnings
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal
 
 import fsspec
 
+if TYPE_CHECKING:
+    import numpy as np
+    import pyarrow as pa
+    from numpy.typing import NDArray
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+PARQUET_MEDIA_TYPE = "application/x-parquet"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
 # The real XArrayEmitter stores aren't consolidated; opening with
 # ``consolidated=False`` silences xarray's fallback warning and skips a probe.
 
@@ -58,6 +97,26 @@ def detect_store_kind(store_uri: str) -> Literal["zarr", "parquet"]:
     return "parquet"
 
 
+def _store_fingerprint(store_uri: str, kind: Literal["zarr", "parquet"]) -> str | None:
+    """A cheap change marker for a store: the ETag (S3) or mtime (local) of its root
+    metadata object — ``.zattrs`` / ``zarr.json`` for zarr, the file itself for Parquet.
+
+    Costs one ``HEAD`` on S3. ``refresh=True`` bypasses the filesystem's listing cache,
+    which opening the store has filled and which would otherwise never see a rewrite.
+    Returns ``None`` if no marker object exists.
+    """
+    fs, path = fsspec.core.url_to_fs(store_uri)
+    candidates = [f"{path}/.zattrs", f"{path}/zarr.json"] if kind == "zarr" else [path]
+    for candidate in candidates:
+        try:
+            info = fs.info(candidate, refresh=True)
+        except (FileNotFoundError, OSError):
+            continue
+        tag = info.get("ETag") or info.get("etag") or info.get("mtime") or info.get("LastModified")
+        return f"{tag}:{info.get('size')}"
+    return None
+
+
 def _effective_stride(n: int, stride: int, max_points: int | None) -> int:
     """Combine an explicit ``stride`` with a ``max_points`` cap into one step >= 1.
 
@@ -70,11 +129,211 @@ def _effective_stride(n: int, stride: int, max_points: int | None) -> int:
     return step
 
 
-def _sanitize(value: float) -> float | None:
-    """Convert NaN/Inf to None for JSON-safe output."""
-    if math.isfinite(value):
-        return value
-    return None
+DownsampleMethod = Literal["lttb", "m4", "minmax"]
+
+
+def _bucket_extrema(y: NDArray[np.float64], n_buckets: int) -> tuple[Any, Any, Any, Any]:
+    """Per equal-width bucket of ``y``: (first, last, argmin, argmax) as global indices.
+
+    Vectorized by padding ``y`` to ``(n_buckets, width)`` and reducing along rows;
+    NaNs never win a min/max unless the whole bucket is NaN.
+    """
+    import numpy as np
+
+    n = len(y)
+    width = math.ceil(n / n_buckets)
+    rows = math.ceil(n / width)
+    padded = np.full(rows * width, np.nan)
+    padded[:n] = y
+    grid = padded.reshape(rows, width)
+    starts = np.arange(rows) * width
+    lasts = np.minimum(starts + width - 1, n - 1)
+    argmin = starts + np.argmin(np.where(np.isnan(grid), np.inf, grid), axis=1)
+    argmax = starts + np.argmax(np.where(np.isnan(grid), -np.inf, grid), axis=1)
+    return starts, lasts, np.minimum(argmin, n - 1), np.minimum(argmax, n - 1)
+
+
+def _lttb_indices(x: NDArray[np.float64], y: NDArray[np.float64], n_out: int) -> Any:
+    """Largest-Triangle-Three-Buckets: pick ``n_out`` indices (first and last always kept).
+
+    The bucket walk is inherently sequential (each pick depends on the previous
+    one), so it loops over the ``n_out`` buckets; the triangle areas within a
+    bucket are computed vectorized.
+    """
+    import numpy as np
+
+    n = len(y)
+    if n_out >= n:
+        return np.arange(n)
+    if n_out < 3:
+        return np.array([0, n - 1])[:n_out]
+    # n_out - 2 interior buckets over [1, n - 1); each is >= 1 wide since n > n_out.
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    yy = np.where(np.isfinite(y), y, 0.0)
+    picked = np.empty(n_out, dtype=np.intp)
+    picked[0] = 0
+    picked[-1] = n - 1
+    prev = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nxt_lo, nxt_hi = (edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        avg_x = x[nxt_lo:nxt_hi].mean()
+        avg_y = yy[nxt_lo:nxt_hi].mean()
+        area = np.abs((x[prev] - avg_x) * (yy[lo:hi] - yy[prev]) - (x[prev] - x[lo:hi]) * (avg_y - yy[prev]))
+        prev = lo + int(np.argmax(area))
+        picked[i + 1] = prev
+    return picked
+
+
+def downsample_indices(
+    time: NDArray[np.float64],
+    series: dict[str, NDArray[np.float64]],
+    max_points: int,
+    method: DownsampleMethod,
+) -> Any:
+    """Sorted row indices that keep every series' visual features within ``max_points``.
+
+    The response has one shared time axis, so each series gets an equal share of
+    the point budget, its picks are computed independently, and the union is
+    returned (never more than ``max_points``):
+
+    * ``lttb`` — Largest-Triangle-Three-Buckets (shape-faithful for line charts).
+    * ``m4`` — first/last/min/max per bucket (pixel-exact for line rasterization).
+    * ``minmax`` — min/max per bucket (preserves spikes and dips).
+    """
+    import numpy as np
+
+    n = len(time)
+    if n <= max_points:
+        return np.arange(n)
+    budget = max(max_points // max(len(series), 1), 1)
+    picks: list[Any] = []
+    for y in series.values() or [time]:
+        if method == "lttb":
+            picks.append(_lttb_indices(time, y, budget))
+        elif method == "m4":
+            picks.extend(_bucket_extrema(y, max(budget // 4, 1)))
+        elif method == "minmax":
+            picks.extend(_bucket_extrema(y, max(budget // 2, 1))[2:])
+        else:
+            raise ValueError(f"unknown downsample method {method!r}; expected one of lttb, m4, minmax")
+    return np.unique(np.concatenate(picks))
+
+
+def _as_float_array(values: Any) -> NDArray[np.float64]:
+    """Coerce a column/array to a C-contiguous float64 vector (what the encoders expect)."""
+    import numpy as np
+
+    return np.ascontiguousarray(np.asarray(values, dtype=np.float64).ravel())
+
+
+def to_json_list(values: NDArray[np.float64]) -> list[float | None]:
+    """Convert a float vector to a JSON-safe list, mapping NaN/±Inf to ``None``.
+
+    Vectorized: one ``tolist()`` plus a mask, so only the non-finite positions are
+    touched in Python.
+    """
+    import numpy as np
+
+    out: list[float | None] = values.tolist()
+    for i in np.flatnonzero(~np.isfinite(values)).tolist():
+        out[i] = None
+    return out
+
+
+# ── Column selectors for 2-D observables ──────────────────────────────────
+
+MAX_SELECTED_COLUMNS = 1024
+
+_SELECTOR_RE = re.compile(r"^(?P<base>[^\[\]]+)\[(?P<spec>[^\[\]]*)\]$")
+
+
+@dataclass(frozen=True)
+class ColumnSelection:
+    """Columns requested from a 2-D observable by ``name[...]``.
+
+    ``spec`` is either positions along the second axis (``0,5,7`` / ``10:20`` /
+    ``-1``, mixable) or ``coord=label,...`` — labels looked up in a 1-D coordinate
+    of that axis (e.g. ``ids``).
+    """
+
+    observable: str
+    spec: str
+
+    def resolve(self, width: int, labels: Callable[[str], Sequence[Any]]) -> tuple[list[int], list[str]]:
+        """Column positions and the series name for each (``obs[5]`` / ``obs[ATP]``).
+
+        ``labels(coord)`` returns the coordinate's values; raises ``KeyError`` for
+        unknown labels/coordinates or out-of-range positions.
+        """
+        coord, eq, rest = self.spec.partition("=")
+        if eq:
+            values = [str(v) for v in labels(coord.strip())]
+            position = {v: i for i, v in enumerate(values)}
+            wanted = [label.strip() for label in rest.split(",") if label.strip()]
+            unknown = [label for label in wanted if label not in position]
+            if unknown:
+                raise KeyError(f"{coord.strip()} labels not in {self.observable!r}: {unknown}")
+            cols, keys = [position[label] for label in wanted], wanted
+        else:
+            cols = []
+            for item in (part.strip() for part in self.spec.split(",")):
+                if not item:
+                    continue
+                try:
+                    if ":" in item:
+                        bounds = [int(b) if b.strip() else None for b in item.split(":")]
+                        cols.extend(range(width)[slice(*bounds)])
+                    else:
+                        i = int(item)
+                        if not -width <= i < width:
+                            raise KeyError(f"column {i} out of range for {self.observable!r} (width {width})")
+                        cols.append(i % width)
+                except ValueError:
+                    raise ValueError(f"invalid column selector {item!r} for {self.observable!r}") from None
+            keys = [str(c) for c in cols]
+        if not cols:
+            raise ValueError(f"empty column selection for {self.observable!r}")
+        if len(cols) > MAX_SELECTED_COLUMNS:
+            raise ValueError(f"{len(cols)} columns selected from {self.observable!r}; limit is {MAX_SELECTED_COLUMNS}")
+        return cols, [f"{self.observable}[{k}]" for k in keys]
+
+
+def parse_observable_name(name: str) -> tuple[str, ColumnSelection | None]:
+    """Split ``bulk[0,5]`` into ``("bulk", ColumnSelection("bulk", "0,5"))``; plain names pass through."""
+    match = _SELECTOR_RE.match(name.strip())
+    if match is None:
+        return name.strip(), None
+    return match["base"].strip(), ColumnSelection(match["base"].strip(), match["spec"])
+
+
+def split_observable_names(names: str) -> list[str]:
+    """Split a comma-separated ``names`` query, keeping commas inside ``[...]`` selectors."""
+    parts: list[str] = []
+    depth, start = 0, 0
+    for i, ch in enumerate(names):
+        if ch == "[":
+            depth += 1
+        elif ch == "]":
+            depth = max(depth - 1, 0)
+        elif ch == "," and depth == 0:
+            parts.append(names[start:i])
+            start = i + 1
+    parts.append(names[start:])
+    return [p.strip() for p in parts if p.strip()]
+
+
+def _not_1d_error(name: str, shape: tuple[int, ...]) -> ValueError:
+    return ValueError(
+        f"observable {name!r} is not a 1-D timeseries (shape {shape}); select columns of a 2-D "
+        f"observable with {name}[i,j,...], {name}[a:b] or {name}[coord=label,...]"
+    )
+
+
+def _split_columns(values: NDArray[np.float64], keys: list[str], series: dict[str, NDArray[np.float64]]) -> None:
+    """Store each column of a (time, k) block as its own contiguous float64 series."""
+    for k, key in enumerate(keys):
+        series[key] = _as_float_array(values[:, k])
 
 
 # ── Hive-partitioned XArrayEmitter datatree ────────────────────────────────
@@ -122,70 +381,440 @@ def _partition_leaves(dt: Any) -> tuple[dict[str, Any], Any] | None:
     return leaves, parent
 
 
-def _read_partitioned_zarr(
-    store_uri: str, names: list[str], stride: int, max_points: int | None
-) -> tuple[list[float], dict[str, list[float | None]]] | None:
-    """Read observables from a hive-partitioned datatree, or ``None`` if the store
-    isn't partitioned (caller falls back to the flat path)."""
+def _generation_plan(
+    handle: StoreHandle, t_start: float | None, t_end: float | None, generations: Sequence[int] | None
+) -> list[tuple[int, slice]]:
+    """``(generation, row slice)`` pairs to read for a time window / generation filter.
+
+    Generations outside ``generations`` or whose ``time_gen={G}`` bounds miss the
+    window are skipped without touching their observable segments; within a kept
+    generation the window becomes a row slice (time is ascending per generation).
+    """
     import numpy as np
-    import xarray as xr
 
-    try:
-        dt = xr.open_datatree(store_uri, engine="zarr", consolidated=False)
-    except Exception:
-        return None
-    part = _partition_leaves(dt)
-    if part is None:
-        return None
-    leaves, parent = part
+    wanted_gens = None if generations is None else set(generations)
+    plan: list[tuple[int, slice]] = []
+    for g in handle.gens:
+        if wanted_gens is not None and g not in wanted_gens:
+            continue
+        if t_start is None and t_end is None:
+            plan.append((g, slice(None)))
+            continue
+        bounds = handle.time_bounds(g)
+        if bounds is None or (t_start is not None and bounds[1] < t_start) or (t_end is not None and bounds[0] > t_end):
+            continue
+        seg = handle.time_segment(g)
+        lo = 0 if t_start is None else int(np.searchsorted(seg, t_start, side="left"))
+        hi = len(seg) if t_end is None else int(np.searchsorted(seg, t_end, side="right"))
+        if hi > lo:
+            plan.append((g, slice(lo, hi)))
+    return plan
+
+
+def _read_partitioned_zarr(
+    handle: StoreHandle,
+    names: list[str],
+    stride: int,
+    max_points: int | None,
+    t_start: float | None = None,
+    t_end: float | None = None,
+    generations: Sequence[int] | None = None,
+) -> tuple[NDArray[np.float64], dict[str, NDArray[np.float64]]]:
+    """Read observables from a hive-partitioned datatree (``handle.partitioned``).
 
-    wanted = names or sorted(leaves)
-    missing = [n for n in wanted if n not in leaves]
+    Each observable's ``generation={G}`` segments are joined with one
+    ``np.concatenate`` and then decimated, so no per-sample Python work is done.
+    With a time window or generation filter only the overlapping segments (and
+    rows) are read.
+    """
+    import numpy as np
+
+    leaves = handle.leaves or {}
+    requests = [parse_observable_name(nm) for nm in names] if names else [(nm, None) for nm in sorted(leaves)]
+    missing = [base for base, _ in requests if base not in leaves]
     if missing:
         raise KeyError(f"observables not in store: {missing}")
 
-    gens = _gen_order(parent)
-    raw_time: list[float] = []
-    for g in gens:
-        raw_time.extend(float(t) for t in np.asarray(parent[f"time_gen={g}"].values).ravel())
+    if t_start is None and t_end is None and generations is None:
+        plan = [(g, slice(None)) for g in handle.gens]
+        raw_time = handle.time_axis()
+    else:
+        plan = _generation_plan(handle, t_start, t_end, generations)
+        time_parts = [handle.time_segment(g)[rows] for g, rows in plan]
+        raw_time = np.concatenate(time_parts) if time_parts else np.empty(0, dtype=float)
     step = _effective_stride(len(raw_time), stride, max_points)
-    time = raw_time[::step]
-
-    series: dict[str, list[float | None]] = {}
-    for nm in wanted:
-        node = leaves[nm]
-        vals: list[float | None] = []
-        for g in gens:
-            var_name = f"generation={g}"
-            if var_name not in (node.data_vars or {}):
+    time = _as_float_array(raw_time[::step])
+
+    series: dict[str, NDArray[np.float64]] = {}
+    for base, selection in requests:
+        cols: list[int] | None = None
+        if selection is not None:
+            tail = handle.leaf_shape(base)
+            if len(tail) != 1:
+                raise ValueError(f"column selectors need a 2-D observable; {base!r} has trailing shape {tail}")
+            cols, keys = selection.resolve(tail[0], functools.partial(handle.leaf_labels, base))
+        segments: list[Any] = []
+        for g, rows in plan:
+            arr = handle.segment(base, g, rows, cols)
+            if arr is None:
                 continue
-            arr = np.asarray(node[var_name].values)
-            if arr.ndim != 1:
-                raise ValueError(
-                    f"observable {nm!r} is not a 1-D timeseries (shape {tuple(arr.shape)}); "
-                    "multi-dimensional observables are not supported"
-                )
-            vals.extend(_sanitize(float(v)) for v in arr)
-        series[nm] = vals[::step]
+            if arr.ndim != (1 if cols is None else 2):
+                raise _not_1d_error(base, tuple(arr.shape))
+            segments.append(arr)
+        if cols is None:
+            joined = np.concatenate(segments) if segments else np.empty(0, dtype=np.float64)
+            series[base] = _as_float_array(joined[::step])
+        else:
+            block = np.concatenate(segments) if segments else np.empty((0, len(cols)), dtype=np.float64)
+            _split_columns(block[::step], keys, series)
     return time, series
 
 
-def _list_partitioned_zarr(store_uri: str) -> list[ObservableInfo] | None:
-    """List observables in a hive-partitioned datatree (concatenated length per
-    observable), or ``None`` if the store isn't partitioned."""
+def _list_partitioned_zarr(handle: StoreHandle) -> list[ObservableInfo]:
+    """List observables in a hive-partitioned datatree (concatenated length per observable)."""
+    total = sum(handle.time_lengths())
+    return [
+        ObservableInfo(name=name, dims=["time", *handle.leaf_dims(name)], shape=[total, *handle.leaf_shape(name)])
+        for name in sorted(handle.leaves or {})
+    ]
+
+
+# ── Store cache ────────────────────────────────────────────────────────────
+
+
+@dataclass
+class StoreHandle:
+    """Everything the reader learns about a store on open, cached per store URI.
+
+    ``leaves`` / ``gens`` are only set for hive-partitioned zarr datatrees; flat
+    zarr and Parquet stores cache just their ``kind``. A partitioned store is
+    backed either by its opened datatree (``dt``; ``leaves`` maps names to nodes)
+    or by its index sidecar (``index``; ``leaves`` maps names to index entries and
+    arrays are opened one by one through zarr).
+    """
+
+    store_uri: str
+    kind: Literal["zarr", "parquet"]
+    fingerprint: str | None
+    opened_at: float
+    dt: Any = None
+    leaves: dict[str, Any] | None = None
+    parent: Any = None
+    gens: list[int] = field(default_factory=list)
+    index: dict[str, Any] | None = None
+    index_requested: bool = False
+    _time: Any = None
+    _time_segments: dict[int, Any] = field(default_factory=dict)
+    _group: Any = None
+
+    @property
+    def partitioned(self) -> bool:
+        return self.leaves is not None
+
+    def _array(self, path: str, rows: slice = slice(None), cols: list[int] | None = None) -> Any:
+        """Read (rows/columns of) one array of an index-backed store, opening only that array's metadata."""
+        import numpy as np
+
+        if self._group is None:
+            import zarr
+
+            self._group = zarr.open_group(self.store_uri, mode="r")
+        arr = self._group[path]
+        return np.asarray(arr[rows] if cols is None else arr.oindex[rows, cols])
+
+    def segment(self, name: str, gen: int, rows: slice = slice(None), cols: list[int] | None = None) -> Any:
+        """Rows (and, for 2-D observables, columns) of ``name``'s ``generation={gen}`` segment.
+
+        Returns ``None`` if the observable has no segment for that generation.
+        Only the zarr chunks covering the selection are read.
+        """
+        import numpy as np
+
+        var = f"generation={gen}"
+        leaf = (self.leaves or {})[name]
+        if self.index is not None:
+            return self._array(f"{leaf['path']}/{var}", rows, cols) if gen in leaf["generations"] else None
+        if var not in (leaf.data_vars or {}):
+            return None
+        da = leaf[var]
+        if not da.ndim:
+            return np.asarray(da.values)
+        selection: dict[Any, Any] = {da.dims[0]: rows}
+        if cols is not None and da.ndim > 1:
+            selection[da.dims[1]] = cols
+        return np.asarray(da.isel(selection).values)
+
+    def _first_segment_var(self, name: str) -> Any:
+        leaf = (self.leaves or {})[name]
+        for g in self.gens:
+            var = f"generation={g}"
+            if var in (leaf.data_vars or {}):
+                return leaf[var]
+        return None
+
+    def leaf_shape(self, name: str) -> tuple[int, ...]:
+        """Trailing (per-sample) shape of observable ``name``; ``()`` for a scalar timeseries."""
+        if self.index is not None:
+            return tuple(int(n) for n in self.index["observables"][name].get("shape", []))
+        da = self._first_segment_var(name)
+        return tuple(int(n) for n in da.shape[1:]) if da is not None else ()
+
+    def leaf_dims(self, name: str) -> list[str]:
+        """Trailing dimension names of observable ``name``."""
+        if self.index is not None:
+            return [str(d) for d in self.index["observables"][name].get("dims", [])]
+        da = self._first_segment_var(name)
+        return [str(d) for d in da.dims[1:]] if da is not None else []
+
+    def leaf_labels(self, name: str, coord: str) -> Any:
+        """Values of coordinate ``coord`` stored with observable ``name`` (for ``name[coord=...]``)."""
+        import numpy as np
+
+        leaf = (self.leaves or {})[name]
+        if self.index is not None:
+            try:
+                return self._array(f"{leaf['path']}/{coord}")
+            except KeyError:
+                raise KeyError(f"no coordinate {coord!r} on observable {name!r}") from None
+        if coord not in leaf.variables:
+            raise KeyError(f"no coordinate {coord!r} on observable {name!r}")
+        return np.asarray(leaf[coord].values)
+
+    def time_lengths(self) -> list[int]:
+        """Samples per generation, in ``gens`` order (metadata only)."""
+        if self.index is not None:
+            return [int(n) for n in self.index["time_lengths"]]
+        return [int(self.parent[f"time_gen={g}"].shape[0]) for g in self.gens]
+
+    def time_segment(self, gen: int) -> Any:
+        """Generation ``gen``'s ``time_gen={gen}`` axis (NumPy array), read once and memoized."""
+        seg = self._time_segments.get(gen)
+        if seg is None:
+            import numpy as np
+
+            if self.index is not None:
+                seg = self._array(f"{self.index['time_path']}/time_gen={gen}").astype(float).ravel()
+            else:
+                seg = np.asarray(self.parent[f"time_gen={gen}"].values, dtype=float).ravel()
+            self._time_segments[gen] = seg
+        return seg
+
+    def time_bounds(self, gen: int) -> tuple[float, float] | None:
+        """``(first, last)`` time of generation ``gen`` (from the index when it has them), or ``None`` if empty."""
+        if self.index is not None:
+            bounds = self.index["time_bounds"][self.gens.index(gen)]
+            return (float(bounds[0]), float(bounds[1])) if bounds else None
+        seg = self.time_segment(gen)
+        return (float(seg[0]), float(seg[-1])) if len(seg) else None
+
+    def time_axis(self) -> Any:
+        """The generation-concatenated time axis (NumPy array), read once and memoized."""
+        if self._time is None:
+            import numpy as np
+
+            segments = [self.time_segment(g) for g in self.gens]
+            self._time = np.concatenate(segments) if segments else np.empty(0, dtype=float)
+        return self._time
+
+    def to_index(self) -> dict[str, Any]:
+        """Describe an opened partitioned datatree as an index sidecar document."""
+        leaves = self.leaves or {}
+        return {
+            "version": STORE_INDEX_VERSION,
+            "store": self.kind,
+            "fingerprint": self.fingerprint,
+            "time_path": str(self.parent.path).strip("/"),
+            "generations": self.gens,
+            "time_lengths": self.time_lengths(),
+            "time_bounds": [self.time_bounds(g) for g in self.gens],
+            "observables": {
+                name: {
+                    "path": str(node.path).strip("/"),
+                    "generations": [g for g in self.gens if f"generation={g}" in (node.data_vars or {})],
+                    "dims": self.leaf_dims(name),
+                    "shape": list(self.leaf_shape(name)),
+                }
+                for name, node in sorted(leaves.items())
+            },
+        }
+
+    def close(self) -> None:
+        if self.dt is not None:
+            with contextlib.suppress(Exception):
+                self.dt.close()
+
+
+@dataclass
+class StoreCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    size: int
+    max_entries: int
+
+
+STORE_INDEX_VERSION = 3
+
+
+def store_index_uri(store_uri: str) -> str:
+    """Where a store's index sidecar lives: next to it, as ``<store>.index.json``."""
+    return f"{store_uri.rstrip('/')}.index.json"
+
+
+def _load_store_index(store_uri: str) -> dict[str, Any] | None:
+    """Fetch a store's index sidecar (one GET), or ``None`` if absent/unreadable/another version."""
+    fs, path = fsspec.core.url_to_fs(store_index_uri(store_uri))
+    try:
+        doc = json.loads(fs.cat_file(path))
+    except (FileNotFoundError, OSError, ValueError):
+        return None
+    if not isinstance(doc, dict) or doc.get("version") != STORE_INDEX_VERSION:
+        return None
+    return doc
+
+
+def _open_store(store_uri: str) -> StoreHandle:
+    """Probe and open a store: detect its kind and, for zarr, walk the partition tree.
+
+    A current index sidecar short-circuits both the probes and the tree walk.
+    """
+    doc = _load_store_index(store_uri)
+    if doc is not None:
+        fingerprint = _store_fingerprint(store_uri, "zarr")
+        if fingerprint is not None and fingerprint == doc.get("fingerprint"):
+            return StoreHandle(
+                store_uri=store_uri,
+                kind="zarr",
+                fingerprint=fingerprint,
+                opened_at=_time.monotonic(),
+                leaves=dict(doc["observables"]),
+                gens=[int(g) for g in doc["generations"]],
+                index=doc,
+            )
+
+    kind = detect_store_kind(store_uri)
+    handle = StoreHandle(
+        store_uri=store_uri,
+        kind=kind,
+        fingerprint=_store_fingerprint(store_uri, kind),
+        opened_at=_time.monotonic(),
+    )
+    if kind != "zarr":
+        return handle
+
     import xarray as xr
 
     try:
         dt = xr.open_datatree(store_uri, engine="zarr", consolidated=False)
     except Exception:
-        return None
+        return handle
     part = _partition_leaves(dt)
     if part is None:
-        return None
-    leaves, parent = part
-    gens = _gen_order(parent)
-    total = sum(int(parent[f"time_gen={g}"].shape[0]) for g in gens)
-    return [ObservableInfo(name=name, dims=["time"], shape=[total]) for name in sorted(leaves)]
+        dt.close()
+        return handle
+    handle.dt = dt
+    handle.leaves, handle.parent = part
+    handle.gens = _gen_order(handle.parent)
+    return handle
+
+
+class StoreCache:
+    """Process-wide, size-bounded LRU of :class:`StoreHandle` keyed by store URI.
+
+    An entry is reused while it is younger than ``ttl_seconds`` *and* the store's
+    fingerprint (``.zattrs`` ETag) is unchanged; otherwise it is dropped and the
+    store is reopened. Stores with no fingerprint object (i.e. that don't exist
+    yet) are never cached, so a run whose store appears later isn't pinned to a
+    stale miss. Safe to share across the ``asyncio.to_thread`` workers.
+    """
+
+    def __init__(self, max_entries: int = 32, ttl_seconds: float = 300.0) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, StoreHandle] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def get(self, store_uri: str) -> StoreHandle:
+        """Return a cached handle for ``store_uri``, opening (and caching) it on a miss."""
+        with self._lock:
+            entry = self._entries.get(store_uri)
+        if entry is not None:
+            fresh = _time.monotonic() - entry.opened_at < self.ttl_seconds
+            if fresh and _store_fingerprint(store_uri, entry.kind) == entry.fingerprint:
+                with self._lock:
+                    if store_uri in self._entries:
+                        self._entries.move_to_end(store_uri)
+                    self._hits += 1
+                return entry
+            self._drop(store_uri, entry)
+
+        handle = _open_store(store_uri)
+        with self._lock:
+            self._misses += 1
+            if self.max_entries <= 0 or handle.fingerprint is None:
+                return handle
+            previous = self._entries.pop(store_uri, None)
+            self._entries[store_uri] = handle
+            evicted = []
+            while len(self._entries) > self.max_entries:
+                _, old = self._entries.popitem(last=False)
+                evicted.append(old)
+                self._evictions += 1
+        if previous is not None and previous is not handle:
+            previous.close()
+        for old in evicted:
+            old.close()
+        return handle
+
+    def _drop(self, store_uri: str, entry: StoreHandle) -> None:
+        with self._lock:
+            if self._entries.get(store_uri) is not entry:
+                return
+            del self._entries[store_uri]
+            self._invalidations += 1
+        entry.close()
+
+    def invalidate(self, store_uri: str | None = None) -> None:
+        """Drop one store's entry (or every entry when ``store_uri`` is ``None``)."""
+        with self._lock:
+            if store_uri is None:
+                dropped = list(self._entries.values())
+                self._entries.clear()
+            else:
+                entry = self._entries.pop(store_uri, None)
+                dropped = [entry] if entry is not None else []
+            self._invalidations += len(dropped)
+        for entry in dropped:
+            entry.close()
+
+    def peek(self, store_uri: str) -> StoreHandle | None:
+        """The cached handle for ``store_uri`` if any, without probing the store."""
+        with self._lock:
+            return self._entries.get(store_uri)
+
+    def stats(self) -> StoreCacheStats:
+        with self._lock:
+            return StoreCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                size=len(self._entries),
+                max_entries=self.max_entries,
+            )
+
+
+_store_cache = StoreCache()
+
+
+def get_store_cache() -> StoreCache:
+    """The process-wide store cache shared by the sync and async reader APIs."""
+    return _store_cache
 
 
 # ── Public API ─────────────────────────────────────────────────────────────
@@ -197,11 +826,10 @@ def list_observables(store_uri: str) -> StoreIndex:
     Metadata-only: the Parquet path reads the schema and the footer row count, not
     any column data.
     """
-    kind = detect_store_kind(store_uri)
-    if kind == "zarr":
-        partitioned = _list_partitioned_zarr(store_uri)
-        if partitioned is not None:
-            return StoreIndex(store="zarr", observables=partitioned)
+    handle = get_store_cache().get(store_uri)
+    if handle.kind == "zarr":
+        if handle.partitioned:
+            return StoreIndex(store="zarr", observables=_list_partitioned_zarr(handle))
 
         import xarray as xr
 
@@ -215,6 +843,10 @@ def list_observables(store_uri: str) -> StoreIndex:
             ds.close()
         return StoreIndex(store="zarr", observables=obs)
 
+    if handle.fingerprint is None:
+        # Neither a zarr group nor an existing parquet object: no store here yet.
+        raise FileNotFoundError(store_uri)
+
     import polars as pl
 
     lf = pl.scan_parquet(store_uri)
@@ -224,12 +856,201 @@ def list_observables(store_uri: str) -> StoreIndex:
     return StoreIndex(store="parquet", observables=obs)
 
 
+def read_observable_arrays(
+    store_uri: str,
+    names: list[str],
+    *,
+    stride: int = 1,
+    max_points: int | None = None,
+    downsample: DownsampleMethod | None = None,
+    t_start: float | None = None,
+    t_end: float | None = None,
+    generations: Sequence[int] | None = None,
+) -> tuple[Literal["zarr", "parquet"], NDArray[np.float64], dict[str, NDArray[np.float64]]]:
+    """Return (store_kind, time, {name: values}) as float64 NumPy vectors.
+
+    This is the vectorized core behind :func:`read_observables`; callers that
+    serialize straight from arrays (e.g. the API's orjson response) use it to skip
+    building Python lists. Non-finite values are left as NaN/±Inf — encoders map
+    them to ``null``. Same arguments and errors as :func:`read_observables`.
+    """
+    if t_start is not None and t_end is not None and t_start > t_end:
+        raise ValueError(f"t_start ({t_start}) is after t_end ({t_end})")
+    capped = max_points if downsample is None else None
+    kind, time, series = _read_observable_arrays(
+        store_uri, names, stride=stride, max_points=capped, t_start=t_start, t_end=t_end, generations=generations
+    )
+    if downsample is None or max_points is None:
+        return kind, time, series
+    idx = downsample_indices(time, series, max_points, downsample)
+    return kind, _as_float_array(time[idx]), {nm: _as_float_array(arr[idx]) for nm, arr in series.items()}
+
+
+def _read_observable_arrays(
+    store_uri: str,
+    names: list[str],
+    *,
+    stride: int,
+    max_points: int | None,
+    t_start: float | None,
+    t_end: float | None,
+    generations: Sequence[int] | None,
+) -> tuple[Literal["zarr", "parquet"], NDArray[np.float64], dict[str, NDArray[np.float64]]]:
+    handle = get_store_cache().get(store_uri)
+    if handle.kind == "zarr":
+        if handle.partitioned:
+            return "zarr", *_read_partitioned_zarr(handle, names, stride, max_points, t_start, t_end, generations)
+        if generations is not None:
+            raise ValueError("a generations filter needs a generation-partitioned store")
+        return "zarr", *_read_flat_zarr(store_uri, names, stride, max_points, t_start, t_end)
+    if handle.fingerprint is None:
+        # Neither a zarr group nor an existing parquet object: no store here yet.
+        raise FileNotFoundError(store_uri)
+    return "parquet", *_read_parquet(store_uri, names, stride, max_points, t_start, t_end, generations)
+
+
+def _dataset_labels(ds: Any, name: str, coord: str) -> Any:
+    import numpy as np
+
+    if coord not in ds.variables:
+        raise KeyError(f"no coordinate {coord!r} for observable {name!r}")
+    return np.asarray(ds[coord].values)
+
+
+def _read_flat_zarr(
+    store_uri: str,
+    names: list[str],
+    stride: int,
+    max_points: int | None,
+    t_start: float | None,
+    t_end: float | None,
+) -> tuple[NDArray[np.float64], dict[str, NDArray[np.float64]]]:
+    import numpy as np
+    import xarray as xr
+
+    ds = xr.open_zarr(store_uri)
+    try:
+        requests = [parse_observable_name(nm) for nm in names] if names else [(str(v), None) for v in ds.data_vars]
+        missing = [base for base, _ in requests if base not in ds.data_vars]
+        if missing:
+            raise KeyError(f"observables not in store: {missing}")
+        n = int(ds["time"].shape[0]) if "time" in ds.coords else int(ds[requests[0][0]].shape[0])
+        lo, hi = 0, n
+        if t_start is not None or t_end is not None:
+            if "time" not in ds.coords:
+                raise ValueError("a time window needs a store with a `time` coordinate")
+            # Only the (1-D) time coordinate is loaded to locate the window.
+            t = np.asarray(ds["time"].values, dtype=float)
+            lo = 0 if t_start is None else int(np.searchsorted(t, t_start, side="left"))
+            hi = n if t_end is None else max(lo, int(np.searchsorted(t, t_end, side="right")))
+        step = _effective_stride(hi - lo, stride, max_points)
+        row_slice = slice(lo, hi, step)
+        if "time" in ds.coords:
+            time_da = ds["time"]
+            time = _as_float_array(time_da.isel({time_da.dims[0]: row_slice}).values)
+        else:
+            time = np.arange(lo, hi, step, dtype=np.float64)
+        series: dict[str, NDArray[np.float64]] = {}
+        for base, selection in requests:
+            var = ds[base]
+            if selection is None:
+                if var.ndim != 1 or var.shape[0] != n:
+                    raise _not_1d_error(base, tuple(var.shape))
+                series[base] = _as_float_array(var.isel({var.dims[0]: row_slice}).values)
+                continue
+            if var.ndim != 2 or var.shape[0] != n:
+                raise ValueError(f"column selectors need a 2-D observable; {base!r} has shape {tuple(var.shape)}")
+            cols, keys = selection.resolve(int(var.shape[1]), functools.partial(_dataset_labels, ds, base))
+            _split_columns(np.asarray(var.isel({var.dims[0]: row_slice, var.dims[1]: cols}).values), keys, series)
+    finally:
+        ds.close()
+    return time, series
+
+
+def _read_parquet(
+    store_uri: str,
+    names: list[str],
+    stride: int,
+    max_points: int | None,
+    t_start: float | None,
+    t_end: float | None,
+    generations: Sequence[int] | None,
+) -> tuple[NDArray[np.float64], dict[str, NDArray[np.float64]]]:
+    import numpy as np
+    import polars as pl
+
+    lf = pl.scan_parquet(store_uri)
+    schema = lf.collect_schema()
+    schema_names = schema.names()
+    requests = (
+        [parse_observable_name(nm) for nm in names] if names else [(c, None) for c in schema_names if c != "time"]
+    )
+    missing = [base for base, _ in requests if base not in schema_names]
+    if missing:
+        raise KeyError(f"observables not in store: {missing}")
+    columns = [_parquet_columns(lf, base, schema[base], selection) for base, selection in requests]
+    has_time = "time" in schema_names
+    # Filters go into the scan, so polars prunes row groups by their statistics.
+    predicates: list[pl.Expr] = []
+    if t_start is not None or t_end is not None:
+        if not has_time:
+            raise ValueError("a time window needs a store with a `time` column")
+        if t_start is not None:
+            predicates.append(pl.col("time") >= t_start)
+        if t_end is not None:
+            predicates.append(pl.col("time") <= t_end)
+    if generations is not None:
+        if "generation" not in schema_names:
+            raise ValueError("a generations filter needs a store with a `generation` column")
+        predicates.append(pl.col("generation").is_in(list(generations)))
+    if predicates:
+        lf = lf.filter(*predicates)
+    nrows = int(lf.select(pl.len()).collect().item())
+    step = _effective_stride(nrows, stride, max_points)
+    exprs = [expr for group in columns for expr in group]
+    df = lf.select([pl.col("time"), *exprs] if has_time else exprs).gather_every(step).collect()
+    time = _as_float_array(df["time"].to_numpy()) if has_time else np.arange(0, nrows, step, dtype=np.float64)
+    return time, {c: _as_float_array(df[c].to_numpy()) for c in df.columns if c != "time"}
+
+
+def _parquet_columns(lf: Any, name: str, dtype: Any, selection: ColumnSelection | None) -> list[Any]:
+    """Polars expressions projecting observable ``name`` (one per selected element of a list column)."""
+    import polars as pl
+
+    if selection is None:
+        return [pl.col(name)]
+    is_array = isinstance(dtype, pl.Array)
+    if is_array:
+        width = int(dtype.size)
+    elif isinstance(dtype, pl.List):
+        # List widths are per row; the first row's length stands in for all of them.
+        first = lf.select(pl.col(name).list.len()).head(1).collect()
+        width = int(first.item()) if first.height else 0
+    else:
+        # ValueError, like every other bad selector, so the API answers 400.
+        raise ValueError(f"column selectors need a list/array column; {name!r} is {dtype}")
+
+    def no_labels(coord: str) -> Any:
+        raise ValueError(f"label selectors ({coord}=...) need a zarr store with a {coord!r} coordinate")
+
+    cols, keys = selection.resolve(width, no_labels)
+    col = pl.col(name)
+    return [
+        (col.arr.get(i) if is_array else col.list.get(i)).cast(pl.Float64).alias(key)
+        for i, key in zip(cols, keys, strict=True)
+    ]
+
+
 def read_observables(
     store_uri: str,
     names: list[str],
     *,
     stride: int = 1,
     max_points: int | None = None,
+    downsample: DownsampleMethod | None = None,
+    t_start: float | None = None,
+    t_end: float | None = None,
+    generations: Sequence[int] | None = None,
 ) -> tuple[Literal["zarr", "parquet"], list[float], dict[str, list[float | None]]]:
     """Return (store_kind, time, {name: values}) for the requested observables.
 
@@ -241,69 +1062,149 @@ def read_observables(
     *before* materialization where possible — a lazy row-slice (Parquet) / ``isel``
     (flat zarr) — so only the kept points are read and serialized.
 
+    With ``downsample`` (``lttb`` | ``m4`` | ``minmax``) the ``max_points`` cap is met
+    by :func:`downsample_indices` instead of every-Nth decimation, so extrema are
+    kept; this reads the store at ``stride`` resolution first.
+
+    ``t_start`` / ``t_end`` (inclusive, in simulation time) and ``generations``
+    restrict the read before decimation. On partitioned zarr stores whole
+    ``generation={G}`` segments outside the filter are never read; on Parquet the
+    filter is pushed into the scan (``generations`` needs a ``generation`` column).
+
     Raises ``KeyError`` if a requested observable is absent, and ``ValueError`` if
     an observable's values are not a 1-D timeseries. Non-finite float values
     (NaN, ±Inf) are sanitized to ``None``.
     """
-    kind = detect_store_kind(store_uri)
-    if kind == "zarr":
-        partitioned = _read_partitioned_zarr(store_uri, names, stride, max_points)
-        if partitioned is not None:
-            return "zarr", partitioned[0], partitioned[1]
+    kind, time, series = read_observable_arrays(
+        store_uri,
+        names,
+        stride=stride,
+        max_points=max_points,
+        downsample=downsample,
+        t_start=t_start,
+        t_end=t_end,
+        generations=generations,
+    )
+    return kind, time.tolist(), {nm: to_json_list(arr) for nm, arr in series.items()}
 
-        import numpy as np
-        import xarray as xr
 
-        ds = xr.open_zarr(store_uri)
-        try:
-            wanted = names or [str(n) for n in ds.data_vars]
-            missing = [n for n in wanted if n not in ds.data_vars]
-            if missing:
-                raise KeyError(f"observables not in store: {missing}")
-            n = int(ds["time"].shape[0]) if "time" in ds.coords else int(ds[wanted[0]].shape[0])
-            step = _effective_stride(n, stride, max_points)
-            row_slice = slice(None, None, step)
-            if "time" in ds.coords:
-                time_da = ds["time"]
-                raw_time = np.asarray(time_da.isel({time_da.dims[0]: row_slice}).values).ravel()
-                time = [float(t) for t in raw_time]
-            else:
-                time = [float(i) for i in range(0, n, step)]
-            series: dict[str, list[float | None]] = {}
-            for nm in wanted:
-                var = ds[nm]
-                if var.ndim != 1 or var.shape[0] != n:
-                    raise ValueError(
-                        f"observable {nm!r} is not a 1-D timeseries (shape {tuple(var.shape)}); "
-                        "multi-dimensional observables are not supported"
-                    )
-                arr = np.asarray(var.isel({var.dims[0]: row_slice}).values)
-                series[nm] = [_sanitize(float(v)) for v in arr]
-        finally:
-            ds.close()
-        return kind, time, series
+def store_index_wanted(store_uri: str) -> bool:
+    """True if ``store_uri`` was last opened as a full datatree walk and has no index sidecar yet.
 
-    import polars as pl
+    Only consults the in-process cache (no I/O), so a route can cheaply decide
+    whether to schedule :func:`write_store_index`; at most one write is requested
+    per cached handle.
+    """
+    handle = get_store_cache().peek(store_uri)
+    return (
+        handle is not None
+        and handle.partitioned
+        and handle.index is None
+        and handle.fingerprint is not None
+        and not handle.index_requested
+    )
 
-    lf = pl.scan_parquet(store_uri)
-    schema_names = lf.collect_schema().names()
-    wanted = names or [c for c in schema_names if c != "time"]
-    missing = [n for n in wanted if n not in schema_names]
-    if missing:
-        raise KeyError(f"observables not in store: {missing}")
-    has_time = "time" in schema_names
-    nrows = int(lf.select(pl.len()).collect().item())
-    step = _effective_stride(nrows, stride, max_points)
-    cols = ["time", *wanted] if has_time else list(wanted)
-    df = lf.select(cols).gather_every(step).collect()
-    time = [float(t) for t in df["time"].to_list()] if has_time else [float(i) for i in range(0, nrows, step)]
-    series_p: dict[str, list[float | None]] = {n: [_sanitize(float(v)) for v in df[n].to_list()] for n in wanted}
-    return kind, time, series_p
+
+def write_store_index(store_uri: str) -> str | None:
+    """Write the index sidecar for a hive-partitioned zarr store; return its URI.
+
+    The sidecar records the store's fingerprint, so a later rewrite of the store
+    makes it stale (and ignored) rather than wrong. Returns ``None`` for stores
+    that are not partitioned datatrees. Only metadata is read. Call it once the
+    run has finished writing, since the fingerprint may not change when new
+    generations are appended.
+    """
+    handle = get_store_cache().get(store_uri)
+    handle.index_requested = True
+    if not handle.partitioned or handle.fingerprint is None:
+        return None
+    index_uri = store_index_uri(store_uri)
+    if handle.index is not None:
+        return index_uri
+    fs, path = fsspec.core.url_to_fs(index_uri)
+    fs.pipe_file(path, json.dumps(handle.to_index(), separators=(",", ":")).encode())
+    return index_uri
+
+
+# ── Columnar encoders ──────────────────────────────────────────────────────
+#
+# The binary response formats carry the same content as the JSON body: a
+# ``time`` column plus one float64 column per observable, with NaN/±Inf stored as
+# nulls (the JSON body's ``null``). Response-level fields (simulation id, seed,
+# store kind, …) travel as string key/values in the Arrow schema metadata.
+
+
+def observables_table(
+    time: NDArray[np.float64],
+    series: dict[str, NDArray[np.float64]],
+    metadata: dict[str, str] | None = None,
+) -> pa.Table:
+    """Build a ``time`` + one-column-per-observable Arrow table (zero-copy where possible)."""
+    import numpy as np
+    import pyarrow as pa
+
+    columns = {"time": pa.array(time, type=pa.float64())}
+    for name, values in series.items():
+        columns[name] = pa.array(values, type=pa.float64(), mask=~np.isfinite(values))
+    return pa.table(columns, metadata=metadata)
+
+
+class ArrowStreamEncoder:
+    """Incremental Arrow IPC stream writer: each call returns the bytes to send next.
+
+    Lets a ``StreamingResponse`` flush record batches as they are produced,
+    rather than encoding the whole table first.
+    """
+
+    def __init__(self, schema: pa.Schema) -> None:
+        import io
+
+        import pyarrow as pa
+
+        self._sink = io.BytesIO()
+        self._writer = pa.ipc.new_stream(self._sink, schema)
+
+    def _drain(self) -> bytes:
+        data = self._sink.getvalue()
+        self._sink.seek(0)
+        self._sink.truncate()
+        return data
+
+    def write(self, batch: pa.RecordBatch | pa.Table) -> bytes:
+        self._writer.write(batch)
+        return self._drain()
+
+    def close(self) -> bytes:
+        """Write the end-of-stream marker and return the final bytes."""
+        self._writer.close()
+        return self._drain()
+
+
+def iter_arrow_stream(table: pa.Table, max_chunksize: int = 65_536) -> Iterator[bytes]:
+    """Yield ``table`` as an Arrow IPC stream, one record batch at a time.
+
+    Each chunk is flushed as soon as its batch is written, so a
+    ``StreamingResponse`` starts sending before the whole table is encoded.
+    """
+    encoder = ArrowStreamEncoder(table.schema)
+    for batch in table.to_batches(max_chunksize=max_chunksize):
+        yield encoder.write(batch)
+    yield encoder.close()
+
+
+def encode_parquet(table: pa.Table) -> bytes:
+    """Serialize ``table`` as a single Parquet file (zstd-compressed)."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    sink = pa.BufferOutputStream()
+    pq.write_table(table, sink, compression="zstd")
+    return bytes(sink.getvalue().to_pybytes())
 
 
 # ── Async API (for FastAPI routes) ─────────────────────────────────────────
 #
-# ``list_observables`` / ``read_observables`` wrap synchronous libraries
+# ``list_observables`` / ``read_observables`` / ``read_observable_arrays`` wrap synchronous libraries
 # (fsspec + xarray/zarr + polars) that have no true-async read path, so they
 # must run off the event loop. These thin wrappers offload to a worker thread
 # (``asyncio.to_thread``) and expose an awaitable surface, so async callers
@@ -315,12 +1216,230 @@ async def list_observables_async(store_uri: str) -> StoreIndex:
     return await asyncio.to_thread(list_observables, store_uri)
 
 
+async def write_store_index_async(store_uri: str) -> str | None:
+    """Async wrapper over :func:`write_store_index` (offloaded to a thread)."""
+    return await asyncio.to_thread(write_store_index, store_uri)
+
+
 async def read_observables_async(
     store_uri: str,
     names: list[str],
     *,
     stride: int = 1,
     max_points: int | None = None,
+    downsample: DownsampleMethod | None = None,
+    t_start: float | None = None,
+    t_end: float | None = None,
+    generations: Sequence[int] | None = None,
 ) -> tuple[Literal["zarr", "parquet"], list[float], dict[str, list[float | None]]]:
     """Async wrapper over :func:`read_observables` (offloaded to a thread)."""
-    return await asyncio.to_thread(read_observables, store_uri, names, stride=stride, max_points=max_points)
+    return await asyncio.to_thread(
+        read_observables,
+        store_uri,
+        names,
+        stride=stride,
+        max_points=max_points,
+        downsample=downsample,
+        t_start=t_start,
+        t_end=t_end,
+        generations=generations,
+    )
+
+
+async def read_observable_arrays_async(
+    store_uri: str,
+    names: list[str],
+    *,
+    stride: int = 1,
+    max_points: int | None = None,
+    downsample: DownsampleMethod | None = None,
+    t_start: float | None = None,
+    t_end: float | None = None,
+    generations: Sequence[int] | None = None,
+) -> tuple[Literal["zarr", "parquet"], NDArray[np.float64], dict[str, NDArray[np.float64]]]:
+    """Async wrapper over :func:`read_observable_arrays` (offloaded to a thread)."""
+    return await asyncio.to_thread(
+        read_observable_arrays,
+        store_uri,
+        names,
+        stride=stride,
+        max_points=max_points,
+        downsample=downsample,
+        t_start=t_start,
+        t_end=t_end,
+        generations=generations,
+    )
+
+
+# ── Multi-seed batches ─────────────────────────────────────────────────────
+
+MAX_BATCH_SEEDS = 256
+MAX_GENERATIONS = 10_000
+DEFAULT_BATCH_CONCURRENCY = 8
+
+SeedArrays = tuple[Literal["zarr", "parquet"], "NDArray[np.float64]", dict[str, "NDArray[np.float64]"]]
+
+
+def _parse_int_ranges(spec: str, what: str, limit: int) -> list[int]:
+    values: set[int] = set()
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        lo_s, sep, hi_s = part.partition("-")
+        try:
+            lo = int(lo_s)
+            hi = int(hi_s) if sep else lo
+        except ValueError:
+            raise ValueError(f"invalid {what} selection {part!r}; expected N or N-M") from None
+        if lo < 0 or hi < lo:
+            raise ValueError(f"invalid {what} range {part!r}")
+        if hi - lo + 1 + len(values) > limit:
+            raise ValueError(f"{what} selection {spec!r} exceeds the {limit}-{what} limit")
+        values.update(range(lo, hi + 1))
+    if not values:
+        raise ValueError(f"empty {what} selection")
+    return sorted(values)
+
+
+def parse_seed_spec(spec: str, *, limit: int = MAX_BATCH_SEEDS) -> list[int]:
+    """Expand a seed selection like ``"0-31"`` or ``"0,2,5-7"`` into sorted, unique seeds.
+
+    Raises ``ValueError`` on malformed or descending ranges, negative seeds, or
+    more than ``limit`` seeds.
+    """
+    return _parse_int_ranges(spec, "seed", limit)
+
+
+def parse_generation_spec(spec: str) -> list[int]:
+    """Expand a generation selection (same ``"3"`` / ``"1,4-6"`` syntax as seeds)."""
+    return _parse_int_ranges(spec, "generation", MAX_GENERATIONS)
+
+
+async def iter_seed_observable_arrays(
+    store_uris: dict[int, str],
+    names: list[str],
+    *,
+    stride: int = 1,
+    max_points: int | None = None,
+    downsample: DownsampleMethod | None = None,
+    t_start: float | None = None,
+    t_end: float | None = None,
+    generations: Sequence[int] | None = None,
+    max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+) -> AsyncIterator[tuple[int, SeedArrays | Exception]]:
+    """Read several seed stores concurrently, yielding ``(seed, result)`` as each finishes.
+
+    At most ``max_concurrency`` reads occupy a worker thread at once. A seed whose
+    store is missing or lacks an observable yields the exception instead of
+    aborting the batch. Reads still queued when the consumer stops are cancelled.
+    """
+    gate = asyncio.Semaphore(max_concurrency)
+
+    async def read_one(seed: int, store_uri: str) -> tuple[int, SeedArrays | Exception]:
+        async with gate:
+            try:
+                return seed, await read_observable_arrays_async(
+                    store_uri,
+                    names,
+                    stride=stride,
+                    max_points=max_points,
+                    downsample=downsample,
+                    t_start=t_start,
+                    t_end=t_end,
+                    generations=generations,
+                )
+            except (FileNotFoundError, KeyError, ValueError) as e:
+                return seed, e
+
+    tasks = [asyncio.create_task(read_one(seed, uri)) for seed, uri in store_uris.items()]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def _percentile_label(q: float) -> str:
+    return f"p{q:g}"
+
+
+def ensemble_bands(
+    runs: Sequence[tuple[NDArray[np.float64], dict[str, NDArray[np.float64]]]],
+    percentiles: Sequence[float] = (5.0, 50.0, 95.0),
+) -> tuple[NDArray[np.float64], dict[str, dict[str, NDArray[np.float64]]]]:
+    """Reduce per-seed ``(time, series)`` runs to per-observable mean and percentile bands.
+
+    Every run is aligned onto the longest run's time axis (linear interpolation
+    when the axes differ). A seed contributes NaN outside its own time range, so
+    after a lineage ends the bands cover only the seeds still running. Returns
+    ``(time, {name: {"mean": ..., "p5": ..., ...}})``.
+    """
+    import numpy as np
+
+    if not runs:
+        raise ValueError("no runs to aggregate")
+    time = max((t for t, _ in runs), key=len)
+    names = list(dict.fromkeys(name for _, series in runs for name in series))
+    bands: dict[str, dict[str, NDArray[np.float64]]] = {}
+    for name in names:
+        stack = np.full((len(runs), len(time)), np.nan)
+        for row, (t, series) in enumerate(runs):
+            values = series.get(name)
+            if values is None or len(t) == 0:
+                continue
+            if len(t) == len(time) and np.array_equal(t, time):
+                stack[row] = values
+            else:
+                stack[row] = np.interp(time, t, values, left=np.nan, right=np.nan)
+        # All-NaN columns (no seed covers that time) are expected; they stay NaN.
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            stats = {"mean": np.nanmean(stack, axis=0)}
+            if percentiles:
+                for q, band in zip(percentiles, np.nanpercentile(stack, list(percentiles), axis=0), strict=True):
+                    stats[_percentile_label(q)] = np.ascontiguousarray(band)
+        bands[name] = stats
+    return time, bands
+
+
+def observables_batch_schema(names: Sequence[str], metadata: dict[str, str] | None = None) -> pa.Schema:
+    """Long-format schema for a multi-seed Arrow stream.
+
+    ``seed`` is set on per-seed rows and ``stat`` (``mean``/``p5``/...) on ensemble
+    rows; the other is null. Then ``time`` and one column per observable.
+    """
+    import pyarrow as pa
+
+    fields = [pa.field("seed", pa.int32()), pa.field("stat", pa.string()), pa.field("time", pa.float64())]
+    fields.extend(pa.field(name, pa.float64()) for name in names)
+    return pa.schema(fields, metadata=metadata)
+
+
+def observables_batch(
+    schema: pa.Schema,
+    time: NDArray[np.float64],
+    series: dict[str, NDArray[np.float64]],
+    *,
+    seed: int | None = None,
+    stat: str | None = None,
+) -> pa.RecordBatch:
+    """One record batch of :func:`observables_batch_schema`; observables missing from ``series`` are null."""
+    import numpy as np
+    import pyarrow as pa
+
+    n = len(time)
+    columns = [
+        pa.nulls(n, pa.int32()) if seed is None else pa.array(np.full(n, seed, dtype=np.int32)),
+        pa.nulls(n, pa.string()) if stat is None else pa.array([stat] * n, type=pa.string()),
+        pa.array(time, type=pa.float64()),
+    ]
+    for name in schema.names[3:]:
+        values = series.get(name)
+        columns.append(
+            pa.nulls(n, pa.float64())
+            if values is None
+            else pa.array(values, type=pa.float64(), mask=~np.isfinite(values))
+        )
+    return pa.RecordBatch.from_arrays(columns, schema=schema)
@@ -12,6 +12,7 @@ from typing import override
 from fastapi import HTTPException
 
 from sms_api.common.hpc.job_service import JobStatusInfo
+from sms_api.common.hpc.job_status_sources import JobStatusSource, SlurmJobStatusSource
 from sms_api.common.hpc.models import SlurmJob
 from sms_api.common.hpc.nextflow_weblog import WEBLOG_RECEIVER_SCRIPT
 from sms_api.common.hpc.slurm_service import SlurmService
@@ -130,6 +131,10 @@ class SimulationService(ABC):
         """Get the current status of a job by its backend-tagged ID."""
         pass
 
+    def job_status_sources(self) -> list[JobStatusSource]:
+        """Batched status sources for the backends this service submits to (see JobStatusWatcher)."""
+        return []
+
     @abstractmethod
     async def cancel_job(self, job_id: JobId) -> None:
         """Cancel a running job."""
@@ -599,6 +604,10 @@ class SimulationServiceHpc(SimulationService):
         else:
             raise RuntimeError(f"Multiple jobs found with ID {slurmjobid}: {slurm_jobs}")
 
+    @override
+    def job_status_sources(self) -> list[JobStatusSource]:
+        return [SlurmJobStatusSource(SlurmService())]
+
     @override
     async def cancel_job(self, job_id: JobId) -> None:
         """Cancel a SLURM job via scancel."""
@@ -12,6 +12,7 @@ from typing import override
 from kubernetes import client as k8s_client
 
 from sms_api.common.hpc.job_service import JobStatusInfo
+from sms_api.common.hpc.job_status_sources import JobStatusSource, K8sJobStatusSource, LocalJobStatusSource
 from sms_api.common.hpc.k8s_job_service import K8sJobService
 from sms_api.common.hpc.local_task_service import LocalTaskService
 from sms_api.common.models import JobBackend, JobId
@@ -443,6 +444,10 @@ echo "Submit image pushed: $ECR_REGISTRY/{settings.ecr_repository}:{image_tag}-s
             return self._local.get_status(job_id.value)
         return self._k8s.get_job_status(job_id.value)
 
+    @override
+    def job_status_sources(self) -> list[JobStatusSource]:
+        return [K8sJobStatusSource(self._k8s), LocalJobStatusSource(self._local)]
+
     @override
     async def cancel_job(self, job_id: JobId) -> None:
         """Cancel a job — dispatches to K8s or local task tracker."""
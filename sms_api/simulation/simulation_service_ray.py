@@ -31,8 +31,14 @@ from typing import Any, override
 import boto3
 
 from sms_api.common.hpc.job_service import JobStatusInfo
+from sms_api.common.hpc.job_status_sources import (
+    BatchJobStatusSource,
+    JobStatusSource,
+    LocalJobStatusSource,
+    batch_job_to_status_info,
+)
 from sms_api.common.hpc.local_task_service import LocalTaskService
-from sms_api.common.models import JobBackend, JobId, JobStatus
+from sms_api.common.models import JobBackend, JobId
 from sms_api.common.simulator_defaults import DEFAULT_BRANCH, DEFAULT_REPO
 from sms_api.common.storage import data_layout
 from sms_api.config import get_settings
@@ -540,18 +546,11 @@ bash docker/build-and-push-ecr.sh -i {commit} -r {settings.ray_ecr_repository} -
         if not jobs:
             logger.warning("No Batch job found with id %s", job_id.value)
             return None
-        job = jobs[0]
-        status = JobStatus.from_batch_state(job.get("status", ""))
-        started = job.get("startedAt")
-        stopped = job.get("stoppedAt")
-        return JobStatusInfo(
-            job_id=job_id,
-            status=status,
-            start_time=str(started) if started else None,
-            end_time=str(stopped) if stopped else None,
-            exit_code=None,
-            error_message=job.get("statusReason") if status == JobStatus.FAILED else None,
-        )
+        return batch_job_to_status_info(jobs[0], job_id)
+
+    @override
+    def job_status_sources(self) -> list[JobStatusSource]:
+        return [BatchJobStatusSource(JobBackend.RAY, self._batch), LocalJobStatusSource(self._local)]
 
     @override
     async def cancel_job(self, job_id: JobId) -> None:
@@ -0,0 +1,212 @@
+"""Unified job status watcher: pushes backend status transitions into the database.
+
+One :class:`JobStatusSource` per backend (SLURM, K8s, AWS Batch, local tasks) is asked
+for the status of every active HpcRun it owns in a single batched call per tick, and
+push-capable sources (the K8s Job watch stream) feed transitions as they happen. Each
+transition is written to the HpcRun row once and published to in-process subscribers,
+so status endpoints read the database instead of calling the backend per request.
+
+The set of active runs is kept in memory: it is re-read from the database every
+``resync_seconds`` (and new runs are added with :meth:`JobStatusWatcher.track`), not
+on every tick.
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+from asyncio import Queue
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from sms_api.common.hpc.job_service import JobStatusInfo, JobStatusUpdate
+from sms_api.common.hpc.job_status_sources import JobStatusSource, PushJobStatusSource
+from sms_api.common.models import JobBackend, JobId, JobStatus
+from sms_api.dependencies import get_job_status_watcher
+from sms_api.simulation.database_service import DatabaseService
+from sms_api.simulation.models import HpcRun
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_JOB_STATUSES = frozenset({JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED})
+WATCH_RESTART_DELAY_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class JobStatusChange:
+    """A status transition of one HpcRun, as published to subscribers."""
+
+    hpc_run: HpcRun  # the run after the change
+    previous_status: JobStatus | None
+
+
+class JobStatusWatcher:
+    """Keeps HpcRun status in the database current for every backend with a source."""
+
+    def __init__(
+        self,
+        database_service: DatabaseService,
+        sources: Iterable[JobStatusSource],
+        resync_seconds: float = 60.0,
+    ) -> None:
+        self.database_service = database_service
+        self.resync_seconds = resync_seconds
+        self._sources: dict[JobBackend, JobStatusSource] = {}
+        for source in sources:
+            # Services that share a backend (e.g. LOCAL tasks) share its source; the first one wins.
+            self._sources.setdefault(source.backend, source)
+        self._active: dict[JobId, HpcRun] = {}
+        self._last_resync: float | None = None
+        self._apply_lock = asyncio.Lock()
+        self._listeners: dict[Queue[JobStatusChange], JobId | None] = {}
+        self._polling_task: asyncio.Task[None] | None = None
+        self._watch_tasks: list[asyncio.Task[None]] = []
+        self._stop_event = asyncio.Event()
+
+    @property
+    def backends(self) -> frozenset[JobBackend]:
+        return frozenset(self._sources)
+
+    def is_running(self) -> bool:
+        return self._polling_task is not None and not self._polling_task.done()
+
+    def covers(self, backend: JobBackend) -> bool:
+        """Whether the database status of ``backend`` runs is kept current by this (running) watcher."""
+        return self.is_running() and backend in self._sources
+
+    def track(self, hpc_run: HpcRun) -> None:
+        """Start watching a newly submitted run without waiting for the next resync."""
+        if hpc_run.job_id.backend in self._sources and hpc_run.status not in TERMINAL_JOB_STATUSES:
+            self._active[hpc_run.job_id] = hpc_run
+
+    def subscribe(self, queue: Queue[JobStatusChange], job_id: JobId | None = None) -> None:
+        """Deliver status changes (of ``job_id``, or of every run) to ``queue``."""
+        self._listeners[queue] = job_id
+
+    def unsubscribe(self, queue: Queue[JobStatusChange]) -> None:
+        self._listeners.pop(queue, None)
+
+    async def start(self, interval_seconds: float = 5.0) -> None:
+        if self.is_running():
+            logger.warning("Job status watcher already running.")
+            return
+        self._stop_event.clear()
+        self._polling_task = asyncio.create_task(self._polling_loop(interval_seconds))
+        self._watch_tasks = [
+            asyncio.create_task(self._watch_loop(source))
+            for source in self._sources.values()
+            if isinstance(source, PushJobStatusSource)
+        ]
+        logger.info(f"Started job status watcher for backends {sorted(self._sources)}")
+
+    async def stop(self) -> None:
+        self._stop_event.set()
+        for task in self._watch_tasks:
+            task.cancel()
+        for task in self._watch_tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._watch_tasks = []
+        if self._polling_task is not None:
+            await self._polling_task
+            self._polling_task = None
+            logger.info("Stopped job status watcher.")
+
+    async def poll_once(self) -> None:
+        """Resync the active set if due, then query every polled source once."""
+        resync = self._last_resync is None or time.monotonic() - self._last_resync >= self.resync_seconds
+        if resync:
+            await self._resync()
+
+        by_backend: dict[JobBackend, list[JobId]] = defaultdict(list)
+        for job_id in self._active:
+            by_backend[job_id.backend].append(job_id)
+        # Pushing sources are only polled on resync, to catch transitions their stream missed.
+        polled = [
+            (self._sources[backend], job_ids)
+            for backend, job_ids in by_backend.items()
+            if resync or not isinstance(self._sources[backend], PushJobStatusSource)
+        ]
+        if not polled:
+            logger.debug("No active jobs found for polling.")
+            return
+        results = await asyncio.gather(
+            *(source.get_statuses(job_ids) for source, job_ids in polled), return_exceptions=True
+        )
+        for (source, _), result in zip(polled, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(f"Status poll for backend {source.backend} failed", exc_info=result)
+                continue
+            for info in result:
+                await self.apply(info)
+
+    async def apply(self, info: JobStatusInfo) -> None:
+        """Record ``info`` if it is a transition of a watched run, and publish it."""
+        async with self._apply_lock:
+            hpc_run = self._active.get(info.job_id)
+            if hpc_run is None or info.status == JobStatus.UNKNOWN or info.status == hpc_run.status:
+                return
+            update = JobStatusUpdate(
+                job_id=hpc_run.job_id,
+                status=info.status,
+                start_time=info.start_time,
+                end_time=info.end_time,
+                exit_code=info.exit_code,
+                error_message=info.error_message,
+            )
+            await self.database_service.update_hpcrun_status(hpcrun_id=hpc_run.database_id, update=update)
+            previous_status = hpc_run.status
+            updated = hpc_run.model_copy(
+                update={
+                    "status": info.status,
+                    "start_time": info.start_time or hpc_run.start_time,
+                    "end_time": info.end_time or hpc_run.end_time,
+                    "error_message": info.error_message or hpc_run.error_message,
+                }
+            )
+            if info.status in TERMINAL_JOB_STATUSES:
+                del self._active[info.job_id]
+            else:
+                self._active[info.job_id] = updated
+        logger.info(f"Updated HpcRun {hpc_run.database_id} status {previous_status} -> {info.status}")
+        self._publish(JobStatusChange(hpc_run=updated, previous_status=previous_status))
+
+    def _publish(self, change: JobStatusChange) -> None:
+        for queue, job_id in list(self._listeners.items()):
+            if job_id is not None and job_id != change.hpc_run.job_id:
+                continue
+            try:
+                queue.put_nowait(change)
+            except asyncio.QueueFull:
+                logger.warning(f"Dropping status change of HpcRun {change.hpc_run.database_id} for a slow subscriber")
+
+    async def _resync(self) -> None:
+        hpc_runs = await self.database_service.list_active_hpcruns()
+        self._active = {run.job_id: run for run in hpc_runs if run.job_id.backend in self._sources}
+        self._last_resync = time.monotonic()
+
+    async def _polling_loop(self, interval_seconds: float) -> None:
+        while not self._stop_event.is_set():
+            try:
+                await self.poll_once()
+            except Exception:
+                logger.exception("Error during job status polling")
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._stop_event.wait(), timeout=interval_seconds)
+
+    async def _watch_loop(self, source: PushJobStatusSource) -> None:
+        while not self._stop_event.is_set():
+            try:
+                async for info in source.watch():
+                    await self.apply(info)
+            except Exception:
+                logger.exception(f"Status watch for backend {source.backend} failed; restarting")
+                await asyncio.sleep(WATCH_RESTART_DELAY_SECONDS)
+
+
+def track_hpcrun(hpc_run: HpcRun) -> None:
+    """Hand a newly submitted run to the job status watcher, if one is configured."""
+    watcher = get_job_status_watcher()
+    if watcher is not None:
+        watcher.track(hpc_run)
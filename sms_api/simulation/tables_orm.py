@@ -3,12 +3,19 @@ import enum
 import logging
 from typing import Any
 
-from sqlalchemy import ForeignKey, Index, func
+from sqlalchemy import BigInteger, ForeignKey, Index, LargeBinary, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncAttrs, AsyncEngine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
-from sms_api.analysis.models import AnalysisConfig, AnalysisConfigOptions, ExperimentAnalysisDTO
+from sms_api.analysis.models import (
+    AnalysisConfig,
+    AnalysisConfigOptions,
+    ExperimentAnalysisDTO,
+    OutputManifest,
+    OutputManifestEntry,
+    OutputStorage,
+)
 from sms_api.common.models import JobBackend, JobId, JobStatus
 from sms_api.simulation.models import (
     HpcRun,
@@ -229,6 +236,26 @@ class ORMWorkerEvent(Base):
         )
 
 
+class ORMWorkerEventBlock(Base):
+    """Up to WORKER_EVENT_BLOCK_SIZE compacted worker events of one HpcRun, stored column-wise
+    (see sms_api.simulation.worker_event_blocks)."""
+
+    __tablename__ = "worker_event_block"
+    __table_args__ = (Index("ix_worker_event_block_hpcrun_seq", "hpcrun_id", "first_sequence_number"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    created_at: Mapped[datetime.datetime] = mapped_column(server_default=func.now())
+    hpcrun_id: Mapped[int] = mapped_column(ForeignKey("hpcrun.id"), nullable=False)
+    correlation_id: Mapped[str] = mapped_column(nullable=False)
+    first_sequence_number: Mapped[int] = mapped_column(nullable=False)
+    last_sequence_number: Mapped[int] = mapped_column(nullable=False)
+    n_events: Mapped[int] = mapped_column(nullable=False)
+    mass_keys: Mapped[list[str]] = mapped_column(JSONB, nullable=False)  # shared key index of the mass matrix
+    sequence_numbers: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)  # int64[n_events], little-endian
+    times: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)  # float64[n_events]
+    mass: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)  # float64[n_events, len(mass_keys)], row-major
+
+
 class ORMAnalysis(Base):
     """General record of an analysis (any type). ``config`` (JSONB) is the
     authoritative store of the full analysis config; the columns below are
@@ -282,6 +309,65 @@ class ORMAnalysis(Base):
         )
 
 
+class ORMOutputManifest(Base):
+    """The indexed state of one output directory (HPC) or prefix (S3); its files are
+    ``output_manifest_file`` rows (see sms_api.analysis.output_manifest)."""
+
+    __tablename__ = "output_manifest"
+    __table_args__ = (UniqueConstraint("storage", "root", name="uq_output_manifest_storage_root"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    storage: Mapped[str] = mapped_column(nullable=False)  # OutputStorage value
+    root: Mapped[str] = mapped_column(nullable=False)
+    experiment_id: Mapped[str | None] = mapped_column(nullable=True, index=True)
+    source_version: Mapped[str | None] = mapped_column(nullable=True)
+    file_count: Mapped[int] = mapped_column(nullable=False, server_default="0")
+    total_bytes: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default="0")
+    indexed_at: Mapped[datetime.datetime] = mapped_column(nullable=False)  # UTC, written by the API
+
+    def to_output_manifest(self) -> OutputManifest:
+        return OutputManifest(
+            database_id=self.id,
+            storage=OutputStorage(self.storage),
+            root=self.root,
+            experiment_id=self.experiment_id,
+            source_version=self.source_version,
+            file_count=self.file_count,
+            total_bytes=self.total_bytes,
+            indexed_at=self.indexed_at,
+        )
+
+
+class ORMOutputManifestFile(Base):
+    __tablename__ = "output_manifest_file"
+    __table_args__ = (
+        UniqueConstraint("manifest_id", "path", name="uq_output_manifest_file_path"),
+        Index("ix_output_manifest_file_partition", "manifest_id", "variant", "lineage_seed", "generation"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    manifest_id: Mapped[int] = mapped_column(ForeignKey("output_manifest.id", ondelete="CASCADE"), nullable=False)
+    path: Mapped[str] = mapped_column(nullable=False)
+    extension: Mapped[str] = mapped_column(nullable=False)  # lower-case, without the dot
+    size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    version: Mapped[str | None] = mapped_column(nullable=True)  # mtime (HPC) or ETag (S3)
+    variant: Mapped[int | None] = mapped_column(nullable=True)
+    lineage_seed: Mapped[int | None] = mapped_column(nullable=True)
+    generation: Mapped[int | None] = mapped_column(nullable=True)
+    agent_id: Mapped[int | None] = mapped_column(nullable=True)
+
+    def to_output_manifest_entry(self) -> OutputManifestEntry:
+        return OutputManifestEntry(
+            path=self.path,
+            size=self.size,
+            version=self.version,
+            variant=self.variant,
+            lineage_seed=self.lineage_seed,
+            generation=self.generation,
+            agent_id=self.agent_id,
+        )
+
+
 async def create_db(async_engine: AsyncEngine) -> None:
     async with async_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
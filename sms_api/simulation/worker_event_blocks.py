@@ -0,0 +1,224 @@
+"""Columnar, block-packed storage of WorkerEvent time series.
+
+Worker events are ingested one row per tick (``worker_event``, mass as a JSONB dict
+that repeats every key). Once an HpcRun has accumulated ``block_size`` rows they are
+compacted into a ``worker_event_block``: one row holding the block's sequence
+numbers and times as packed ``int64``/``float64`` arrays, the mass values as one
+packed ``float64`` matrix (events x keys) and the mass key names once, as the
+block's shared key index. Reads return a NumPy-backed :class:`WorkerEventSeries`.
+
+An event without a value for one of the block's keys is stored as NaN and the key
+is left out again when the series is turned back into WorkerEvents.
+"""
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import NDArray
+
+from sms_api.simulation.models import WorkerEvent, WorkerEventBucket
+
+WORKER_EVENT_BLOCK_SIZE = 1024
+
+_SEQUENCE_DTYPE = np.dtype("<i8")
+_VALUE_DTYPE = np.dtype("<f8")
+
+
+@dataclass(frozen=True)
+class PackedWorkerEventBlock:
+    """The column values of one ``worker_event_block`` row."""
+
+    first_sequence_number: int
+    last_sequence_number: int
+    n_events: int
+    mass_keys: list[str]
+    sequence_numbers: bytes
+    times: bytes
+    mass: bytes
+
+
+@dataclass(frozen=True)
+class WorkerEventSeries:
+    """Worker events of one HpcRun as columns, ordered by sequence number."""
+
+    hpcrun_id: int
+    sequence_numbers: NDArray[np.int64]
+    times: NDArray[np.float64]
+    mass_keys: list[str]
+    mass: NDArray[np.float64]  # shape (len(sequence_numbers), len(mass_keys))
+
+    def __len__(self) -> int:
+        return len(self.sequence_numbers)
+
+    @classmethod
+    def empty(cls, hpcrun_id: int) -> "WorkerEventSeries":
+        return cls(
+            hpcrun_id=hpcrun_id,
+            sequence_numbers=np.empty(0, dtype=np.int64),
+            times=np.empty(0, dtype=np.float64),
+            mass_keys=[],
+            mass=np.empty((0, 0), dtype=np.float64),
+        )
+
+    @classmethod
+    def from_worker_events(
+        cls, hpcrun_id: int, worker_events: Sequence[WorkerEvent], mass_keys: list[str] | None = None
+    ) -> "WorkerEventSeries":
+        keys = mass_keys if mass_keys is not None else mass_key_union(worker_events)
+        column = {key: i for i, key in enumerate(keys)}
+        mass = np.full((len(worker_events), len(keys)), np.nan, dtype=np.float64)
+        for row, worker_event in enumerate(worker_events):
+            for key, value in worker_event.mass.items():
+                mass[row, column[key]] = value
+        return cls(
+            hpcrun_id=hpcrun_id,
+            sequence_numbers=np.fromiter((e.sequence_number for e in worker_events), np.int64, len(worker_events)),
+            times=np.fromiter((e.time for e in worker_events), np.float64, len(worker_events)),
+            mass_keys=list(keys),
+            mass=mass,
+        )
+
+    @classmethod
+    def concat(cls, hpcrun_id: int, parts: Sequence["WorkerEventSeries"]) -> "WorkerEventSeries":
+        """Merge parts (possibly with different keys) into one series sorted by sequence number."""
+        parts = [part for part in parts if len(part)]
+        if not parts:
+            return cls.empty(hpcrun_id)
+        if len(parts) == 1:
+            return parts[0]
+        keys = list(dict.fromkeys(key for part in parts for key in part.mass_keys))
+        column = {key: i for i, key in enumerate(keys)}
+        mass = np.full((sum(len(part) for part in parts), len(keys)), np.nan, dtype=np.float64)
+        offset = 0
+        for part in parts:
+            columns = [column[key] for key in part.mass_keys]
+            mass[offset : offset + len(part), columns] = part.mass
+            offset += len(part)
+        sequence_numbers = np.concatenate([part.sequence_numbers for part in parts])
+        order = np.argsort(sequence_numbers, kind="stable")
+        return cls(
+            hpcrun_id=hpcrun_id,
+            sequence_numbers=sequence_numbers[order],
+            times=np.concatenate([part.times for part in parts])[order],
+            mass_keys=keys,
+            mass=mass[order],
+        )
+
+    def select(
+        self, start_sequence_number: int | None = None, end_sequence_number: int | None = None
+    ) -> "WorkerEventSeries":
+        """Events with ``start <= sequence_number <= end`` (either bound optional)."""
+        lo = 0 if start_sequence_number is None else int(np.searchsorted(self.sequence_numbers, start_sequence_number))
+        hi = (
+            len(self)
+            if end_sequence_number is None
+            else int(np.searchsorted(self.sequence_numbers, end_sequence_number, side="right"))
+        )
+        return WorkerEventSeries(
+            hpcrun_id=self.hpcrun_id,
+            sequence_numbers=self.sequence_numbers[lo:hi],
+            times=self.times[lo:hi],
+            mass_keys=self.mass_keys,
+            mass=self.mass[lo:hi],
+        )
+
+    def head(self, n: int) -> "WorkerEventSeries":
+        """The first ``n`` events."""
+        return WorkerEventSeries(
+            hpcrun_id=self.hpcrun_id,
+            sequence_numbers=self.sequence_numbers[:n],
+            times=self.times[:n],
+            mass_keys=self.mass_keys,
+            mass=self.mass[:n],
+        )
+
+    def downsample(self, bucket_seconds: float) -> list[WorkerEventBucket]:
+        """Min/max/mean of each mass component per ``bucket_seconds`` of simulation time.
+
+        Buckets are aligned to multiples of ``bucket_seconds`` and ordered by time; a
+        component missing from every event of a bucket is left out of that bucket.
+        """
+        if bucket_seconds <= 0:
+            raise ValueError("bucket_seconds must be positive")
+        if not len(self):
+            return []
+        bucket_index = np.floor(self.times / bucket_seconds).astype(np.int64)
+        order = np.argsort(bucket_index, kind="stable")
+        bucket_index = bucket_index[order]
+        starts = np.flatnonzero(np.r_[True, bucket_index[1:] != bucket_index[:-1]])
+        sizes = np.diff(np.r_[starts, len(self)])
+        sequence_numbers = self.sequence_numbers[order]
+        first_sequence_numbers = np.minimum.reduceat(sequence_numbers, starts)
+        last_sequence_numbers = np.maximum.reduceat(sequence_numbers, starts)
+        mass = self.mass[order]
+        present = ~np.isnan(mass)
+        counts = np.add.reduceat(present.astype(np.int64), starts, axis=0)
+        sums = np.add.reduceat(np.where(present, mass, 0.0), starts, axis=0)
+        minima = np.fmin.reduceat(mass, starts, axis=0)  # fmin/fmax skip NaN
+        maxima = np.fmax.reduceat(mass, starts, axis=0)
+
+        buckets = []
+        for b, start in enumerate(starts):
+            columns = [(j, key) for j, key in enumerate(self.mass_keys) if counts[b, j]]
+            buckets.append(
+                WorkerEventBucket(
+                    start_time=float(bucket_index[start] * bucket_seconds),
+                    n_events=int(sizes[b]),
+                    first_sequence_number=int(first_sequence_numbers[b]),
+                    last_sequence_number=int(last_sequence_numbers[b]),
+                    mass_min={key: float(minima[b, j]) for j, key in columns},
+                    mass_max={key: float(maxima[b, j]) for j, key in columns},
+                    mass_mean={key: float(sums[b, j] / counts[b, j]) for j, key in columns},
+                )
+            )
+        return buckets
+
+    def to_worker_events(self, correlation_id: str = "") -> list[WorkerEvent]:
+        worker_events = []
+        for row in range(len(self)):
+            values = self.mass[row]
+            worker_events.append(
+                WorkerEvent(
+                    hpcrun_id=self.hpcrun_id,
+                    correlation_id=correlation_id,
+                    sequence_number=int(self.sequence_numbers[row]),
+                    time=float(self.times[row]),
+                    mass={key: float(v) for key, v in zip(self.mass_keys, values, strict=True) if not np.isnan(v)},
+                )
+            )
+        return worker_events
+
+
+def mass_key_union(worker_events: Iterable[WorkerEvent]) -> list[str]:
+    """Mass keys of all events, in first-seen order."""
+    return list(dict.fromkeys(key for worker_event in worker_events for key in worker_event.mass))
+
+
+def pack_worker_events(worker_events: Sequence[WorkerEvent]) -> PackedWorkerEventBlock:
+    """Pack events (sorted by sequence number) into the columns of one block."""
+    if not worker_events:
+        raise ValueError("Cannot pack an empty block of worker events")
+    series = WorkerEventSeries.from_worker_events(hpcrun_id=0, worker_events=worker_events)
+    return PackedWorkerEventBlock(
+        first_sequence_number=int(series.sequence_numbers[0]),
+        last_sequence_number=int(series.sequence_numbers[-1]),
+        n_events=len(series),
+        mass_keys=series.mass_keys,
+        sequence_numbers=series.sequence_numbers.astype(_SEQUENCE_DTYPE).tobytes(),
+        times=series.times.astype(_VALUE_DTYPE).tobytes(),
+        mass=series.mass.astype(_VALUE_DTYPE).tobytes(),
+    )
+
+
+def unpack_worker_event_block(
+    hpcrun_id: int, mass_keys: list[str], sequence_numbers: bytes, times: bytes, mass: bytes
+) -> WorkerEventSeries:
+    sequence_array = np.frombuffer(sequence_numbers, dtype=_SEQUENCE_DTYPE).astype(np.int64)
+    return WorkerEventSeries(
+        hpcrun_id=hpcrun_id,
+        sequence_numbers=sequence_array,
+        times=np.frombuffer(times, dtype=_VALUE_DTYPE).astype(np.float64),
+        mass_keys=list(mass_keys),
+        mass=np.frombuffer(mass, dtype=_VALUE_DTYPE).astype(np.float64).reshape(len(sequence_array), len(mass_keys)),
+    )
@@ -0,0 +1,218 @@
+"""Buffered, batched ingestion of WorkerEvents into the database.
+
+Decoded events are put on a bounded queue and written by one background task with a
+single multi-row INSERT per batch — every ``batch_size`` events or ``flush_interval``
+seconds, whichever comes first — instead of a session, transaction and flush per
+message. A full queue applies backpressure to the producer (the messaging listener):
+:meth:`WorkerEventIngestor.submit` waits up to ``enqueue_timeout`` seconds for room
+before the event is dropped and counted.
+
+Once ``block_size`` events of an HpcRun have been inserted they are compacted into a
+columnar block (see :mod:`sms_api.simulation.worker_event_blocks`) by a separate task,
+so a compaction never holds up the inserts behind it.
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from sms_api.config import get_settings
+from sms_api.simulation.database_service import DatabaseService
+from sms_api.simulation.models import WorkerEvent
+from sms_api.simulation.worker_event_blocks import WORKER_EVENT_BLOCK_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WorkerEventIngestMetrics:
+    """Point-in-time counters of a :class:`WorkerEventIngestor`."""
+
+    received: int = 0
+    inserted: int = 0
+    batches: int = 0
+    throttled: int = 0  # submissions that had to wait for room in a full queue
+    dropped: int = 0  # queue stayed full past enqueue_timeout
+    failed: int = 0  # lost to a failed bulk insert
+    compacted: int = 0  # events packed into columnar blocks
+    queue_depth: int = 0
+    lag_seconds: float = 0.0  # enqueue-to-commit delay of the oldest event of the last batch
+    last_batch_size: int = 0
+    events_per_second: float = 0.0  # inserted events per second since start
+
+
+class WorkerEventIngestor:
+    """Bounded queue + background bulk writer for WorkerEvents (each with ``hpcrun_id`` set)."""
+
+    def __init__(
+        self,
+        database_service: DatabaseService,
+        batch_size: int = 500,
+        flush_interval: float = 0.05,
+        max_queue_size: int = 10_000,
+        enqueue_timeout: float = 1.0,
+        on_inserted: Callable[[list[WorkerEvent]], None] | None = None,
+        block_size: int = WORKER_EVENT_BLOCK_SIZE,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.database_service = database_service
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.enqueue_timeout = enqueue_timeout
+        self.on_inserted = on_inserted
+        self.block_size = block_size
+        self._uncompacted: dict[int, int] = {}  # hpcrun_id -> events inserted since its last compaction
+        self._queue: asyncio.Queue[tuple[float, WorkerEvent]] = asyncio.Queue(maxsize=max_queue_size)
+        self._task: asyncio.Task[None] | None = None
+        self._compaction: asyncio.Task[None] | None = None
+        self._arrived = asyncio.Event()  # wakes a writer waiting to fill a partial batch
+        self._stopping = False
+        self._started_at: float | None = None
+        self._metrics = WorkerEventIngestMetrics()
+
+    @classmethod
+    def from_settings(
+        cls, database_service: DatabaseService, on_inserted: Callable[[list[WorkerEvent]], None] | None = None
+    ) -> "WorkerEventIngestor":
+        settings = get_settings()
+        return cls(
+            database_service=database_service,
+            batch_size=settings.worker_event_batch_size,
+            flush_interval=settings.worker_event_flush_interval,
+            max_queue_size=settings.worker_event_queue_size,
+            enqueue_timeout=settings.worker_event_enqueue_timeout,
+            on_inserted=on_inserted,
+            block_size=settings.worker_event_block_size,
+        )
+
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.is_running():
+            return
+        self._started_at = time.monotonic()
+        self._stopping = False
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Write out everything already queued, then stop the writer once a running compaction ends."""
+        if self._task is None:
+            return
+        self._stopping = True  # flush partial batches without waiting out flush_interval
+        self._arrived.set()
+        if not self._task.done():
+            await self._queue.join()
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        if self._compaction is not None:
+            await self._compaction
+            self._compaction = None
+        logger.info(f"Stopped worker event ingestion: {self.metrics()}")
+
+    async def submit(self, worker_event: WorkerEvent) -> bool:
+        """Queue ``worker_event`` for insertion; False if it was dropped because the queue stayed full."""
+        if worker_event.hpcrun_id is None:
+            raise ValueError(f"WorkerEvent {worker_event.correlation_id} has no hpcrun_id")
+        self._metrics.received += 1
+        item = (time.monotonic(), worker_event)
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self._metrics.throttled += 1
+            try:
+                await asyncio.wait_for(self._queue.put(item), timeout=self.enqueue_timeout)
+            except TimeoutError:
+                self._metrics.dropped += 1
+                logger.warning(
+                    f"Dropping worker event {worker_event.correlation_id}#{worker_event.sequence_number}: "
+                    f"ingestion queue full for {self.enqueue_timeout}s"
+                )
+                return False
+        self._arrived.set()
+        return True
+
+    def metrics(self) -> WorkerEventIngestMetrics:
+        metrics = WorkerEventIngestMetrics(**vars(self._metrics))
+        metrics.queue_depth = self._queue.qsize()
+        if self._started_at is not None:
+            metrics.events_per_second = metrics.inserted / max(time.monotonic() - self._started_at, 1e-9)
+        return metrics
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._stopping:
+                    break
+                self._arrived.clear()
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._arrived.wait(), timeout=remaining)
+            try:
+                await self._write(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _write(self, batch: list[tuple[float, WorkerEvent]]) -> None:
+        try:
+            inserted = await self.database_service.insert_worker_events([event for _, event in batch])
+        except Exception:
+            self._metrics.failed += len(batch)
+            logger.exception(f"Bulk insert of {len(batch)} worker events failed")
+            return
+        self._metrics.inserted += len(inserted)
+        self._metrics.batches += 1
+        self._metrics.last_batch_size = len(inserted)
+        self._metrics.lag_seconds = time.monotonic() - min(enqueued for enqueued, _ in batch)
+        if self.on_inserted is not None:
+            try:
+                self.on_inserted(inserted)
+            except Exception:
+                logger.exception("Worker event subscriber callback failed")
+        self._schedule_compaction(inserted)
+
+    def _schedule_compaction(self, inserted: list[WorkerEvent]) -> None:
+        """Count ``inserted`` towards their runs' blocks; start a compaction pass if one is due and none runs."""
+        if self.block_size < 1:
+            return
+        for worker_event in inserted:
+            if worker_event.hpcrun_id is not None:
+                self._uncompacted[worker_event.hpcrun_id] = self._uncompacted.get(worker_event.hpcrun_id, 0) + 1
+        if self._compaction is not None and not self._compaction.done():
+            return  # the running pass also picks up runs that became due meanwhile
+        if any(count >= self.block_size for count in self._uncompacted.values()):
+            self._compaction = asyncio.create_task(self._compact())
+
+    async def _compact(self) -> None:
+        failed: set[int] = set()  # retried by the next pass, not in a loop here
+        while due := [
+            hpcrun_id
+            for hpcrun_id, count in self._uncompacted.items()
+            if count >= self.block_size and hpcrun_id not in failed
+        ]:
+            hpcrun_id = due[0]
+            try:
+                compacted = await self.database_service.compact_worker_events(hpcrun_id, self.block_size)
+            except Exception:
+                logger.exception(f"Compaction of worker events of HpcRun {hpcrun_id} failed")
+                failed.add(hpcrun_id)
+                continue
+            self._metrics.compacted += compacted
+            remaining = self._uncompacted.get(hpcrun_id, 0) - compacted
+            # Nothing compacted: another replica holds the rows, leave them to it.
+            if compacted == 0 or remaining <= 0:
+                del self._uncompacted[hpcrun_id]
+            else:
+                self._uncompacted[hpcrun_id] = remaining
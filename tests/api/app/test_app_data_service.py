@@ -8,6 +8,7 @@ To run: pytest tests/api/app/test_app_data_service.py -v -m integration
 To skip: pytest tests/api/app/test_app_data_service.py -v -m "not integration"
 """
 
+import gzip
 import os
 from pathlib import Path
 
@@ -16,6 +17,8 @@ import pytest
 import pytest_asyncio
 
 from app.app_data_service import BaseUrl, E2EDataService, get_data_service
+from sms_api.analysis.models import TsvOutputFile
+from sms_api.simulation.observable_reader import NDJSON_MEDIA_TYPE
 
 # --- Configuration ---
 TEST_BASE_URL = BaseUrl.LOCAL_8080
@@ -58,6 +61,29 @@ async def data_service() -> E2EDataService:
     return get_data_service(base_url=TEST_BASE_URL, timeout=TEST_TIMEOUT)
 
 
+# --- Unit Tests (mocked transport) ---
+
+
+def test_iter_analysis_data_reads_a_gzipped_ndjson_stream() -> None:
+    outputs = [TsvOutputFile(filename=f"f{g}.tsv", content="a\tb\n", variant=0, generation=g) for g in (6, 5)]
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        body = b"".join(o.model_dump_json().encode() + b"\n" for o in outputs)
+        return httpx.Response(
+            200, content=gzip.compress(body), headers={"Content-Type": NDJSON_MEDIA_TYPE, "Content-Encoding": "gzip"}
+        )
+
+    service = E2EDataService(base_url=TEST_BASE_URL)
+    service.client = httpx.Client(base_url=TEST_BASE_URL, transport=httpx.MockTransport(handler))
+
+    assert list(service.iter_analysis_data(analysis_id=3, min_generation=5)) == outputs
+    assert requests[0].url.path == "/api/v1/analyses/3/data"
+    assert dict(requests[0].url.params) == {"min_generation": "5"}
+    assert requests[0].headers["accept"] == NDJSON_MEDIA_TYPE
+
+
 # --- Integration Tests (require live server) ---
 
 
@@ -1,14 +1,19 @@
 """Endpoint tests for the read-side analysis-result API (list + fetch-by-id)."""
 
 import datetime
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from httpx import ASGITransport, AsyncClient
 
+from sms_api.analysis.models import TsvOutputFile
+from sms_api.analysis.output_manifest import manifest_entry
 from sms_api.common.storage.file_service import ListingItem
-from sms_api.dependencies import set_file_service
-from sms_api.simulation.database_service import DatabaseServiceSQL
+from sms_api.dependencies import get_database_service, set_database_service, set_file_service
+from sms_api.simulation.database_service import DatabaseService, DatabaseServiceSQL
 from sms_api.simulation.models import SimulationRequest
+from sms_api.simulation.observable_reader import NDJSON_MEDIA_TYPE
 from sms_api.simulation.tables_orm import AnalysisStatusDB
 
 _RESULT_URI = "vecoli-output/exp-ana/exp-ana/analyses"
@@ -124,3 +129,66 @@ async def test_list_all_analyses_exhaustive_and_filter(base_router: str, databas
         filtered = await client.get(f"{base_router}/analyses", params={"experiment_id": "exp-all-x"})
         assert filtered.status_code == 200
         assert {r["experiment_id"] for r in filtered.json()} == {"exp-all-x"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("accept_encoding", ["gzip", "identity"])
+async def test_get_analysis_data_streams_ndjson(
+    base_router: str, monkeypatch: pytest.MonkeyPatch, accept_encoding: str
+) -> None:
+    files = [
+        manifest_entry(f"{_RESULT_URI}/variant=0/lineage_seed=0/generation={g}/proteomics.tsv", 10, "x")
+        for g in range(3)
+    ]
+    monkeypatch.setattr("sms_api.common.handlers.analyses.list_analysis_data_files", AsyncMock(return_value=files))
+    saved = get_database_service()
+    set_database_service(cast(DatabaseService, MagicMock()))
+    set_file_service(_FakeFileService("EcoCyc Reaction ID\tmean\n"))  # type: ignore[arg-type]
+    try:
+        async with await _client() as client:
+            resp = await client.get(
+                f"{base_router}/analyses/7/data",
+                headers={"Accept": NDJSON_MEDIA_TYPE, "Accept-Encoding": accept_encoding},
+            )
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == NDJSON_MEDIA_TYPE
+        assert resp.headers.get("content-encoding") == ("gzip" if accept_encoding == "gzip" else None)
+        outputs = [TsvOutputFile.model_validate_json(line) for line in resp.text.splitlines()]
+        assert sorted(o.generation or 0 for o in outputs) == [0, 1, 2]
+        assert all(o.filename == "proteomics.tsv" and o.lineage_seed == 0 for o in outputs)
+    finally:
+        set_file_service(None)
+        set_database_service(saved)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("accept", "expected"),
+    [
+        ("application/json, application/x-ndjson;q=0.5", "application/json"),
+        ("application/x-ndjson;q=0", "application/json"),
+        ("application/json;q=0.1, application/x-ndjson", NDJSON_MEDIA_TYPE),
+        ("*/*", "application/json"),
+    ],
+)
+async def test_get_analysis_data_accept_quality(
+    base_router: str, monkeypatch: pytest.MonkeyPatch, accept: str, expected: str
+) -> None:
+    """NDJSON is streamed only when `Accept` ranks it above JSON by `q`."""
+    files = [manifest_entry(f"{_RESULT_URI}/variant=0/lineage_seed=0/generation=0/proteomics.tsv", 10, "x")]
+    monkeypatch.setattr("sms_api.common.handlers.analyses.list_analysis_data_files", AsyncMock(return_value=files))
+    monkeypatch.setattr(
+        "sms_api.common.handlers.analyses.fetch_analysis_data",
+        AsyncMock(return_value=[TsvOutputFile(filename="proteomics.tsv", content="EcoCyc Reaction ID\tmean\n")]),
+    )
+    saved = get_database_service()
+    set_database_service(cast(DatabaseService, MagicMock()))
+    set_file_service(_FakeFileService("EcoCyc Reaction ID\tmean\n"))  # type: ignore[arg-type]
+    try:
+        async with await _client() as client:
+            resp = await client.get(f"{base_router}/analyses/7/data", headers={"Accept": accept})
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == expected
+    finally:
+        set_file_service(None)
+        set_database_service(saved)
@@ -2,9 +2,11 @@ from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from typing import cast
 
+import numpy as np
 import pytest
 from httpx import ASGITransport, AsyncClient
 
+from app.app_data_service import OBSERVABLE_FORMATS, decode_observables_body
 from sms_api.api.main import app
 from sms_api.dependencies import get_database_service, set_database_service
 from sms_api.simulation.database_service import DatabaseService
@@ -102,8 +104,12 @@ async def test_observables_series_ok(monkeypatch: pytest.MonkeyPatch) -> None:
     saved = get_database_service()
     set_database_service(cast(DatabaseService, _FakeDB(_sim())))
     monkeypatch.setattr(
-        "sms_api.simulation.observable_reader.read_observables",
-        lambda uri, names, *, stride=1, max_points=None: ("zarr", [0.0, 1.0, 2.0], {"mass": [1.0, 2.0, 3.0]}),
+        "sms_api.simulation.observable_reader.read_observable_arrays",
+        lambda uri, names, *, stride=1, max_points=None, downsample=None, **_: (
+            "zarr",
+            np.array([0.0, 1.0, 2.0]),
+            {"mass": np.array([1.0, 2.0, 3.0])},
+        ),
     )
     try:
         async with _client() as c:
@@ -117,6 +123,97 @@ async def test_observables_series_ok(monkeypatch: pytest.MonkeyPatch) -> None:
         set_database_service(saved)
 
 
+@pytest.mark.asyncio
+async def test_observables_series_non_finite_as_null(monkeypatch: pytest.MonkeyPatch) -> None:
+    """NaN/±Inf in the reader's arrays are encoded as JSON null."""
+    saved = get_database_service()
+    set_database_service(cast(DatabaseService, _FakeDB(_sim())))
+    monkeypatch.setattr(
+        "sms_api.simulation.observable_reader.read_observable_arrays",
+        lambda uri, names, *, stride=1, max_points=None, downsample=None, **_: (
+            "zarr",
+            np.array([0.0, 1.0, 2.0]),
+            {"mass": np.array([1.0, np.nan, np.inf])},
+        ),
+    )
+    try:
+        async with _client() as c:
+            r = await c.get(f"{BASE}/simulations/49/observables", params={"names": "mass"})
+        assert r.status_code == 200
+        assert r.headers["content-type"] == "application/json"
+        body = r.json()
+        assert body["simulation_id"] == 49
+        assert body["seed"] == 0
+        assert body["series"]["mass"] == [1.0, None, None]
+    finally:
+        set_database_service(saved)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fmt", ["arrow", "parquet"])
+async def test_observables_series_columnar_formats(monkeypatch: pytest.MonkeyPatch, fmt: str) -> None:
+    """`Accept` selects an Arrow IPC stream / Parquet body that decodes back to the JSON content."""
+    saved = get_database_service()
+    set_database_service(cast(DatabaseService, _FakeDB(_sim())))
+    monkeypatch.setattr(
+        "sms_api.simulation.observable_reader.read_observable_arrays",
+        lambda uri, names, *, stride=1, max_points=None, downsample=None, **_: (
+            "zarr",
+            np.array([0.0, 1.0, 2.0]),
+            {"mass": np.array([1.0, np.nan, 3.0]), "volume": np.array([0.1, 0.2, 0.3])},
+        ),
+    )
+    try:
+        async with _client() as c:
+            r = await c.get(
+                f"{BASE}/simulations/49/observables",
+                params={"names": "mass,volume"},
+                headers={"Accept": OBSERVABLE_FORMATS[fmt]},
+            )
+        assert r.status_code == 200
+        assert r.headers["content-type"] == OBSERVABLE_FORMATS[fmt]
+        obs = decode_observables_body(r.content, r.headers["content-type"])
+        assert obs.simulation_id == 49
+        assert obs.experiment_id == "exp-abc"
+        assert obs.store == "zarr"
+        assert obs.time == [0.0, 1.0, 2.0]
+        assert obs.series == {"mass": [1.0, None, 3.0], "volume": [0.1, 0.2, 0.3]}
+    finally:
+        set_database_service(saved)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("accept", "expected"),
+    [
+        ("application/json, application/vnd.apache.arrow.stream;q=0.1", "json"),
+        ("application/vnd.apache.arrow.stream;q=0, application/x-parquet;q=0", "json"),
+        ("application/vnd.apache.arrow.stream;q=0.5, application/x-parquet;q=0.9", "parquet"),
+        ("application/json;q=0.2, application/vnd.apache.arrow.stream", "arrow"),
+        ("text/html, */*;q=0.8", "json"),
+    ],
+)
+async def test_observables_series_accept_quality(monkeypatch: pytest.MonkeyPatch, accept: str, expected: str) -> None:
+    """The body format is the acceptable type with the highest `q`; `q=0` excludes a type."""
+    saved = get_database_service()
+    set_database_service(cast(DatabaseService, _FakeDB(_sim())))
+    monkeypatch.setattr(
+        "sms_api.simulation.observable_reader.read_observable_arrays",
+        lambda uri, names, *, stride=1, max_points=None, downsample=None, **_: (
+            "zarr",
+            np.array([0.0, 1.0]),
+            {"mass": np.array([1.0, 2.0])},
+        ),
+    )
+    try:
+        async with _client() as c:
+            r = await c.get(f"{BASE}/simulations/49/observables", params={"names": "mass"}, headers={"Accept": accept})
+        assert r.status_code == 200
+        assert r.headers["content-type"] == OBSERVABLE_FORMATS[expected]
+    finally:
+        set_database_service(saved)
+
+
 @pytest.mark.asyncio
 async def test_observables_series_forwards_decimation(monkeypatch: pytest.MonkeyPatch) -> None:
     """`stride` / `max_points` query params are forwarded to the reader."""
@@ -124,19 +221,93 @@ async def test_observables_series_forwards_decimation(monkeypatch: pytest.Monkey
     set_database_service(cast(DatabaseService, _FakeDB(_sim())))
     captured: dict[str, object] = {}
 
-    def _capture(uri: str, names: list[str], *, stride: int = 1, max_points: int | None = None) -> tuple:  # type: ignore[type-arg]
+    def _capture(
+        uri: str,
+        names: list[str],
+        *,
+        stride: int = 1,
+        max_points: int | None = None,
+        downsample: str | None = None,
+        **window: object,
+    ) -> tuple[str, object, object]:
         captured["stride"] = stride
         captured["max_points"] = max_points
-        return "zarr", [0.0, 2.0], {"mass": [1.0, 3.0]}
+        captured["downsample"] = downsample
+        captured.update(window)
+        return "zarr", np.array([0.0, 2.0]), {"mass": np.array([1.0, 3.0])}
 
-    monkeypatch.setattr("sms_api.simulation.observable_reader.read_observables", _capture)
+    monkeypatch.setattr("sms_api.simulation.observable_reader.read_observable_arrays", _capture)
     try:
         async with _client() as c:
             r = await c.get(
-                f"{BASE}/simulations/49/observables", params={"names": "mass", "stride": 2, "max_points": 100}
+                f"{BASE}/simulations/49/observables",
+                params={
+                    "names": "mass",
+                    "stride": 2,
+                    "max_points": 100,
+                    "downsample": "m4",
+                    "t_start": 1.5,
+                    "generations": "2-3",
+                },
             )
         assert r.status_code == 200
-        assert captured == {"stride": 2, "max_points": 100}
+        assert captured == {
+            "stride": 2,
+            "max_points": 100,
+            "downsample": "m4",
+            "t_start": 1.5,
+            "t_end": None,
+            "generations": [2, 3],
+        }
+    finally:
+        set_database_service(saved)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "params", [{"t_start": 5, "t_end": 1}, {"generations": "3-1"}, {"generations": "x"}], ids=["window", "range", "gen"]
+)
+async def test_observables_series_bad_window_400(params: dict[str, object]) -> None:
+    saved = get_database_service()
+    set_database_service(cast(DatabaseService, _FakeDB(_sim())))
+    try:
+        async with _client() as c:
+            r = await c.get(f"{BASE}/simulations/49/observables", params=params)  # type: ignore[arg-type]
+        assert r.status_code == 400
+    finally:
+        set_database_service(saved)
+
+
+@pytest.mark.asyncio
+async def test_observables_series_unknown_downsample_422() -> None:
+    saved = get_database_service()
+    set_database_service(cast(DatabaseService, _FakeDB(_sim())))
+    try:
+        async with _client() as c:
+            r = await c.get(f"{BASE}/simulations/49/observables", params={"max_points": 10, "downsample": "nope"})
+        assert r.status_code == 422
+    finally:
+        set_database_service(saved)
+
+
+@pytest.mark.asyncio
+async def test_observables_series_keeps_column_selectors(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Commas inside `bulk[...]` selectors don't split the `names` list."""
+    saved = get_database_service()
+    set_database_service(cast(DatabaseService, _FakeDB(_sim())))
+    captured: list[list[str]] = []
+
+    def _capture(uri: str, names: list[str], **_: object) -> tuple[str, object, object]:
+        captured.append(names)
+        return "zarr", np.array([0.0]), {"mass": np.array([1.0]), "bulk[0]": np.array([2.0])}
+
+    monkeypatch.setattr("sms_api.simulation.observable_reader.read_observable_arrays", _capture)
+    try:
+        async with _client() as c:
+            r = await c.get(f"{BASE}/simulations/49/observables", params={"names": "mass,bulk[0,2]"})
+        assert r.status_code == 200
+        assert captured == [["mass", "bulk[0,2]"]]
+        assert r.json()["series"]["bulk[0]"] == [2.0]
     finally:
         set_database_service(saved)
 
@@ -146,10 +317,18 @@ async def test_observables_series_bad_name_400(monkeypatch: pytest.MonkeyPatch)
     saved = get_database_service()
     set_database_service(cast(DatabaseService, _FakeDB(_sim())))
 
-    def _raise(uri: str, names: list[str], *, stride: int = 1, max_points: int | None = None) -> None:
+    def _raise(
+        uri: str,
+        names: list[str],
+        *,
+        stride: int = 1,
+        max_points: int | None = None,
+        downsample: str | None = None,
+        **_: object,
+    ) -> None:
         raise KeyError("observables not in store: ['nope']")
 
-    monkeypatch.setattr("sms_api.simulation.observable_reader.read_observables", _raise)
+    monkeypatch.setattr("sms_api.simulation.observable_reader.read_observable_arrays", _raise)
     try:
         async with _client() as c:
             r = await c.get(f"{BASE}/simulations/49/observables", params={"names": "nope"})
@@ -164,12 +343,20 @@ async def test_observables_series_multidim_400(monkeypatch: pytest.MonkeyPatch)
     saved = get_database_service()
     set_database_service(cast(DatabaseService, _FakeDB(_sim())))
 
-    def _raise(uri: str, names: list[str], *, stride: int = 1, max_points: int | None = None) -> None:
+    def _raise(
+        uri: str,
+        names: list[str],
+        *,
+        stride: int = 1,
+        max_points: int | None = None,
+        downsample: str | None = None,
+        **_: object,
+    ) -> None:
         raise ValueError(
             "observable 'bulk' is not a 1-D timeseries (shape (3, 5)); multi-dimensional observables are not supported"
         )
 
-    monkeypatch.setattr("sms_api.simulation.observable_reader.read_observables", _raise)
+    monkeypatch.setattr("sms_api.simulation.observable_reader.read_observable_arrays", _raise)
     try:
         async with _client() as c:
             r = await c.get(f"{BASE}/simulations/49/observables", params={"names": "bulk"})
@@ -177,3 +364,114 @@ async def test_observables_series_multidim_400(monkeypatch: pytest.MonkeyPatch)
         assert "1-D timeseries" in r.json()["detail"]
     finally:
         set_database_service(saved)
+
+
+def _fake_seed_reader(
+    uri: str,
+    names: list[str],
+    *,
+    stride: int = 1,
+    max_points: int | None = None,
+    downsample: str | None = None,
+    **_: object,
+) -> tuple[str, object, object]:
+    """Seed N's mass is ``N + t``; seed 2's store is missing."""
+    if "seed02" in uri:
+        raise FileNotFoundError(uri)
+    seed = int(uri.rsplit("seed", 1)[1][:2])
+    t = np.array([0.0, 1.0, 2.0])
+    return "zarr", t, {"mass": t + seed}
+
+
+@pytest.mark.asyncio
+async def test_observables_batch_ndjson_with_ensemble(monkeypatch: pytest.MonkeyPatch) -> None:
+    """One line per seed (errors inline), then the ensemble bands."""
+    import orjson
+
+    saved = get_database_service()
+    set_database_service(cast(DatabaseService, _FakeDB(_sim())))
+    monkeypatch.setattr("sms_api.simulation.observable_reader.read_observable_arrays", _fake_seed_reader)
+    try:
+        async with _client() as c:
+            r = await c.get(
+                f"{BASE}/simulations/49/observables/batch",
+                params={"seeds": "0-2", "names": "mass", "ensemble": "true", "percentiles": "0,100"},
+            )
+        assert r.status_code == 200
+        assert r.headers["content-type"] == "application/x-ndjson"
+        lines = [orjson.loads(line) for line in r.content.splitlines()]
+        per_seed = {line["seed"]: line for line in lines[:-1]}
+        assert set(per_seed) == {0, 1, 2}
+        assert "error" in per_seed[2]
+        assert per_seed[1]["series"]["mass"] == [1.0, 2.0, 3.0]
+        ensemble = lines[-1]
+        assert ensemble["seeds"] == [0, 1]
+        assert ensemble["bands"]["mass"] == {"mean": [0.5, 1.5, 2.5], "p0": [0.0, 1.0, 2.0], "p100": [1.0, 2.0, 3.0]}
+    finally:
+        set_database_service(saved)
+
+
+@pytest.mark.asyncio
+async def test_observables_batch_arrow(monkeypatch: pytest.MonkeyPatch) -> None:
+    import pyarrow as pa
+
+    saved = get_database_service()
+    set_database_service(cast(DatabaseService, _FakeDB(_sim())))
+    monkeypatch.setattr("sms_api.simulation.observable_reader.read_observable_arrays", _fake_seed_reader)
+    try:
+        async with _client() as c:
+            r = await c.get(
+                f"{BASE}/simulations/49/observables/batch",
+                params={"seeds": "0,1,2", "names": "mass", "ensemble": "true"},
+                headers={"Accept": OBSERVABLE_FORMATS["arrow"]},
+            )
+        assert r.status_code == 200
+        table = pa.ipc.open_stream(r.content).read_all()
+        assert table.column_names == ["seed", "stat", "time", "mass"]
+        assert table.schema.metadata[b"experiment_id"] == b"exp-abc"
+        rows = table.to_pylist()
+        assert sorted({row["seed"] for row in rows if row["seed"] is not None}) == [0, 1]
+        assert [row["mass"] for row in rows if row["stat"] == "mean"] == [0.5, 1.5, 2.5]
+        assert {row["stat"] for row in rows if row["stat"]} == {"mean", "p5", "p50", "p95"}
+    finally:
+        set_database_service(saved)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("accept", "expected"),
+    [
+        ("application/x-ndjson, application/vnd.apache.arrow.stream;q=0.1", "application/x-ndjson"),
+        ("application/vnd.apache.arrow.stream;q=0", "application/x-ndjson"),
+        ("application/x-ndjson;q=0.2, application/vnd.apache.arrow.stream", "application/vnd.apache.arrow.stream"),
+        ("*/*", "application/x-ndjson"),
+    ],
+)
+async def test_observables_batch_accept_quality(monkeypatch: pytest.MonkeyPatch, accept: str, expected: str) -> None:
+    """The batch body is NDJSON unless `Accept` ranks Arrow higher by `q`."""
+    saved = get_database_service()
+    set_database_service(cast(DatabaseService, _FakeDB(_sim())))
+    monkeypatch.setattr("sms_api.simulation.observable_reader.read_observable_arrays", _fake_seed_reader)
+    try:
+        async with _client() as c:
+            r = await c.get(
+                f"{BASE}/simulations/49/observables/batch",
+                params={"seeds": "0,1", "names": "mass"},
+                headers={"Accept": accept},
+            )
+        assert r.status_code == 200
+        assert r.headers["content-type"] == expected
+    finally:
+        set_database_service(saved)
+
+
+@pytest.mark.asyncio
+async def test_observables_batch_bad_seeds_400() -> None:
+    saved = get_database_service()
+    set_database_service(cast(DatabaseService, _FakeDB(_sim())))
+    try:
+        async with _client() as c:
+            r = await c.get(f"{BASE}/simulations/49/observables/batch", params={"seeds": "5-1"})
+        assert r.status_code == 400
+    finally:
+        set_database_service(saved)
@@ -1,8 +1,12 @@
+from unittest.mock import MagicMock
+
 import pytest
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 
 from sms_api.common.gateway.models import ServerMode
+from sms_api.simulation.database_cache import CachingDatabaseService
+from sms_api.simulation.worker_event_ingest import WorkerEventIngestMetrics
 from sms_api.version import __version__
 
 server_urls = [ServerMode.DEV, ServerMode.PROD]
@@ -39,3 +43,32 @@ async def test_ping(fastapi_app: FastAPI, local_base_url: str) -> None:
         data = response.json()
         assert data["docs"].split("/")[-1] == "docs"
         assert data["version"] == current_version
+
+
+@pytest.mark.asyncio
+async def test_metrics(fastapi_app: FastAPI, local_base_url: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    job_scheduler = MagicMock()
+    job_scheduler.worker_event_metrics.return_value = WorkerEventIngestMetrics(received=3, inserted=2, compacted=1)
+    monkeypatch.setattr("sms_api.api.main.get_job_scheduler", lambda: job_scheduler)
+    async with AsyncClient(transport=ASGITransport(app=fastapi_app), base_url=local_base_url) as client:
+        response = await client.get("/metrics")
+        assert response.status_code == 200
+        ingest = response.json()["worker_event_ingest"]
+        assert (ingest["received"], ingest["inserted"], ingest["compacted"]) == (3, 2, 1)
+
+
+@pytest.mark.asyncio
+async def test_metrics_database_cache(
+    fastapi_app: FastAPI, local_base_url: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    database_service = CachingDatabaseService(MagicMock())
+    database_service.cache.get(("simulation", 1))
+    monkeypatch.setattr("sms_api.api.main.get_database_service", lambda: database_service)
+    monkeypatch.setattr("sms_api.api.main.get_job_scheduler", lambda: None)
+    async with AsyncClient(transport=ASGITransport(app=fastapi_app), base_url=local_base_url) as client:
+        response = await client.get("/metrics")
+        assert response.status_code == 200
+        metrics = response.json()
+        assert "worker_event_ingest" not in metrics
+        assert metrics["database_cache"]["misses"] == 1
+        assert metrics["database_cache"]["hit_rate"] == 0.0
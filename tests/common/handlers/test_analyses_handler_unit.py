@@ -1,4 +1,13 @@
-from sms_api.common.handlers.analyses import _parse_cached_filename_metadata
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from sms_api.analysis.models import OutputManifestEntry
+from sms_api.analysis.output_manifest import manifest_entry
+from sms_api.common.handlers.analyses import _parse_cached_filename_metadata, fetch_analysis_data, iter_analysis_data
+from sms_api.common.storage.file_paths import S3FilePath
 
 
 class TestParseCachedFilenameMetadata:
@@ -23,3 +32,66 @@ class TestParseCachedFilenameMetadata:
     def test_csv_extension(self) -> None:
         result = _parse_cached_filename_metadata("ptools_rna_v0_s0_g3.csv")
         assert result == {"variant": 0, "lineage_seed": 0, "generation": 3}
+
+
+class _SlowFileService:
+    """Returns ``b"<path>"`` after a per-file delay, tracking how many reads overlap."""
+
+    def __init__(self, delays: dict[str, float]) -> None:
+        self.delays = delays
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_file_contents(self, s3_path: S3FilePath) -> bytes | None:
+        path = str(s3_path.s3_path)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays[path])
+        finally:
+            self.in_flight -= 1
+        return None if path.endswith("gone.tsv") else path.encode()
+
+
+def _files(n: int) -> list[OutputManifestEntry]:
+    return [manifest_entry(f"out/variant=0/generation={i}/f{i}.tsv", 1, None) for i in range(n)]
+
+
+class TestAnalysisDataFetch:
+    """Bounded-concurrency S3 reads behind GET /analyses/{id}/data."""
+
+    @pytest.mark.asyncio
+    async def test_iter_keeps_at_most_max_concurrency_reads_in_flight(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        files = _files(8)
+        file_service = _SlowFileService({f.path: 0.01 for f in files})
+        monkeypatch.setattr("sms_api.common.handlers.analyses.get_file_service", lambda: file_service)
+
+        outputs = []
+        async for output in iter_analysis_data(files, max_concurrency=3):
+            outputs.append(output)
+            await asyncio.sleep(0.02)  # slow consumer: finished reads must not pile up
+
+        assert sorted(o.generation or 0 for o in outputs) == list(range(8))
+        assert file_service.max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_iter_yields_in_completion_order(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        files = _files(3)
+        file_service = _SlowFileService({files[0].path: 0.05, files[1].path: 0.0, files[2].path: 0.02})
+        monkeypatch.setattr("sms_api.common.handlers.analyses.get_file_service", lambda: file_service)
+
+        generations = [o.generation async for o in iter_analysis_data(files, max_concurrency=3)]
+
+        assert generations == [1, 2, 0]
+
+    @pytest.mark.asyncio
+    async def test_fetch_returns_path_order_and_skips_vanished_objects(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        files = [*_files(3), manifest_entry("out/gone.tsv", 1, None)]
+        delays = {f.path: 0.03 - 0.01 * i for i, f in enumerate(files)}
+        file_service = _SlowFileService(delays)
+        monkeypatch.setattr("sms_api.common.handlers.analyses.get_file_service", lambda: file_service)
+        monkeypatch.setattr("sms_api.common.handlers.analyses.list_analysis_data_files", AsyncMock(return_value=files))
+
+        outputs = await fetch_analysis_data(MagicMock(), analysis_id=1, max_concurrency=4)
+
+        assert [(o.filename, o.content) for o in outputs] == [(Path(f.path).name, f.path) for f in files[:3]]
@@ -1,25 +1,48 @@
 import asyncio
-from collections.abc import AsyncGenerator
+import io
+import tarfile
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 import pytest_asyncio
+from fastapi.responses import FileResponse, StreamingResponse
 
 from sms_api.analysis.models import TsvOutputFile
 from sms_api.common.handlers.simulations import (
     _S3_DOWNLOAD_CONCURRENCY,
+    _S3_PREFETCH_CONCURRENCY,
     SimulationAnalysisResponseType,
+    _cached_archive_response,
     _download_outputs_from_s3,
+    _list_s3_archive_objects,
+    _prefetch_s3_objects,
+    _remote_archive_response,
+    _stream_s3_objects_archive,
     fetch_omics_outputs,
     get_available_omics_output_paths,
+    list_simulation_worker_events,
+    stream_simulation_events,
 )
+from sms_api.common.hpc.job_service import JobStatusInfo
+from sms_api.common.hpc.job_status_sources import JobStatusSource
+from sms_api.common.models import JobBackend, JobId, JobStatus
+from sms_api.common.sse import iter_sse_events
 from sms_api.common.ssh.ssh_service import SSHSessionService
+from sms_api.common.storage.archive import ArchiveFormat, archive_member_names
+from sms_api.common.storage.archive_cache import ArchiveCache, archive_key
 from sms_api.common.storage.file_paths import HPCFilePath, S3FilePath
 from sms_api.common.storage.file_service import FileService, ListingItem
 from sms_api.config import get_settings
 from sms_api.dependencies import get_file_service, set_file_service
+from sms_api.simulation.job_scheduler import JobScheduler
+from sms_api.simulation.models import HpcRun, JobType, SimulationRun, WorkerEvent, WorkerEventMessagePayload
+from sms_api.simulation.status_watcher import JobStatusWatcher
+from sms_api.simulation.worker_event_blocks import WorkerEventSeries
 
 
 @pytest.mark.integration
@@ -106,8 +129,21 @@ class _FakeFileService(FileService):
             prefix = prefix + "/"
         return [item for item in self._listing if item.Key.startswith(prefix)]
 
-    async def get_file_contents(self, s3_path: S3FilePath) -> bytes | None:  # pragma: no cover
-        return b"fake-content"
+    async def get_file_contents(self, s3_path: S3FilePath) -> bytes | None:
+        async with self._lock:
+            self._active += 1
+            self.max_active = max(self.max_active, self._active)
+        try:
+            key = str(s3_path.s3_path)
+            if key in self._fail_keys:
+                raise RuntimeError(f"simulated S3 failure for {key}")
+            if self._per_download_sleep:
+                await asyncio.sleep(self._per_download_sleep)
+            self.downloads.append(key)
+            return f"content:{key}".encode()
+        finally:
+            async with self._lock:
+                self._active -= 1
 
     async def delete_file(self, s3_path: S3FilePath) -> None:  # pragma: no cover
         pass
@@ -138,8 +174,15 @@ def _make_listing(experiment_prefix: str, n_files: int) -> list[ListingItem]:
             Size=50,
         )
     )
-    # workflow_config.json at experiment root (listed under the analyses prefix shouldn't match;
-    # the real handler fetches it by exact key, so listing it here is not required)
+    # workflow_config.json lives outside the analyses prefix, so analyses listings never match it
+    items.append(
+        ListingItem(
+            Key=f"{experiment_prefix}/nextflow/workflow_config.json",
+            LastModified=now,
+            ETag="etag-config",
+            Size=20,
+        )
+    )
     return items
 
 
@@ -245,3 +288,482 @@ async def test_download_outputs_from_s3_skips_cached_files(tmp_path: Path, _swap
     downloaded_tsvs = [k for k in fake.downloads if k.endswith(".tsv")]
     assert len(downloaded_tsvs) == 5 - len(cached_keys)
     assert all(k not in cached_keys for k in downloaded_tsvs)
+
+
+# ---------------------------------------------------------------------------
+# _stream_s3_objects_archive — parallel prefetch feeding the archive stream in order
+# ---------------------------------------------------------------------------
+
+
+async def _collect(stream: AsyncIterator[bytes]) -> bytes:
+    return b"".join([chunk async for chunk in stream])
+
+
+async def _stream_s3_archive(
+    experiment_id: str, archive_format: ArchiveFormat = ArchiveFormat.TAR_GZ, level: int | None = None
+) -> AsyncIterator[bytes]:
+    experiment_prefix, items = await _list_s3_archive_objects(experiment_id)
+    async for chunk in _stream_s3_objects_archive(experiment_id, experiment_prefix, items, archive_format, level):
+        yield chunk
+
+
+@pytest.mark.asyncio
+async def test_stream_s3_archive_prefetches_in_parallel_and_keeps_order(_swap_file_service: None) -> None:
+    experiment_id = "test-exp-stream"
+    settings = get_settings()
+    experiment_prefix = f"{settings.s3_output_prefix}/{experiment_id}/{experiment_id}"
+    n_files = _S3_PREFETCH_CONCURRENCY * 2 + 3
+    listing = _make_listing(experiment_prefix, n_files=n_files)
+
+    fake = _FakeFileService(listing=listing, per_download_sleep=0.02)
+    set_file_service(fake)
+
+    archive = await _collect(_stream_s3_archive(experiment_id))
+
+    with tarfile.open(fileobj=io.BytesIO(archive), mode="r:gz") as tar:
+        members = tar.getmembers()
+        names = [m.name for m in members]
+        expected = [f"{experiment_id}/analyses/variant=0/plots/analysis={i}/output.tsv" for i in range(n_files)] + [
+            f"{experiment_id}/nextflow/workflow_config.json"
+        ]
+        assert names == expected
+        first = tar.extractfile(members[0])
+        assert first is not None
+        assert first.read() == f"content:{experiment_prefix}/analyses/variant=0/plots/analysis=0/output.tsv".encode()
+    assert 1 < fake.max_active <= _S3_PREFETCH_CONCURRENCY
+
+
+@pytest.mark.asyncio
+async def test_stream_s3_archive_fails_on_failed_object(_swap_file_service: None) -> None:
+    experiment_id = "test-exp-stream-fail"
+    settings = get_settings()
+    experiment_prefix = f"{settings.s3_output_prefix}/{experiment_id}/{experiment_id}"
+    listing = _make_listing(experiment_prefix, n_files=4)
+    failed = f"{experiment_prefix}/analyses/variant=0/plots/analysis=1/output.tsv"
+
+    set_file_service(_FakeFileService(listing=listing, fail_keys={failed}))
+
+    with pytest.raises(RuntimeError, match="simulated S3 failure"):
+        await _collect(_stream_s3_archive(experiment_id))
+
+
+@pytest.mark.asyncio
+async def test_prefetch_s3_objects_bounded_by_window_bytes(_swap_file_service: None) -> None:
+    """Listed sizes cap the prefetch window; an oversized object still goes through alone."""
+    listing = _make_listing("bucket/exp", n_files=0)
+    fake = _FakeFileService(listing=listing, per_download_sleep=0.01)
+    set_file_service(fake)
+
+    objects = [(f"bucket/exp/obj{i}", 40) for i in range(8)] + [("bucket/exp/huge", 1000)]
+    results = [item async for item in _prefetch_s3_objects(objects, concurrency=8, window_bytes=100)]
+
+    assert [key for key, _ in results] == [key for key, _ in objects]
+    assert all(content is not None for _, content in results)
+    assert fake.max_active == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_s3_archive_zstd(_swap_file_service: None) -> None:
+    experiment_id = "test-exp-stream-zst"
+    settings = get_settings()
+    experiment_prefix = f"{settings.s3_output_prefix}/{experiment_id}/{experiment_id}"
+    set_file_service(_FakeFileService(listing=_make_listing(experiment_prefix, n_files=3)))
+
+    archive = await _collect(_stream_s3_archive(experiment_id, ArchiveFormat.TAR_ZST, level=5))
+
+    assert archive_member_names(archive, ArchiveFormat.TAR_ZST) == [
+        *(f"{experiment_id}/analyses/variant=0/plots/analysis={i}/output.tsv" for i in range(3)),
+        f"{experiment_id}/nextflow/workflow_config.json",
+    ]
+
+
+# ---------------------------------------------------------------------------
+# _cached_archive_response — ETag / If-None-Match / Range over the archive cache
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture()
+def archive_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> ArchiveCache:
+    cache = ArchiveCache(tmp_path / "archives", max_bytes=1 << 30)
+    monkeypatch.setattr("sms_api.common.handlers.simulations.get_archive_cache", lambda: cache)
+    return cache
+
+
+def _counting_source(payload: bytes, calls: list[int]) -> Callable[[], AsyncIterator[bytes]]:
+    async def _gen() -> AsyncIterator[bytes]:
+        calls.append(1)
+        for i in range(0, len(payload), 1000):
+            yield payload[i : i + 1000]
+
+    return _gen
+
+
+@pytest.mark.asyncio
+async def test_cached_archive_response_streams_then_serves_from_disk(archive_cache: ArchiveCache) -> None:
+    key = archive_key("exp", ArchiveFormat.TAR, None, [("a.tsv", "etag-a", 10)])
+    payload = bytes(range(256)) * 40
+    calls: list[int] = []
+
+    first = await _cached_archive_response(
+        key, _counting_source(payload, calls), "exp.tar", as_file=False, if_none_match=None, range_requested=False
+    )
+    assert isinstance(first, StreamingResponse)
+    assert first.headers["etag"] == key.etag
+    assert await _collect(first.body_iterator) == payload  # type: ignore[arg-type]
+
+    second = await _cached_archive_response(
+        key, _counting_source(payload, calls), "exp.tar", as_file=False, if_none_match=None, range_requested=False
+    )
+    assert isinstance(second, FileResponse)
+    assert Path(second.path).read_bytes() == payload
+    assert second.headers["etag"] == key.etag
+    assert second.headers["content-disposition"] == 'attachment; filename="exp.tar"'
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_archive_response_not_modified(archive_cache: ArchiveCache) -> None:
+    key = archive_key("exp", ArchiveFormat.TAR_GZ, None, [("a.tsv", "etag-a", 10)])
+    calls: list[int] = []
+
+    response = await _cached_archive_response(
+        key, _counting_source(b"x", calls), "exp.tar.gz", as_file=False, if_none_match=key.etag, range_requested=False
+    )
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == key.etag
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_cached_archive_response_range_builds_first(archive_cache: ArchiveCache) -> None:
+    """A Range request on a cold cache waits for the whole archive so FileResponse can slice it."""
+    key = archive_key("exp", ArchiveFormat.TAR, None, [("a.tsv", "etag-a", 10)])
+    calls: list[int] = []
+
+    response = await _cached_archive_response(
+        key, _counting_source(b"y" * 5000, calls), "exp.tar", as_file=False, if_none_match=None, range_requested=True
+    )
+
+    assert isinstance(response, FileResponse)
+    assert archive_cache.lookup(key) == Path(response.path)
+    assert calls == [1]
+
+
+@pytest.mark.asyncio
+async def test_cached_archive_response_failed_s3_object_is_not_cached(
+    archive_cache: ArchiveCache, _swap_file_service: None
+) -> None:
+    """One failed S3 GET aborts the build: the response errors and no partial archive is kept."""
+    experiment_id = "test-exp-cache-fail"
+    settings = get_settings()
+    experiment_prefix = f"{settings.s3_output_prefix}/{experiment_id}/{experiment_id}"
+    listing = _make_listing(experiment_prefix, n_files=4)
+    failed = f"{experiment_prefix}/analyses/variant=0/plots/analysis=2/output.tsv"
+    set_file_service(_FakeFileService(listing=listing, fail_keys={failed}))
+    _, items = await _list_s3_archive_objects(experiment_id)
+    key = archive_key(experiment_id, ArchiveFormat.TAR, None, ((i.Key, i.ETag, i.Size) for i in items))
+
+    response = await _cached_archive_response(
+        key,
+        lambda: _stream_s3_archive(experiment_id, ArchiveFormat.TAR),
+        "exp.tar",
+        as_file=False,
+        if_none_match=None,
+        range_requested=False,
+    )
+    assert isinstance(response, StreamingResponse)
+    with pytest.raises(RuntimeError, match="failed"):
+        await _collect(response.body_iterator)  # type: ignore[arg-type]
+
+    assert archive_cache.lookup(key) is None
+    assert [p for p in archive_cache.root.rglob("*") if p.is_file()] == []
+    with pytest.raises(RuntimeError, match="failed"):
+        await archive_cache.build(key, lambda: _stream_s3_archive(experiment_id, ArchiveFormat.TAR))
+    assert archive_cache.lookup(key) is None
+
+
+# ---------------------------------------------------------------------------
+# _remote_archive_response — archive built on the login node and relayed over SSH
+# ---------------------------------------------------------------------------
+
+
+class _LocalShellSession:
+    """Stands in for an SSHSession by running the commands in a local shell."""
+
+    def __init__(self, has_zstd: bool) -> None:
+        self.has_zstd = has_zstd
+        self.commands: list[str] = []
+
+    async def run_command(self, command: str, check: bool = True) -> tuple[int, str, str]:
+        if not self.has_zstd:
+            command = command.replace("command -v zstd", "false")
+        process = await asyncio.create_subprocess_shell(
+            command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await process.communicate()
+        return process.returncode or 0, stdout.decode(), stderr.decode()
+
+    async def stream_command(self, command: str, chunk_size: int = 64 * 1024) -> AsyncIterator[bytes]:
+        self.commands.append(command)
+        process = await asyncio.create_subprocess_shell(command, stdout=asyncio.subprocess.PIPE)
+        assert process.stdout is not None
+        while chunk := await process.stdout.read(chunk_size):
+            yield chunk
+        assert await process.wait() == 0
+
+
+@pytest.fixture()
+def local_shell(monkeypatch: pytest.MonkeyPatch) -> Callable[[bool], _LocalShellSession]:
+    def _install(has_zstd: bool) -> _LocalShellSession:
+        session = _LocalShellSession(has_zstd)
+
+        @asynccontextmanager
+        async def _session() -> AsyncIterator[_LocalShellSession]:
+            yield session
+
+        monkeypatch.setattr(
+            "sms_api.common.handlers.simulations.get_ssh_session_service",
+            lambda target: MagicMock(session=_session),
+        )
+        return session
+
+    return _install
+
+
+def _analysis_outputs(root: Path) -> HPCFilePath:
+    outdir = root / "exp1" / "analyses"
+    (outdir / "variant=0" / "lineage_seed=1").mkdir(parents=True)
+    (outdir / "variant=0" / "lineage_seed=1" / "mass.tsv").write_text("a\tb\n")
+    (outdir / "plot one.html").write_text("<html/>")
+    (outdir / "scratch.parquet").write_bytes(b"not an omics output")
+    return HPCFilePath(remote_path=outdir)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("archive_format", "has_zstd"),
+    [(ArchiveFormat.TAR_GZ, False), (ArchiveFormat.TAR_ZST, True), (ArchiveFormat.TAR_ZST, False)],
+)
+async def test_remote_archive_response_streams_remote_tar(
+    tmp_path: Path,
+    local_shell: Callable[[bool], _LocalShellSession],
+    archive_format: ArchiveFormat,
+    has_zstd: bool,
+) -> None:
+    session = local_shell(has_zstd)
+    outdir = _analysis_outputs(tmp_path)
+
+    response = await _remote_archive_response(outdir, "exp1", archive_format, None, archive_name="exp1.tar")
+    content = await _collect(response.body_iterator)  # type: ignore[arg-type]
+
+    assert sorted(archive_member_names(content, archive_format)) == [
+        "exp1/plot one.html",
+        "exp1/variant=0/lineage_seed=1/mass.tsv",
+    ]
+    assert response.headers["content-disposition"] == 'attachment; filename="exp1.tar"'
+    assert "etag" not in response.headers
+    assert ("zstd" in session.commands[0]) == (archive_format == ArchiveFormat.TAR_ZST and has_zstd)
+
+
+@pytest.mark.asyncio
+async def test_remote_archive_response_missing_directory(
+    tmp_path: Path, local_shell: Callable[[bool], _LocalShellSession]
+) -> None:
+    session = local_shell(True)
+
+    with pytest.raises(ValueError, match="not found"):
+        await _remote_archive_response(
+            HPCFilePath(remote_path=tmp_path / "missing"),
+            "exp1",
+            ArchiveFormat.TAR_GZ,
+            None,
+            archive_name="exp1.tar.gz",
+        )
+    assert session.commands == []
+
+
+# ---------------------------------------------------------------------------
+# stream_simulation_events — SSE of status transitions and ingested worker events
+# ---------------------------------------------------------------------------
+
+
+class _IdleSlurmSource(JobStatusSource):
+    backend = JobBackend.SLURM
+
+    async def get_statuses(self, job_ids: list[JobId]) -> list[JobStatusInfo]:
+        return []
+
+
+def _events_database_service(hpc_run: HpcRun) -> MagicMock:
+    db = MagicMock()
+    db.get_simulation = AsyncMock(return_value=MagicMock())
+    db.get_hpcrun_by_ref = AsyncMock(return_value=hpc_run)
+    db.list_active_hpcruns = AsyncMock(return_value=[hpc_run])
+    db.update_hpcrun_status = AsyncMock()
+    db.get_hpcrun_id_by_correlation_id = AsyncMock(return_value=hpc_run.database_id)
+
+    async def _insert_worker_events(worker_events: list[WorkerEvent]) -> list[WorkerEvent]:
+        return [event.model_copy(update={"database_id": i}) for i, event in enumerate(worker_events, start=1)]
+
+    db.insert_worker_events = AsyncMock(side_effect=_insert_worker_events)
+    return db
+
+
+@pytest.mark.asyncio
+async def test_stream_simulation_events_pushes_worker_events_and_ends_on_terminal_status(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    hpc_run = HpcRun(
+        database_id=3,
+        job_id=JobId.slurm(42),
+        correlation_id="corr-3",
+        job_type=JobType.SIMULATION,
+        ref_id=7,
+        status=JobStatus.RUNNING,
+    )
+    db = _events_database_service(hpc_run)
+    watcher = JobStatusWatcher(database_service=db, sources=[_IdleSlurmSource()])
+    messaging = MagicMock()
+    messaging.subscribe = AsyncMock()
+    scheduler = JobScheduler(messaging_service=messaging, database_service=db, status_watcher=watcher)
+    await scheduler.subscribe()
+    on_message = messaging.subscribe.call_args.kwargs["callback"]
+    monkeypatch.setattr("sms_api.common.handlers.simulations.get_job_status_watcher", lambda: watcher)
+    monkeypatch.setattr("sms_api.common.handlers.simulations.get_job_scheduler", lambda: scheduler)
+
+    await watcher.start(interval_seconds=3600)
+    try:
+        await asyncio.sleep(0)  # first resync picks up the running job
+        stream = await stream_simulation_events(db_service=db, simulation_id=7)
+        chunks = [await anext(stream)]
+        payload = WorkerEventMessagePayload(
+            correlation_id="corr-3", sequence_number=1, time=2.0, mass={"dry": 1.5}, bulk=None
+        )
+        await on_message(payload.model_dump_json().encode())
+        chunks.append(await anext(stream))
+        await watcher.apply(JobStatusInfo(job_id=hpc_run.job_id, status=JobStatus.COMPLETED))
+        chunks.extend([chunk async for chunk in stream])
+    finally:
+        await watcher.stop()
+        await scheduler.worker_event_ingestor.stop()
+
+    events = list(iter_sse_events("".join(chunks).splitlines()))
+    assert [event.event for event in events] == ["status", "worker_event", "status"]
+    assert SimulationRun.model_validate_json(events[0].data).status == JobStatus.RUNNING
+    worker_event = WorkerEvent.model_validate_json(events[1].data)
+    assert (worker_event.hpcrun_id, worker_event.time, worker_event.mass) == (3, 2.0, {"dry": 1.5})
+    assert SimulationRun.model_validate_json(events[2].data) == SimulationRun(id=7, status=JobStatus.COMPLETED)
+    assert scheduler._worker_event_listeners == {}  # unsubscribed once the stream ended
+
+
+@pytest.mark.asyncio
+async def test_stream_simulation_events_keepalive_then_recheck(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Without a watcher, the stream re-checks the status after each idle interval."""
+    hpc_run = HpcRun(
+        database_id=3,
+        job_id=JobId.slurm(42),
+        correlation_id="corr-3",
+        job_type=JobType.SIMULATION,
+        ref_id=7,
+        status=JobStatus.RUNNING,
+    )
+    db = _events_database_service(hpc_run)
+    statuses = iter([JobStatus.RUNNING, JobStatus.RUNNING, JobStatus.FAILED])
+    simulation_service = MagicMock()
+    simulation_service.get_job_status = AsyncMock(
+        side_effect=lambda job_id: JobStatusInfo(job_id=job_id, status=next(statuses))
+    )
+    monkeypatch.setattr("sms_api.common.handlers.simulations.get_job_status_watcher", lambda: None)
+    monkeypatch.setattr("sms_api.common.handlers.simulations.get_job_scheduler", lambda: None)
+    monkeypatch.setattr(
+        "sms_api.common.handlers.simulations.get_simulation_service_for_job", lambda job_id: simulation_service
+    )
+
+    stream = await stream_simulation_events(db_service=db, simulation_id=7, keepalive_seconds=0.01)
+    body = "".join([chunk async for chunk in stream])
+
+    assert body.count(": keepalive") == 1
+    assert [event.event for event in iter_sse_events(body.splitlines())] == ["status", "status"]
+    db.update_hpcrun_status.assert_awaited_once()
+
+
+# ---------------------------------------------------------------------------
+# list_simulation_worker_events — keyset pages of raw or bucketed worker events
+# ---------------------------------------------------------------------------
+
+
+def _worker_events_database_service(n_events: int) -> MagicMock:
+    events = [
+        WorkerEvent(correlation_id="corr-3", sequence_number=i, time=float(i), mass={"dry": float(i)}, hpcrun_id=3)
+        for i in range(n_events)
+    ]
+    series = WorkerEventSeries.from_worker_events(3, events)
+
+    async def _list_worker_events(
+        hpcrun_id: int, prev_sequence_number: int | None = None, limit: int | None = None
+    ) -> list[WorkerEvent]:
+        after = [e for e in events if prev_sequence_number is None or e.sequence_number > prev_sequence_number]
+        return after[:limit]
+
+    async def _get_worker_event_series(
+        hpcrun_id: int,
+        start_sequence_number: int | None = None,
+        end_sequence_number: int | None = None,
+        limit: int | None = None,
+    ) -> WorkerEventSeries:
+        selected = series.select(start_sequence_number, end_sequence_number)
+        return selected if limit is None else selected.head(limit)
+
+    db = MagicMock()
+    db.get_hpcrun_by_ref = AsyncMock(
+        return_value=HpcRun(
+            database_id=3, job_id=JobId.slurm(42), correlation_id="corr-3", job_type=JobType.SIMULATION, ref_id=7
+        )
+    )
+    db.list_worker_events = AsyncMock(side_effect=_list_worker_events)
+    db.get_worker_event_series = AsyncMock(side_effect=_get_worker_event_series)
+    return db
+
+
+@pytest.mark.asyncio
+async def test_list_simulation_worker_events_pages_by_sequence_number() -> None:
+    db = _worker_events_database_service(n_events=5)
+
+    first = await list_simulation_worker_events(db_service=db, simulation_id=7, limit=2)
+    second = await list_simulation_worker_events(
+        db_service=db, simulation_id=7, after_seq=first.next_after_seq, limit=3
+    )
+
+    assert [e.sequence_number for e in first.events] == [0, 1]
+    assert (first.next_after_seq, first.has_more, first.buckets) == (1, True, None)
+    assert [e.sequence_number for e in second.events] == [2, 3, 4]
+    assert (second.next_after_seq, second.has_more) == (4, False)
+
+
+@pytest.mark.asyncio
+async def test_list_simulation_worker_events_downsamples_into_buckets(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("sms_api.common.handlers.simulations.WORKER_EVENTS_SCAN_SIZE", 4)
+    db = _worker_events_database_service(n_events=25)  # times 0..24, 10 s buckets: [0, 10), [10, 20), [20, 25)
+
+    first = await list_simulation_worker_events(db_service=db, simulation_id=7, limit=2, bucket_seconds=10.0)
+    rest = await list_simulation_worker_events(
+        db_service=db, simulation_id=7, after_seq=first.next_after_seq, limit=2, bucket_seconds=10.0
+    )
+
+    assert first.buckets is not None and rest.buckets is not None
+    assert [(b.start_time, b.n_events) for b in first.buckets] == [(0.0, 10), (10.0, 10)]
+    bucket = first.buckets[1]
+    assert (bucket.first_sequence_number, bucket.last_sequence_number) == (10, 19)
+    assert (bucket.mass_min, bucket.mass_max, bucket.mass_mean) == ({"dry": 10.0}, {"dry": 19.0}, {"dry": 14.5})
+    assert (first.next_after_seq, first.has_more) == (19, True)
+    assert [(b.start_time, b.n_events) for b in rest.buckets] == [(20.0, 5)]
+    assert (rest.next_after_seq, rest.has_more) == (24, False)
+
+
+@pytest.mark.asyncio
+async def test_list_simulation_worker_events_unknown_simulation() -> None:
+    db = _worker_events_database_service(n_events=0)
+    db.get_hpcrun_by_ref = AsyncMock(return_value=None)
+    with pytest.raises(ValueError, match="No HPC run"):
+        await list_simulation_worker_events(db_service=db, simulation_id=7)
@@ -0,0 +1,94 @@
+"""Archive codecs: block-parallel tar.zst / tar.gz output must decode as one ordinary
+archive with standard tools, and plain tar must pass bytes through untouched."""
+
+import gzip
+import io
+import os
+import tarfile
+from pathlib import Path
+
+import pytest
+
+from sms_api.common.storage.archive import (
+    ArchiveCompressor,
+    ArchiveFormat,
+    archive_member_names,
+    extract_archive,
+    resolve_compression_level,
+    write_archive,
+)
+
+
+def _tar_bytes(files: dict[str, bytes]) -> bytes:
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w") as tar:
+        for name, data in files.items():
+            info = tarfile.TarInfo(name=name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return buf.getvalue()
+
+
+def _compress_in_pieces(compressor: ArchiveCompressor, data: bytes, piece: int) -> bytes:
+    out = bytearray()
+    for i in range(0, len(data), piece):
+        out += compressor.write(data[i : i + piece])
+    out += compressor.close()
+    return bytes(out)
+
+
+@pytest.mark.parametrize("archive_format", list(ArchiveFormat))
+def test_compressor_multi_block_round_trip(archive_format: ArchiveFormat) -> None:
+    files = {f"exp/file{i}.tsv": os.urandom(3000) + b"a" * 5000 for i in range(20)}
+    raw = _tar_bytes(files)
+    compressor = ArchiveCompressor(archive_format, block_size=16 * 1024)
+
+    encoded = _compress_in_pieces(compressor, raw, piece=7000)
+
+    assert archive_member_names(encoded, archive_format) == list(files)
+    if archive_format == ArchiveFormat.TAR:
+        assert encoded == raw
+    elif archive_format == ArchiveFormat.TAR_GZ:
+        # Many independent members, still one gzip stream to standard decoders.
+        assert gzip.decompress(encoded) == raw
+
+
+def test_compressor_empty_stream_is_valid() -> None:
+    encoded = ArchiveCompressor(ArchiveFormat.TAR_GZ).close()
+    assert gzip.decompress(encoded) == b""
+
+
+@pytest.mark.parametrize(
+    ("archive_format", "level", "expected"),
+    [
+        (ArchiveFormat.TAR_GZ, None, 6),
+        (ArchiveFormat.TAR_ZST, None, 3),
+        (ArchiveFormat.TAR_ZST, 19, 19),
+        (ArchiveFormat.TAR, None, None),
+    ],
+)
+def test_resolve_compression_level(archive_format: ArchiveFormat, level: int | None, expected: int | None) -> None:
+    assert resolve_compression_level(archive_format, level) == expected
+
+
+@pytest.mark.parametrize(
+    ("archive_format", "level"), [(ArchiveFormat.TAR_GZ, 10), (ArchiveFormat.TAR_ZST, 0), (ArchiveFormat.TAR, 1)]
+)
+def test_resolve_compression_level_rejects(archive_format: ArchiveFormat, level: int) -> None:
+    with pytest.raises(ValueError, match="level"):
+        resolve_compression_level(archive_format, level)
+
+
+@pytest.mark.parametrize("archive_format", list(ArchiveFormat))
+def test_write_and_extract_archive(tmp_path: Path, archive_format: ArchiveFormat) -> None:
+    src = tmp_path / "exp-1"
+    (src / "analyses").mkdir(parents=True)
+    (src / "analyses" / "out.tsv").write_text("a\tb\n1\t2\n")
+    (src / "workflow_config.json").write_text("{}")
+
+    archive = write_archive(src, tmp_path / f"exp-1.{archive_format}", archive_format)
+    dest = tmp_path / "dest"
+    extract_archive(archive, dest, archive_format)
+
+    assert (dest / "exp-1" / "analyses" / "out.tsv").read_text() == "a\tb\n1\t2\n"
+    assert (dest / "exp-1" / "workflow_config.json").read_text() == "{}"
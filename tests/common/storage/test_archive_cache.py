@@ -0,0 +1,141 @@
+"""ArchiveCache: single-flight builds that outlive their clients, content-addressed keys,
+and LRU eviction by total bytes."""
+
+import asyncio
+import os
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+from pathlib import Path
+
+import pytest
+
+from sms_api.common.storage.archive import ArchiveFormat
+from sms_api.common.storage.archive_cache import ArchiveCache, archive_key, etag_matches
+
+
+def _source(
+    chunks: list[bytes], calls: list[int], delay: float = 0.0, fail_after: int | None = None
+) -> Callable[[], AsyncIterator[bytes]]:
+    async def _gen() -> AsyncIterator[bytes]:
+        calls.append(1)
+        for i, chunk in enumerate(chunks):
+            if fail_after is not None and i == fail_after:
+                raise RuntimeError("source failed")
+            await asyncio.sleep(delay)
+            yield chunk
+
+    return _gen
+
+
+async def _collect(stream: AsyncIterator[bytes]) -> bytes:
+    return b"".join([chunk async for chunk in stream])
+
+
+def test_archive_key_is_order_independent_and_tracks_versions() -> None:
+    entries = [("a.tsv", "e1", 10), ("b.tsv", "e2", 20)]
+    key = archive_key("exp", ArchiveFormat.TAR_GZ, None, entries)
+
+    assert key == archive_key("exp", ArchiveFormat.TAR_GZ, 6, list(reversed(entries)))
+    assert key != archive_key("exp", ArchiveFormat.TAR_GZ, None, [("a.tsv", "e1-new", 10), ("b.tsv", "e2", 20)])
+    assert key != archive_key("exp", ArchiveFormat.TAR_ZST, None, entries)
+    assert key.etag == f'"{key.digest}"'
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [(None, False), ('"abc"', True), ('W/"abc"', True), ('"x", "abc"', True), ("*", True), ('"x"', False)],
+)
+def test_etag_matches(header: str | None, expected: bool) -> None:
+    assert etag_matches(header, '"abc"') is expected
+
+
+@pytest.mark.asyncio
+async def test_concurrent_streams_share_one_build(tmp_path: Path) -> None:
+    cache = ArchiveCache(tmp_path, max_bytes=1 << 20)
+    key = archive_key("exp", ArchiveFormat.TAR, None, [("a", "1", 1)])
+    chunks = [bytes([i]) * 100 for i in range(10)]
+    calls: list[int] = []
+
+    results = await asyncio.gather(
+        _collect(cache.stream(key, _source(chunks, calls, delay=0.005))),
+        _collect(cache.stream(key, _source(chunks, calls, delay=0.005))),
+        cache.build(key, _source(chunks, calls, delay=0.005)),
+    )
+
+    assert results[0] == results[1] == b"".join(chunks)
+    assert results[2] == cache.entry_path(key)
+    assert results[2].read_bytes() == b"".join(chunks)
+    assert calls == [1]
+
+
+@pytest.mark.asyncio
+async def test_build_outlives_a_disconnected_client(tmp_path: Path) -> None:
+    cache = ArchiveCache(tmp_path, max_bytes=1 << 20)
+    key = archive_key("exp", ArchiveFormat.TAR, None, [("a", "1", 1)])
+    chunks = [b"x" * 100] * 5
+    calls: list[int] = []
+
+    stream = cache.stream(key, _source(chunks, calls, delay=0.005))
+    assert isinstance(stream, AsyncGenerator)
+    assert await anext(stream) == chunks[0]
+    await stream.aclose()  # client went away after the first chunk
+
+    path = await cache.build(key, _source(chunks, calls))
+    assert path.read_bytes() == b"".join(chunks)
+    assert calls == [1]
+
+
+@pytest.mark.asyncio
+async def test_failed_build_leaves_no_entry(tmp_path: Path) -> None:
+    cache = ArchiveCache(tmp_path, max_bytes=1 << 20)
+    key = archive_key("exp", ArchiveFormat.TAR, None, [("a", "1", 1)])
+    calls: list[int] = []
+
+    with pytest.raises(RuntimeError, match="failed"):
+        await _collect(cache.stream(key, _source([b"a", b"b", b"c"], calls, fail_after=2)))
+    with pytest.raises(RuntimeError, match="failed"):
+        await cache.build(key, _source([b"a"], calls, fail_after=0))
+
+    assert cache.lookup(key) is None
+    assert list((tmp_path / "exp").iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_new_listing_supersedes_and_lru_evicts(tmp_path: Path) -> None:
+    cache = ArchiveCache(tmp_path, max_bytes=250)
+    calls: list[int] = []
+
+    old = archive_key("exp-a", ArchiveFormat.TAR, None, [("a", "1", 1)])
+    new = archive_key("exp-a", ArchiveFormat.TAR, None, [("a", "2", 1)])
+    await cache.build(old, _source([b"o" * 100], calls))
+    await cache.build(new, _source([b"n" * 100], calls))
+    assert cache.lookup(old) is None  # superseded by the new listing of the same experiment
+
+    other = archive_key("exp-b", ArchiveFormat.TAR, None, [("b", "1", 1)])
+    await cache.build(other, _source([b"b" * 100], calls))
+    os.utime(cache.entry_path(new), (1, 1))  # make exp-a the least recently used
+    third = archive_key("exp-c", ArchiveFormat.TAR, None, [("c", "1", 1)])
+    await cache.build(third, _source([b"c" * 100], calls))
+
+    assert cache.lookup(new) is None
+    assert cache.lookup(other) is not None
+    assert cache.lookup(third) is not None
+
+
+@pytest.mark.asyncio
+async def test_compression_levels_of_one_listing_coexist_until_superseded(tmp_path: Path) -> None:
+    cache = ArchiveCache(tmp_path, max_bytes=10_000)
+    calls: list[int] = []
+    entries = [("a", "1", 1)]
+
+    fast = archive_key("exp", ArchiveFormat.TAR_GZ, 1, entries)
+    best = archive_key("exp", ArchiveFormat.TAR_GZ, 9, entries)
+    await cache.build(fast, _source([b"f"], calls))
+    await cache.build(best, _source([b"b"], calls))
+    assert fast.etag != best.etag
+    assert cache.lookup(fast) is not None  # another level of the same listing is not superseded
+
+    changed = archive_key("exp", ArchiveFormat.TAR_GZ, 1, [("a", "2", 1)])
+    await cache.build(changed, _source([b"c"], calls))
+    assert cache.lookup(fast) is None
+    assert cache.lookup(best) is None
+    assert cache.lookup(changed) is not None
@@ -1,10 +1,16 @@
 """Tests for the messaging service abstraction with Redis implementation."""
 
 import asyncio
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import Any
 
 import pytest
 
 from sms_api.common.messaging.messaging_service_redis import MessagingServiceRedis
+from sms_api.common.messaging.messaging_service_redis_streams import MessagingServiceRedisStreams
+
+StreamsFactory = Callable[[str], Awaitable[MessagingServiceRedisStreams]]
 
 
 @pytest.mark.asyncio
@@ -95,3 +101,154 @@ async def test_redis_connection_status(redis_subscriber_service: MessagingServic
 
     await redis_subscriber_service.disconnect()
     assert not redis_subscriber_service.is_connected()
+
+
+@pytest.mark.asyncio
+async def test_redis_streams_delivers_messages_published_before_subscribing(
+    redis_streams_consumer_factory: StreamsFactory,
+) -> None:
+    """A stream keeps messages until the consumer group reads them (unlike pub/sub)."""
+    subject = f"stream-{uuid.uuid4().hex[:8]}"
+    producer = await redis_streams_consumer_factory("producer")
+    for i in range(3):
+        await producer.publish(subject, f"early {i}".encode())
+
+    received: list[bytes] = []
+    done = asyncio.Event()
+
+    async def handler(data: bytes) -> None:
+        received.append(data)
+        if len(received) == 3:
+            done.set()
+
+    consumer = await redis_streams_consumer_factory("consumer-a")
+    await consumer.subscribe(subject, callback=handler)
+    await asyncio.wait_for(done.wait(), timeout=5.0)
+    assert sorted(received) == [b"early 0", b"early 1", b"early 2"]
+
+
+@pytest.mark.asyncio
+async def test_redis_streams_consumers_share_the_load_without_duplicates(
+    redis_streams_consumer_factory: StreamsFactory,
+) -> None:
+    subject = f"stream-{uuid.uuid4().hex[:8]}"
+    expected = {f"message {i}".encode() for i in range(50)}
+    by_consumer: dict[str, list[bytes]] = {"a": [], "b": []}
+    done = asyncio.Event()
+
+    def handler_for(name: str) -> Callable[[bytes], Awaitable[None]]:
+        async def handler(data: bytes) -> None:
+            by_consumer[name].append(data)
+            await asyncio.sleep(0.01)
+            if sum(len(messages) for messages in by_consumer.values()) >= len(expected):
+                done.set()
+
+        return handler
+
+    for name in by_consumer:
+        service = await redis_streams_consumer_factory(f"consumer-{name}")
+        await service.subscribe(subject, callback=handler_for(name))
+    producer = await redis_streams_consumer_factory("producer")
+    for message in sorted(expected):
+        await producer.publish(subject, message)
+
+    await asyncio.wait_for(done.wait(), timeout=10.0)
+    delivered = by_consumer["a"] + by_consumer["b"]
+    assert len(delivered) == len(expected)
+    assert set(delivered) == expected
+
+
+# ---------------------------------------------------------------------------
+# MessagingServiceRedisStreams dispatch — in-memory stand-in for the Redis client
+# ---------------------------------------------------------------------------
+
+
+class _FakeStreamsClient:
+    def __init__(self, batches: list[list[tuple[bytes, dict[bytes, bytes] | None]]], pending: list[Any] | None = None):
+        self.batches = batches
+        self.pending = pending or []
+        self.acked: list[bytes] = []
+        self.reads: list[dict[Any, Any]] = []
+
+    async def xreadgroup(
+        self, group: str, consumer: str, streams: dict[Any, Any], count: int | None = None, block: int | None = None
+    ) -> list[Any]:
+        self.reads.append(streams)
+        if ">" not in streams.values():
+            pending, self.pending = self.pending, []
+            return [[b"events", pending]] if pending else []
+        if self.batches:
+            return [[b"events", self.batches.pop(0)]]
+        await asyncio.sleep((block or 0) / 1000)
+        return []
+
+    async def xgroup_create(self, *args: Any, **kwargs: Any) -> bool:
+        return True
+
+    async def xautoclaim(self, *args: Any, **kwargs: Any) -> list[Any]:
+        return [b"0-0", [], []]
+
+    async def xack(self, stream: str, group: str, message_id: bytes) -> int:
+        self.acked.append(message_id)
+        return 1
+
+    async def close(self) -> None:
+        pass
+
+
+def _streams_service(client: _FakeStreamsClient, max_concurrency: int) -> MessagingServiceRedisStreams:
+    service = MessagingServiceRedisStreams(consumer="test", max_concurrency=max_concurrency, block_ms=10)
+    service._client = client  # type: ignore[assignment]
+    return service
+
+
+@pytest.mark.asyncio
+async def test_redis_streams_dispatches_a_batch_concurrently_and_acks_each_message() -> None:
+    batch: list[tuple[bytes, dict[bytes, bytes] | None]] = [(f"1-{i}".encode(), {b"data": b"x"}) for i in range(12)]
+    client = _FakeStreamsClient(batches=[batch])
+    service = _streams_service(client, max_concurrency=4)
+    running = 0
+    peak = 0
+
+    async def handler(data: bytes) -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.02)
+        running -= 1
+
+    await service.subscribe("events", callback=handler)
+    for _ in range(200):
+        if len(client.acked) == len(batch):
+            break
+        await asyncio.sleep(0.01)
+    await service.disconnect()
+
+    assert peak == 4
+    assert sorted(client.acked) == sorted(message_id for message_id, _ in batch)
+
+
+@pytest.mark.asyncio
+async def test_redis_streams_replays_pending_and_acks_failed_or_trimmed_messages() -> None:
+    client = _FakeStreamsClient(
+        batches=[[(b"2-0", {b"data": b"boom"})]],
+        pending=[(b"1-0", {b"data": b"left over"}), (b"1-1", None)],
+    )
+    service = _streams_service(client, max_concurrency=2)
+    handled: list[bytes] = []
+
+    async def handler(data: bytes) -> None:
+        handled.append(data)
+        if data == b"boom":
+            raise RuntimeError("handler failed")
+
+    await service.subscribe("events", callback=handler)
+    for _ in range(200):
+        if len(client.acked) == 3:
+            break
+        await asyncio.sleep(0.01)
+    await service.disconnect()
+
+    assert client.reads[0] == {"events": "0"}  # this consumer's pending entries come first
+    assert handled == [b"left over", b"boom"]
+    assert client.acked == [b"1-0", b"1-1", b"2-0"]
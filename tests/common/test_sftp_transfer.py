@@ -0,0 +1,142 @@
+"""SFTPBulkDownloader against an in-memory fake connection: small files via one tar stream,
+large ones via concurrent SFTP gets, layout preserved, present files skipped, tar fallback."""
+
+import io
+import shlex
+import tarfile
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from sms_api.common.ssh.sftp_transfer import SFTPBulkDownloader
+from sms_api.common.storage.file_paths import HPCFilePath
+
+BASE = "/remote/exp1/analyses"
+
+
+class _FakeSFTP:
+    def __init__(self, files: dict[str, bytes]) -> None:
+        self.files = files
+        self.gets: list[str] = []
+
+    async def stat(self, path: str) -> SimpleNamespace:
+        return SimpleNamespace(size=len(self.files[path]))
+
+    async def get(self, remote_path: str, local_path: Path, max_requests: int = -1) -> None:
+        self.gets.append(remote_path)
+        local_path.write_bytes(self.files[remote_path])
+
+
+class _FakeStdout:
+    def __init__(self, data: bytes) -> None:
+        self._data = io.BytesIO(data)
+
+    async def read(self, n: int) -> bytes:
+        return self._data.read(n)
+
+
+class _FakeConnection:
+    def __init__(self, files: dict[str, bytes], tar_exit_status: int = 0) -> None:
+        self.sftp = _FakeSFTP(files)
+        self.files = files
+        self.tar_exit_status = tar_exit_status
+        self.commands: list[str] = []
+
+    @asynccontextmanager
+    async def start_sftp_client(self) -> AsyncIterator[_FakeSFTP]:
+        yield self.sftp
+
+    async def create_process(self, command: str, input: bytes, encoding: None) -> SimpleNamespace:
+        self.commands.append(command)
+        base = shlex.split(command)[4]  # tar -cf - -C <base> ...
+        buffer = io.BytesIO()
+        if self.tar_exit_status == 0:
+            with tarfile.open(fileobj=buffer, mode="w") as tar:
+                for name in input.decode().split("\0")[:-1]:
+                    data = self.files[f"{base}/{name}"]
+                    info = tarfile.TarInfo(name)
+                    info.size = len(data)
+                    tar.addfile(info, io.BytesIO(data))
+
+        async def _wait() -> SimpleNamespace:
+            return SimpleNamespace(exit_status=self.tar_exit_status, stderr=b"tar: error")
+
+        return SimpleNamespace(stdout=_FakeStdout(buffer.getvalue()), wait=_wait)
+
+
+def _files() -> dict[str, bytes]:
+    return {
+        f"{BASE}/single/mass.tsv": b"a\tb\n1\t2\n",
+        f"{BASE}/multiseed/variant=0/mass.tsv": b"x\n",
+        f"{BASE}/multiseed/variant=0/plot.html": b"<html/>",
+        f"{BASE}/multigeneration/big.csv": b"0" * 4096,
+    }
+
+
+def _mapping(local_dir: Path, files: dict[str, bytes]) -> list[tuple[HPCFilePath, Path]]:
+    return [(HPCFilePath(remote_path=Path(path)), local_dir / Path(path).relative_to(BASE)) for path in files]
+
+
+@pytest.mark.asyncio
+async def test_small_files_come_in_one_tar_stream_and_large_ones_over_sftp(tmp_path: Path) -> None:
+    files = _files()
+    conn = _FakeConnection(files)
+    downloader = SFTPBulkDownloader(conn, small_file_bytes=1024)  # type: ignore[arg-type]
+
+    stats = await downloader.download(_mapping(tmp_path, files))
+
+    for path, data in files.items():
+        assert (tmp_path / Path(path).relative_to(BASE)).read_bytes() == data
+    assert len(conn.commands) == 1 and "--null -T -" in conn.commands[0]
+    assert conn.sftp.gets == [f"{BASE}/multigeneration/big.csv"]
+    assert sorted((t.method, t.files) for t in stats.transfers) == [("sftp", 1), ("tar", 3)]
+    assert stats.files == 4 and stats.bytes > 4096
+    assert not list(tmp_path.rglob("*.part"))
+
+
+@pytest.mark.asyncio
+async def test_files_already_present_are_skipped(tmp_path: Path) -> None:
+    files = _files()
+    conn = _FakeConnection(files)
+    mapping = _mapping(tmp_path, files)
+    for _, local in mapping[:3]:
+        local.parent.mkdir(parents=True, exist_ok=True)
+        local.write_bytes(b"cached")
+
+    stats = await SFTPBulkDownloader(conn, small_file_bytes=1024).download(mapping)  # type: ignore[arg-type]
+
+    assert stats.skipped == 3
+    assert conn.commands == []
+    assert conn.sftp.gets == [f"{BASE}/multigeneration/big.csv"]
+    assert mapping[0][1].read_bytes() == b"cached"
+
+
+@pytest.mark.asyncio
+async def test_failed_tar_stream_falls_back_to_sftp(tmp_path: Path) -> None:
+    files = _files()
+    conn = _FakeConnection(files, tar_exit_status=2)
+
+    stats = await SFTPBulkDownloader(conn, small_file_bytes=1024).download(_mapping(tmp_path, files))  # type: ignore[arg-type]
+
+    assert sorted(conn.sftp.gets) == sorted(files)
+    assert {t.method for t in stats.transfers} == {"sftp"}
+    for path, data in files.items():
+        assert (tmp_path / Path(path).relative_to(BASE)).read_bytes() == data
+
+
+@pytest.mark.asyncio
+async def test_failures_are_raised_after_the_other_files(tmp_path: Path) -> None:
+    files = _files()
+    conn = _FakeConnection(files)
+
+    async def _failing_get(remote_path: str, local_path: Path, max_requests: int = -1) -> None:
+        raise OSError("permission denied")
+
+    conn.sftp.get = _failing_get  # type: ignore[method-assign]
+
+    with pytest.raises(RuntimeError, match="1 transfer"):
+        await SFTPBulkDownloader(conn, small_file_bytes=1024).download(_mapping(tmp_path, files))  # type: ignore[arg-type]
+    assert (tmp_path / "single" / "mass.tsv").exists()  # the tar-streamed files still landed
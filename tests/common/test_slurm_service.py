@@ -3,13 +3,14 @@ import tempfile
 import uuid
 from dataclasses import dataclass
 from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from sms_api.common.hpc.models import SlurmJob
-from sms_api.common.hpc.slurm_service import SlurmService
+from sms_api.common.hpc.slurm_service import SlurmService, TerminalJobCache
 from sms_api.common.models import SSHTarget
-from sms_api.common.ssh.ssh_service import SSHSessionService
+from sms_api.common.ssh.ssh_service import SSHSession, SSHSessionService
 from sms_api.common.storage.file_paths import HPCFilePath
 from sms_api.config import get_settings
 from sms_api.dependencies import get_ssh_session_service
@@ -102,6 +103,133 @@ def test_slurm_job_from_scontrol_output_cancelled_with_reason() -> None:
     assert job.exit_code == "0:15"
 
 
+def _scontrol_line(job_id: int, state: str) -> str:
+    end_time = "2026-01-14T12:05:00" if state == "COMPLETED" else "Unknown"
+    return (
+        f"JobId={job_id} JobName=sim-{job_id} UserId=svc_vivarium(12345) GroupId=pi-agmon(67890) "
+        f"Account=pi-agmon QOS=normal JobState={state} Reason=None ExitCode=0:0 RunTime=00:05:00 "
+        f"StartTime=2026-01-14T12:00:00 EndTime={end_time}"
+    )
+
+
+def _fake_ssh(responses: dict[str, tuple[int, str, str]]) -> tuple[SSHSession, list[str]]:
+    """SSHSession over a fake connection that answers commands from ``responses``."""
+    commands: list[str] = []
+
+    async def _run(command: str, check: bool = False) -> MagicMock:
+        commands.append(command)
+        returncode, stdout, stderr = responses[command]
+        return MagicMock(stdout=stdout, stderr=stderr, returncode=returncode)
+
+    mock_conn = MagicMock()
+    mock_conn.run = AsyncMock(side_effect=_run)
+    return SSHSession(mock_conn, "test-host"), commands
+
+
+def _squeue_command(job_ids: str | None = None) -> str:
+    fields = f'--noheader --states=all --format="{SlurmJob.get_squeue_status_format_string()}"'
+    return f"squeue {fields} -j {job_ids}" if job_ids is not None else f"squeue -u $USER {fields}"
+
+
+def _squeue_row(job_id: int, state: str) -> str:
+    return f"{job_id}|sim-{job_id}|pi-agmon|svc_vivarium|{state}|2026-01-14T12:00:00|5:00|None"
+
+
+@pytest.mark.asyncio
+async def test_get_job_statuses_queries_only_our_jobs_in_one_squeue() -> None:
+    """Live jobs come from one `squeue -j` for just the requested IDs, never a cluster-wide listing."""
+    stdout = "\n".join([_squeue_row(101, "RUNNING"), _squeue_row(103, "PENDING")])
+    ssh, commands = _fake_ssh({
+        _squeue_command("103,101,104"): (0, stdout, ""),
+        "scontrol -o show job 104": (1, "", "slurm_load_jobs error: Invalid job id specified"),
+    })
+    slurm_service = SlurmService(terminal_cache=TerminalJobCache())
+
+    jobs = await slurm_service.get_job_statuses(ssh, [103, 101, 104])
+
+    assert commands == [_squeue_command("103,101,104"), "scontrol -o show job 104"]
+    assert [(job.job_id, job.job_state) for job in jobs] == [(103, "PENDING"), (101, "RUNNING")]
+    assert jobs[1].start_time == "2026-01-14T12:00:00"
+    assert jobs[1].reason is None
+
+
+@pytest.mark.asyncio
+async def test_get_job_statuses_never_requeries_terminal_jobs() -> None:
+    """A job squeue reports finished (or no longer reports) is read once with scontrol, then cached."""
+    ssh, commands = _fake_ssh({
+        _squeue_command("101,102"): (0, f"{_squeue_row(101, 'RUNNING')}\n{_squeue_row(102, 'COMPLETED')}", ""),
+        "scontrol -o show job 102": (0, _scontrol_line(102, "COMPLETED"), ""),
+        _squeue_command("101"): (1, "", "slurm_load_jobs error: Invalid job id specified"),
+        "scontrol -o show job 101": (0, _scontrol_line(101, "FAILED"), ""),
+    })
+    slurm_service = SlurmService(terminal_cache=TerminalJobCache())
+
+    await slurm_service.get_job_statuses(ssh, [101, 102])
+    jobs = await slurm_service.get_job_statuses(ssh, [101, 102])
+    again = await slurm_service.get_job_statuses(ssh, [101, 102])
+
+    assert commands == [
+        _squeue_command("101,102"),
+        "scontrol -o show job 102",
+        _squeue_command("101"),
+        "scontrol -o show job 101",
+    ]
+    assert [(job.job_id, job.job_state) for job in jobs] == [(101, "FAILED"), (102, "COMPLETED")]
+    assert jobs[1].end_time == "2026-01-14T12:05:00"
+    assert again == jobs
+
+
+@pytest.mark.asyncio
+async def test_get_job_statuses_batch_with_an_invalid_id_lists_only_the_users_jobs() -> None:
+    ssh, commands = _fake_ssh({
+        _squeue_command("101,102"): (1, "", "slurm_load_jobs error: Invalid job id specified"),
+        _squeue_command(): (0, f"{_squeue_row(101, 'RUNNING')}\n{_squeue_row(999, 'RUNNING')}", ""),
+        "scontrol -o show job 102": (1, "", "slurm_load_jobs error: Invalid job id specified"),
+    })
+
+    jobs = await SlurmService(terminal_cache=TerminalJobCache()).get_job_statuses(ssh, [101, 102])
+
+    assert commands == [_squeue_command("101,102"), _squeue_command(), "scontrol -o show job 102"]
+    assert [job.job_id for job in jobs] == [101]
+
+
+@pytest.mark.asyncio
+async def test_get_job_statuses_single_unknown_job_is_not_an_error() -> None:
+    ssh, _ = _fake_ssh({
+        _squeue_command("5"): (1, "", "slurm_load_jobs error: Invalid job id specified"),
+        "scontrol -o show job 5": (1, "", "slurm_load_jobs error: Invalid job id specified"),
+    })
+    assert await SlurmService(terminal_cache=TerminalJobCache()).get_job_statuses(ssh, [5]) == []
+
+
+@pytest.mark.asyncio
+async def test_squeue_invalid_job_id_falls_back_to_one_listing() -> None:
+    fmt = SlurmJob.get_squeue_format_string()
+    base = f'squeue -u $USER --noheader --format="{fmt}"'
+    row = "101|sim-101|pi-agmon|svc_vivarium|RUNNING"
+    ssh, commands = _fake_ssh({
+        f"{base} -j 101,102": (1, "", "slurm_load_jobs error: Invalid job id specified"),
+        base: (0, f"{row}\n{row.replace('101', '999')}\n", ""),
+    })
+
+    jobs = await SlurmService(terminal_cache=TerminalJobCache()).get_job_status_squeue(ssh, [101, 102])
+
+    assert commands == [f"{base} -j 101,102", base]
+    assert [job.job_id for job in jobs] == [101]
+
+
+def test_terminal_job_cache_is_bounded() -> None:
+    cache = TerminalJobCache(max_size=2)
+    for job_id in (1, 2, 3):
+        cache.add(SlurmJob.from_scontrol_output(_scontrol_line(job_id, "COMPLETED")))
+    cache.add(SlurmJob.from_scontrol_output(_scontrol_line(4, "RUNNING")))
+
+    assert len(cache) == 2
+    assert cache.get(1) is None
+    assert cache.get(3) is not None
+    assert cache.get(4) is None
+
+
 # =============================================================================
 # Integration tests (SSH required)
 # =============================================================================
@@ -253,7 +381,8 @@ async def _run_nextflow_workflow_test(
 
         # Start with common placeholder replacements
         sbatch_content = (
-            sbatch_template.replace("NEXTFLOW_SCRIPT_PATH", str(remote_nf_script))
+            sbatch_template
+            .replace("NEXTFLOW_SCRIPT_PATH", str(remote_nf_script))
             .replace("REMOTE_LOG_OUTPUT_FILE", str(remote_output_file))
             .replace("REMOTE_LOG_ERROR_FILE", str(remote_error_file))
             .replace("REMOTE_REPORT_FILE", str(remote_report_file))
@@ -0,0 +1,23 @@
+import pytest
+
+from sms_api.common.sse import ServerSentEvent, format_sse, format_sse_comment, iter_sse_events
+
+
+def test_sse_round_trip_skips_comments() -> None:
+    body = format_sse("status", '{"id":1}') + format_sse_comment() + format_sse("worker_event", '{"time":2.0}')
+
+    assert list(iter_sse_events(body.splitlines(keepends=True))) == [
+        ServerSentEvent(event="status", data='{"id":1}'),
+        ServerSentEvent(event="worker_event", data='{"time":2.0}'),
+    ]
+
+
+def test_sse_parser_handles_crlf_and_an_unterminated_last_event() -> None:
+    lines = ["event: status\r\n", "data:{}\r\n", "\r\n", "data: orphan\n", "\n", "event: status", "data: 1"]
+
+    assert list(iter_sse_events(lines)) == [ServerSentEvent("status", "{}"), ServerSentEvent("status", "1")]
+
+
+def test_format_sse_rejects_multiline_data() -> None:
+    with pytest.raises(ValueError, match="single line"):
+        format_sse("status", "a\nb")
@@ -1,7 +1,10 @@
+import asyncio
 import uuid
 from pathlib import Path
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import asyncssh
 import pytest
 
 from sms_api.common.ssh.ssh_service import SSHSession, SSHSessionService
@@ -218,3 +221,181 @@ async def test_ssh_session_run_command_check_true_raises() -> None:
 
     with pytest.raises(RuntimeError, match="SSH command failed with exit code 1"):
         await session.run_command("failing command")  # check=True is default
+
+
+def _mock_connection(ping_stdout: str = "ping") -> MagicMock:
+    mock_conn = MagicMock()
+    mock_conn.run = AsyncMock(return_value=MagicMock(stdout=ping_stdout, stderr="", returncode=0))
+    mock_conn.is_closed = MagicMock(return_value=False)
+    mock_conn.wait_closed = AsyncMock()
+    return mock_conn
+
+
+def _pooled_service(**kwargs: Any) -> SSHSessionService:
+    return SSHSessionService(hostname="test-host", username="test-user", key_path=Path("/fake/key"), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_pooled_sessions_reuse_one_connection() -> None:
+    """Unit test: sequential pooled sessions share a connection that stays open between them."""
+    mock_conn = _mock_connection()
+    with patch("sms_api.common.ssh.ssh_service.asyncssh.connect", new_callable=AsyncMock) as mock_connect:
+        mock_connect.return_value = mock_conn
+        service = _pooled_service(pool_size=2)
+
+        for _ in range(3):
+            async with service.session() as ssh:
+                assert ssh.connection is mock_conn
+
+        mock_connect.assert_called_once()
+        mock_conn.close.assert_not_called()
+        metrics = service.pool_metrics()
+        assert metrics is not None
+        assert (metrics.connections, metrics.idle_connections, metrics.acquisitions, metrics.reuses) == (1, 1, 3, 2)
+
+        await service.close()
+        mock_conn.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_pooled_sessions_multiplex_then_wait_at_capacity() -> None:
+    """Unit test: concurrent sessions share connections up to the channel limit, then wait for a free slot."""
+    with patch("sms_api.common.ssh.ssh_service.asyncssh.connect", new_callable=AsyncMock) as mock_connect:
+        mock_connect.side_effect = lambda **_: _mock_connection()
+        service = _pooled_service(pool_size=2, pool_max_channels=2)
+        release = asyncio.Event()
+        connections: list[object] = []
+
+        async def _use() -> None:
+            async with service.session() as ssh:
+                connections.append(ssh.connection)
+                await release.wait()
+
+        tasks = [asyncio.create_task(_use()) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        metrics = service.pool_metrics()
+        assert metrics is not None
+        assert (metrics.connections, metrics.active_sessions, metrics.waiting) == (2, 4, 1)
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert mock_connect.call_count == 2
+        assert len(connections) == 5
+        assert len(set(map(id, connections))) == 2
+        await service.close()
+
+
+@pytest.mark.asyncio
+async def test_pooled_connection_failing_health_check_is_replaced() -> None:
+    """Unit test: an idle connection that no longer answers is closed and replaced on the next lease."""
+    stale_conn, fresh_conn = _mock_connection(), _mock_connection()
+    with patch("sms_api.common.ssh.ssh_service.asyncssh.connect", new_callable=AsyncMock) as mock_connect:
+        mock_connect.side_effect = [stale_conn, fresh_conn]
+        service = _pooled_service(pool_size=1, pool_health_check_interval=0.0)
+
+        async with service.session() as ssh:
+            assert ssh.connection is stale_conn
+        stale_conn.run.side_effect = asyncssh.ConnectionLost("gone")
+
+        async with service.session() as ssh:
+            assert ssh.connection is fresh_conn
+
+        stale_conn.close.assert_called_once()
+        metrics = service.pool_metrics()
+        assert metrics is not None
+        assert (metrics.connections, metrics.health_check_failures) == (1, 1)
+        await service.close()
+
+
+@pytest.mark.asyncio
+async def test_pooled_session_error_on_a_healthy_connection_keeps_it_for_other_leases() -> None:
+    """Unit test: a local transfer error on a shared connection neither closes nor replaces it."""
+    mock_conn = _mock_connection()
+    with patch("sms_api.common.ssh.ssh_service.asyncssh.connect", new_callable=AsyncMock) as mock_connect:
+        mock_connect.return_value = mock_conn
+        service = _pooled_service(pool_size=1, pool_max_channels=2)
+
+        async with service.session() as first, service.session() as second:
+            first._retry_delay = 0.0
+            with patch("sms_api.common.ssh.ssh_service.asyncssh.scp", new_callable=AsyncMock) as mock_scp:
+                mock_scp.side_effect = [OSError("No space left on device"), None]
+                await first.scp_download(Path("/local/out.tsv"), HPCFilePath(remote_path=Path("/remote/out.tsv")))
+
+            assert first.connection is second.connection is mock_conn
+            mock_conn.close.assert_not_called()
+            assert await second.run_command("hostname") == (0, "ping", "")
+
+        mock_connect.assert_called_once()
+        await service.close()
+
+
+@pytest.mark.asyncio
+async def test_pooled_lost_connection_is_replaced_once_and_closed_after_its_last_lease() -> None:
+    """Unit test: two leases on a lost connection move to one replacement; the old one closes when both left it."""
+    lost_conn, fresh_conn = _mock_connection(), _mock_connection()
+    with patch("sms_api.common.ssh.ssh_service.asyncssh.connect", new_callable=AsyncMock) as mock_connect:
+        mock_connect.side_effect = [lost_conn, fresh_conn]
+        service = _pooled_service(pool_size=1, pool_max_channels=2)
+
+        async with service.session() as first, service.session() as second:
+            first._retry_delay = second._retry_delay = 0.0
+            lost_conn.is_closed.return_value = True
+            lost_conn.run.side_effect = asyncssh.ConnectionLost("gone")
+
+            await first.run_command("hostname")
+            assert first.connection is fresh_conn
+            lost_conn.close.assert_not_called()  # the second session still leases it
+
+            await second.run_command("hostname")
+            assert second.connection is fresh_conn
+            lost_conn.close.assert_called_once()
+
+        assert mock_connect.call_count == 2
+        fresh_conn.close.assert_not_called()
+        metrics = service.pool_metrics()
+        assert metrics is not None
+        assert (metrics.connections, metrics.connections_opened, metrics.connections_closed) == (1, 2, 1)
+        await service.close()
+
+
+def test_unpooled_service_has_no_pool_metrics() -> None:
+    assert _pooled_service().pool_metrics() is None
+
+
+def _streaming_process(chunks: list[bytes], exit_status: int = 0) -> MagicMock:
+    process = MagicMock()
+    process.stdout.read = AsyncMock(side_effect=[*chunks, b""])
+    process.wait = AsyncMock(return_value=MagicMock(exit_status=exit_status, stderr=b"tar: boom"))
+    return process
+
+
+@pytest.mark.asyncio
+async def test_ssh_session_stream_command_yields_stdout() -> None:
+    """Unit test: SSHSession.stream_command relays stdout chunks and closes the process."""
+    process = _streaming_process([b"abc", b"def"])
+    mock_conn = MagicMock()
+    mock_conn.create_process = AsyncMock(return_value=process)
+
+    session = SSHSession(mock_conn, "test-host")
+    chunks = [chunk async for chunk in session.stream_command("tar -cf - .")]
+
+    assert chunks == [b"abc", b"def"]
+    mock_conn.create_process.assert_called_once_with("tar -cf - .", encoding=None)
+    process.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_ssh_session_stream_command_raises_on_failure() -> None:
+    """Unit test: SSHSession.stream_command raises after the output if the command exits non-zero."""
+    process = _streaming_process([b"partial"], exit_status=2)
+    mock_conn = MagicMock()
+    mock_conn.create_process = AsyncMock(return_value=process)
+
+    session = SSHSession(mock_conn, "test-host")
+    chunks: list[bytes] = []
+    with pytest.raises(RuntimeError, match="exit code 2"):
+        async for chunk in session.stream_command("tar -cf - ."):
+            chunks.append(chunk)
+
+    assert chunks == [b"partial"]
+    process.close.assert_called_once()
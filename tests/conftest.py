@@ -115,6 +115,7 @@ from tests.fixtures.postgres_fixtures import async_postgres_engine, database_ser
 from tests.fixtures.redis_fixtures import (  # noqa: F401
     redis_container_host_and_port,
     redis_producer_service,
+    redis_streams_consumer_factory,
     redis_subscriber_service,
 )
 from tests.fixtures.simulation_fixtures import (  # noqa: F401
@@ -2,13 +2,14 @@ from pathlib import Path
 
 import pytest
 
-from sms_api.analysis.analysis_service import AnalysisServiceSlurm, RequestPayload, parse_partition_metadata
+from sms_api.analysis.analysis_service import AnalysisServiceSlurm, RequestPayload
 from sms_api.analysis.models import (
     AnalysisConfig,
     ExperimentAnalysisRequest,
     PtoolsAnalysisConfig,
     PtoolsAnalysisType,
 )
+from sms_api.analysis.output_manifest import parse_partition_metadata
 from sms_api.api import request_examples
 from sms_api.config import get_settings
 
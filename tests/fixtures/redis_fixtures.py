@@ -1,10 +1,12 @@
-from collections.abc import AsyncGenerator
+import uuid
+from collections.abc import AsyncGenerator, Awaitable, Callable
 
 import pytest
 import pytest_asyncio
 from testcontainers.redis import RedisContainer  # type: ignore[import-untyped]
 
 from sms_api.common.messaging.messaging_service_redis import MessagingServiceRedis
+from sms_api.common.messaging.messaging_service_redis_streams import MessagingServiceRedisStreams
 from tests.docker_utils import SKIP_DOCKER_REASON, SKIP_DOCKER_TESTS
 
 
@@ -35,3 +37,22 @@ async def redis_producer_service(
     await service.connect(host=redis_container_host_and_port[0], port=redis_container_host_and_port[1])
     yield service
     await service.disconnect()
+
+
+@pytest_asyncio.fixture(scope="function")
+async def redis_streams_consumer_factory(
+    redis_container_host_and_port: tuple[str, int],
+) -> AsyncGenerator[Callable[[str], Awaitable[MessagingServiceRedisStreams]]]:
+    """Connected stream services sharing one fresh consumer group, one per consumer name."""
+    group = f"test-group-{uuid.uuid4().hex[:8]}"
+    services: list[MessagingServiceRedisStreams] = []
+
+    async def _create(consumer: str) -> MessagingServiceRedisStreams:
+        service = MessagingServiceRedisStreams(group=group, consumer=consumer, block_ms=100)
+        await service.connect(host=redis_container_host_and_port[0], port=redis_container_host_and_port[1])
+        services.append(service)
+        return service
+
+    yield _create
+    for service in services:
+        await service.disconnect()
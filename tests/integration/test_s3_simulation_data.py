@@ -21,7 +21,7 @@ from urllib.parse import urlparse
 
 import pytest
 import pytest_asyncio
-from starlette.responses import FileResponse
+from starlette.responses import FileResponse, StreamingResponse
 
 from sms_api.common.handlers.simulations import (
     SimulationAnalysisDataResponseType,
@@ -227,10 +227,11 @@ class TestGetSimulationOutputsS3:
         )
 
         assert response.media_type == "application/gzip"
+        assert isinstance(response, StreamingResponse)
 
         # Collect the streamed bytes
         chunks: list[bytes | memoryview[int]] = []
-        async for chunk in response.body_iterator:  # type: ignore[union-attr]
+        async for chunk in response.body_iterator:
             if isinstance(chunk, str):
                 chunk = chunk.encode()
             chunks.append(chunk)
@@ -0,0 +1,167 @@
+"""AnalysisStatusWatcher: one batched status query for all due analyses, per-analysis
+exponential backoff, shared futures and subscriptions (status source faked, clock faked
+where timing matters), plus AnalysisServiceSlurm.wait_for_completion on top of it."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from sms_api.analysis.analysis_service import AnalysisServiceSlurm
+from sms_api.analysis.models import AnalysisJobFailedException, AnalysisRun, ExperimentAnalysisDTO
+from sms_api.analysis.status_watcher import AnalysisStatusWatcher
+from sms_api.common.hpc.job_service import JobStatusInfo
+from sms_api.common.hpc.job_status_sources import JobStatusSource
+from sms_api.common.models import JobBackend, JobId, JobStatus
+from sms_api.config import get_settings
+
+
+class _FakeSource(JobStatusSource):
+    backend = JobBackend.SLURM
+
+    def __init__(self, statuses: dict[int, JobStatus]) -> None:
+        self.statuses = statuses
+        self.calls: list[list[int]] = []
+        self.fail = False
+
+    async def get_statuses(self, job_ids: list[JobId]) -> list[JobStatusInfo]:
+        self.calls.append([job_id.as_slurm_int for job_id in job_ids])
+        if self.fail:
+            raise RuntimeError("ssh down")
+        return [
+            JobStatusInfo(job_id=job_id, status=self.statuses[job_id.as_slurm_int])
+            for job_id in job_ids
+            if job_id.as_slurm_int in self.statuses
+        ]
+
+
+@pytest.fixture()
+def clock(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """A manual ``time.monotonic`` for the watcher; the real background loop then idles on long timeouts."""
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr("sms_api.analysis.status_watcher.time", SimpleNamespace(monotonic=lambda: clock.now))
+    return clock
+
+
+@pytest.mark.asyncio
+async def test_due_analyses_share_one_query_until_terminal(clock: SimpleNamespace) -> None:
+    source = _FakeSource({101: JobStatus.COMPLETED, 102: JobStatus.FAILED, 103: JobStatus.RUNNING})
+    watcher = AnalysisStatusWatcher(source, min_interval_seconds=2.0)
+    changes: asyncio.Queue[AnalysisRun] = asyncio.Queue()
+    watcher.subscribe(changes)
+    futures = [watcher.watch(analysis_id=i, job_id=100 + i) for i in (1, 2, 3)]
+    try:
+        assert watcher.watch(analysis_id=1, job_id=101) is futures[0]
+        assert await watcher.poll_once() is not None
+        assert source.calls == []  # just submitted: not due before min_interval_seconds
+
+        clock.now += 2.0
+        await watcher.poll_once()
+
+        assert source.calls == [[101, 102, 103]]
+        assert futures[0].result().status == JobStatus.COMPLETED
+        assert futures[1].result().status == JobStatus.FAILED
+        assert not futures[2].done()
+        assert watcher.status(3) == AnalysisRun(id=3, status=JobStatus.RUNNING, job_id=103)
+        assert watcher.status(1) is None  # terminal analyses are no longer watched
+        assert sorted((r.id, r.status) for r in (changes.get_nowait() for _ in range(changes.qsize()))) == [
+            (1, JobStatus.COMPLETED),
+            (2, JobStatus.FAILED),
+            (3, JobStatus.RUNNING),
+        ]
+    finally:
+        await watcher.stop()
+    assert futures[2].cancelled()
+
+
+@pytest.mark.asyncio
+async def test_unchanged_status_backs_off_exponentially(clock: SimpleNamespace) -> None:
+    source = _FakeSource({7: JobStatus.PENDING})
+    watcher = AnalysisStatusWatcher(source, min_interval_seconds=2.0, max_interval_seconds=16.0)
+    future = watcher.watch(analysis_id=1, job_id=7)
+    try:
+        delays: list[float] = []
+        for step in range(7):
+            if step == 5:
+                source.statuses[7] = JobStatus.RUNNING
+            clock.now += delays[-1] if delays else 2.0
+            delay = await watcher.poll_once()
+            assert delay is not None
+            delays.append(delay)
+        assert delays == [2.0, 4.0, 8.0, 16.0, 16.0, 2.0, 4.0]  # reset on PENDING -> RUNNING
+
+        source.fail = True  # a failed query counts as "unchanged"
+        clock.now += 4.0
+        assert await watcher.poll_once() == 8.0
+
+        source.fail = False
+        source.statuses[7] = JobStatus.CANCELLED
+        clock.now += 8.0
+        assert await watcher.poll_once() is None
+        assert future.result().status == JobStatus.CANCELLED
+    finally:
+        await watcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_resolved_by_the_background_loop() -> None:
+    source = _FakeSource({55: JobStatus.RUNNING})
+    watcher = AnalysisStatusWatcher(source, min_interval_seconds=0.01, max_interval_seconds=0.02)
+    try:
+        waiters = [asyncio.create_task(watcher.wait(analysis_id=9, job_id=55, timeout=5)) for _ in range(3)]
+        impatient = asyncio.create_task(watcher.wait(analysis_id=9, job_id=55, timeout=0.001))
+        with pytest.raises(TimeoutError):
+            await impatient
+        await asyncio.sleep(0.05)
+        source.statuses[55] = JobStatus.COMPLETED
+
+        runs = await asyncio.gather(*waiters)
+
+        assert {run.status for run in runs} == {JobStatus.COMPLETED}
+        assert all(call == [55] for call in source.calls)  # one query per poll, however many waiters
+    finally:
+        await watcher.stop()
+
+
+def _dto(job_id: int | None = 4242) -> ExperimentAnalysisDTO:
+    # The config is irrelevant to waiting; skip validating a full AnalysisConfig.
+    return ExperimentAnalysisDTO.model_construct(
+        database_id=3, name="analysis-x", job_name="sms-analysis-x", job_id=job_id
+    )
+
+
+@pytest.mark.asyncio
+async def test_wait_for_completion_raises_with_the_job_log_on_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    watcher = MagicMock()
+    watcher.wait = AsyncMock(return_value=AnalysisRun(id=3, status=JobStatus.FAILED, job_id=4242))
+    ssh = MagicMock()
+    ssh.run_command = AsyncMock(return_value=(0, "Traceback: boom", ""))
+
+    @asynccontextmanager
+    async def _session() -> AsyncIterator[MagicMock]:
+        yield ssh
+
+    monkeypatch.setattr(
+        "sms_api.analysis.analysis_service.get_ssh_session_service", lambda target: MagicMock(session=_session)
+    )
+    service = AnalysisServiceSlurm(env=get_settings(), status_watcher=watcher)
+
+    with pytest.raises(AnalysisJobFailedException) as excinfo:
+        await service.wait_for_completion(_dto())
+
+    watcher.wait.assert_awaited_once_with(analysis_id=3, job_id=4242)
+    assert excinfo.value.run.error_log == "Traceback: boom"
+
+
+@pytest.mark.asyncio
+async def test_wait_for_completion_returns_the_completed_run() -> None:
+    watcher = MagicMock()
+    watcher.wait = AsyncMock(return_value=AnalysisRun(id=3, status=JobStatus.COMPLETED, job_id=4242))
+    service = AnalysisServiceSlurm(env=get_settings(), status_watcher=watcher)
+
+    assert (await service.wait_for_completion(_dto())).status == JobStatus.COMPLETED
+    with pytest.raises(ValueError, match="no job id"):
+        await service.wait_for_completion(_dto(job_id=None))
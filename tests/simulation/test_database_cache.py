@@ -0,0 +1,115 @@
+"""CachingDatabaseService: hits for repeated lookups of immutable rows, invalidation on
+writes, TTL expiry, LRU bound and hit accounting (wrapped service mocked)."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from sms_api.simulation.database_cache import SIMULATION, CachingDatabaseService, DatabaseCache
+from sms_api.simulation.models import (
+    JobType,
+    ParcaDataset,
+    ParcaDatasetRequest,
+    ParcaOptions,
+    SimulatorVersion,
+)
+
+SIMULATOR = SimulatorVersion(
+    database_id=1, git_commit_hash="abc1234", git_repo_url="https://github.com/CovertLab/vEcoli", git_branch="master"
+)
+
+
+def _database_service() -> MagicMock:
+    db = MagicMock()
+    db.get_simulator = AsyncMock(return_value=SIMULATOR)
+    db.delete_simulator = AsyncMock()
+    db.get_simulation = AsyncMock(return_value=None)
+    db.add_tags = AsyncMock()
+    db.insert_parca_dataset = AsyncMock(
+        side_effect=lambda request: ParcaDataset(database_id=5, parca_dataset_request=request)
+    )
+    db.delete_parca_dataset = AsyncMock()
+    db.get_hpcrun_by_ref = AsyncMock(return_value=None)
+    return db
+
+
+@pytest.mark.asyncio
+async def test_repeated_lookups_hit_the_cache() -> None:
+    db = _database_service()
+    service = CachingDatabaseService(db)
+
+    first = await service.get_simulator(1)
+    second = await service.get_simulator(1)
+
+    assert first == second == SIMULATOR
+    assert second is not first  # callers get their own copy
+    db.get_simulator.assert_awaited_once_with(1)
+    stats = service.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+    assert stats.hits_by_kind == {"simulator": 1}
+    assert stats.hit_rate == 0.5
+
+
+@pytest.mark.asyncio
+async def test_misses_and_mutable_rows_are_not_cached() -> None:
+    db = _database_service()
+    service = CachingDatabaseService(db)
+
+    assert await service.get_simulation(7) is None
+    assert await service.get_simulation(7) is None
+    await service.get_hpcrun_by_ref(7, JobType.SIMULATION)
+    await service.get_hpcrun_by_ref(7, JobType.SIMULATION)
+
+    assert db.get_simulation.await_count == 2
+    assert db.get_hpcrun_by_ref.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_cached_rows() -> None:
+    db = _database_service()
+    service = CachingDatabaseService(db)
+    await service.get_simulator(1)
+
+    await service.delete_simulator(1)
+    await service.get_simulator(1)
+
+    assert db.get_simulator.await_count == 2
+    assert service.stats().invalidations == 1
+
+
+@pytest.mark.asyncio
+async def test_repeated_parca_dataset_insert_is_served_from_cache() -> None:
+    db = _database_service()
+    service = CachingDatabaseService(db)
+    request = ParcaDatasetRequest(simulator_version=SIMULATOR, parca_config=ParcaOptions())
+
+    first = await service.insert_parca_dataset(request)
+    second = await service.insert_parca_dataset(request)
+    by_id = await service.get_parca_dataset(5)
+
+    assert first == second == by_id
+    db.insert_parca_dataset.assert_awaited_once()
+
+    await service.delete_parca_dataset(5)
+    await service.insert_parca_dataset(request)
+    assert db.insert_parca_dataset.await_count == 2
+
+
+def test_cache_expires_entries_and_evicts_least_recently_used() -> None:
+    cache = DatabaseCache(max_entries=2, ttl_seconds=60.0)
+    for key in (1, 2, 3):
+        cache.put((SIMULATION, key), SIMULATOR)
+
+    assert cache.get((SIMULATION, 1)) is None  # evicted
+    assert cache.get((SIMULATION, 3)) == SIMULATOR
+    assert cache.stats().evictions == 1
+
+    cache.ttl_seconds = 0.0
+    assert cache.get((SIMULATION, 3)) is None  # expired
+    assert cache.stats().size == 1
+
+
+def test_disabled_cache_stores_nothing() -> None:
+    cache = DatabaseCache(max_entries=0)
+    cache.put((SIMULATION, 1), SIMULATOR)
+    assert cache.get((SIMULATION, 1)) is None
@@ -4,19 +4,22 @@ These cover the state machine without touching a database. End-to-end
 stamp/upgrade behavior is exercised against a real Postgres by the migration
 Job in deployment; here we lock down the decision logic that drives it.
 
-The fingerprint vectors below are length-5, matching LEGACY_FINGERPRINTS:
-    [baseline, hpcrun-k8s, cancelled-enum, simulation.tags, analysis.n_tp]
+The fingerprint vectors below are length-7, matching LEGACY_FINGERPRINTS:
+    [baseline, hpcrun-k8s, cancelled-enum, simulation.tags, analysis.n_tp,
+     worker_event_block, output_manifest]
 """
 
 from sms_api.simulation.db_reconcile import DbState, classify
 
-HEAD = "d3f9a1c72b84"
+HEAD = "f5c7d9e1a3b2"
 # Mirrors LEGACY_FINGERPRINTS ordering.
-REVS = ["fb7621a73e24", "0f991fad32ba", "a1c3e5f7b9d2", "c1a2b3d4e5f6", "d3f9a1c72b84"]
+REVS = ["fb7621a73e24", "0f991fad32ba", "a1c3e5f7b9d2", "c1a2b3d4e5f6", "d3f9a1c72b84", "e4b2c6d8f0a1", "f5c7d9e1a3b2"]
 
 
 def test_managed_database_takes_upgrade_path() -> None:
-    diag = classify(alembic_revision="0f991fad32ba", fingerprint=[True, True, False, False, False], head_revision=HEAD)
+    diag = classify(
+        alembic_revision="0f991fad32ba", fingerprint=[True, True, False, False, False, False, False], head_revision=HEAD
+    )
     assert diag.state is DbState.MANAGED
     assert diag.current_revision == "0f991fad32ba"
     assert diag.matched_revision is None
@@ -25,63 +28,91 @@ def test_managed_database_takes_upgrade_path() -> None:
 
 
 def test_managed_takes_precedence_even_with_odd_fingerprint() -> None:
-    diag = classify(alembic_revision=HEAD, fingerprint=[False, False, False, False, False], head_revision=HEAD)
+    diag = classify(
+        alembic_revision=HEAD, fingerprint=[False, False, False, False, False, False, False], head_revision=HEAD
+    )
     assert diag.state is DbState.MANAGED
 
 
 def test_fresh_database_when_no_tables_and_no_version() -> None:
-    diag = classify(alembic_revision=None, fingerprint=[False, False, False, False, False], head_revision=HEAD)
+    diag = classify(
+        alembic_revision=None, fingerprint=[False, False, False, False, False, False, False], head_revision=HEAD
+    )
     assert diag.state is DbState.FRESH
     assert diag.matched_revision is None
     assert diag.can_upgrade is True
 
 
 def test_legacy_matches_baseline_only() -> None:
-    diag = classify(alembic_revision=None, fingerprint=[True, False, False, False, False], head_revision=HEAD)
+    diag = classify(
+        alembic_revision=None, fingerprint=[True, False, False, False, False, False, False], head_revision=HEAD
+    )
     assert diag.state is DbState.LEGACY
     assert diag.matched_revision == "fb7621a73e24"
 
 
 def test_legacy_matches_middle_revision() -> None:
-    diag = classify(alembic_revision=None, fingerprint=[True, True, False, False, False], head_revision=HEAD)
+    diag = classify(
+        alembic_revision=None, fingerprint=[True, True, False, False, False, False, False], head_revision=HEAD
+    )
     assert diag.state is DbState.LEGACY
     assert diag.matched_revision == "0f991fad32ba"
 
 
 def test_legacy_matches_cancelled_revision() -> None:
-    diag = classify(alembic_revision=None, fingerprint=[True, True, True, False, False], head_revision=HEAD)
+    diag = classify(
+        alembic_revision=None, fingerprint=[True, True, True, False, False, False, False], head_revision=HEAD
+    )
     assert diag.state is DbState.LEGACY
     assert diag.matched_revision == "a1c3e5f7b9d2"
 
 
 def test_legacy_matches_tags_revision() -> None:
-    diag = classify(alembic_revision=None, fingerprint=[True, True, True, True, False], head_revision=HEAD)
+    diag = classify(
+        alembic_revision=None, fingerprint=[True, True, True, True, False, False, False], head_revision=HEAD
+    )
     assert diag.state is DbState.LEGACY
     assert diag.matched_revision == "c1a2b3d4e5f6"
 
 
 def test_legacy_matches_head_when_all_markers_present() -> None:
-    diag = classify(alembic_revision=None, fingerprint=[True, True, True, True, True], head_revision=HEAD)
+    diag = classify(alembic_revision=None, fingerprint=[True, True, True, True, True, True, True], head_revision=HEAD)
+    assert diag.state is DbState.LEGACY
+    assert diag.matched_revision == "f5c7d9e1a3b2"
+
+
+def test_legacy_matches_worker_event_block_revision() -> None:
+    diag = classify(alembic_revision=None, fingerprint=[True, True, True, True, True, True, False], head_revision=HEAD)
+    assert diag.state is DbState.LEGACY
+    assert diag.matched_revision == "e4b2c6d8f0a1"
+
+
+def test_legacy_matches_analysis_query_columns_revision() -> None:
+    diag = classify(alembic_revision=None, fingerprint=[True, True, True, True, True, False, False], head_revision=HEAD)
     assert diag.state is DbState.LEGACY
     assert diag.matched_revision == "d3f9a1c72b84"
 
 
 def test_inconsistent_when_later_marker_present_but_earlier_missing() -> None:
-    diag = classify(alembic_revision=None, fingerprint=[True, False, True, False, False], head_revision=HEAD)
+    diag = classify(
+        alembic_revision=None, fingerprint=[True, False, True, False, False, False, False], head_revision=HEAD
+    )
     assert diag.state is DbState.INCONSISTENT
     assert diag.matched_revision is None
     assert diag.can_upgrade is False
 
 
 def test_inconsistent_when_baseline_missing_but_later_present() -> None:
-    diag = classify(alembic_revision=None, fingerprint=[False, True, True, True, True], head_revision=HEAD)
+    diag = classify(alembic_revision=None, fingerprint=[False, True, True, True, True, True, False], head_revision=HEAD)
     assert diag.state is DbState.INCONSISTENT
     assert diag.can_upgrade is False
 
 
 def test_markers_are_reported_with_labels() -> None:
-    diag = classify(alembic_revision=None, fingerprint=[True, True, False, False, False], head_revision=HEAD)
+    diag = classify(
+        alembic_revision=None, fingerprint=[True, True, False, False, False, False, False], head_revision=HEAD
+    )
     labels = [label for label, _ in diag.markers]
     presence = [present for _, present in diag.markers]
-    assert presence == [True, True, False, False, False]
+    assert presence == [True, True, False, False, False, False, False]
     assert any("analysis.n_tp" in label for label in labels)
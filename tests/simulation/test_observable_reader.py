@@ -1,16 +1,32 @@
 import os
 from pathlib import Path
 
+import fsspec
 import numpy as np
 import pandas as pd
 import pytest
 import xarray as xr
+from fsspec.implementations.local import LocalFileSystem
 
 from sms_api.simulation.observable_reader import (
+    StoreCache,
+    StoreHandle,
     StoreIndex,
     detect_store_kind,
+    downsample_indices,
+    ensemble_bands,
+    get_store_cache,
+    iter_seed_observable_arrays,
     list_observables,
+    parse_generation_spec,
+    parse_observable_name,
+    parse_seed_spec,
+    read_observable_arrays,
     read_observables,
+    split_observable_names,
+    store_index_uri,
+    store_index_wanted,
+    write_store_index,
 )
 
 
@@ -95,6 +111,22 @@ def test_read_observables_zarr_nan_sanitized(tmp_path: Path) -> None:
     assert series["mass"][2] == 3.0
 
 
+def test_read_observable_arrays_keeps_numpy(tmp_path: Path) -> None:
+    """The vectorized path returns contiguous float64 arrays with NaN left in place."""
+    ds = xr.Dataset(
+        data_vars={"mass": ("time", np.array([1, 2, 3, 4], dtype=np.int64))},
+        coords={"time": np.array([0.0, 1.0, 2.0, 3.0])},
+    )
+    store_path = tmp_path / "store.zarr"
+    ds.to_zarr(store_path, mode="w")
+
+    _, time, series = read_observable_arrays(f"file://{store_path}", names=["mass"], stride=2)
+    assert time.dtype == np.float64
+    assert series["mass"].dtype == np.float64
+    assert series["mass"].flags.c_contiguous
+    assert series["mass"].tolist() == [1.0, 3.0]
+
+
 def _write_fixture_parquet(tmp_path: Path) -> str:
     df = pd.DataFrame({"time": [0.0, 1.0, 2.0], "mass": [1.0, 2.0, 3.0], "volume": [0.1, 0.2, 0.3]})
     p = tmp_path / "store.parquet"
@@ -193,6 +225,43 @@ def test_read_observables_max_points_overrides_smaller_stride(tmp_path: Path, wr
     assert time == [0.0, 4.0]
 
 
+# ── Feature-preserving downsampling ───────────────────────────────────────
+
+
+@pytest.mark.parametrize("method", ["lttb", "m4", "minmax"])
+def test_downsample_indices_keeps_spikes(method: str) -> None:
+    """Unlike every-Nth decimation, each method keeps an isolated spike and dip."""
+    t = np.arange(5000, dtype=float)
+    y = np.sin(t / 300.0)
+    y[1234] = 50.0
+    y[3001] = -50.0
+    y[10] = np.nan
+    idx = downsample_indices(t, {"y": y}, 200, method)  # type: ignore[arg-type]
+    assert len(idx) <= 200
+    assert np.all(np.diff(idx) > 0)
+    assert 1234 in idx and 3001 in idx
+
+
+def test_downsample_indices_shares_budget_across_series() -> None:
+    t = np.arange(1000, dtype=float)
+    idx = downsample_indices(t, {"a": np.sin(t), "b": np.cos(t), "c": t}, 90, "minmax")
+    assert len(idx) <= 90
+
+
+def test_downsample_indices_short_series_untouched() -> None:
+    t = np.arange(5, dtype=float)
+    assert downsample_indices(t, {"y": t}, 10, "lttb").tolist() == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.parametrize("writer", [_write_wide_zarr, _write_wide_parquet])
+def test_read_observables_downsample(tmp_path: Path, writer) -> None:  # type: ignore[no-untyped-def]
+    uri = writer(tmp_path, 64)
+    _, time, series = read_observables(uri, names=["mass", "growth"], max_points=8, downsample="minmax")
+    assert 0 < len(time) <= 8
+    assert len(series["mass"]) == len(time)
+    assert time[-1] == 63.0  # the trace's maximum survives (plain max_points=8 stops at 56)
+
+
 # ── Hive-partitioned datatree (real Ray XArrayEmitter layout) ──────────────
 
 
@@ -248,6 +317,281 @@ def test_read_observables_partitioned_bad_name(tmp_path: Path) -> None:
         read_observables(uri, names=["nope"])
 
 
+# ── Time window / generation filters ───────────────────────────────────────
+
+
+def test_partitioned_window_reads_only_overlapping_generations(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    uri = _write_partitioned_zarr(tmp_path)
+    get_store_cache().invalidate(uri)
+    read_gens: list[int] = []
+    real_segment = StoreHandle.segment
+
+    def _spy(self, name, gen, rows=slice(None), cols=None):  # type: ignore[no-untyped-def]
+        read_gens.append(gen)
+        return real_segment(self, name, gen, rows, cols)
+
+    monkeypatch.setattr(StoreHandle, "segment", _spy)
+    _, time, series = read_observables(uri, names=["cell_mass"], t_start=3.5)
+    assert time == [4.0]
+    assert series["cell_mass"] == [14.0]
+    assert read_gens == [2]
+
+    read_gens.clear()
+    _, time, series = read_observables(uri, names=["cell_mass"], generations=[1], t_end=1.0)
+    assert time == [0.0, 1.0]
+    assert series["cell_mass"] == [10.0, 11.0]
+    assert read_gens == [1]
+
+
+def test_partitioned_window_through_index_sidecar(tmp_path: Path) -> None:
+    uri = _write_partitioned_zarr(tmp_path)
+    get_store_cache().invalidate(uri)
+    write_store_index(uri)
+    get_store_cache().invalidate(uri)
+    _, time, series = read_observables(uri, names=["growth"], t_start=1.0, t_end=3.0)
+    handle = get_store_cache().peek(uri)
+    assert handle is not None and handle.index is not None
+    assert time == [1.0, 2.0, 3.0]
+    assert series["growth"] == [0.2, 0.3, 0.4]
+
+
+@pytest.mark.parametrize("writer", [_write_wide_zarr, _write_wide_parquet])
+def test_read_observables_time_window(tmp_path: Path, writer) -> None:  # type: ignore[no-untyped-def]
+    uri = writer(tmp_path, 8)
+    _, time, series = read_observables(uri, names=["mass"], t_start=2.0, t_end=6.0, stride=2)
+    assert time == [2.0, 4.0, 6.0]
+    assert series["mass"] == [2.0, 4.0, 6.0]
+    _, time, _ = read_observables(uri, names=["mass"], t_start=100.0)
+    assert time == []
+    with pytest.raises(ValueError):
+        read_observables(uri, names=["mass"], t_start=5.0, t_end=1.0)
+    with pytest.raises(ValueError):
+        read_observables(uri, names=["mass"], generations=[0])
+
+
+def test_read_observables_parquet_generation_filter(tmp_path: Path) -> None:
+    p = tmp_path / "gens.parquet"
+    pd.DataFrame({"time": [0.0, 1.0, 2.0, 3.0], "generation": [1, 1, 2, 2], "mass": [1.0, 2.0, 3.0, 4.0]}).to_parquet(p)
+    _, time, series = read_observables(f"file://{p}", names=["mass"], generations=[2])
+    assert time == [2.0, 3.0]
+    assert series["mass"] == [3.0, 4.0]
+
+
+def test_parse_generation_spec() -> None:
+    assert parse_generation_spec("1,4-6") == [1, 4, 5, 6]
+    with pytest.raises(ValueError):
+        parse_generation_spec("x")
+
+
+# ── 2-D observables: column selectors ─────────────────────────────────────
+
+
+def _write_partitioned_bulk_zarr(tmp_path: Path) -> str:
+    """Partitioned store whose ``bulk`` leaf is (time, molecule) with an ``ids`` coordinate."""
+    from xarray import DataTree
+
+    parent = xr.Dataset({"time_gen=1": ("t1", [0.0, 1.0]), "time_gen=2": ("t2", [2.0])})
+    ids = ["ATP", "GTP", "H2O"]
+    bulk = xr.Dataset(
+        {
+            "generation=1": (("t1", "mol"), np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])),
+            "generation=2": (("t2", "mol"), np.array([[7.0, 8.0, 9.0]])),
+        },
+        coords={"ids": ("mol", ids)},
+    )
+    mass = xr.Dataset({"generation=1": ("t1", [10.0, 11.0]), "generation=2": ("t2", [12.0])})
+    base = "experiment_id=cmp/variant=0/lineage_seed=0"
+    dt = DataTree.from_dict({base: parent, f"{base}/bulk": bulk, f"{base}/mass": mass})
+    store = tmp_path / "v2ecoli_seed00.zarr"
+    dt.to_zarr(store, mode="w")
+    return f"file://{store}"
+
+
+def test_split_and_parse_observable_names() -> None:
+    assert split_observable_names("mass, bulk[0,2], bulk[ids=ATP,GTP],") == ["mass", "bulk[0,2]", "bulk[ids=ATP,GTP]"]
+    base, selection = parse_observable_name("bulk[1:3]")
+    assert base == "bulk" and selection is not None
+    assert selection.resolve(5, lambda coord: []) == ([1, 2], ["bulk[1]", "bulk[2]"])
+    assert parse_observable_name("mass") == ("mass", None)
+
+
+@pytest.mark.parametrize("use_index", [False, True])
+def test_partitioned_column_selection(tmp_path: Path, use_index: bool) -> None:
+    uri = _write_partitioned_bulk_zarr(tmp_path)
+    get_store_cache().invalidate(uri)
+    if use_index:
+        write_store_index(uri)
+        get_store_cache().invalidate(uri)
+
+    idx = list_observables(uri)
+    assert {o.name: o.shape for o in idx.observables} == {"bulk": [3, 3], "mass": [3]}
+
+    _, time, series = read_observables(uri, names=["mass", "bulk[0,-1]"])
+    assert time == [0.0, 1.0, 2.0]
+    assert series == {"mass": [10.0, 11.0, 12.0], "bulk[0]": [1.0, 4.0, 7.0], "bulk[2]": [3.0, 6.0, 9.0]}
+    _, _, series = read_observables(uri, names=["bulk[ids=GTP]"], t_start=1.0)
+    assert series == {"bulk[GTP]": [5.0, 8.0]}
+
+    with pytest.raises(ValueError, match="1-D timeseries"):
+        read_observables(uri, names=["bulk"])
+    with pytest.raises(KeyError):
+        read_observables(uri, names=["bulk[ids=NOPE]"])
+    with pytest.raises(KeyError):
+        read_observables(uri, names=["bulk[7]"])
+    with pytest.raises(ValueError):
+        read_observables(uri, names=["mass[0]"])
+
+
+def test_flat_zarr_column_selection(tmp_path: Path) -> None:
+    ds = xr.Dataset(
+        {"bulk": (("time", "mol"), np.arange(12, dtype=float).reshape(4, 3))},
+        coords={"time": np.arange(4, dtype=float), "ids": ("mol", ["a", "b", "c"])},
+    )
+    store = tmp_path / "flat.zarr"
+    ds.to_zarr(store, mode="w")
+    _, _, series = read_observables(f"file://{store}", names=["bulk[ids=c,a]"], stride=2)
+    assert series == {"bulk[c]": [2.0, 8.0], "bulk[a]": [0.0, 6.0]}
+
+
+def test_parquet_list_column_selection(tmp_path: Path) -> None:
+    p = tmp_path / "lists.parquet"
+    pd.DataFrame({"time": [0.0, 1.0], "bulk": [[1, 2, 3], [4, 5, 6]]}).to_parquet(p)
+    _, _, series = read_observables(f"file://{p}", names=["bulk[1:]"])
+    assert series == {"bulk[1]": [2.0, 5.0], "bulk[2]": [3.0, 6.0]}
+    with pytest.raises(ValueError):
+        read_observables(f"file://{p}", names=["bulk[ids=x]"])
+
+
+# ── Index sidecar ──────────────────────────────────────────────────────────
+
+
+def test_store_index_sidecar_replaces_tree_walk(tmp_path: Path) -> None:
+    uri = _write_partitioned_zarr(tmp_path)
+    cache = get_store_cache()
+    cache.invalidate(uri)
+    list_observables(uri)
+    assert store_index_wanted(uri)
+
+    index_uri = write_store_index(uri)
+    assert index_uri == store_index_uri(uri) == f"{uri}.index.json"
+    assert os.path.exists(index_uri.removeprefix("file://"))
+    assert not store_index_wanted(uri)
+
+    cache.invalidate(uri)
+    idx = list_observables(uri)
+    handle = cache.peek(uri)
+    assert handle is not None and handle.index is not None and handle.dt is None
+    assert {o.name: o.shape for o in idx.observables} == {"cell_mass": [5], "growth": [5]}
+    _, time, series = read_observables(uri, names=["cell_mass"], stride=2)
+    assert time == [0.0, 2.0, 4.0]
+    assert series["cell_mass"] == [10.0, 12.0, 14.0]
+    with pytest.raises(KeyError):
+        read_observables(uri, names=["nope"])
+
+
+def test_store_index_sidecar_ignored_when_stale(tmp_path: Path) -> None:
+    uri = _write_partitioned_zarr(tmp_path)
+    get_store_cache().invalidate(uri)
+    write_store_index(uri)
+    store = Path(uri.removeprefix("file://"))
+    for name in (".zattrs", "zarr.json"):
+        marker = store / name
+        if marker.exists():
+            os.utime(marker, (marker.stat().st_mtime + 10, marker.stat().st_mtime + 10))
+    get_store_cache().invalidate(uri)
+    list_observables(uri)
+    handle = get_store_cache().peek(uri)
+    assert handle is not None and handle.index is None and handle.dt is not None
+
+
+def test_write_store_index_skips_flat_store(tmp_path: Path) -> None:
+    uri = _write_fixture_zarr(tmp_path)
+    assert write_store_index(uri) is None
+    assert not os.path.exists(store_index_uri(uri).removeprefix("file://"))
+
+
+# ── Store cache ────────────────────────────────────────────────────────────
+
+
+def test_store_cache_reuses_opened_datatree(tmp_path: Path) -> None:
+    """A second read of the same store is a cache hit and reuses the opened handle."""
+    uri = _write_partitioned_zarr(tmp_path)
+    cache = get_store_cache()
+    before = cache.stats()
+    list_observables(uri)
+    handle = cache.get(uri)
+    _, time, series = read_observables(uri, names=["growth"])
+    after = cache.stats()
+    assert after.misses == before.misses + 1
+    assert after.hits == before.hits + 2
+    assert cache.get(uri) is handle
+    assert time == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert series["growth"] == [0.1, 0.2, 0.3, 0.4, 0.5]
+
+
+def test_store_cache_invalidated_when_store_rewritten(tmp_path: Path) -> None:
+    uri = _write_wide_zarr(tmp_path, npoints=4)
+    cache = StoreCache()
+    first = cache.get(uri)
+    _write_wide_zarr(tmp_path, npoints=6)  # rewrites the root metadata → new fingerprint
+    second = cache.get(uri)
+    assert second is not first
+    assert cache.stats().invalidations == 1
+
+
+class _ListingCachedFileSystem(LocalFileSystem):  # type: ignore[misc]
+    """A local filesystem that, like s3fs, answers ``info`` from a listing cache unless refreshed."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.info_cache: dict[str, dict[str, object]] = {}
+
+    def info(self, path: str, refresh: bool = False, **kwargs: object) -> dict[str, object]:
+        path = self._strip_protocol(path)
+        if refresh or path not in self.info_cache:
+            self.info_cache[path] = super().info(path, **kwargs)
+        return self.info_cache[path]
+
+
+def test_store_cache_invalidated_despite_a_cached_listing(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    uri = _write_wide_zarr(tmp_path)
+    fs = _ListingCachedFileSystem()
+    url_to_fs = fsspec.core.url_to_fs
+    monkeypatch.setattr(fsspec.core, "url_to_fs", lambda url, **kw: (fs, url_to_fs(url, **kw)[1]))
+    cache = StoreCache()
+    first = cache.get(uri)
+    assert fs.info_cache  # opening the store cached the root metadata's info
+
+    for marker in (tmp_path / "store.zarr" / ".zattrs", tmp_path / "store.zarr" / "zarr.json"):
+        if marker.exists():  # rewrite whichever root metadata the zarr format wrote
+            marker.write_text(marker.read_text() + "\n")
+            os.utime(marker, (1, 1))
+
+    assert cache.get(uri) is not first
+    assert cache.stats().invalidations == 1
+
+
+def test_store_cache_ttl_and_lru_bound(tmp_path: Path) -> None:
+    a = _write_wide_zarr(tmp_path / "a")
+    b = _write_wide_zarr(tmp_path / "b")
+    cache = StoreCache(max_entries=1, ttl_seconds=0.0)
+    cache.get(a)
+    cache.get(a)  # expired immediately → reopened
+    cache.get(b)  # evicts a
+    stats = cache.stats()
+    assert stats.hits == 0
+    assert stats.misses == 3
+    assert stats.evictions == 1
+    assert stats.size == 1
+
+
+def test_store_cache_skips_missing_store(tmp_path: Path) -> None:
+    cache = StoreCache()
+    handle = cache.get(f"file://{tmp_path / 'not_there.zarr'}")
+    assert handle.kind == "parquet"
+    assert cache.stats().size == 0
+
+
 # ── Remote store (review item: include remote tests if .dev_env vars present) ──
 
 _REMOTE_STORE_URI = os.environ.get("TEST_OBSERVABLE_STORE_URI", "")
@@ -274,3 +618,48 @@ def test_remote_store_round_trip() -> None:
     assert len(time) <= 50
     assert first in series
     assert len(series[first]) == len(time)
+
+
+# ── Multi-seed batches ─────────────────────────────────────────────────────
+
+
+def test_parse_seed_spec() -> None:
+    assert parse_seed_spec("0-3") == [0, 1, 2, 3]
+    assert parse_seed_spec("5, 0,2-3,2") == [0, 2, 3, 5]
+    for bad in ("", "a", "3-1", "-1", "0-999"):
+        with pytest.raises(ValueError):
+            parse_seed_spec(bad)
+
+
+def test_ensemble_bands_aligns_shorter_seeds() -> None:
+    """A seed that ended early only contributes to the bands while it has samples."""
+    long_t = np.array([0.0, 1.0, 2.0, 3.0])
+    short_t = np.array([0.0, 2.0])
+    time, bands = ensemble_bands(
+        [
+            (long_t, {"mass": np.array([1.0, 2.0, 3.0, 4.0])}),
+            (short_t, {"mass": np.array([3.0, 5.0])}),
+        ],
+        percentiles=[0, 100],
+    )
+    assert time.tolist() == [0.0, 1.0, 2.0, 3.0]
+    assert bands["mass"]["mean"].tolist() == [2.0, 3.0, 4.0, 4.0]
+    assert bands["mass"]["p0"].tolist() == [1.0, 2.0, 3.0, 4.0]
+    assert bands["mass"]["p100"].tolist() == [3.0, 4.0, 5.0, 4.0]
+
+
+@pytest.mark.asyncio
+async def test_iter_seed_observable_arrays_reports_missing_seed(tmp_path: Path) -> None:
+    uris = {}
+    for seed in (0, 1):
+        seed_dir = tmp_path / f"seed{seed}"
+        seed_dir.mkdir()
+        uris[seed] = _write_wide_zarr(seed_dir, npoints=4)
+    uris[2] = f"file://{tmp_path}/missing.zarr"
+
+    results = {seed: r async for seed, r in iter_seed_observable_arrays(uris, ["mass"], max_concurrency=2)}
+    assert set(results) == {0, 1, 2}
+    assert isinstance(results[2], FileNotFoundError)
+    ok = results[0]
+    assert not isinstance(ok, Exception)
+    assert ok[2]["mass"].tolist() == [0.0, 1.0, 2.0, 3.0]
@@ -0,0 +1,219 @@
+"""Output manifests: listing parsing, staleness/re-sync decisions and the COMPLETED indexer
+(database mocked), plus the incremental sync and partition queries against Postgres."""
+
+import asyncio
+import datetime
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from sms_api.analysis.models import OutputManifest, OutputManifestEntry, OutputStorage, PartitionFilter
+from sms_api.analysis.output_manifest import (
+    OutputManifestIndexer,
+    hpc_output_files,
+    list_hpc_outputs,
+    manifest_entry,
+    s3_output_files,
+)
+from sms_api.common.models import JobBackend, JobId, JobStatus
+from sms_api.common.storage.file_paths import HPCFilePath, S3FilePath
+from sms_api.simulation.database_service import DatabaseServiceSQL
+from sms_api.simulation.models import HpcRun, JobType
+from sms_api.simulation.status_watcher import JobStatusChange
+
+ROOT = "/hpc/sims/exp1/analyses"
+
+
+def _manifest(age_seconds: float = 0.0, source_version: str | None = None) -> OutputManifest:
+    indexed_at = datetime.datetime.now(datetime.UTC).replace(tzinfo=None) - datetime.timedelta(seconds=age_seconds)
+    return OutputManifest(
+        database_id=1, storage=OutputStorage.S3, root=ROOT, source_version=source_version, indexed_at=indexed_at
+    )
+
+
+def _database_service(manifest: OutputManifest | None) -> MagicMock:
+    db = MagicMock()
+    db.get_output_manifest = AsyncMock(return_value=manifest)
+    db.sync_output_manifest = AsyncMock()
+    db.list_output_manifest_files = AsyncMock(return_value=[manifest_entry(f"{ROOT}/generation=5/a.tsv", 3, "e")])
+    return db
+
+
+@pytest.fixture()
+def fake_ssh(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    session = MagicMock()
+    session.run_command = AsyncMock(
+        return_value=(
+            0,
+            f"12\t1760000000.5\t{ROOT}/multiseed/variant=0/lineage_seed=1/generation=5/mass.tsv\n"
+            f"7\t1760000001.0\t{ROOT}/plot one.html\n",
+            "",
+        )
+    )
+
+    @asynccontextmanager
+    async def _session() -> AsyncIterator[MagicMock]:
+        yield session
+
+    monkeypatch.setattr(
+        "sms_api.analysis.output_manifest.get_ssh_session_service", lambda target: MagicMock(session=_session)
+    )
+    return session
+
+
+def test_manifest_entry_parses_the_partition() -> None:
+    entry = manifest_entry("out/single/variant[2]/lineage_seed[0]/generation[7]/ptools_rna.tsv", 10, "etag")
+    assert (entry.variant, entry.lineage_seed, entry.generation, entry.agent_id) == (2, 0, 7, None)
+
+
+@pytest.mark.asyncio
+async def test_list_hpc_outputs_reads_sizes_and_mtimes_from_one_find(fake_ssh: MagicMock) -> None:
+    entries = await list_hpc_outputs(HPCFilePath(remote_path=Path(ROOT)))
+
+    assert [(e.path, e.size, e.version, e.generation) for e in entries] == [
+        (f"{ROOT}/multiseed/variant=0/lineage_seed=1/generation=5/mass.tsv", 12, "1760000000.5", 5),
+        (f"{ROOT}/plot one.html", 7, "1760000001.0", None),
+    ]
+    fake_ssh.run_command.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_fresh_manifest_is_answered_from_the_database(monkeypatch: pytest.MonkeyPatch) -> None:
+    db = _database_service(_manifest(source_version="v1"))
+    list_s3 = AsyncMock()
+    monkeypatch.setattr("sms_api.analysis.output_manifest.list_s3_outputs", list_s3)
+    partition = PartitionFilter(min_generation=5)
+
+    files = await s3_output_files(
+        db, S3FilePath(s3_path=Path(ROOT)), extensions=[".tsv"], partition=partition, source_version="v1"
+    )
+
+    assert [f.generation for f in files] == [5]
+    list_s3.assert_not_called()
+    db.sync_output_manifest.assert_not_called()
+    db.list_output_manifest_files.assert_awaited_once_with(
+        OutputStorage.S3, ROOT, extensions=[".tsv"], partition=partition
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("manifest", "source_version"),
+    [(None, "v1"), (_manifest(source_version="v1"), "v2"), (_manifest(age_seconds=3600, source_version="v1"), "v1")],
+    ids=["never-indexed", "source-changed", "stale"],
+)
+async def test_missing_changed_or_stale_manifest_is_resynced(
+    monkeypatch: pytest.MonkeyPatch, manifest: OutputManifest | None, source_version: str
+) -> None:
+    db = _database_service(manifest)
+    entries = [manifest_entry(f"{ROOT}/a.tsv", 1, "e")]
+    monkeypatch.setattr("sms_api.analysis.output_manifest.list_s3_outputs", AsyncMock(return_value=entries))
+
+    await s3_output_files(db, S3FilePath(s3_path=Path(ROOT)), experiment_id="exp1", source_version=source_version)
+
+    db.sync_output_manifest.assert_awaited_once_with(
+        OutputStorage.S3, ROOT, entries, experiment_id="exp1", source_version=source_version
+    )
+
+
+@pytest.mark.asyncio
+async def test_refresh_relists_the_hpc_directory(fake_ssh: MagicMock) -> None:
+    db = _database_service(_manifest())
+
+    await hpc_output_files(db, HPCFilePath(remote_path=Path(ROOT)), refresh=True)
+
+    fake_ssh.run_command.assert_awaited_once()
+    db.sync_output_manifest.assert_awaited_once()
+
+
+def _status_change(job_type: JobType, backend: JobBackend, status: JobStatus) -> JobStatusChange:
+    job_id = JobId(backend=backend, value="42")
+    hpc_run = HpcRun(database_id=1, job_id=job_id, correlation_id="c", job_type=job_type, ref_id=7, status=status)
+    return JobStatusChange(hpc_run=hpc_run, previous_status=JobStatus.RUNNING)
+
+
+@pytest.mark.asyncio
+async def test_indexer_indexes_completed_slurm_simulations_only(
+    fake_ssh: MagicMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        "sms_api.analysis.output_manifest.simulation_analyses_dir",
+        lambda experiment_id: HPCFilePath(remote_path=Path(ROOT)),
+    )
+    db = MagicMock()
+    db.get_simulation = AsyncMock(return_value=MagicMock(experiment_id="exp1"))
+    db.sync_output_manifest = AsyncMock()
+    watcher = MagicMock()
+    indexer = OutputManifestIndexer(db, watcher)
+    indexer.start()
+    ((queue,), _) = watcher.subscribe.call_args
+
+    for change in (
+        _status_change(JobType.SIMULATION, JobBackend.SLURM, JobStatus.FAILED),
+        _status_change(JobType.PARCA, JobBackend.SLURM, JobStatus.COMPLETED),
+        _status_change(JobType.SIMULATION, JobBackend.K8S, JobStatus.COMPLETED),
+        _status_change(JobType.SIMULATION, JobBackend.SLURM, JobStatus.COMPLETED),
+    ):
+        queue.put_nowait(change)
+    while not queue.empty():
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    await indexer.stop()
+
+    db.get_simulation.assert_awaited_once_with(simulation_id=7)
+    ((storage, root, entries), kwargs) = db.sync_output_manifest.call_args
+    assert (storage, root, len(entries), kwargs) == (OutputStorage.HPC, ROOT, 2, {"experiment_id": "exp1"})
+    watcher.unsubscribe.assert_called_once_with(queue)
+
+
+# ---------------------------------------------------------------------------
+# DatabaseServiceSQL — against the testcontainer Postgres
+# ---------------------------------------------------------------------------
+
+
+def _entries(**sizes: Any) -> list[OutputManifestEntry]:
+    return [manifest_entry(f"{ROOT}/{name.replace('_', '/')}.tsv", size, f"m{size}") for name, size in sizes.items()]
+
+
+@pytest.mark.asyncio
+async def test_sync_output_manifest_applies_only_the_difference(database_service: DatabaseServiceSQL) -> None:
+    first = await database_service.sync_output_manifest(
+        OutputStorage.HPC, ROOT, _entries(a=1, b=2, c=3), experiment_id="exp1"
+    )
+    assert (first.file_count, first.total_bytes, first.experiment_id) == (3, 6, "exp1")
+
+    second = await database_service.sync_output_manifest(OutputStorage.HPC, ROOT, _entries(a=1, b=5, d=4))
+    files = await database_service.list_output_manifest_files(OutputStorage.HPC, ROOT)
+
+    assert second.database_id == first.database_id
+    assert (second.file_count, second.total_bytes, second.experiment_id) == (3, 10, "exp1")
+    assert files is not None
+    assert [(Path(f.path).name, f.size, f.version) for f in files] == [
+        ("a.tsv", 1, "m1"),
+        ("b.tsv", 5, "m5"),
+        ("d.tsv", 4, "m4"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_list_output_manifest_files_filters_by_extension_and_partition(
+    database_service: DatabaseServiceSQL,
+) -> None:
+    entries = [
+        manifest_entry(f"{ROOT}/variant=0/lineage_seed=0/generation={g}/mass.{ext}", 1, None)
+        for g in range(8)
+        for ext in ("tsv", "html")
+    ]
+    await database_service.sync_output_manifest(OutputStorage.HPC, ROOT, entries)
+
+    files = await database_service.list_output_manifest_files(
+        OutputStorage.HPC, ROOT, extensions=[".TSV"], partition=PartitionFilter(variant=0, min_generation=5)
+    )
+
+    assert files is not None
+    assert [(f.generation, Path(f.path).suffix) for f in files] == [(5, ".tsv"), (6, ".tsv"), (7, ".tsv")]
+    assert await database_service.list_output_manifest_files(OutputStorage.S3, ROOT) is None
@@ -0,0 +1,162 @@
+"""JobStatusWatcher: batched per-backend polling, push sources, DB updates and in-process pub/sub
+(database mocked), plus the batched AWS Batch status source."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from sms_api.common.hpc.job_service import JobStatusInfo
+from sms_api.common.hpc.job_status_sources import BatchJobStatusSource, JobStatusSource, PushJobStatusSource
+from sms_api.common.models import JobBackend, JobId, JobStatus
+from sms_api.simulation.models import HpcRun, JobType
+from sms_api.simulation.status_watcher import JobStatusChange, JobStatusWatcher
+
+
+class _FakeSource(JobStatusSource):
+    def __init__(self, backend: JobBackend, statuses: dict[str, JobStatus]) -> None:
+        self.backend = backend
+        self.statuses = statuses
+        self.calls: list[list[JobId]] = []
+        self.events: asyncio.Queue[JobStatusInfo] = asyncio.Queue()
+
+    async def get_statuses(self, job_ids: list[JobId]) -> list[JobStatusInfo]:
+        self.calls.append(job_ids)
+        return [
+            JobStatusInfo(job_id=job_id, status=self.statuses[job_id.value])
+            for job_id in job_ids
+            if job_id.value in self.statuses
+        ]
+
+
+class _FakePushSource(_FakeSource, PushJobStatusSource):
+    async def watch(self) -> AsyncIterator[JobStatusInfo]:
+        while True:
+            yield await self.events.get()
+
+
+def _hpc_run(database_id: int, job_id: JobId, status: JobStatus = JobStatus.RUNNING) -> HpcRun:
+    return HpcRun(
+        database_id=database_id,
+        job_id=job_id,
+        correlation_id="N/A",
+        job_type=JobType.SIMULATION,
+        ref_id=database_id,
+        status=status,
+    )
+
+
+def _database_service(hpc_runs: list[HpcRun]) -> MagicMock:
+    db = MagicMock()
+    db.list_active_hpcruns = AsyncMock(return_value=hpc_runs)
+    db.update_hpcrun_status = AsyncMock()
+    return db
+
+
+@pytest.mark.asyncio
+async def test_poll_batches_per_backend_and_publishes_transitions() -> None:
+    slurm_runs = [_hpc_run(i, JobId.slurm(100 + i)) for i in range(3)]
+    ray_run = _hpc_run(10, JobId.ray("batch-1"), status=JobStatus.PENDING)
+    db = _database_service([*slurm_runs, ray_run])
+    slurm = _FakeSource(JobBackend.SLURM, {"100": JobStatus.RUNNING, "101": JobStatus.COMPLETED})
+    ray = _FakeSource(JobBackend.RAY, {"batch-1": JobStatus.RUNNING})
+    watcher = JobStatusWatcher(database_service=db, sources=[slurm, ray])
+    changes: asyncio.Queue[JobStatusChange] = asyncio.Queue()
+    watcher.subscribe(changes)
+
+    await watcher.poll_once()
+
+    assert slurm.calls == [[run.job_id for run in slurm_runs]]
+    assert ray.calls == [[ray_run.job_id]]
+    updated = {
+        call.kwargs["hpcrun_id"]: call.kwargs["update"].status for call in db.update_hpcrun_status.call_args_list
+    }
+    assert updated == {1: JobStatus.COMPLETED, 10: JobStatus.RUNNING}
+    published = {changes.get_nowait().hpc_run.database_id for _ in range(changes.qsize())}
+    assert published == {1, 10}
+
+    # The terminal run is no longer polled, and the DB is not re-listed before the resync interval.
+    await watcher.poll_once()
+    assert slurm.calls[-1] == [slurm_runs[0].job_id, slurm_runs[2].job_id]
+    db.list_active_hpcruns.assert_awaited_once()
+    assert db.update_hpcrun_status.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_tracked_run_is_polled_before_resync_and_subscribers_filter_by_job() -> None:
+    db = _database_service([])
+    source = _FakeSource(JobBackend.SLURM, {"7": JobStatus.FAILED, "8": JobStatus.COMPLETED})
+    watcher = JobStatusWatcher(database_service=db, sources=[source])
+    await watcher.poll_once()
+
+    only_seven: asyncio.Queue[JobStatusChange] = asyncio.Queue()
+    watcher.subscribe(only_seven, job_id=JobId.slurm(7))
+    watcher.track(_hpc_run(1, JobId.slurm(7)))
+    watcher.track(_hpc_run(2, JobId.slurm(8)))
+    await watcher.poll_once()
+
+    change = only_seven.get_nowait()
+    assert (change.hpc_run.database_id, change.previous_status, change.hpc_run.status) == (
+        1,
+        JobStatus.RUNNING,
+        JobStatus.FAILED,
+    )
+    assert only_seven.empty()
+
+
+@pytest.mark.asyncio
+async def test_push_source_updates_without_polling() -> None:
+    run = _hpc_run(1, JobId.k8s("wf-1"))
+    db = _database_service([run])
+    k8s = _FakePushSource(JobBackend.K8S, {})
+    watcher = JobStatusWatcher(database_service=db, sources=[k8s])
+    changes: asyncio.Queue[JobStatusChange] = asyncio.Queue()
+    watcher.subscribe(changes)
+
+    await watcher.start(interval_seconds=3600)
+    try:
+        await asyncio.sleep(0)  # first poll: resync (and a catch-up poll of the push source)
+        assert watcher.covers(JobBackend.K8S)
+        assert not watcher.covers(JobBackend.SLURM)
+        await k8s.events.put(JobStatusInfo(job_id=run.job_id, status=JobStatus.COMPLETED))
+        change = await asyncio.wait_for(changes.get(), timeout=1)
+    finally:
+        await watcher.stop()
+
+    assert change.hpc_run.status == JobStatus.COMPLETED
+    assert len(k8s.calls) == 1
+    assert not watcher.is_running()
+
+
+@pytest.mark.asyncio
+async def test_failing_source_does_not_block_other_backends() -> None:
+    db = _database_service([_hpc_run(1, JobId.slurm(1)), _hpc_run(2, JobId.local("abc"))])
+    slurm = _FakeSource(JobBackend.SLURM, {})
+    slurm.get_statuses = AsyncMock(side_effect=RuntimeError("ssh down"))  # type: ignore[method-assign]
+    local = _FakeSource(JobBackend.LOCAL, {"abc": JobStatus.COMPLETED})
+    watcher = JobStatusWatcher(database_service=db, sources=[slurm, local])
+
+    await watcher.poll_once()
+
+    db.update_hpcrun_status.assert_awaited_once()
+    assert db.update_hpcrun_status.call_args.kwargs["hpcrun_id"] == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_source_describes_up_to_100_jobs_per_call() -> None:
+    job_ids = [JobId.ray(f"job-{i}") for i in range(250)]
+    client = MagicMock()
+
+    def _describe_jobs(jobs: list[str]) -> dict[str, Any]:
+        return {"jobs": [{"jobId": job, "status": "SUCCEEDED", "stoppedAt": 1} for job in jobs]}
+
+    client.describe_jobs.side_effect = _describe_jobs
+    source = BatchJobStatusSource(JobBackend.RAY, lambda: client)
+
+    infos = await source.get_statuses(job_ids)
+
+    assert [len(call.kwargs["jobs"]) for call in client.describe_jobs.call_args_list] == [100, 100, 50]
+    assert {info.job_id for info in infos} == set(job_ids)
+    assert all(info.status == JobStatus.COMPLETED for info in infos)
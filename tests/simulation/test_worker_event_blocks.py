@@ -0,0 +1,146 @@
+"""Columnar WorkerEvent blocks: pack/unpack round trip, key union with NaN for missing
+values, range selection, and the ingestor's compaction trigger (database mocked)."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from sms_api.simulation.models import WorkerEvent
+from sms_api.simulation.worker_event_blocks import (
+    WorkerEventSeries,
+    pack_worker_events,
+    unpack_worker_event_block,
+)
+from sms_api.simulation.worker_event_ingest import WorkerEventIngestor
+
+
+def _event(sequence_number: int, mass: dict[str, float] | None = None, hpcrun_id: int = 1) -> WorkerEvent:
+    return WorkerEvent(
+        correlation_id="corr",
+        sequence_number=sequence_number,
+        mass=mass if mass is not None else {"dry": float(sequence_number), "water": 2.0 * sequence_number},
+        time=0.5 * sequence_number,
+    ).model_copy(update={"hpcrun_id": hpcrun_id})
+
+
+def test_pack_unpack_round_trip() -> None:
+    events = [_event(i) for i in range(5)]
+    packed = pack_worker_events(events)
+
+    assert (packed.first_sequence_number, packed.last_sequence_number, packed.n_events) == (0, 4, 5)
+    assert packed.mass_keys == ["dry", "water"]
+    assert len(packed.mass) == 5 * 2 * 8
+
+    series = unpack_worker_event_block(1, packed.mass_keys, packed.sequence_numbers, packed.times, packed.mass)
+    assert series.sequence_numbers.dtype == np.int64
+    assert series.mass.shape == (5, 2)
+    np.testing.assert_array_equal(series.times, [0.0, 0.5, 1.0, 1.5, 2.0])
+    assert [(e.sequence_number, e.time, e.mass) for e in series.to_worker_events()] == [
+        (e.sequence_number, e.time, e.mass) for e in events
+    ]
+
+
+def test_missing_keys_are_nan_and_dropped_again() -> None:
+    events = [_event(0, {"dry": 1.0}), _event(1, {"water": 3.0})]
+
+    series = WorkerEventSeries.from_worker_events(1, events)
+
+    assert series.mass_keys == ["dry", "water"]
+    assert np.isnan(series.mass[0, 1]) and np.isnan(series.mass[1, 0])
+    assert [e.mass for e in series.to_worker_events()] == [{"dry": 1.0}, {"water": 3.0}]
+
+
+def test_concat_merges_keys_and_select_is_inclusive() -> None:
+    block = WorkerEventSeries.from_worker_events(1, [_event(i, {"dry": float(i)}) for i in range(0, 4)])
+    rows = WorkerEventSeries.from_worker_events(1, [_event(i, {"rna": float(i)}) for i in range(4, 6)])
+
+    series = WorkerEventSeries.concat(1, [rows, block])
+
+    np.testing.assert_array_equal(series.sequence_numbers, np.arange(6))
+    assert series.mass_keys == ["rna", "dry"]
+    selected = series.select(2, 4)
+    np.testing.assert_array_equal(selected.sequence_numbers, [2, 3, 4])
+    assert [e.mass for e in selected.to_worker_events()] == [{"dry": 2.0}, {"dry": 3.0}, {"rna": 4.0}]
+    assert len(series.select(10)) == 0
+    assert len(WorkerEventSeries.concat(1, [])) == 0
+
+
+def test_downsample_skips_nan_and_aligns_buckets() -> None:
+    events = [
+        _event(0, {"dry": 1.0}),
+        _event(1, {"dry": 3.0, "rna": 5.0}),
+        _event(2, {"dry": 2.0}),
+        _event(3, {"dry": 4.0}),
+    ]  # times 0.0, 0.5, 1.0, 1.5
+
+    buckets = WorkerEventSeries.from_worker_events(1, events).downsample(bucket_seconds=1.0)
+
+    assert [(b.start_time, b.n_events, b.first_sequence_number, b.last_sequence_number) for b in buckets] == [
+        (0.0, 2, 0, 1),
+        (1.0, 2, 2, 3),
+    ]
+    assert (buckets[0].mass_min, buckets[0].mass_max) == ({"dry": 1.0, "rna": 5.0}, {"dry": 3.0, "rna": 5.0})
+    assert buckets[0].mass_mean == {"dry": 2.0, "rna": 5.0}
+    assert buckets[1].mass_mean == {"dry": 3.0}
+    assert WorkerEventSeries.empty(1).downsample(1.0) == []
+    with pytest.raises(ValueError, match="positive"):
+        WorkerEventSeries.empty(1).downsample(0.0)
+
+
+def test_pack_rejects_empty_block() -> None:
+    with pytest.raises(ValueError, match="empty"):
+        pack_worker_events([])
+
+
+@pytest.mark.asyncio
+async def test_ingestor_compacts_once_a_run_has_a_full_block() -> None:
+    async def _insert_worker_events(worker_events: list[WorkerEvent]) -> list[WorkerEvent]:
+        return worker_events
+
+    db = MagicMock()
+    db.insert_worker_events = AsyncMock(side_effect=_insert_worker_events)
+    db.compact_worker_events = AsyncMock(return_value=4)
+    ingestor = WorkerEventIngestor(db, batch_size=3, flush_interval=10.0, block_size=4)
+    for i in range(6):
+        await ingestor.submit(_event(i, hpcrun_id=1))
+    await ingestor.submit(_event(0, hpcrun_id=2))
+
+    ingestor.start()
+    await ingestor.stop()
+
+    db.compact_worker_events.assert_awaited_once_with(1, 4)
+    assert ingestor.metrics().compacted == 4
+
+
+@pytest.mark.asyncio
+async def test_compaction_does_not_hold_up_inserts() -> None:
+    async def _insert_worker_events(worker_events: list[WorkerEvent]) -> list[WorkerEvent]:
+        return worker_events
+
+    release = asyncio.Event()
+
+    async def _compact_worker_events(hpcrun_id: int, block_size: int) -> int:
+        await release.wait()
+        return block_size
+
+    db = MagicMock()
+    db.insert_worker_events = AsyncMock(side_effect=_insert_worker_events)
+    db.compact_worker_events = AsyncMock(side_effect=_compact_worker_events)
+    ingestor = WorkerEventIngestor(db, batch_size=2, flush_interval=0.01, block_size=2)
+    ingestor.start()
+    try:
+        for i in range(6):
+            await ingestor.submit(_event(i, hpcrun_id=1))
+        for _ in range(100):
+            if ingestor.metrics().inserted == 6:
+                break
+            await asyncio.sleep(0.01)
+        assert ingestor.metrics().inserted == 6  # every batch went in while the first compaction was stuck
+        assert db.compact_worker_events.await_count == 1
+    finally:
+        release.set()
+        await ingestor.stop()
+
+    assert ingestor.metrics().compacted == 6
@@ -0,0 +1,96 @@
+"""WorkerEventIngestor: size/time-bounded bulk inserts, backpressure and drops, and failure
+accounting (database mocked)."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from sms_api.simulation.models import WorkerEvent
+from sms_api.simulation.worker_event_ingest import WorkerEventIngestor
+
+
+def _event(sequence_number: int, hpcrun_id: int | None = 1) -> WorkerEvent:
+    return WorkerEvent(
+        correlation_id="corr", sequence_number=sequence_number, mass={"dry": 1.0}, time=float(sequence_number)
+    ).model_copy(update={"hpcrun_id": hpcrun_id})
+
+
+def _database_service() -> MagicMock:
+    async def _insert_worker_events(worker_events: list[WorkerEvent]) -> list[WorkerEvent]:
+        return [event.model_copy(update={"database_id": event.sequence_number}) for event in worker_events]
+
+    db = MagicMock()
+    db.insert_worker_events = AsyncMock(side_effect=_insert_worker_events)
+    return db
+
+
+@pytest.mark.asyncio
+async def test_events_are_inserted_in_batches_of_batch_size() -> None:
+    db = _database_service()
+    published: list[WorkerEvent] = []
+    ingestor = WorkerEventIngestor(db, batch_size=4, flush_interval=10.0, on_inserted=published.extend)
+    for i in range(10):
+        assert await ingestor.submit(_event(i))
+
+    ingestor.start()
+    await ingestor.stop()  # flushes the partial last batch
+
+    assert [len(call.args[0]) for call in db.insert_worker_events.call_args_list] == [4, 4, 2]
+    assert [event.database_id for event in published] == list(range(10))
+    metrics = ingestor.metrics()
+    assert (metrics.received, metrics.inserted, metrics.batches, metrics.dropped) == (10, 10, 3, 0)
+    assert metrics.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_partial_batch_is_flushed_after_flush_interval() -> None:
+    db = _database_service()
+    ingestor = WorkerEventIngestor(db, batch_size=100, flush_interval=0.01)
+    ingestor.start()
+    try:
+        await ingestor.submit(_event(1))
+        await ingestor.submit(_event(2))
+        for _ in range(100):
+            if db.insert_worker_events.await_count:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await ingestor.stop()
+
+    assert [len(call.args[0]) for call in db.insert_worker_events.call_args_list] == [2]
+    assert ingestor.metrics().lag_seconds > 0
+
+
+@pytest.mark.asyncio
+async def test_full_queue_throttles_then_drops() -> None:
+    db = _database_service()
+    ingestor = WorkerEventIngestor(db, max_queue_size=2, enqueue_timeout=0.01)  # writer not started
+
+    results = [await ingestor.submit(_event(i)) for i in range(3)]
+
+    assert results == [True, True, False]
+    metrics = ingestor.metrics()
+    assert (metrics.received, metrics.throttled, metrics.dropped, metrics.queue_depth) == (3, 1, 1, 2)
+
+
+@pytest.mark.asyncio
+async def test_failed_insert_is_counted_and_ingestion_continues() -> None:
+    db = _database_service()
+    db.insert_worker_events.side_effect = [RuntimeError("db down"), [_event(3)]]
+    ingestor = WorkerEventIngestor(db, batch_size=2, flush_interval=10.0)
+    for i in range(3):
+        await ingestor.submit(_event(i))
+
+    ingestor.start()
+    await ingestor.stop()
+
+    metrics = ingestor.metrics()
+    assert (metrics.failed, metrics.inserted, metrics.batches) == (2, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_event_without_hpcrun_is_rejected() -> None:
+    ingestor = WorkerEventIngestor(_database_service())
+    with pytest.raises(ValueError, match="no hpcrun_id"):
+        await ingestor.submit(_event(1, hpcrun_id=None))